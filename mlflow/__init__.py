@@ -24,6 +24,8 @@ implement mutual exclusion manually.
 
 For a lower level API, see the :py:mod:`mlflow.tracking` module.
 """
+import sys
+
 from mlflow.version import VERSION as __version__
 from mlflow.utils.logging_utils import _configure_mlflow_loggers
 import mlflow.tracking.fluent
@@ -38,7 +40,6 @@ warnings.filterwarnings("ignore", message="numpy.ufunc size changed")  # noqa: E
 warnings.filterwarnings("module", category=DeprecationWarning)
 
 # pylint: disable=wrong-import-position
-import mlflow.projects as projects  # noqa
 import mlflow.tracking as tracking  # noqa
 
 _configure_mlflow_loggers(root_module_name=__name__)
@@ -63,8 +64,34 @@ log_params = mlflow.tracking.fluent.log_params
 log_metrics = mlflow.tracking.fluent.log_metrics
 set_tags = mlflow.tracking.fluent.set_tags
 
-
-run = projects.run
+# Attributes imported on first access, as their modules are slow to import and not needed to log
+# to a run. Maps each attribute to its module and to its name in the module, or None to refer to
+# the module itself.
+_LAZY_ATTRIBUTES = {
+    "projects": ("mlflow.projects", None),
+    "run": ("mlflow.projects", "run"),
+}
+
+
+def _import_lazy_attribute(name):
+    import importlib
+
+    module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute_name is None else getattr(module, attribute_name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in _LAZY_ATTRIBUTES:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+        return _import_lazy_attribute(name)
+else:
+    # Module-level __getattr__ (PEP 562) is not supported, so import the attributes eagerly
+    for _name in _LAZY_ATTRIBUTES:
+        _import_lazy_attribute(_name)
 
 
 __all__ = ["ActiveRun", "log_param", "log_params", "log_metric", "log_metrics", "set_tag",
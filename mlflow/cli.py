@@ -237,8 +237,13 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
               help="Additional command line options forwarded to gunicorn processes.")
 @click.option("--waitress-opts", default=None,
               help="Additional command line options for waitress-serve.")
+@click.option("--serve-artifacts", is_flag=True, default=False,
+              help="Serve artifacts under the default artifact root through the tracking server. "
+                   "Clients can then log and download artifacts via "
+                   "'http(s)://<host>:<port>/api/2.0/mlflow-artifacts/artifacts/<path>' URIs "
+                   "without direct access to the underlying storage.")
 def server(backend_store_uri, default_artifact_root, host, port,
-           workers, static_prefix, gunicorn_opts, waitress_opts):
+           workers, static_prefix, gunicorn_opts, waitress_opts, serve_artifacts):
     """
     Run the MLflow tracking server.
 
@@ -271,7 +276,7 @@ def server(backend_store_uri, default_artifact_root, host, port,
 
     try:
         _run_server(backend_store_uri, default_artifact_root, host, port,
-                    static_prefix, workers, gunicorn_opts, waitress_opts)
+                    static_prefix, workers, gunicorn_opts, waitress_opts, serve_artifacts)
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
         sys.exit(1)
@@ -1,8 +1,14 @@
 from abc import abstractmethod
 import pprint
 
+import six
+
 
 class _MLflowObject(object):
+    # Entities created in large numbers, e.g. by run searches, list their attributes in __slots__
+    # so that their instances do not carry a __dict__
+    __slots__ = ()
+
     def __iter__(self):
         # Iterate through list of properties and yield as key -> value
         for prop in self._properties():
@@ -10,7 +16,44 @@ class _MLflowObject(object):
 
     @classmethod
     def _properties(cls):
-        return sorted([p for p in cls.__dict__ if isinstance(getattr(cls, p), property)])
+        # Cached per class, as the properties are listed each time an object is iterated
+        properties = cls.__dict__.get("_cached_properties")
+        if properties is None:
+            properties = sorted([p for p in cls.__dict__ if isinstance(getattr(cls, p), property)])
+            cls._cached_properties = properties
+        return properties
+
+    @classmethod
+    def _slots(cls):
+        # Cached per class, as __slots__ only lists the attributes added by the class itself
+        slots = cls.__dict__.get("_cached_slots")
+        if slots is None:
+            slots = []
+            for klass in reversed(cls.__mro__):
+                klass_slots = klass.__dict__.get("__slots__", ())
+                if isinstance(klass_slots, six.string_types):
+                    klass_slots = (klass_slots,)
+                slots.extend(slot for slot in klass_slots
+                             if slot not in slots and slot not in ("__dict__", "__weakref__"))
+            cls._cached_slots = slots
+        return slots
+
+    def _slot_values(self):
+        """Values of the attributes listed in the ``__slots__`` of the object's class and bases."""
+        return [getattr(self, slot) for slot in self._slots()]
+
+    def __getstate__(self):
+        # Pickle protocols 0 and 1 cannot save slotted objects, which have no __dict__, unless
+        # their state is returned explicitly
+        state = dict(getattr(self, "__dict__", {}))
+        for slot in self._slots():
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @classmethod
     @abstractmethod
@@ -7,6 +7,8 @@ class Metric(_MLflowObject):
     Metric object.
     """
 
+    __slots__ = ("_key", "_value", "_timestamp", "_step")
+
     def __init__(self, key, value, timestamp, step):
         self._key = key
         self._value = value
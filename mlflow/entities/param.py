@@ -7,6 +7,8 @@ class Param(_MLflowObject):
     Parameter object.
     """
 
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key, value):
         self._key = key
         self._value = value
@@ -10,6 +10,8 @@ class Run(_MLflowObject):
     Run object.
     """
 
+    __slots__ = ("_info", "_data")
+
     def __init__(self, run_info, run_data):
         if run_info is None:
             raise MlflowException("run_info cannot be None")
@@ -10,6 +10,9 @@ class RunData(_MLflowObject):
     """
     Run data (metrics and parameters).
     """
+
+    __slots__ = ("_metric_objs", "_metrics", "_params", "_tags")
+
     def __init__(self, metrics=None, params=None, tags=None):
         """
         Construct a new :py:class:`mlflow.entities.RunData` instance.
@@ -4,6 +4,9 @@ from mlflow.protos.service_pb2 import RunTag as ProtoRunTag
 
 class RunTag(_MLflowObject):
     """Tag object associated with a run."""
+
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key, value):
         self._key = key
         self._value = value
@@ -11,7 +14,7 @@ class RunTag(_MLflowObject):
     def __eq__(self, other):
         if type(other) is type(self):
             # TODO deep equality here?
-            return self.__dict__ == other.__dict__
+            return self._slot_values() == other._slot_values()
         return False
 
     @property
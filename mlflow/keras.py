@@ -15,6 +15,7 @@ import os
 import yaml
 import gorilla
 
+import numpy as np
 import pandas as pd
 
 from mlflow import pyfunc
@@ -23,7 +24,7 @@ import mlflow.tracking
 from mlflow.exceptions import MlflowException
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
-from mlflow.utils.model_utils import _get_flavor_configuration
+from mlflow.utils.model_utils import _get_flavor_configuration, _run_in_batches
 from mlflow.utils.annotations import experimental
 from mlflow.utils.autologging_utils import try_mlflow_log
 
@@ -35,6 +36,11 @@ _KERAS_MODULE_SPEC_PATH = "keras_module.txt"
 # File name to which keras model is saved
 _MODEL_SAVE_PATH = "model.h5"
 
+# Maximum number of rows passed to the model at a time by the pyfunc flavor. Larger inputs are
+# scored in several runs of the model, which bounds the memory used by intermediate activations.
+# By default, each input is scored in a single run.
+PREDICT_BATCH_SIZE_ENV_VAR = "MLFLOW_KERAS_PREDICT_BATCH_SIZE"
+
 
 def get_default_conda_env(include_cloudpickle=False, keras_module=None):
     """
@@ -263,17 +269,37 @@ def _load_model(model_path, keras_module, **kwargs):
 
 
 class _KerasModelWrapper:
-    def __init__(self, keras_model, graph, sess):
+    """
+    Wrapper class that exposes a Keras model with the TensorFlow backend for inference via a
+    ``predict`` function. ``predict`` accepts a pandas DataFrame, in which case it returns a
+    DataFrame with the same index, or a NumPy array, in which case it returns a NumPy array
+    without converting the input or the output to pandas.
+
+    The forward pass of the model is prepared once, as a callable of the model's session, so that
+    predictions neither enter the model's graph and session nor build Keras' predict function.
+    Sessions are thread-safe, so ``predict`` may be called from several threads at once.
+
+    :param batch_size: Maximum number of rows passed to the model at a time. If ``None``, the
+                       whole input is scored in a single run.
+    """
+    def __init__(self, keras_model, graph, sess, batch_size=None):
         self.keras_model = keras_model
+        self.batch_size = batch_size
         self._graph = graph
         self._sess = sess
+        self._input_dtypes = [tensor.dtype.as_numpy_dtype for tensor in keras_model.inputs]
+        self._predict_fn = sess.make_callable(fetches=keras_model.outputs,
+                                              feed_list=keras_model.inputs)
 
-    def predict(self, dataframe):
-        with self._graph.as_default():
-            with self._sess.as_default():
-                predicted = pd.DataFrame(self.keras_model.predict(dataframe))
-        predicted.index = dataframe.index
-        return predicted
+    def predict(self, data):
+        values = data.values if isinstance(data, pd.DataFrame) else data
+        # Cast the input once, rather than letting the session cast every batch
+        values = np.asarray(values, dtype=self._input_dtypes[0])
+        outputs = _run_in_batches(self._predict_fn, [values], self.batch_size)
+        predicted = outputs[0] if len(outputs) == 1 else outputs
+        if not isinstance(data, pd.DataFrame):
+            return predicted
+        return pd.DataFrame(predicted, index=data.index)
 
 
 def _load_pyfunc(path):
@@ -301,7 +327,9 @@ def _load_pyfunc(path):
             with sess.as_default():  # pylint:disable=not-context-manager
                 K.set_learning_phase(0)
                 m = _load_model(path, keras_module=keras_module, compile=False)
-        return _KerasModelWrapper(m, graph, sess)
+                batch_size = os.environ.get(PREDICT_BATCH_SIZE_ENV_VAR)
+                return _KerasModelWrapper(m, graph, sess,
+                                          batch_size=int(batch_size) if batch_size else None)
     else:
         raise MlflowException("Unsupported backend '%s'" % K._BACKEND)
 
@@ -29,13 +29,16 @@ class Model(object):
     An MLflow Model that can support multiple model flavors. Provides APIs for implementing
     new Model flavors.
     """
-    def __init__(self, artifact_path=None, run_id=None, utc_time_created=None, flavors=None):
+    def __init__(self, artifact_path=None, run_id=None, utc_time_created=None, flavors=None,
+                 saved_input_example_info=None):
         # store model id instead of run_id and path to avoid confusion when model gets exported
         if run_id:
             self.run_id = run_id
             self.artifact_path = artifact_path
         self.utc_time_created = str(utc_time_created or datetime.utcnow())
         self.flavors = flavors if flavors is not None else {}
+        if saved_input_example_info:
+            self.saved_input_example_info = saved_input_example_info
 
     def add_flavor(self, name, **params):
         """Add an entry for how to serve the model in a given format."""
@@ -5,6 +5,8 @@ import posixpath
 
 from mlflow.models import Model
 from mlflow.models.flavor_backend_registry import get_flavor_backend
+from mlflow.pyfunc.backend import serve_multiple_models
+from mlflow.pyfunc.batch_predict import INPUT_FORMATS, OUTPUT_FORMATS
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.file_utils import TempDir
 from mlflow.utils import cli_args
@@ -30,7 +32,10 @@ def commands():
 @cli_args.WORKERS
 @cli_args.NO_CONDA
 @cli_args.INSTALL_MLFLOW
-def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
+@cli_args.PRELOAD
+@cli_args.THREADS
+def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False, preload=False,
+          threads=None):
     """
     Serve a model saved with MLflow by launching a webserver on the specified host and port. For
     information about the input data formats accepted by the webserver, see the following
@@ -52,8 +57,58 @@ def serve(model_uri, port, host, workers, no_conda=False, install_mlflow=False):
     return _get_flavor_backend(model_uri,
                                no_conda=no_conda,
                                workers=workers,
-                               install_mlflow=install_mlflow).serve(model_uri=model_uri, port=port,
-                                                                    host=host)
+                               install_mlflow=install_mlflow,
+                               preload=preload,
+                               threads=threads).serve(model_uri=model_uri, port=port, host=host)
+
+
+@commands.command("serve-models")
+@click.option("--model", "-m", "models", multiple=True, required=True, metavar="NAME=URI",
+              help="Name and URI of a model to serve, e.g. 'churn=runs:/my-run-id/model'. "
+                   "Can be repeated.")
+@cli_args.PORT
+@cli_args.HOST
+@cli_args.WORKERS
+@cli_args.PRELOAD
+@cli_args.THREADS
+@click.option("--max-loaded-models", default=None, type=click.INT,
+              help="Maximum number of models loaded by each worker at the same time. Models are "
+                   "loaded on their first request, unloading the least recently used model when "
+                   "the limit is reached. By default, all models stay loaded.")
+def serve_models(models, port, host, workers, preload=False, threads=None,
+                 max_loaded_models=None):
+    """
+    Serve several pyfunc models from a single webserver on the specified host and port. Models
+    are served in the current Python environment, which must satisfy the dependencies of all
+    of them.
+
+    You can make requests to ``POST /models/<name>/invocations``, with the same input formats as
+    ``mlflow models serve``. ``GET /models`` lists the served models.
+
+    Example:
+
+    .. code-block:: bash
+
+        $ mlflow models serve-models -m churn=runs:/run-1/model -m fraud=runs:/run-2/model &
+
+        $ curl http://127.0.0.1:5000/models/churn/invocations \\
+            -H 'Content-Type: application/json' -d '{
+            "columns": ["a", "b", "c"],
+            "data": [[1, 2, 3], [4, 5, 6]]
+        }'
+    """
+    model_uris = {}
+    for model in models:
+        name, sep, model_uri = model.partition("=")
+        if not sep or not name or not model_uri:
+            raise click.BadParameter("Expected NAME=URI, got '%s'" % model, param_hint="--model")
+        if name in model_uris:
+            raise click.BadParameter("Model name '%s' is given more than once" % name,
+                                     param_hint="--model")
+        model_uris[name] = model_uri
+    return serve_multiple_models(model_uris, port=port, host=host, workers=workers,
+                                 preload=preload, max_loaded_models=max_loaded_models,
+                                 threads=threads)
 
 
 @commands.command("predict")
@@ -91,6 +146,48 @@ def predict(model_uri, input_path, output_path, content_type, json_format, no_co
                                                                       json_format=json_format)
 
 
+@commands.command("predict-batch")
+@cli_args.MODEL_URI
+@click.option("--input-path", "-i", required=True,
+              help="File containing the rows to predict against, in CSV, JSON-lines (one JSON "
+                   "object per row) or Parquet format.")
+@click.option("--output-path", "-o", default=None,
+              help="File to write the predictions to. If not provided, output to stdout.")
+@click.option("--input-format", type=click.Choice(INPUT_FORMATS), default=None,
+              help="Format of the input file. Inferred from its extension by default.")
+@click.option("--output-format", type=click.Choice(OUTPUT_FORMATS), default=None,
+              help="Format of the output. Inferred from the extension of the output path by "
+                   "default, and 'jsonl' for stdout.")
+@click.option("--chunk-size", default=10000, type=click.INT,
+              help="Number of rows read and scored at a time (default: 10000).")
+@click.option("--workers", "-w", default=1, type=click.INT,
+              help="Number of processes scoring chunks, each loading the model once "
+                   "(default: 1).")
+@cli_args.NO_CONDA
+@cli_args.INSTALL_MLFLOW
+def predict_batch(model_uri, input_path, output_path, input_format, output_format, chunk_size,
+                  workers, no_conda, install_mlflow):
+    """
+    Generate predictions for an input file of any size using a saved MLflow model. The input is
+    read and scored in chunks of rows, and the predictions of each chunk are written, in input
+    order, before reading further chunks. Progress and throughput are logged periodically.
+
+    Example:
+
+    .. code-block:: bash
+
+        $ mlflow models predict-batch -m runs:/my-run-id/model -i data.csv -o predictions.parquet \\
+            --chunk-size 50000 --workers 4
+    """
+    backend = _get_flavor_backend(model_uri, no_conda=no_conda, install_mlflow=install_mlflow)
+    if not hasattr(backend, "predict_batch"):
+        raise Exception("Batch prediction is not supported for this model's flavors.")
+    return backend.predict_batch(model_uri=model_uri, input_path=input_path,
+                                 output_path=output_path, input_format=input_format,
+                                 output_format=output_format, chunk_size=chunk_size,
+                                 num_workers=workers)
+
+
 @commands.command("build-docker")
 @cli_args.MODEL_URI
 @click.option("--name", "-n", default="mlflow-pyfunc-servable",
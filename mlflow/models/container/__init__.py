@@ -12,6 +12,7 @@ import signal
 import shutil
 from subprocess import check_call, Popen
 import sys
+import tempfile
 
 from pkg_resources import resource_filename
 
@@ -21,6 +22,7 @@ import mlflow.version
 from mlflow import pyfunc, mleap
 from mlflow.models import Model
 from mlflow.models.docker_utils import DISABLE_ENV_CREATION
+from mlflow.pyfunc.scoring_server.metrics import METRICS_DIR_ENV_VAR
 from mlflow.version import VERSION as MLFLOW_VERSION
 
 MODEL_PATH = "/opt/ml/model"
@@ -30,6 +32,13 @@ DEPLOYMENT_CONFIG_KEY_FLAVOR_NAME = "MLFLOW_DEPLOYMENT_FLAVOR_NAME"
 
 DEFAULT_SAGEMAKER_SERVER_PORT = 8080
 
+# If set to "true", the model is loaded in the gunicorn master process before forking the workers,
+# which then share the memory pages of the model instead of each loading its own copy
+PRELOAD_MODEL_ENV_VAR = "MLFLOW_SCORING_SERVER_PRELOAD"
+# If set, requests are served by gunicorn gthread workers, each handling up to this many requests
+# concurrently
+SERVER_THREADS_ENV_VAR = "MLFLOW_SCORING_SERVER_THREADS"
+
 SUPPORTED_FLAVORS = [
     pyfunc.FLAVOR_NAME,
     mleap.FLAVOR_NAME
@@ -132,8 +141,15 @@ def _serve_pyfunc(model):
     os.system("pip -V")
     os.system("python -V")
     os.system('python -c"from mlflow.version import VERSION as V; print(V)"')
-    cmd = "gunicorn -w {cpu_count} ".format(cpu_count=cpu_count) + \
-          "${GUNICORN_CMD_ARGS} mlflow.models.container.scoring_server.wsgi:app"
+    if not os.environ.get(METRICS_DIR_ENV_VAR):
+        # Report the metrics of all gunicorn workers on /metrics
+        os.environ[METRICS_DIR_ENV_VAR] = tempfile.mkdtemp(prefix="mlflow-metrics-")
+    preload = "--preload " if os.environ.get(PRELOAD_MODEL_ENV_VAR) == "true" else ""
+    threads = os.environ.get(SERVER_THREADS_ENV_VAR)
+    threads = "-k gthread --threads {} ".format(int(threads)) if threads else ""
+    cmd = "gunicorn -w {cpu_count} {preload}{threads}".format(
+        cpu_count=cpu_count, preload=preload, threads=threads) + \
+        "${GUNICORN_CMD_ARGS} mlflow.models.container.scoring_server.wsgi:app"
     bash_cmds.append(cmd)
     gunicorn = Popen(["/bin/bash", "-c", " && ".join(bash_cmds)])
     signal.signal(signal.SIGTERM, lambda a, b: _sigterm_handler(pids=[nginx.pid, gunicorn.pid]))
@@ -1,3 +1,14 @@
+import gc
+import os
 from mlflow.pyfunc import scoring_server
 from mlflow import pyfunc
-app = scoring_server.init(pyfunc.load_pyfunc("/opt/ml/model/"))
+from mlflow.models.container import PRELOAD_MODEL_ENV_VAR
+warmup_input = scoring_server.load_warmup_input("/opt/ml/model/") \
+    if scoring_server.is_warmup_enabled() else None
+app = scoring_server.init(pyfunc.load_pyfunc("/opt/ml/model/"), warmup_input=warmup_input,
+                          block_on_warmup=os.environ.get(PRELOAD_MODEL_ENV_VAR) == "true")
+
+if hasattr(gc, "freeze"):
+    # Keep the garbage collector from copying the model's memory pages in forked workers when
+    # serving with gunicorn --preload (see mlflow.pyfunc.scoring_server.wsgi)
+    gc.freeze()
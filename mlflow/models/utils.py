@@ -0,0 +1,61 @@
+"""
+Utilities for storing an example of the model input alongside an MLflow Model.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+_INPUT_EXAMPLE_SUBPATH = "input_example.json"
+
+
+def _save_example(mlflow_model, input_example, path):
+    """
+    Save an input example to the model directory, as a pandas DataFrame in the JSON ``split``
+    orientation, and record it in the model configuration.
+
+    :param mlflow_model: :py:mod:`mlflow.models.Model` to which the example is added.
+    :param input_example: pandas DataFrame, numpy ndarray, or dictionary mapping column names to
+                          column values. If ``None``, the model is saved without input example.
+    :param path: Local path of the model directory.
+    """
+    if input_example is None:
+        # ``mlflow_model`` may be a default argument shared with earlier calls that saved an example
+        mlflow_model.__dict__.pop("saved_input_example_info", None)
+        return
+    if isinstance(input_example, pd.DataFrame):
+        df = input_example
+    elif isinstance(input_example, (np.ndarray, dict)):
+        df = pd.DataFrame(input_example)
+    else:
+        raise MlflowException(
+            message="Unsupported input example type: {}. Expected a pandas DataFrame, a numpy"
+                    " ndarray or a dictionary.".format(type(input_example)),
+            error_code=INVALID_PARAMETER_VALUE)
+    df.to_json(os.path.join(path, _INPUT_EXAMPLE_SUBPATH), orient="split", index=False)
+    mlflow_model.saved_input_example_info = {
+        "artifact_path": _INPUT_EXAMPLE_SUBPATH,
+        "type": "dataframe",
+        "pandas_orient": "split",
+    }
+
+
+def _read_example(mlflow_model, path):
+    """
+    Read the input example saved with a model.
+
+    :param mlflow_model: :py:mod:`mlflow.models.Model` loaded from ``path``.
+    :param path: Local path of the model directory.
+    :return: The input example as a pandas DataFrame, or ``None`` if the model has no input
+             example.
+    """
+    example_info = getattr(mlflow_model, "saved_input_example_info", None)
+    if example_info is None:
+        return None
+    if example_info["type"] != "dataframe":
+        raise MlflowException("Unsupported input example type: {}".format(example_info["type"]))
+    with open(os.path.join(path, example_info["artifact_path"])) as f:
+        return pd.read_json(f, orient=example_info["pandas_orient"], dtype=False)
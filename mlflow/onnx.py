@@ -10,7 +10,9 @@ ONNX (native) format
 
 from __future__ import absolute_import
 
+import json
 import os
+import uuid
 import yaml
 import numpy as np
 
@@ -20,7 +22,7 @@ from mlflow import pyfunc
 from mlflow.models import Model
 import mlflow.tracking
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import RESOURCE_ALREADY_EXISTS
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_ALREADY_EXISTS
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils import experimental
 from mlflow.utils.environment import _mlflow_conda_env
@@ -28,6 +30,23 @@ from mlflow.utils.model_utils import _get_flavor_configuration
 
 FLAVOR_NAME = "onnx"
 
+# JSON object of ONNX Runtime session options overriding those saved with a model, used when the
+# model is loaded as a pyfunc model
+SESSION_OPTIONS_ENV_VAR = "MLFLOW_ONNX_SESSION_OPTIONS"
+
+_GRAPH_OPTIMIZATION_LEVELS = {
+    "disable_all": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+_EXECUTION_MODES = {
+    "sequential": "ORT_SEQUENTIAL",
+    "parallel": "ORT_PARALLEL",
+}
+_SESSION_OPTION_NAMES = ["graph_optimization_level", "intra_op_num_threads",
+                         "inter_op_num_threads", "execution_mode", "optimized_model_path"]
+
 
 @experimental
 def get_default_conda_env():
@@ -51,7 +70,7 @@ def get_default_conda_env():
 
 
 @experimental
-def save_model(onnx_model, path, conda_env=None, mlflow_model=Model()):
+def save_model(onnx_model, path, conda_env=None, mlflow_model=Model(), session_options=None):
     """
     Save an ONNX model to a path on the local file system.
 
@@ -76,8 +95,27 @@ def save_model(onnx_model, path, conda_env=None, mlflow_model=Model()):
                         }
 
     :param mlflow_model: :py:mod:`mlflow.models.Model` this flavor is being added to.
+    :param session_options: (Experimental) Dictionary of ONNX Runtime session options used when
+                            the model is loaded as a pyfunc model. Supported options are:
+
+                            - ``graph_optimization_level``: One of ``"disable_all"``,
+                              ``"basic"``, ``"extended"`` and ``"all"``.
+                            - ``intra_op_num_threads`` and ``inter_op_num_threads``: Number of
+                              threads used to run each operator and to run operators in
+                              parallel.
+                            - ``execution_mode``: ``"sequential"`` or ``"parallel"``.
+                            - ``optimized_model_path``: Path, relative to the model directory if
+                              it is not absolute, at which the optimized model is saved when the
+                              model is first loaded. Later loads read the optimized model
+                              instead of optimizing the model again. Optimized models may only
+                              run on hardware similar to the one that optimized them.
+
+                            Options can be overridden when the model is loaded with the
+                            ``MLFLOW_ONNX_SESSION_OPTIONS`` environment variable, set to a JSON
+                            object of options.
     """
     import onnx
+    _validate_session_options(session_options or {})
 
     path = os.path.abspath(path)
     if os.path.exists(path):
@@ -102,7 +140,8 @@ def save_model(onnx_model, path, conda_env=None, mlflow_model=Model()):
 
     pyfunc.add_to_model(mlflow_model, loader_module="mlflow.onnx",
                         data=model_data_subpath, env=conda_env_subpath)
-    mlflow_model.add_flavor(FLAVOR_NAME, onnx_version=onnx.__version__, data=model_data_subpath)
+    mlflow_model.add_flavor(FLAVOR_NAME, onnx_version=onnx.__version__, data=model_data_subpath,
+                            session_options=session_options or {})
     mlflow_model.save(os.path.join(path, "MLmodel"))
 
 
@@ -115,10 +154,80 @@ def _load_model(model_file):
     return onnx_model
 
 
+def _validate_session_options(session_options):
+    for name, value in session_options.items():
+        if name not in _SESSION_OPTION_NAMES:
+            raise MlflowException(
+                message="Unknown ONNX Runtime session option '{}'. Supported options: {}".format(
+                    name, _SESSION_OPTION_NAMES),
+                error_code=INVALID_PARAMETER_VALUE)
+        allowed_values = {"graph_optimization_level": _GRAPH_OPTIMIZATION_LEVELS,
+                          "execution_mode": _EXECUTION_MODES}.get(name)
+        if allowed_values is not None and value not in allowed_values:
+            raise MlflowException(
+                message="Invalid value '{}' for ONNX Runtime session option '{}'. Supported"
+                        " values: {}".format(value, name, sorted(allowed_values)),
+                error_code=INVALID_PARAMETER_VALUE)
+
+
+def _create_session(path, session_options):
+    """
+    Create an ONNX Runtime inference session for the model at ``path`` with the given session
+    options (see :py:func:`save_model`).
+    """
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    if "graph_optimization_level" in session_options:
+        options.graph_optimization_level = getattr(
+            onnxruntime.GraphOptimizationLevel,
+            _GRAPH_OPTIMIZATION_LEVELS[session_options["graph_optimization_level"]])
+    if "intra_op_num_threads" in session_options:
+        options.intra_op_num_threads = int(session_options["intra_op_num_threads"])
+    if "inter_op_num_threads" in session_options:
+        options.inter_op_num_threads = int(session_options["inter_op_num_threads"])
+    if "execution_mode" in session_options:
+        options.execution_mode = getattr(
+            onnxruntime.ExecutionMode, _EXECUTION_MODES[session_options["execution_mode"]])
+    optimized_model_path = session_options.get("optimized_model_path")
+    if optimized_model_path:
+        optimized_model_path = os.path.join(os.path.dirname(path), optimized_model_path)
+        if os.path.exists(optimized_model_path):
+            # The model was optimized by a previous load
+            path = optimized_model_path
+            options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+        else:
+            return _create_session_saving_optimized_model(path, options, optimized_model_path)
+    return onnxruntime.InferenceSession(path, sess_options=options)
+
+
+def _create_session_saving_optimized_model(path, options, optimized_model_path):
+    """
+    Create an inference session for the model at ``path`` and save the optimized model at
+    ``optimized_model_path``. ONNX Runtime does not write the optimized model atomically, so it is
+    written to a temporary file in the same directory and renamed once complete: other processes
+    loading the model concurrently, e.g. server workers, never read a partially written file.
+    """
+    import onnxruntime
+
+    temp_path = "{}.{}.tmp".format(optimized_model_path, uuid.uuid4().hex)
+    options.optimized_model_filepath = temp_path
+    try:
+        session = onnxruntime.InferenceSession(path, sess_options=options)
+        try:
+            os.rename(temp_path, optimized_model_path)
+        except OSError:
+            # E.g. on Windows, if another process saved the optimized model first
+            pass
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return session
+
+
 class _OnnxModelWrapper:
-    def __init__(self, path):
-        import onnxruntime
-        self.rt = onnxruntime.InferenceSession(path)
+    def __init__(self, path, session_options=None):
+        self.rt = _create_session(path, session_options or {})
         assert len(self.rt.get_inputs()) >= 1
         self.inputs = [
             (inp.name, inp.type) for inp in self.rt.get_inputs()
@@ -134,6 +243,26 @@ class _OnnxModelWrapper:
                 dataframe[input_name] = dataframe[input_name].values.astype(np.float32)
         return dataframe
 
+    @staticmethod
+    def _to_float32_array(dataframe):
+        """
+        Convert a DataFrame to a 2D float32 array, casting float64 values to float32. If the
+        DataFrame only holds floats, the result is built in a single copy (or without copying if
+        all values are float32). Otherwise, the values are returned as given by
+        ``DataFrame.values`` after casting the float64 columns.
+        """
+        dtypes = set(dataframe.dtypes)
+        if dtypes <= {np.dtype(np.float32), np.dtype(np.float64)}:
+            if len(dtypes) == 1:
+                return np.asarray(dataframe.values, dtype=np.float32)
+            values = np.empty(dataframe.shape, dtype=np.float32)
+            for i in range(dataframe.shape[1]):
+                values[:, i] = dataframe.iloc[:, i].values
+            return values
+        # Cast a shallow copy, so that the columns of the caller's DataFrame are not replaced
+        return _OnnxModelWrapper._cast_float64_to_float32(
+            dataframe.copy(deep=False), dataframe.columns).values
+
     @experimental
     def predict(self, dataframe):
         """
@@ -158,19 +287,16 @@ class _OnnxModelWrapper:
         # https://github.com/mlflow/mlflow/issues/1286. Meanwhile, we explicitly cast the input to
         # 32-bit floats when needed. TODO: Remove explicit casting when issue #1286 is fixed.
         if len(self.inputs) > 1:
-            cols = [name for (name, type) in self.inputs if type == 'tensor(float)']
-        else:
-            cols = dataframe.columns if self.inputs[0][1] == 'tensor(float)' else []
-
-        dataframe = _OnnxModelWrapper._cast_float64_to_float32(dataframe, cols)
-        if len(self.inputs) > 1:
-            feed_dict = {
-                name: dataframe[name].values
-                for (name, _) in self.inputs
-            }
+            feed_dict = {}
+            for name, input_type in self.inputs:
+                values = dataframe[name].values
+                if input_type == 'tensor(float)' and values.dtype == np.float64:
+                    values = values.astype(np.float32)
+                feed_dict[name] = values
+        elif self.inputs[0][1] == 'tensor(float)':
+            feed_dict = {self.inputs[0][0]: _OnnxModelWrapper._to_float32_array(dataframe)}
         else:
             feed_dict = {self.inputs[0][0]: dataframe.values}
-
         predicted = self.rt.run(self.output_names, feed_dict)
         return pd.DataFrame.from_dict(
             {c: p.reshape(-1) for (c, p) in zip(self.output_names, predicted)})
@@ -180,7 +306,17 @@ def _load_pyfunc(path):
     """
     Load PyFunc implementation. Called by ``pyfunc.load_pyfunc``.
     """
-    return _OnnxModelWrapper(path)
+    # The model data is saved at the root of the model directory, next to the MLmodel file
+    try:
+        flavor_conf = _get_flavor_configuration(model_path=os.path.dirname(path),
+                                                flavor_name=FLAVOR_NAME)
+    except MlflowException:
+        flavor_conf = {}
+    session_options = dict(flavor_conf.get("session_options") or {})
+    if os.environ.get(SESSION_OPTIONS_ENV_VAR):
+        session_options.update(json.loads(os.environ[SESSION_OPTIONS_ENV_VAR]))
+        _validate_session_options(session_options)
+    return _OnnxModelWrapper(path, session_options)
 
 
 @experimental
@@ -209,7 +345,7 @@ def load_model(model_uri):
 
 
 @experimental
-def log_model(onnx_model, artifact_path, conda_env=None):
+def log_model(onnx_model, artifact_path, conda_env=None, session_options=None):
     """
     Log an ONNX model as an MLflow artifact for the current run.
 
@@ -232,6 +368,24 @@ def log_model(onnx_model, artifact_path, conda_env=None):
                                 'onnxruntime=0.3.0'
                             ]
                         }
+    :param session_options: (Experimental) Dictionary of ONNX Runtime session options used when
+                            the model is loaded as a pyfunc model. Supported options are:
+
+                            - ``graph_optimization_level``: One of ``"disable_all"``,
+                              ``"basic"``, ``"extended"`` and ``"all"``.
+                            - ``intra_op_num_threads`` and ``inter_op_num_threads``: Number of
+                              threads used to run each operator and to run operators in
+                              parallel.
+                            - ``execution_mode``: ``"sequential"`` or ``"parallel"``.
+                            - ``optimized_model_path``: Path, relative to the model directory if
+                              it is not absolute, at which the optimized model is saved when the
+                              model is first loaded. Later loads read the optimized model
+                              instead of optimizing the model again. Optimized models may only
+                              run on hardware similar to the one that optimized them.
+
+                            Options can be overridden when the model is loaded with the
+                            ``MLFLOW_ONNX_SESSION_OPTIONS`` environment variable, set to a JSON
+                            object of options.
     """
     Model.log(artifact_path=artifact_path, flavor=mlflow.onnx,
-              onnx_model=onnx_model, conda_env=conda_env)
+              onnx_model=onnx_model, conda_env=conda_env, session_options=session_options)
@@ -199,7 +199,9 @@ from copy import deepcopy
 import mlflow
 import mlflow.pyfunc.model
 import mlflow.pyfunc.utils
+from mlflow.pyfunc import model_cache
 from mlflow.models import Model
+from mlflow.models.utils import _save_example
 from mlflow.pyfunc.model import PythonModel, PythonModelContext, get_default_conda_env
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils import PYTHON_VERSION, deprecated, get_major_minor_py_version
@@ -260,7 +262,7 @@ def _load_model_env(path):
     return _get_flavor_configuration(model_path=path, flavor_name=FLAVOR_NAME).get(ENV, None)
 
 
-def load_model(model_uri, suppress_warnings=False):
+def load_model(model_uri, suppress_warnings=False, use_cache=False):
     """
     Load a model stored in Python function format.
 
@@ -277,7 +279,20 @@ def load_model(model_uri, suppress_warnings=False):
     :param suppress_warnings: If ``True``, non-fatal warning messages associated with the model
                               loading process will be suppressed. If ``False``, these warning
                               messages will be emitted.
+    :param use_cache: If ``True``, the model is cached in memory, and later calls with the same
+                      ``model_uri`` return the cached model as long as the files of the model do
+                      not change. At most ``MLFLOW_PYFUNC_MODEL_CACHE_SIZE`` (4 by default) models
+                      are cached, the least recently used model being evicted first. Cached models
+                      can be removed with :py:func:`mlflow.pyfunc.model_cache.invalidate`.
+
+                      If the ``MLFLOW_PYFUNC_MODEL_CACHE_DIR`` environment variable is set,
+                      downloaded models are also cached in that local directory, so that other
+                      processes loading the same model read it from the cache instead of
+                      downloading it again. See :py:mod:`mlflow.pyfunc.model_cache`.
     """
+    if use_cache or model_cache.get_disk_cache_from_env() is not None:
+        return model_cache.load_model(model_uri, suppress_warnings=suppress_warnings,
+                                      use_cache=use_cache)
     return load_pyfunc(model_uri, suppress_warnings)
 
 
@@ -302,10 +317,19 @@ def load_pyfunc(model_uri, suppress_warnings=False):
                               messages will be emitted.
     """
     local_model_path = _download_artifact_from_uri(artifact_uri=model_uri)
-    conf = _get_flavor_configuration(model_path=local_model_path, flavor_name=FLAVOR_NAME)
-    model_py_version = conf.get(PY_VERSION)
-    if not suppress_warnings:
-        _warn_potentially_incompatible_py_version_if_necessary(model_py_version=model_py_version)
+    return _load_model_from_local_path(local_model_path, suppress_warnings=suppress_warnings)
+
+
+def _load_model_from_local_path(local_model_path, conf=None, suppress_warnings=False):
+    """
+    :param conf: The pyfunc flavor configuration of the model, if it has already been read and
+                 validated. Otherwise, it is read from the MLmodel file of the model.
+    """
+    if conf is None:
+        conf = _get_flavor_configuration(model_path=local_model_path, flavor_name=FLAVOR_NAME)
+        if not suppress_warnings:
+            _warn_potentially_incompatible_py_version_if_necessary(
+                model_py_version=conf.get(PY_VERSION))
     if CODE in conf and conf[CODE]:
         code_path = os.path.join(local_model_path, conf[CODE])
         mlflow.pyfunc.utils._add_code_to_system_path(code_path=code_path)
@@ -362,7 +386,8 @@ def spark_udf(spark, model_uri, result_type="double"):
 
     :param result_type: the return type of the user-defined function. The value can be either a
         ``pyspark.sql.types.DataType`` object or a DDL-formatted type string. Only a primitive
-        type or an array ``pyspark.sql.types.ArrayType`` of primitive type are allowed.
+        type, an array ``pyspark.sql.types.ArrayType`` of primitive type or a struct
+        ``pyspark.sql.types.StructType`` of primitive types are allowed.
         The following classes of result type are supported:
 
         - "int" or ``pyspark.sql.types.IntegerType``: The leftmost integer that can fit in an
@@ -387,6 +412,15 @@ def spark_udf(spark, model_uri, result_type="double"):
 
         - ``ArrayType(StringType)``: All columns converted to ``string``.
 
+        - ``StructType`` of the primitive types above, e.g. ``"label string, score double"``:
+          One field per prediction column, converted to the type of the field. Each field is
+          taken from the prediction column with the same name if there is one, and from the
+          prediction column at the same position otherwise. Requires Spark 3.0 or later.
+
+    The model is applied to batches of at most ``spark.sql.execution.arrow.maxRecordsPerBatch``
+    rows, a setting of the Spark session that applies to all its pandas UDFs. Larger batches
+    amortize the per-batch overhead of the model, at the cost of memory in the Python workers.
+
     :return: Spark UDF that applies the model's ``predict`` method to the data and returns a
              type specified by ``result_type``, which by default is a double.
     """
@@ -396,51 +430,48 @@ def spark_udf(spark, model_uri, result_type="double"):
     from mlflow.pyfunc.spark_model_cache import SparkModelCache
     from pyspark.sql.functions import pandas_udf
     from pyspark.sql.types import _parse_datatype_string
-    from pyspark.sql.types import ArrayType, DataType
+    from pyspark.sql.types import ArrayType, DataType, StructType
     from pyspark.sql.types import DoubleType, IntegerType, FloatType, LongType, StringType
 
     if not isinstance(result_type, DataType):
         result_type = _parse_datatype_string(result_type)
 
-    elem_type = result_type
-    if isinstance(elem_type, ArrayType):
-        elem_type = elem_type.elementType
+    if isinstance(result_type, StructType):
+        elem_types = [field.dataType for field in result_type.fields]
+    elif isinstance(result_type, ArrayType):
+        elem_types = [result_type.elementType]
+    else:
+        elem_types = [result_type]
 
     supported_types = [IntegerType, LongType, FloatType, DoubleType, StringType]
 
-    if not any([isinstance(elem_type, x) for x in supported_types]):
-        raise MlflowException(
-            message="Invalid result_type '{}'. Result type can only be one of or an array of one "
-                    "of the following types types: {}".format(str(elem_type), str(supported_types)),
-            error_code=INVALID_PARAMETER_VALUE)
+    for elem_type in elem_types:
+        if not any([isinstance(elem_type, x) for x in supported_types]):
+            raise MlflowException(
+                message="Invalid result_type '{}'. Result type can only be one of or an array or "
+                        "a struct of the following types types: {}".format(
+                            str(elem_type), str(supported_types)),
+                error_code=INVALID_PARAMETER_VALUE)
 
     with TempDir() as local_tmpdir:
         local_model_path = _download_artifact_from_uri(
             artifact_uri=model_uri, output_path=local_tmpdir.path())
         archive_path = SparkModelCache.add_local_model(spark, local_model_path)
 
-    def predict(*args):
-        model = SparkModelCache.get_or_load(archive_path)
-        schema = {str(i): arg for i, arg in enumerate(args)}
-        # Explicitly pass order of columns to avoid lexicographic ordering (i.e., 10 < 2)
-        columns = [str(i) for i, _ in enumerate(args)]
-        pdf = pandas.DataFrame(schema, columns=columns)
-        result = model.predict(pdf)
-        if not isinstance(result, pandas.DataFrame):
-            result = pandas.DataFrame(data=result)
-
-        elif type(elem_type) == IntegerType:
-            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort,
-                                           np.int32]).astype(np.int32)
+    def select_columns(result, elem_type):
+        """
+        Select the columns of ``result`` that can be represented as ``elem_type``, without
+        converting them.
+        """
+        if type(elem_type) == IntegerType:
+            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int32])
 
         elif type(elem_type) == LongType:
-            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int, np.long])
-
-        elif type(elem_type) == FloatType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float32)
+            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int32,
+                                           np.int64])
 
-        elif type(elem_type) == DoubleType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float64)
+        elif type(elem_type) in (FloatType, DoubleType):
+            result = result.select_dtypes(include=(np.number,))
 
         if len(result.columns) == 0:
             raise MlflowException(
@@ -448,23 +479,85 @@ def spark_udf(spark, model_uri, result_type="double"):
                         "type '{}'. Consider requesting udf with StringType or "
                         "Arraytype(StringType).".format(str(elem_type)),
                 error_code=INVALID_PARAMETER_VALUE)
+        return result
+
+    def convert(values, elem_type):
+        """
+        Convert a Series or a DataFrame of values to ``elem_type``.
+        """
+        if type(elem_type) == IntegerType:
+            return values.astype(np.int32)
+        elif type(elem_type) == LongType:
+            return values.astype(np.int64)
+        elif type(elem_type) == FloatType:
+            return values.astype(np.float32)
+        elif type(elem_type) == DoubleType:
+            return values.astype(np.float64)
+        elif type(elem_type) == StringType:
+            return values.applymap(str) if isinstance(values, pandas.DataFrame) \
+                else values.map(str)
+        return values
 
-        if type(elem_type) == StringType:
-            result = result.applymap(str)
+    def predict(*args):
+        model = SparkModelCache.get_or_load(archive_path)
+        schema = {str(i): arg for i, arg in enumerate(args)}
+        # Explicitly pass order of columns to avoid lexicographic ordering (i.e., 10 < 2)
+        columns = [str(i) for i, _ in enumerate(args)]
+        pdf = pandas.DataFrame(schema, columns=columns)
+        result = model.predict(pdf)
+        predicted_dataframe = isinstance(result, pandas.DataFrame)
+        if not predicted_dataframe:
+            result = pandas.DataFrame(data=result)
 
-        if type(result_type) == ArrayType:
-            return pandas.Series([row[1].values for row in result.iterrows()])
+        if isinstance(result_type, StructType):
+            return _get_struct_result(result, result_type, convert)
+
+        elem_type = elem_types[0]
+        if predicted_dataframe:
+            # Predictions that are not DataFrames, e.g. the int64 ndarrays returned by scikit-learn
+            # classifiers, are converted to the requested type without filtering their columns
+            result = select_columns(result, elem_type)
+        if isinstance(result_type, ArrayType):
+            # Build the arrays from the rows of a single ndarray holding all the converted
+            # values, which Arrow serializes without going through a Series per row
+            values = convert(result, elem_type).values
+            return pandas.Series(list(values))
         else:
-            return result[result.columns[0]]
+            # Only convert the returned column
+            return convert(result[result.columns[0]], elem_type)
 
     return pandas_udf(predict, result_type)
 
 
+def _get_struct_result(result, result_type, convert):
+    """
+    :return: DataFrame with one column per field of the ``StructType`` ``result_type``, taken from
+             the column of ``result`` with the same name as the field if there is one, and from the
+             column at the same position otherwise.
+    """
+    column_names = [str(column) for column in result.columns]
+    struct = pandas.DataFrame(index=result.index)
+    for i, field in enumerate(result_type.fields):
+        if field.name in column_names:
+            values = result.iloc[:, column_names.index(field.name)]
+        elif i < len(column_names):
+            values = result.iloc[:, i]
+        else:
+            raise MlflowException(
+                message="The model produced {} columns and none is named '{}', which cannot be"
+                        " mapped to field {} of the requested type '{}'.".format(
+                            len(column_names), field.name, i, result_type.simpleString()),
+                error_code=INVALID_PARAMETER_VALUE)
+        struct[field.name] = convert(values, field.dataType)
+    return struct
+
+
 def save_model(path, loader_module=None, data_path=None, code_path=None, conda_env=None,
-               mlflow_model=Model(), python_model=None, artifacts=None, **kwargs):
+               mlflow_model=Model(), python_model=None, artifacts=None, input_example=None,
+               **kwargs):
     """
     save_model(path, loader_module=None, data_path=None, code_path=None, conda_env=None,\
-               mlflow_model=Model(), python_model=None, artifacts=None)
+               mlflow_model=Model(), python_model=None, artifacts=None, input_example=None)
 
     Save a Pyfunc model with custom inference logic and optional data dependencies to a path on the
     local filesystem.
@@ -539,6 +632,9 @@ def save_model(path, loader_module=None, data_path=None, code_path=None, conda_e
                       path via ``context.artifacts["my_file"]``.
 
                       If ``None``, no artifacts are added to the model.
+    :param input_example: (Experimental) Example of the model input, as a pandas DataFrame, a
+                          numpy ndarray or a dictionary mapping column names to column values. It
+                          is stored with the model and used, e.g., to warm up model servers.
     """
     mlflow_model = kwargs.pop('model', mlflow_model)
     if len(kwargs) > 0:
@@ -572,15 +668,16 @@ def save_model(path, loader_module=None, data_path=None, code_path=None, conda_e
     if first_argument_set_specified:
         return _save_model_with_loader_module_and_data_path(
                 path=path, loader_module=loader_module, data_path=data_path,
-                code_paths=code_path, conda_env=conda_env, mlflow_model=mlflow_model)
+                code_paths=code_path, conda_env=conda_env, mlflow_model=mlflow_model,
+                input_example=input_example)
     elif second_argument_set_specified:
         return mlflow.pyfunc.model._save_model_with_class_artifacts_params(
             path=path, python_model=python_model, artifacts=artifacts, conda_env=conda_env,
-            code_paths=code_path, mlflow_model=mlflow_model)
+            code_paths=code_path, mlflow_model=mlflow_model, input_example=input_example)
 
 
 def log_model(artifact_path, loader_module=None, data_path=None, code_path=None, conda_env=None,
-              python_model=None, artifacts=None):
+              python_model=None, artifacts=None, input_example=None):
     """
     Log a Pyfunc model with custom inference logic and optional data dependencies as an MLflow
     artifact for the current run.
@@ -653,6 +750,9 @@ def log_model(artifact_path, loader_module=None, data_path=None, code_path=None,
                       path via ``context.artifacts["my_file"]``.
 
                       If ``None``, no artifacts are added to the model.
+    :param input_example: (Experimental) Example of the model input, as a pandas DataFrame, a
+                          numpy ndarray or a dictionary mapping column names to column values. It
+                          is stored with the model and used, e.g., to warm up model servers.
     """
     return Model.log(artifact_path=artifact_path,
                      flavor=mlflow.pyfunc,
@@ -661,12 +761,13 @@ def log_model(artifact_path, loader_module=None, data_path=None, code_path=None,
                      code_path=code_path,
                      python_model=python_model,
                      artifacts=artifacts,
-                     conda_env=conda_env)
+                     conda_env=conda_env,
+                     input_example=input_example)
 
 
 def _save_model_with_loader_module_and_data_path(path, loader_module, data_path=None,
                                                  code_paths=None, conda_env=None,
-                                                 mlflow_model=Model()):
+                                                 mlflow_model=Model(), input_example=None):
     """
     Export model as a generic Python function model.
     :param path: The path to which to save the Python model.
@@ -680,6 +781,7 @@ def _save_model_with_loader_module_and_data_path(path, loader_module, data_path=
     :param conda_env: Either a dictionary representation of a Conda environment or the path to a
                       Conda environment yaml file. If provided, this decribes the environment
                       this model should be run in.
+    :param input_example: Example of the model input to store with the model.
     :return: Model configuration containing model info.
     """
     if os.path.exists(path):
@@ -707,6 +809,7 @@ def _save_model_with_loader_module_and_data_path(path, loader_module, data_path=
 
     mlflow.pyfunc.add_to_model(
         mlflow_model, loader_module=loader_module, code=code, data=data, env=env)
+    _save_example(mlflow_model, input_example, path)
     mlflow_model.save(os.path.join(path, 'MLmodel'))
     return mlflow_model
 
@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 
@@ -7,11 +8,13 @@ from mlflow.models import FlavorBackend
 from mlflow.models.docker_utils import _build_image, DISABLE_ENV_CREATION
 from mlflow.pyfunc import ENV
 from mlflow.pyfunc import scoring_server
+from mlflow.pyfunc.batch_predict import predict_batch
+from mlflow.pyfunc.scoring_server.metrics import METRICS_DIR_ENV_VAR
 
 from mlflow.projects import _get_or_create_conda_env, _get_conda_bin_executable, \
                             _get_conda_command
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
-from mlflow.utils.file_utils import path_to_local_file_uri
+from mlflow.utils.file_utils import path_to_local_file_uri, TempDir
 from mlflow.version import VERSION
 
 _logger = logging.getLogger(__name__)
@@ -22,11 +25,14 @@ class PyFuncBackend(FlavorBackend):
         Flavor backend implementation for the generic python models.
     """
 
-    def __init__(self, config, workers=1, no_conda=False, install_mlflow=False, **kwargs):
+    def __init__(self, config, workers=1, no_conda=False, install_mlflow=False, preload=False,
+                 threads=None, **kwargs):
         super(PyFuncBackend, self).__init__(config=config, **kwargs)
         self._nworkers = workers or 1
         self._no_conda = no_conda
         self._install_mlflow = install_mlflow
+        self._preload = preload
+        self._threads = threads
 
     def predict(self, model_uri, input_path, output_path, content_type, json_format, ):
         """
@@ -56,6 +62,39 @@ class PyFuncBackend(FlavorBackend):
             scoring_server._predict(local_uri, input_path, output_path, content_type,
                                     json_format)
 
+    def predict_batch(self, model_uri, input_path, output_path, input_format, output_format,
+                      chunk_size, num_workers):
+        """
+        Generate predictions for a large input file in chunks, using generic python model saved
+        with MLflow. See :py:func:`mlflow.pyfunc.batch_predict.predict_batch`.
+        """
+        local_path = _download_artifact_from_uri(model_uri)
+        # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
+        # platform compatibility.
+        local_uri = path_to_local_file_uri(local_path)
+        if not self._no_conda and ENV in self._config:
+            conda_env_path = os.path.join(local_path, self._config[ENV])
+            command = ('python -c "from mlflow.pyfunc.batch_predict import predict_batch; '
+                       'predict_batch(model_uri={model_uri}, '
+                       'input_path={input_path}, '
+                       'output_path={output_path}, '
+                       'input_format={input_format}, '
+                       'output_format={output_format}, '
+                       'chunk_size={chunk_size}, '
+                       'num_workers={num_workers})"'
+                       ).format(
+                model_uri=repr(local_uri),
+                input_path=repr(input_path),
+                output_path=repr(output_path),
+                input_format=repr(input_format),
+                output_format=repr(output_format),
+                chunk_size=repr(chunk_size),
+                num_workers=repr(num_workers))
+            return _execute_in_conda_env(conda_env_path, command, self._install_mlflow)
+        else:
+            predict_batch(local_uri, input_path, output_path, input_format, output_format,
+                          chunk_size, num_workers)
+
     def serve(self, model_uri, port, host):
         """
         Serve pyfunc model locally.
@@ -64,20 +103,22 @@ class PyFuncBackend(FlavorBackend):
         # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
         # platform compatibility.
         local_uri = path_to_local_file_uri(local_path)
-        command = ("gunicorn --timeout=60 -b {host}:{port} -w {nworkers} ${{GUNICORN_CMD_ARGS}}"
-                   " -- mlflow.pyfunc.scoring_server.wsgi:app").format(
-            host=host,
-            port=port,
-            nworkers=self._nworkers)
+        command = _build_gunicorn_command(host, port, self._nworkers, self._preload,
+                                          self._threads)
         command_env = os.environ.copy()
         command_env[scoring_server._SERVER_MODEL_PATH] = local_uri
-        if not self._no_conda and ENV in self._config:
-            conda_env_path = os.path.join(local_path, self._config[ENV])
-            return _execute_in_conda_env(conda_env_path, command, self._install_mlflow,
-                                         command_env=command_env)
-        else:
-            _logger.info("=== Running command '%s'", command)
-            subprocess.Popen(["bash", "-c", command], env=command_env).wait()
+        if self._preload:
+            command_env[scoring_server._SERVER_PRELOAD] = "true"
+        with TempDir() as metrics_dir:
+            # Report the metrics of all gunicorn workers on /metrics
+            command_env.setdefault(METRICS_DIR_ENV_VAR, metrics_dir.path())
+            if not self._no_conda and ENV in self._config:
+                conda_env_path = os.path.join(local_path, self._config[ENV])
+                return _execute_in_conda_env(conda_env_path, command, self._install_mlflow,
+                                             command_env=command_env)
+            else:
+                _logger.info("=== Running command '%s'", command)
+                subprocess.Popen(["bash", "-c", command], env=command_env).wait()
 
     def can_score_model(self):
         if self._no_conda:
@@ -123,6 +164,53 @@ class PyFuncBackend(FlavorBackend):
         )
 
 
+def serve_multiple_models(model_uris, port, host, workers=1, preload=False,
+                          max_loaded_models=None, threads=None):
+    """
+    Serve several pyfunc models from the same server processes, in the current Python
+    environment. Each model is scored at ``/models/<name>/invocations``.
+
+    :param model_uris: Dictionary mapping model names to model URIs.
+    :param preload: If ``True``, load models in the gunicorn master process before forking the
+                    workers, so that the workers share the memory of these models.
+    :param max_loaded_models: Maximum number of models loaded in each worker at the same time.
+                              Models are loaded on their first request and the least recently
+                              used model is unloaded to stay within this limit.
+    :param threads: If specified, serve requests with gunicorn's ``gthread`` workers, each handling
+                    up to this many requests concurrently.
+    """
+    local_uris = {}
+    for name, model_uri in model_uris.items():
+        # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
+        # platform compatibility.
+        local_uris[name] = path_to_local_file_uri(_download_artifact_from_uri(model_uri))
+    command = _build_gunicorn_command(host, port, workers or 1, preload, threads)
+    command_env = os.environ.copy()
+    command_env[scoring_server._SERVER_MODEL_URIS] = json.dumps(local_uris)
+    if max_loaded_models is not None:
+        command_env[scoring_server._SERVER_MAX_LOADED_MODELS] = str(max_loaded_models)
+    if preload:
+        command_env[scoring_server._SERVER_PRELOAD] = "true"
+    with TempDir() as metrics_dir:
+        command_env.setdefault(METRICS_DIR_ENV_VAR, metrics_dir.path())
+        _logger.info("=== Running command '%s'", command)
+        subprocess.Popen(["bash", "-c", command], env=command_env).wait()
+
+
+def _build_gunicorn_command(host, port, nworkers, preload, threads=None):
+    # With --preload, the application (and thereby the model) is loaded before forking the
+    # workers, which then share the model's memory pages until they write to them.
+    # gthread workers wait for connections in an event loop and handle requests in a thread pool,
+    # so that a worker keeps serving while some of its requests wait on I/O.
+    return ("gunicorn --timeout=60 -b {host}:{port} -w {nworkers} {preload}{threads}"
+            "${{GUNICORN_CMD_ARGS}} -- mlflow.pyfunc.scoring_server.wsgi:app").format(
+        host=host,
+        port=port,
+        nworkers=nworkers,
+        preload="--preload " if preload else "",
+        threads="-k gthread --threads {} ".format(threads) if threads else "")
+
+
 def _execute_in_conda_env(conda_env_path, command, install_mlflow, command_env=None):
     if command_env is None:
         command_env = os.environ
@@ -0,0 +1,244 @@
+"""
+Streaming batch prediction with pyfunc models.
+
+The input is read and scored in chunks of rows, and the predictions of each chunk are appended to
+the output before the next chunks are read, so that inputs larger than memory can be scored.
+Chunks can be scored by several worker processes, each loading the model once; the predictions
+are still written in input order.
+
+Supported input formats are ``csv``, ``jsonl`` (one JSON object per row) and ``parquet``, and
+supported output formats are ``jsonl``, ``csv`` and ``parquet``.
+"""
+import collections
+import logging
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.pyfunc import load_model
+
+INPUT_FORMATS = ["csv", "jsonl", "parquet"]
+OUTPUT_FORMATS = ["jsonl", "csv", "parquet"]
+
+_DEFAULT_CHUNK_SIZE = 10000
+# Minimum time between two progress reports
+_PROGRESS_INTERVAL_SECONDS = 10
+
+_logger = logging.getLogger(__name__)
+
+
+def predict_batch(model_uri, input_path, output_path=None, input_format=None,
+                  output_format=None, chunk_size=_DEFAULT_CHUNK_SIZE, num_workers=1):
+    """
+    Score the rows of a file with a pyfunc model, in chunks, and write the predictions of each
+    chunk as soon as they are available.
+
+    At most ``chunk_size`` rows are read at a time, and at most two chunks per worker are read
+    ahead of the one being written, which bounds the memory used regardless of the input size.
+
+    :param model_uri: URI of the pyfunc model.
+    :param input_path: Path of the input file.
+    :param output_path: Path of the output file. If ``None``, predictions are written to stdout,
+                        which is not supported for the ``parquet`` output format.
+    :param input_format: One of ``csv``, ``jsonl`` and ``parquet``. Inferred from the extension of
+                         ``input_path`` if ``None``.
+    :param output_format: One of ``jsonl``, ``csv`` and ``parquet``. Inferred from the extension of
+                          ``output_path`` if ``None``, defaulting to ``jsonl``.
+    :param chunk_size: Number of rows scored at a time.
+    :param num_workers: Number of processes scoring chunks. If 1, chunks are scored in the
+                        current process.
+    :return: The number of scored rows.
+    """
+    input_format = input_format or _get_format_from_extension(input_path, INPUT_FORMATS)
+    output_format = output_format or \
+        (_get_format_from_extension(output_path, OUTPUT_FORMATS) if output_path else "jsonl")
+    if input_format not in INPUT_FORMATS:
+        raise MlflowException("Unsupported input format '{}'. Supported formats: {}".format(
+            input_format, INPUT_FORMATS), error_code=INVALID_PARAMETER_VALUE)
+    if output_format not in OUTPUT_FORMATS:
+        raise MlflowException("Unsupported output format '{}'. Supported formats: {}".format(
+            output_format, OUTPUT_FORMATS), error_code=INVALID_PARAMETER_VALUE)
+    if output_path is None and output_format == "parquet":
+        raise MlflowException("An output path is required to write Parquet output",
+                              error_code=INVALID_PARAMETER_VALUE)
+    if chunk_size < 1 or num_workers < 1:
+        raise MlflowException("The chunk size and the number of workers must be positive",
+                              error_code=INVALID_PARAMETER_VALUE)
+
+    chunks = _read_chunks(input_path, input_format, chunk_size)
+    writer = _PredictionWriter(output_path, output_format)
+    progress = _ProgressReporter()
+    try:
+        for predictions in _predict_chunks(model_uri, chunks, num_workers):
+            writer.write(predictions)
+            progress.update(len(predictions))
+    finally:
+        writer.close()
+    progress.report_done()
+    return progress.num_rows
+
+
+def _get_format_from_extension(path, formats):
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    extension = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(extension, extension)
+    if extension not in formats:
+        raise MlflowException(
+            "Cannot infer the format of '{}' from its extension. Specify one of {}.".format(
+                path, formats),
+            error_code=INVALID_PARAMETER_VALUE)
+    return extension
+
+
+def _read_chunks(path, input_format, chunk_size):
+    """
+    :return: Iterator over the rows of the input file, as DataFrames of at most ``chunk_size``
+             rows.
+    """
+    if input_format == "csv":
+        return pd.read_csv(path, chunksize=chunk_size)
+    elif input_format == "jsonl":
+        return pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    return _read_parquet_chunks(path, chunk_size)
+
+
+def _read_parquet_chunks(path, chunk_size):
+    import pyarrow.parquet as pq
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+
+def _predict_chunks(model_uri, chunks, num_workers):
+    """
+    :return: Iterator over the predictions of each chunk, in the order of ``chunks``.
+    """
+    if num_workers == 1:
+        model = load_model(model_uri)
+        for chunk in chunks:
+            yield _to_frame(model.predict(chunk))
+        return
+
+    pool = multiprocessing.Pool(num_workers, initializer=_init_worker, initargs=(model_uri,))
+    try:
+        # Keep a bounded number of chunks in flight rather than using Pool.imap, whose task
+        # feeder reads the whole input ahead of the workers
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_predict_in_worker, (chunk,)))
+            if len(pending) >= 2 * num_workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+_worker_model = None
+
+
+def _init_worker(model_uri):
+    global _worker_model  # pylint: disable=global-statement
+    _worker_model = load_model(model_uri)
+
+
+def _predict_in_worker(chunk):
+    return _to_frame(_worker_model.predict(chunk))
+
+
+def _to_frame(predictions):
+    """
+    Convert the predictions of a pyfunc model to a DataFrame with string column names. Predictions
+    with a single unnamed column are returned in a column named ``prediction``.
+    """
+    if isinstance(predictions, pd.DataFrame):
+        df = predictions
+    elif isinstance(predictions, pd.Series):
+        df = predictions.to_frame(predictions.name if predictions.name is not None
+                                  else "prediction")
+    else:
+        predictions = np.asarray(predictions)
+        if predictions.ndim == 1:
+            df = pd.DataFrame({"prediction": predictions})
+        else:
+            df = pd.DataFrame(predictions)
+    df = df.reset_index(drop=True)
+    df.columns = [str(column) for column in df.columns]
+    return df
+
+
+class _PredictionWriter(object):
+    """
+    Appends DataFrames of predictions to a JSON-lines, CSV or Parquet output.
+    """
+
+    def __init__(self, output_path, output_format):
+        self._output_path = output_path
+        self._output_format = output_format
+        self._output = None
+        self._parquet_writer = None
+
+    def write(self, df):
+        if self._output_format == "parquet":
+            self._write_parquet(df)
+            return
+        is_first_chunk = self._output is None
+        if is_first_chunk:
+            self._output = open(self._output_path, "w") if self._output_path else sys.stdout
+        if self._output_format == "csv":
+            df.to_csv(self._output, header=is_first_chunk, index=False)
+        elif len(df) > 0:
+            self._output.write(df.to_json(orient="records", lines=True).rstrip("\n"))
+            self._output.write("\n")
+
+    def _write_parquet(self, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self._parquet_writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._parquet_writer = pq.ParquetWriter(self._output_path, table.schema)
+        else:
+            # Cast the predictions to the types of the first chunk, e.g. if a column of integers
+            # contains missing values in a later chunk
+            table = pa.Table.from_pandas(df, schema=self._parquet_writer.schema,
+                                         preserve_index=False)
+        self._parquet_writer.write_table(table)
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        elif self._output is not None and self._output is not sys.stdout:
+            self._output.close()
+        elif self._output is not None:
+            self._output.flush()
+
+
+class _ProgressReporter(object):
+    def __init__(self):
+        self.num_rows = 0
+        self.num_chunks = 0
+        self._start = time.time()
+        self._last_report = self._start
+
+    def update(self, num_rows):
+        self.num_rows += num_rows
+        self.num_chunks += 1
+        now = time.time()
+        if now - self._last_report >= _PROGRESS_INTERVAL_SECONDS:
+            self._last_report = now
+            self._report("Scored", now)
+
+    def report_done(self):
+        self._report("Done. Scored", time.time())
+
+    def _report(self, prefix, now):
+        elapsed = now - self._start
+        _logger.info("%s %d rows in %d chunks in %.1f seconds (%.0f rows/second)",
+                     prefix, self.num_rows, self.num_chunks, elapsed,
+                     self.num_rows / elapsed if elapsed > 0 else 0)
@@ -3,8 +3,10 @@ The ``mlflow.pyfunc.model`` module defines logic for saving and loading custom "
 models with a user-defined ``PythonModel`` subclass.
 """
 
+import inspect
 import os
 import shutil
+import threading
 import yaml
 from abc import ABCMeta, abstractmethod
 
@@ -14,6 +16,7 @@ import mlflow.pyfunc
 import mlflow.utils
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
+from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_ALREADY_EXISTS
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
@@ -72,6 +75,10 @@ class PythonModel(object):
         Evaluates a pyfunc-compatible input and produces a pyfunc-compatible output.
         For more information about the pyfunc input/output API, see the :ref:`pyfunc-inference-api`.
 
+        On Python 3.5 and later, this method may be a coroutine (``async def predict(...)``), e.g.
+        to await calls to other services. Coroutines are run on an event loop shared by all
+        threads of the process, so that concurrent predictions wait on their I/O concurrently.
+
         :param context: A :class:`~PythonModelContext` instance containing artifacts that the model
                         can use to perform inference.
         :param model_input: A pyfunc-compatible input for the model to evaluate.
@@ -104,7 +111,8 @@ class PythonModelContext(object):
 
 
 def _save_model_with_class_artifacts_params(path, python_model, artifacts=None, conda_env=None,
-                                            code_paths=None, mlflow_model=Model()):
+                                            code_paths=None, mlflow_model=Model(),
+                                            input_example=None):
     """
     :param path: The path to which to save the Python model.
     :param python_model: An instance of a subclass of :class:`~PythonModel`. ``python_model``
@@ -125,6 +133,7 @@ def _save_model_with_class_artifacts_params(path, python_model, artifacts=None,
                        containing file dependencies). These files are *prepended* to the system
                        path before the model is loaded.
     :param mlflow_model: The model configuration to which to add the ``mlflow.pyfunc`` flavor.
+    :param input_example: Example of the model input to store with the model.
     """
     if os.path.exists(path):
         raise MlflowException(
@@ -184,6 +193,7 @@ def _save_model_with_class_artifacts_params(path, python_model, artifacts=None,
 
     mlflow.pyfunc.add_to_model(model=mlflow_model, loader_module=__name__, code=saved_code_subpath,
                                env=conda_env_subpath, **custom_model_config_kwargs)
+    _save_example(mlflow_model, input_example, path)
     mlflow_model.save(os.path.join(path, 'MLmodel'))
 
 
@@ -240,4 +250,47 @@ class _PythonModelPyfuncWrapper(object):
         self.context = context
 
     def predict(self, model_input):
+        if _is_coroutine_function(self.python_model.predict):
+            return _run_coroutine(self.python_model.predict(self.context, model_input))
         return self.python_model.predict(self.context, model_input)
+
+
+# Event loop running the coroutines of PythonModels with an asynchronous ``predict``, in a
+# background thread, and the ID of the process that started it. Each process starts its own, as
+# threads do not survive fork(). The loop is started under the lock so that concurrent first
+# predictions do not each start a loop.
+_event_loop = None
+_event_loop_pid = None
+_event_loop_lock = threading.Lock()
+
+
+def _is_coroutine_function(func):
+    is_coroutine_function = getattr(inspect, "iscoroutinefunction", None)
+    return is_coroutine_function is not None and is_coroutine_function(func)
+
+
+def _start_event_loop():
+    import asyncio
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="mlflow-pyfunc-event-loop")
+    thread.daemon = True
+    thread.start()
+    return loop
+
+
+def _get_event_loop():
+    global _event_loop, _event_loop_pid
+    if _event_loop_pid != os.getpid():
+        with _event_loop_lock:
+            if _event_loop_pid != os.getpid():
+                _event_loop = _start_event_loop()
+                _event_loop_pid = os.getpid()
+    return _event_loop
+
+
+def _run_coroutine(coroutine):
+    """
+    Run ``coroutine`` on the background event loop and wait for its result.
+    """
+    import asyncio
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_event_loop()).result()
@@ -0,0 +1,324 @@
+"""
+Caching of loaded pyfunc models, so that repeatedly loading the same model in a process, or in
+successive processes on the same machine, does not download and deserialize it every time.
+
+Two levels of caching are available:
+
+- An in-memory, least recently used cache of loaded models, used by
+  :py:func:`mlflow.pyfunc.load_model` when called with ``use_cache=True``. Its size is set by the
+  ``MLFLOW_PYFUNC_MODEL_CACHE_SIZE`` environment variable.
+- An on-disk cache of downloaded and validated model directories, enabled by setting the
+  ``MLFLOW_PYFUNC_MODEL_CACHE_DIR`` environment variable to a local directory. A process loading a
+  model found in this cache reads it from the cache directory instead of downloading it, and skips
+  the checks already performed when the model was added to the cache.
+
+Cache entries are keyed by the resolved URI of the model (e.g. the artifact location that a
+``runs:/`` URI refers to) and by a fingerprint of its files: their paths and sizes, and for local
+models their modification times. Models whose files change are therefore loaded again rather than
+served from the cache.
+"""
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import shutil
+import tempfile
+
+from six.moves import urllib
+
+from mlflow.store.artifact_repository_registry import get_artifact_repository
+from mlflow.utils import PYTHON_VERSION, get_major_minor_py_version
+from mlflow.utils.cache_utils import ProcessLocalCache
+from mlflow.utils.file_utils import get_local_path_or_none
+
+# Maximum number of models kept in memory by mlflow.pyfunc.load_model(use_cache=True)
+CACHE_SIZE_ENV_VAR = "MLFLOW_PYFUNC_MODEL_CACHE_SIZE"
+# Local directory in which downloaded models are cached across processes
+CACHE_DIR_ENV_VAR = "MLFLOW_PYFUNC_MODEL_CACHE_DIR"
+
+_DEFAULT_CACHE_SIZE = 4
+# File written in an on-disk cache entry once the model has been downloaded and validated
+_CACHE_ENTRY_INFO_FILE_NAME = "cache_entry.json"
+_CACHE_ENTRY_MODEL_DIR_NAME = "model"
+_TMP_ENTRY_PREFIX = ".tmp"
+
+_logger = logging.getLogger(__name__)
+
+
+class ModelCache(object):
+    """
+    In-memory, least recently used cache of loaded models.
+
+    Each entry stores the fingerprint of the model it was loaded from, and a lookup with a
+    different fingerprint misses, so that a model whose files changed is loaded again. Loaded
+    models (e.g. TensorFlow sessions or PyTorch thread pools) are generally not safe to share
+    across ``fork()``, so entries are only visible to the process that loaded them.
+
+    :param max_size: Maximum number of models to keep. If ``None``, the cache is unbounded.
+    """
+
+    def __init__(self, max_size=None):
+        self._models = ProcessLocalCache(max_size=max_size)
+        self.num_hits = 0
+
+    def get(self, key, fingerprint=None):
+        """
+        :return: The model cached under ``key`` with the given ``fingerprint``, or ``None``.
+        """
+        entry = self._models.get(key)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        self.num_hits += 1
+        return entry[1]
+
+    def put(self, key, model, fingerprint=None):
+        """
+        Cache ``model`` under ``key``, replacing any model previously cached under ``key``.
+        """
+        self._models.put(key, (fingerprint, model))
+
+    def get_or_load(self, key, load_fn, fingerprint=None):
+        """
+        :return: The model cached under ``key`` with the given ``fingerprint``, calling
+                 ``load_fn()`` to load and cache it on a miss.
+        """
+        model = self.get(key, fingerprint)
+        if model is None:
+            model = load_fn()
+            self.put(key, model, fingerprint)
+        return model
+
+    def invalidate(self, key=None):
+        """
+        Remove the model cached under ``key``, or all models if ``key`` is ``None``.
+        """
+        if key is None:
+            self._models.clear()
+        else:
+            self._models.pop(key)
+
+    def __len__(self):
+        return len(self._models)
+
+
+class DiskModelCache(object):
+    """
+    Cache of downloaded and validated model directories in a local directory, which may be
+    shared by several processes.
+
+    Each entry is a subdirectory named after the resolved URI and fingerprint of the model. It is
+    populated in a temporary directory that is renamed into place once the model has been
+    downloaded and validated, so that concurrent processes never load a partially written entry.
+
+    :param cache_dir: Local directory holding the cache entries. Created if it does not exist.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+
+    def get_or_download(self, resolved_uri, fingerprint, validate_fn):
+        """
+        :param resolved_uri: Resolved URI of the model, as returned by
+                             :py:func:`resolve_model_uri`.
+        :param fingerprint: Fingerprint of the model, as returned by
+                            :py:func:`get_model_fingerprint`.
+        :param validate_fn: Function called with the local path of a newly downloaded model, or of
+                            a cached model validated by another Python version. Returns a
+                            JSON-serializable value (e.g. the flavor configuration) stored with
+                            the entry. Exceptions it raises are propagated, and nothing is
+                            cached.
+        :return: Tuple of the local path of the model in the cache and the value returned by
+                 ``validate_fn`` when the entry was added.
+        """
+        from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+
+        entry_dir = os.path.join(self.cache_dir, _get_entry_name(resolved_uri, fingerprint))
+        local_model_path = os.path.join(entry_dir, _CACHE_ENTRY_MODEL_DIR_NAME)
+        entry_info = _read_entry_info(entry_dir)
+        if entry_info is not None:
+            if get_major_minor_py_version(entry_info["python_version"]) != \
+                    get_major_minor_py_version(PYTHON_VERSION):
+                return local_model_path, validate_fn(local_model_path)
+            return local_model_path, entry_info["validation"]
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        tmp_entry_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=_TMP_ENTRY_PREFIX)
+        try:
+            tmp_model_path = os.path.join(tmp_entry_dir, _CACHE_ENTRY_MODEL_DIR_NAME)
+            downloaded_path = _download_artifact_from_uri(resolved_uri, output_path=tmp_entry_dir)
+            if downloaded_path != tmp_model_path:
+                os.rename(downloaded_path, tmp_model_path)
+            validation = validate_fn(tmp_model_path)
+            with open(os.path.join(tmp_entry_dir, _CACHE_ENTRY_INFO_FILE_NAME), "w") as f:
+                json.dump({"model_uri": resolved_uri, "fingerprint": fingerprint,
+                           "python_version": PYTHON_VERSION, "validation": validation}, f)
+            try:
+                os.rename(tmp_entry_dir, entry_dir)
+            except OSError:
+                # Another process added the same entry first
+                if _read_entry_info(entry_dir) is None:
+                    raise
+        finally:
+            shutil.rmtree(tmp_entry_dir, ignore_errors=True)
+        _logger.info("Added model '%s' to the model cache in %s", resolved_uri, self.cache_dir)
+        return local_model_path, validation
+
+    def invalidate(self, resolved_uri=None):
+        """
+        Remove the cached models downloaded from ``resolved_uri``, or all cached models if
+        ``resolved_uri`` is ``None``.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry_name in os.listdir(self.cache_dir):
+            if entry_name.startswith(_TMP_ENTRY_PREFIX):
+                # Entry being added by another process
+                continue
+            entry_dir = os.path.join(self.cache_dir, entry_name)
+            if resolved_uri is not None:
+                entry_info = _read_entry_info(entry_dir)
+                if entry_info is None or entry_info["model_uri"] != resolved_uri:
+                    continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def _get_entry_name(resolved_uri, fingerprint):
+    return hashlib.sha256(
+        json.dumps([resolved_uri, fingerprint]).encode("utf-8")).hexdigest()[:40]
+
+
+def _read_entry_info(entry_dir):
+    """
+    :return: The information stored in a complete on-disk cache entry, or ``None`` if the entry
+             does not exist or is being written.
+    """
+    try:
+        with open(os.path.join(entry_dir, _CACHE_ENTRY_INFO_FILE_NAME)) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def resolve_model_uri(model_uri):
+    """
+    :return: The URI of the location that ``model_uri`` refers to: the absolute path of local
+             models, and the underlying artifact location of ``runs:/`` URIs.
+    """
+    local_path = get_local_path_or_none(model_uri)
+    if local_path is not None:
+        return os.path.abspath(local_path)
+    if urllib.parse.urlparse(model_uri).scheme == "runs":
+        from mlflow.store.runs_artifact_repo import RunsArtifactRepository
+        return RunsArtifactRepository.get_underlying_uri(
+            *RunsArtifactRepository.parse_runs_uri(model_uri))
+    return model_uri
+
+
+def get_model_fingerprint(resolved_uri):
+    """
+    Compute a fingerprint of the files of a model without downloading them: a hash of the paths
+    and sizes of the files, and of their modification times for local models.
+
+    :param resolved_uri: Resolved URI of the model, as returned by :py:func:`resolve_model_uri`.
+    """
+    if os.path.isdir(resolved_uri):
+        files = []
+        for root, _, file_names in os.walk(resolved_uri):
+            for file_name in file_names:
+                path = os.path.join(root, file_name)
+                stat = os.stat(path)
+                files.append((os.path.relpath(path, resolved_uri), stat.st_size, stat.st_mtime))
+    elif os.path.isfile(resolved_uri):
+        stat = os.stat(resolved_uri)
+        files = [(os.path.basename(resolved_uri), stat.st_size, stat.st_mtime)]
+    else:
+        files = _list_remote_files(get_artifact_repository(resolved_uri))
+    return hashlib.sha256(json.dumps(sorted(files)).encode("utf-8")).hexdigest()
+
+
+def _list_remote_files(repo, path=None):
+    files = []
+    for file_info in repo.list_artifacts(path):
+        if file_info.is_dir:
+            files.extend(_list_remote_files(repo, file_info.path))
+        else:
+            files.append((posixpath.normpath(file_info.path), file_info.file_size))
+    return files
+
+
+_in_memory_cache = None
+
+
+def _get_in_memory_cache():
+    global _in_memory_cache  # pylint: disable=global-statement
+    if _in_memory_cache is None:
+        _in_memory_cache = ModelCache(
+            max_size=int(os.environ.get(CACHE_SIZE_ENV_VAR, _DEFAULT_CACHE_SIZE)))
+    return _in_memory_cache
+
+
+def get_disk_cache_from_env():
+    """
+    :return: A :py:class:`DiskModelCache` in the directory given by the
+             ``MLFLOW_PYFUNC_MODEL_CACHE_DIR`` environment variable, or ``None`` if it is not set.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    return DiskModelCache(cache_dir) if cache_dir else None
+
+
+def load_model(model_uri, suppress_warnings=False, use_cache=True):
+    """
+    Load a pyfunc model through the model caches. Models are looked up in the in-memory cache if
+    ``use_cache`` is ``True``, and then in the on-disk cache if ``MLFLOW_PYFUNC_MODEL_CACHE_DIR``
+    is set.
+    """
+    from mlflow.pyfunc import _load_model_from_local_path  # pylint: disable=cyclic-import
+    from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+
+    resolved_uri = resolve_model_uri(model_uri)
+    fingerprint = get_model_fingerprint(resolved_uri)
+    disk_cache = get_disk_cache_from_env()
+
+    def load():
+        if disk_cache is None or get_local_path_or_none(resolved_uri) is not None:
+            # Local models are read in place rather than copied to the on-disk cache
+            return _load_model_from_local_path(_download_artifact_from_uri(resolved_uri),
+                                               suppress_warnings=suppress_warnings)
+        local_model_path, conf = disk_cache.get_or_download(
+            resolved_uri, fingerprint,
+            validate_fn=lambda path: _validate_model(path, suppress_warnings))
+        return _load_model_from_local_path(local_model_path, conf=conf,
+                                           suppress_warnings=True)
+
+    if not use_cache:
+        return load()
+    return _get_in_memory_cache().get_or_load(resolved_uri, load, fingerprint)
+
+
+def _validate_model(local_model_path, suppress_warnings):
+    from mlflow.pyfunc import FLAVOR_NAME, PY_VERSION, \
+        _warn_potentially_incompatible_py_version_if_necessary  # pylint: disable=cyclic-import
+    from mlflow.utils.model_utils import _get_flavor_configuration
+
+    conf = _get_flavor_configuration(model_path=local_model_path, flavor_name=FLAVOR_NAME)
+    if not suppress_warnings:
+        _warn_potentially_incompatible_py_version_if_necessary(
+            model_py_version=conf.get(PY_VERSION))
+    return conf
+
+
+def invalidate(model_uri=None):
+    """
+    Remove a model from the in-memory cache of this process and from the on-disk cache, if
+    enabled, so that it is downloaded and loaded again the next time it is loaded through the
+    cache.
+
+    :param model_uri: URI of the model to remove. If ``None``, all cached models are removed.
+    """
+    resolved_uri = resolve_model_uri(model_uri) if model_uri is not None else None
+    _get_in_memory_cache().invalidate(resolved_uri)
+    disk_cache = get_disk_cache_from_env()
+    if disk_cache is not None:
+        disk_cache.invalidate(resolved_uri)
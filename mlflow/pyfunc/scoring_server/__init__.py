@@ -3,24 +3,28 @@ Scoring server for python model format.
 The passed int model is expected to have function:
    predict(pandas.Dataframe) -> pandas.DataFrame
 
-Input, expected intext/csv or application/json format,
-is parsed into pandas.DataFrame and passed to the model.
+Input, expected intext/csv or application/json format, or as an Apache Arrow IPC stream or a
+NumPy .npy file, is parsed into pandas.DataFrame and passed to the model.
 
-Defines two endpoints:
+Defines three endpoints:
     /ping used for health check
     /invocations used for scoring
+    /metrics used for monitoring, in the Prometheus text format
 """
 from __future__ import print_function
 
 from collections import OrderedDict
 import flask
+import importlib
 import json
 from json import JSONEncoder
 import logging
 import numpy as np
+import os
 import pandas as pd
 from six import reraise
 import sys
+import time
 import traceback
 
 # NB: We need to be careful what we import form mlflow here. Scoring server is used from within
@@ -34,30 +38,62 @@ try:
     from mlflow.pyfunc import load_model
 except ImportError:
     from mlflow.pyfunc import load_pyfunc as load_model
-from mlflow.protos.databricks_pb2 import MALFORMED_REQUEST, BAD_REQUEST
+from mlflow.protos.databricks_pb2 import MALFORMED_REQUEST, BAD_REQUEST, INVALID_PARAMETER_VALUE, \
+    INTERNAL_ERROR, ErrorCode
+from mlflow.pyfunc.scoring_server.batching import get_batcher_from_env
+from mlflow.pyfunc.scoring_server.executor import get_executor_from_env, \
+    PredictionRejectedException
+from mlflow.pyfunc.scoring_server.metrics import get_metrics_registry_from_env, \
+    ScoringServerMetrics, PROMETHEUS_CONTENT_TYPE
+from mlflow.pyfunc.scoring_server.multi_model import LazyModelCache
+from mlflow.pyfunc.scoring_server.warmup import get_warmup_from_env, is_warmup_enabled, \
+    WARMUP_INPUT_ENV_VAR
 from mlflow.server.handlers import catch_mlflow_exception
 
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
+from io import BytesIO
 
 _SERVER_MODEL_PATH = "__pyfunc_model_path__"
+# JSON dictionary mapping names to URIs of models served together by a multi-model server
+_SERVER_MODEL_URIS = "__pyfunc_model_uris__"
+_SERVER_MAX_LOADED_MODELS = "__pyfunc_max_loaded_models__"
+_SERVER_PRELOAD = "__pyfunc_preload__"
 
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
 CONTENT_TYPE_JSON_RECORDS_ORIENTED = "application/json; format=pandas-records"
 CONTENT_TYPE_JSON_SPLIT_ORIENTED = "application/json; format=pandas-split"
 CONTENT_TYPE_JSON_SPLIT_NUMPY = "application/json-numpy-split"
+CONTENT_TYPE_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_NPY = "application/x-npy"
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_JSON_RECORDS_ORIENTED,
     CONTENT_TYPE_JSON_SPLIT_ORIENTED,
-    CONTENT_TYPE_JSON_SPLIT_NUMPY
+    CONTENT_TYPE_JSON_SPLIT_NUMPY,
+    CONTENT_TYPE_ARROW_STREAM,
+    CONTENT_TYPE_NPY,
 ]
 
+# Predictions are returned as JSON unless the request's Accept header prefers one of these
+RESPONSE_CONTENT_TYPES = [
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_NPY,
+    CONTENT_TYPE_ARROW_STREAM,
+]
+
+# Library used to serialize predictions to JSON: one of "json" (the default, the standard
+# library's json module), "orjson", "ujson" or "auto", which uses orjson or ujson if installed and
+# json otherwise. orjson and ujson are faster, but may serialize some values differently, e.g.
+# orjson writes NaN and infinity as null
+JSON_BACKEND_ENV_VAR = "MLFLOW_SCORING_SERVER_JSON_BACKEND"
+_JSON_BACKENDS = ["auto", "json", "orjson", "ujson"]
+
 _logger = logging.getLogger(__name__)
 
 
@@ -120,9 +156,166 @@ def parse_split_oriented_json_input_to_numpy(json_input):
             error_code=MALFORMED_REQUEST)
 
 
+def parse_arrow_stream_input(arrow_input):
+    """
+    :param arrow_input: Bytes containing a table serialized in the Apache Arrow IPC streaming
+                        format, for example using ``pyarrow.ipc.new_stream``. The columns are
+                        converted in bulk, without materializing Python objects for numeric
+                        values.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise MlflowException(
+            message=("Scoring Apache Arrow input requires the 'pyarrow' package, which is not"
+                     " installed in the model's environment."),
+            error_code=BAD_REQUEST)
+    # pylint: disable=broad-except
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(arrow_input)).read_all()
+        return table.to_pandas()
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as an Apache Arrow IPC stream. Ensure that the input is"
+                " a table serialized in the Arrow streaming format, e.g. with"
+                " `pyarrow.ipc.new_stream`."),
+            error_code=MALFORMED_REQUEST)
+
+
+def parse_npy_input(npy_input):
+    """
+    :param npy_input: Bytes containing a one- or two-dimensional array in the NumPy ``.npy``
+                      format, for example as written by ``numpy.save``. Object arrays are not
+                      accepted. Unless the array is structured, the returned DataFrame is backed
+                      by a read-only view of ``npy_input``. A one-dimensional array is treated as
+                      a single column.
+    """
+    # pylint: disable=broad-except
+    try:
+        stream = BytesIO(npy_input)
+        version = np.lib.format.read_magic(stream)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+        if dtype.hasobject or len(shape) not in (1, 2):
+            raise ValueError("Unsupported array with dtype %s and shape %s" % (dtype, shape))
+        count = int(np.prod(shape))
+        array = np.frombuffer(npy_input, dtype=dtype, count=count, offset=stream.tell())
+        array = array.reshape(shape, order="F" if fortran_order else "C")
+        if dtype.names is not None:
+            return pd.DataFrame(array)
+        return pd.DataFrame(array.reshape(-1, 1) if array.ndim == 1 else array, copy=False)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a NumPy array. Ensure that the input is a one- or"
+                " two-dimensional array of a non-object dtype in the .npy format, e.g. as"
+                " produced by `numpy.save`."),
+            error_code=MALFORMED_REQUEST)
+
+
 def predictions_to_json(raw_predictions, output):
-    predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
-    json.dump(predictions, output, cls=NumpyEncoder)
+    """
+    Write predictions to the text stream ``output`` as JSON. DataFrames are serialized in the
+    ``records`` orientation.
+    """
+    output.write(_dumps_predictions(raw_predictions))
+
+
+def predictions_to_npy(raw_predictions, output):
+    """
+    Write predictions to the binary stream ``output`` in the NumPy ``.npy`` format. DataFrames
+    whose columns have different dtypes are written as structured arrays with one field per
+    column. Predictions that can only be represented as object arrays are rejected.
+    """
+    if isinstance(raw_predictions, pd.DataFrame):
+        if len(set(raw_predictions.dtypes)) > 1:
+            array = raw_predictions.to_records(index=False)
+        else:
+            array = raw_predictions.values
+    else:
+        array = np.asarray(raw_predictions)
+    if array.dtype.hasobject:
+        raise MlflowException(
+            message=("Predictions of dtype {dtype} cannot be returned in the .npy format. Request"
+                     " a JSON response instead.".format(dtype=array.dtype)),
+            error_code=BAD_REQUEST)
+    np.save(output, array, allow_pickle=False)
+
+
+def predictions_to_arrow_stream(raw_predictions, output):
+    """
+    Write predictions to the binary stream ``output`` as a table in the Apache Arrow IPC streaming
+    format. Series and arrays are converted to a DataFrame first.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise MlflowException(
+            message=("Returning predictions in the Apache Arrow format requires the 'pyarrow'"
+                     " package, which is not installed in the model's environment."),
+            error_code=BAD_REQUEST)
+    df = raw_predictions if isinstance(raw_predictions, pd.DataFrame) \
+        else pd.DataFrame(raw_predictions)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    writer = pa.ipc.new_stream(output, table.schema)
+    writer.write_table(table)
+    writer.close()
+
+
+def _get_json_backend():
+    """
+    :return: Tuple of the name and module of the JSON library selected through the
+             ``MLFLOW_SCORING_SERVER_JSON_BACKEND`` environment variable.
+    """
+    backend = os.environ.get(JSON_BACKEND_ENV_VAR, "json")
+    if backend not in _JSON_BACKENDS:
+        raise MlflowException("Invalid value '{backend}' for {env_var}. Must be one of {backends}"
+                              .format(backend=backend, env_var=JSON_BACKEND_ENV_VAR,
+                                      backends=_JSON_BACKENDS),
+                              error_code=INVALID_PARAMETER_VALUE)
+    candidates = ["orjson", "ujson"] if backend == "auto" else [backend]
+    for name in candidates:
+        if name == "json":
+            break
+        try:
+            return name, importlib.import_module(name)
+        except ImportError:
+            if backend != "auto":
+                raise MlflowException("{env_var} is set to '{backend}', which is not installed"
+                                      .format(env_var=JSON_BACKEND_ENV_VAR, backend=backend),
+                                      error_code=INVALID_PARAMETER_VALUE)
+    return "json", json
+
+
+def _dumps_predictions(raw_predictions):
+    name, module = _get_json_backend()
+    if name == "orjson":
+        # orjson serializes numpy arrays and scalars natively, without converting them to Python
+        # objects first
+        options = module.OPT_SERIALIZE_NUMPY
+        if isinstance(raw_predictions, np.ndarray):
+            try:
+                return module.dumps(raw_predictions, option=options).decode("utf-8")
+            except TypeError:
+                # E.g. non-contiguous arrays or unsupported dtypes, which are converted to lists
+                pass
+        predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
+        try:
+            return module.dumps(predictions, option=options).decode("utf-8")
+        except TypeError:
+            pass
+    else:
+        predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
+        if name == "ujson":
+            try:
+                return module.dumps(predictions)
+            except (TypeError, ValueError, OverflowError):
+                # E.g. NaN values or numpy scalars in object columns
+                pass
+    return json.dumps(predictions, cls=NumpyEncoder)
 
 
 def _handle_serving_error(error_message, error_code):
@@ -144,22 +337,62 @@ def _handle_serving_error(error_message, error_code):
                 stack_trace=traceback_buf.getvalue()))
 
 
-def init(model):
+def init(model, warmup_input=None, block_on_warmup=False):
     """
     Initialize the server. Loads pyfunc model from the path.
+
+    If the ``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE`` environment variable is set, concurrent
+    requests are scored together in batches of up to that many rows (see
+    :py:class:`mlflow.pyfunc.scoring_server.batching.MicroBatcher`).
+
+    If any of the ``MLFLOW_SCORING_SERVER_PREDICT_THREADS``,
+    ``MLFLOW_SCORING_SERVER_MAX_CONCURRENT_REQUESTS`` or
+    ``MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT_SECONDS`` environment variables is set, predictions run
+    in a thread pool, with a limit on concurrent predictions and a timeout (see
+    :py:class:`mlflow.pyfunc.scoring_server.executor.PredictExecutor`).
+
+    If the ``MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS`` environment variable is set, the model
+    scores ``warmup_input`` that many times before ``/ping`` reports the server as healthy (see
+    :py:class:`mlflow.pyfunc.scoring_server.warmup.ModelWarmup`).
+
+    :param warmup_input: pandas DataFrame used to warm up the model, e.g. as returned by
+                         :py:func:`load_warmup_input`.
+    :param block_on_warmup: If ``True``, warm up the model before returning rather than in the
+                            background.
     """
+    # Fail on startup, rather than on every request, if the JSON backend is invalid
+    _get_json_backend()
     app = flask.Flask(__name__)
+    metrics_registry = get_metrics_registry_from_env()
+    scoring_metrics = ScoringServerMetrics(metrics_registry)
+    batcher = get_batcher_from_env(model.predict, metrics_registry) if model is not None else None
+    predict = batcher.predict if batcher is not None else getattr(model, "predict", None)
+    executor = get_executor_from_env(predict) if model is not None else None
+    predict = executor.predict if executor is not None else predict
+    warmup = get_warmup_from_env(model.predict, warmup_input) if model is not None else None
+    if warmup is not None:
+        warmup.start(block=block_on_warmup)
 
     @app.route('/ping', methods=['GET'])
     def ping():  # pylint: disable=unused-variable
         """
         Determine if the container is working and healthy.
-        We declare it healthy if we can load the model successfully.
+        We declare it healthy if we can load the model successfully and its warm-up, if any, is
+        done.
         """
-        health = model is not None
-        status = 200 if health else 404
+        if model is None:
+            status = 404
+        elif warmup is not None and not warmup.is_ready():
+            status = 503
+        else:
+            status = 200
         return flask.Response(response='\n', status=status, mimetype='application/json')
 
+    @app.route('/metrics', methods=['GET'])
+    def metrics():  # pylint: disable=unused-variable
+        return flask.Response(response=metrics_registry.expose(), status=200,
+                              mimetype=PROMETHEUS_CONTENT_TYPE)
+
     @app.route('/invocations', methods=['POST'])
     @catch_mlflow_exception
     def transformation():  # pylint: disable=unused-variable
@@ -168,20 +401,152 @@ def init(model):
         we take data as CSV or json, convert it to a Pandas DataFrame or Numpy,
         generate predictions and convert them back to json.
         """
-        # Convert from CSV to pandas
-        if flask.request.content_type == CONTENT_TYPE_CSV:
-            data = flask.request.data.decode('utf-8')
-            csv_input = StringIO(data)
-            data = parse_csv_input(csv_input=csv_input)
-        elif flask.request.content_type in [CONTENT_TYPE_JSON, CONTENT_TYPE_JSON_SPLIT_ORIENTED]:
-            data = parse_json_input(json_input=flask.request.data.decode('utf-8'),
-                                    orient="split")
-        elif flask.request.content_type == CONTENT_TYPE_JSON_RECORDS_ORIENTED:
-            data = parse_json_input(json_input=flask.request.data.decode('utf-8'),
-                                    orient="records")
-        elif flask.request.content_type == CONTENT_TYPE_JSON_SPLIT_NUMPY:
-            data = parse_split_oriented_json_input_to_numpy(flask.request.data.decode('utf-8'))
-        else:
+        return _score_request(predict, scoring_metrics)
+
+    return app
+
+
+def load_warmup_input(model_path):
+    """
+    Load the input used to warm up a served model: the file given by the
+    ``MLFLOW_SCORING_SERVER_WARMUP_INPUT`` environment variable if it is set, and the input example
+    stored with the model otherwise.
+
+    The warm-up input file is read according to its extension: ``.csv``, ``.json`` (a pandas
+    DataFrame in the ``split`` orientation), ``.npy`` or ``.arrow`` (an Apache Arrow IPC stream).
+
+    :param model_path: Local path, or local file URI, of the served model.
+    :return: The warm-up input as a pandas DataFrame, or ``None`` if there is none.
+    """
+    input_path = os.environ.get(WARMUP_INPUT_ENV_VAR)
+    if input_path:
+        return _read_input_file(input_path)
+    try:
+        from mlflow.models import Model
+        from mlflow.models.utils import _read_example
+    except ImportError:
+        # Older versions of mlflow, in the model's environment, do not store input examples
+        return None
+    from mlflow.utils.file_utils import local_file_uri_to_path
+    model_path = local_file_uri_to_path(model_path)
+    return _read_example(Model.load(model_path), model_path)
+
+
+def _read_input_file(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return parse_csv_input(path)
+    elif extension == ".json":
+        with open(path) as f:
+            return parse_json_input(f.read(), orient="split")
+    elif extension in [".npy", ".arrow"]:
+        with open(path, "rb") as f:
+            data = f.read()
+        return parse_npy_input(data) if extension == ".npy" else parse_arrow_stream_input(data)
+    raise MlflowException(
+        message="Unsupported input file '{}'. Expected a .csv, .json, .npy or .arrow file.".format(
+            path),
+        error_code=INVALID_PARAMETER_VALUE)
+
+
+def init_multi_model(model_uris, max_loaded_models=None, preload=False):
+    """
+    Initialize a server hosting several models, each scored at ``/models/<name>/invocations``.
+
+    Models are loaded on their first request and, if ``max_loaded_models`` is set, the least
+    recently used model is unloaded when loading another one would exceed that number.
+
+    :param model_uris: Dictionary mapping model names to the URIs of the models.
+    :param max_loaded_models: Maximum number of models loaded at the same time. Unlimited if
+                              ``None``.
+    :param preload: If ``True``, load models (up to ``max_loaded_models``) immediately rather than
+                    on their first request. Servers that create the application before forking
+                    worker processes (e.g. gunicorn with ``--preload``) then share the memory of
+                    these models between workers.
+    """
+    # Fail on startup, rather than on every request, if the JSON backend is invalid
+    _get_json_backend()
+    app = flask.Flask(__name__)
+    metrics_registry = get_metrics_registry_from_env()
+    scoring_metrics = ScoringServerMetrics(metrics_registry)
+    models = LazyModelCache(model_uris, max_loaded_models, load_model, metrics_registry)
+    if preload:
+        models.preload()
+
+    @app.route('/ping', methods=['GET'])
+    def ping():  # pylint: disable=unused-variable
+        return flask.Response(response='\n', status=200, mimetype='application/json')
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics():  # pylint: disable=unused-variable
+        return flask.Response(response=metrics_registry.expose(), status=200,
+                              mimetype=PROMETHEUS_CONTENT_TYPE)
+
+    @app.route('/models', methods=['GET'])
+    def list_models():  # pylint: disable=unused-variable
+        return flask.Response(response=json.dumps({"models": models.describe()}), status=200,
+                              mimetype='application/json')
+
+    @app.route('/models/<name>/invocations', methods=['POST'])
+    @catch_mlflow_exception
+    def model_transformation(name):  # pylint: disable=unused-variable
+        return _score_request(models.get_predict_fn(name), scoring_metrics)
+
+    return app
+
+
+def _get_input_parser(content_type):
+    """
+    :return: Function parsing a request body of the given content type into the input of the
+             model, or ``None`` if the content type is not supported.
+    """
+    if content_type == CONTENT_TYPE_CSV:
+        return lambda body: parse_csv_input(csv_input=StringIO(body.decode('utf-8')))
+    elif content_type in [CONTENT_TYPE_JSON, CONTENT_TYPE_JSON_SPLIT_ORIENTED]:
+        return lambda body: parse_json_input(json_input=body.decode('utf-8'), orient="split")
+    elif content_type == CONTENT_TYPE_JSON_RECORDS_ORIENTED:
+        return lambda body: parse_json_input(json_input=body.decode('utf-8'), orient="records")
+    elif content_type == CONTENT_TYPE_JSON_SPLIT_NUMPY:
+        return lambda body: parse_split_oriented_json_input_to_numpy(body.decode('utf-8'))
+    elif content_type == CONTENT_TYPE_ARROW_STREAM:
+        return parse_arrow_stream_input
+    elif content_type == CONTENT_TYPE_NPY:
+        return parse_npy_input
+    return None
+
+
+def _score_request(predict, metrics):
+    """
+    Parse the input of the current ``/invocations`` request, score it with ``predict`` and
+    serialize the predictions in the format requested by the request's ``Accept`` header.
+
+    :param metrics: :py:class:`mlflow.pyfunc.scoring_server.metrics.ScoringServerMetrics` in which
+                    to record the request.
+    :return: The ``flask.Response`` to the request.
+    """
+    start = time.time()
+    status = 500
+    try:
+        response = _score_request_in_stages(predict, metrics)
+        status = response.status_code
+        return response
+    except MlflowException as e:
+        status = e.get_http_status_code()
+        metrics.errors.inc(error_code=e.error_code)
+        raise
+    except Exception:
+        metrics.errors.inc(error_code=ErrorCode.Name(INTERNAL_ERROR))
+        raise
+    finally:
+        metrics.requests.inc(status=status)
+        metrics.request_duration.observe(time.time() - start)
+        metrics.registry.mark_updated()
+
+
+def _score_request_in_stages(predict, metrics):
+    with metrics.time_stage("dispatch"):
+        parse = _get_input_parser(flask.request.content_type)
+        if parse is None:
             return flask.Response(
                 response=("This predictor only supports the following content types,"
                           " {supported_content_types}. Got '{received_content_type}'.".format(
@@ -189,11 +554,21 @@ def init(model):
                             received_content_type=flask.request.content_type)),
                 status=415,
                 mimetype='text/plain')
+        body = flask.request.get_data()
+    metrics.request_size.observe(len(body))
+
+    # Convert the input to pandas
+    with metrics.time_stage("parse"):
+        data = parse(body)
+    metrics.input_rows.inc(len(data))
 
-        # Do the prediction
+    # Do the prediction
+    with metrics.time_stage("predict"):
         # pylint: disable=broad-except
         try:
-            raw_predictions = model.predict(data)
+            raw_predictions = predict(data)
+        except PredictionRejectedException:
+            raise
         except Exception:
             _handle_serving_error(
                 error_message=(
@@ -201,11 +576,22 @@ def init(model):
                     " that the serialized input Dataframe is compatible with the model for"
                     " inference."),
                 error_code=BAD_REQUEST)
-        result = StringIO()
-        predictions_to_json(raw_predictions, result)
-        return flask.Response(response=result.getvalue(), status=200, mimetype='application/json')
 
-    return app
+    with metrics.time_stage("serialize"):
+        response_content_type = flask.request.accept_mimetypes.best_match(
+            RESPONSE_CONTENT_TYPES, default=CONTENT_TYPE_JSON)
+        if response_content_type == CONTENT_TYPE_NPY:
+            result = BytesIO()
+            predictions_to_npy(raw_predictions, result)
+        elif response_content_type == CONTENT_TYPE_ARROW_STREAM:
+            result = BytesIO()
+            predictions_to_arrow_stream(raw_predictions, result)
+        else:
+            result = StringIO()
+            predictions_to_json(raw_predictions, result)
+        response_body = result.getvalue()
+    metrics.response_size.observe(len(response_body))
+    return flask.Response(response=response_body, status=200, mimetype=response_content_type)
 
 
 def _predict(model_uri, input_path, output_path, content_type, json_format):
@@ -241,7 +627,7 @@ class NumpyEncoder(JSONEncoder):
 
     def default(self, o):  # pylint: disable=E0202
         if isinstance(o, np.generic):
-            return np.asscalar(o)
+            return o.item()
         return JSONEncoder.default(self, o)
 
 
@@ -257,8 +643,22 @@ def _get_jsonable_obj(data, pandas_orient="records"):
     if isinstance(data, np.ndarray):
         return data.tolist()
     if isinstance(data, pd.DataFrame):
+        if pandas_orient == "records":
+            return _dataframe_to_records(data)
         return data.to_dict(orient=pandas_orient)
     if isinstance(data, pd.Series):
-        return pd.DataFrame(data).to_dict(orient=pandas_orient)
+        return _get_jsonable_obj(pd.DataFrame(data), pandas_orient)
     else:  # by default just return whatever this is and hope for the best
         return data
+
+
+def _dataframe_to_records(df):
+    """
+    Equivalent to ``df.to_dict(orient="records")``, but converts each column to Python objects in
+    bulk with ``tolist`` rather than boxing every value as a numpy scalar.
+    """
+    columns = list(df.columns)
+    if len(columns) == 0:
+        return [{} for _ in range(len(df))]
+    column_values = [df.iloc[:, i].tolist() for i in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*column_values)]
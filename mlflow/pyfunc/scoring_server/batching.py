@@ -0,0 +1,221 @@
+"""
+Dynamic micro-batching of scoring requests.
+
+Concurrent requests handled by the same server process are coalesced into a single DataFrame,
+scored with one call to the model's ``predict`` method and the predictions are split back into
+per-request results by row ranges.
+"""
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from six.moves import queue
+
+# Maximum number of rows scored together. Batching is disabled unless this is set.
+MAX_BATCH_SIZE_ENV_VAR = "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE"
+# Maximum time (in milliseconds) that the first request of a batch waits for more requests
+MAX_BATCH_DELAY_MS_ENV_VAR = "MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS"
+_DEFAULT_MAX_BATCH_DELAY_MS = 5
+
+_BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+_QUEUE_DELAY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+_logger = logging.getLogger(__name__)
+
+
+def get_batcher_from_env(predict_fn, metrics_registry=None):
+    """
+    :return: A :py:class:`MicroBatcher` configured through the
+             ``MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE`` and
+             ``MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS`` environment variables, or ``None`` if
+             batching is not enabled.
+    """
+    max_batch_size = os.environ.get(MAX_BATCH_SIZE_ENV_VAR)
+    if not max_batch_size:
+        return None
+    max_batch_delay_ms = float(os.environ.get(MAX_BATCH_DELAY_MS_ENV_VAR,
+                                              _DEFAULT_MAX_BATCH_DELAY_MS))
+    return MicroBatcher(predict_fn, int(max_batch_size), max_batch_delay_ms, metrics_registry)
+
+
+class _PendingRequest(object):
+    def __init__(self, data):
+        self.data = data
+        self.enqueue_time = time.time()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class MicroBatcher(object):
+    """
+    Scores DataFrames submitted concurrently from several threads in batches.
+
+    A background thread takes the oldest pending request and keeps adding requests to its batch
+    until the batch holds ``max_batch_size`` rows or ``max_batch_delay_ms`` milliseconds have
+    passed since the batch was started. Requests whose columns differ from those of the first
+    request in the batch are scored in a separate batch. If scoring a batch fails, or the model
+    does not return one prediction per input row, each of its requests is scored on its own so
+    that errors are reported for the offending requests only.
+
+    :param predict_fn: Function scoring a ``pandas.DataFrame``, e.g. a pyfunc model's ``predict``.
+    :param max_batch_size: Maximum number of rows per batch. A single request with more rows is
+                           scored on its own.
+    :param max_batch_delay_ms: Maximum time to wait for more requests before scoring a batch.
+    :param metrics_registry: If specified, a
+                             :py:class:`mlflow.pyfunc.scoring_server.metrics.MetricsRegistry` in
+                             which to record batch sizes and queue delays.
+    """
+
+    def __init__(self, predict_fn, max_batch_size, max_batch_delay_ms=_DEFAULT_MAX_BATCH_DELAY_MS,
+                 metrics_registry=None):
+        self._predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay_ms = max_batch_delay_ms
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._closed = False
+        self.batch_size = None
+        self.queue_delay = None
+        if metrics_registry is not None:
+            self.batch_size = metrics_registry.histogram(
+                "mlflow_scoring_server_batch_size_rows",
+                "Number of rows scored together by one call to predict.",
+                _BATCH_SIZE_BUCKETS)
+            self.queue_delay = metrics_registry.histogram(
+                "mlflow_scoring_server_batch_queue_delay_seconds",
+                "Time between a request being queued and its batch being scored.",
+                _QUEUE_DELAY_BUCKETS)
+
+    def _get_queue(self):
+        # The worker thread is started lazily, in the process serving requests: servers such as
+        # gunicorn with --preload create the application before forking worker processes, which
+        # do not inherit the threads of their parent. Must be called with self._lock held.
+        if self._pid != os.getpid():
+            self._queue = queue.Queue()
+            worker = threading.Thread(target=self._run, args=(self._queue,),
+                                      name="mlflow-scoring-batcher")
+            worker.daemon = True
+            worker.start()
+            self._pid = os.getpid()
+        return self._queue
+
+    def predict(self, data):
+        """
+        Score ``data`` as part of a batch, blocking until its predictions are available. After
+        :py:meth:`close` has been called, ``data`` is scored on its own.
+
+        :param data: A ``pandas.DataFrame``.
+        :return: The predictions for the rows of ``data``.
+        """
+        request = _PendingRequest(data)
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._get_queue().put(request)
+        if closed:
+            return self._predict_fn(data)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def close(self):
+        """
+        Stop the background thread once all pending requests have been scored, releasing its
+        reference to the prediction function.
+        """
+        with self._lock:
+            if not self._closed and self._pid == os.getpid():
+                self._queue.put(None)
+            self._closed = True
+
+    def _run(self, request_queue):
+        carry_over = []
+        closed = False
+        while carry_over or not closed:
+            first = carry_over.pop(0) if carry_over else request_queue.get()
+            if first is None:
+                closed = True
+                continue
+            batch = [first]
+            num_rows = len(first.data)
+            deadline = time.time() + self.max_batch_delay_ms / 1000.0
+            while num_rows < self.max_batch_size:
+                if carry_over:
+                    request = carry_over.pop(0)
+                else:
+                    timeout = deadline - time.time()
+                    if closed or timeout <= 0:
+                        break
+                    try:
+                        request = request_queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if request is None:
+                        closed = True
+                        break
+                if not _has_same_columns(first.data, request.data) or \
+                        num_rows + len(request.data) > self.max_batch_size:
+                    carry_over.append(request)
+                    break
+                batch.append(request)
+                num_rows += len(request.data)
+            self._score_batch(batch, num_rows)
+
+    def _score_batch(self, batch, num_rows):
+        dispatch_time = time.time()
+        if self.queue_delay is not None:
+            for request in batch:
+                self.queue_delay.observe(dispatch_time - request.enqueue_time)
+        if self.batch_size is not None:
+            self.batch_size.observe(num_rows)
+        if len(batch) > 1:
+            # pylint: disable=broad-except
+            try:
+                data = pd.concat([request.data for request in batch], ignore_index=True)
+                predictions = self._predict_fn(data)
+                results = _split_predictions(predictions, [len(r.data) for r in batch])
+            except Exception:
+                _logger.debug("Failed to score a batch of %s requests; scoring them one by one",
+                              len(batch), exc_info=True)
+                results = None
+            if results is not None:
+                for request, result in zip(batch, results):
+                    request.result = result
+                    request.done.set()
+                return
+        for request in batch:
+            # pylint: disable=broad-except
+            try:
+                request.result = self._predict_fn(request.data)
+            except Exception as e:
+                request.error = e
+            request.done.set()
+
+
+def _has_same_columns(df1, df2):
+    return list(df1.columns) == list(df2.columns)
+
+
+def _split_predictions(predictions, sizes):
+    """
+    Split batch predictions into consecutive row ranges of the given sizes.
+
+    :return: List of per-request predictions, or ``None`` if the predictions cannot be split
+             because they are of an unknown type or do not have exactly one row per input row.
+    """
+    if not isinstance(predictions, (pd.DataFrame, pd.Series, np.ndarray, list)) or \
+            len(predictions) != sum(sizes):
+        return None
+    rows = predictions.iloc if isinstance(predictions, (pd.DataFrame, pd.Series)) else predictions
+    results = []
+    start = 0
+    for size in sizes:
+        results.append(rows[start:start + size])
+        start += size
+    return results
@@ -0,0 +1,155 @@
+"""
+Execution of model predictions in a bounded thread pool, with a limit on the number of concurrent
+predictions and a per-request timeout.
+
+Models that spend most of their time waiting on I/O (e.g. calls to a feature store) can then be
+served by a server handling many connections concurrently, such as gunicorn's ``gthread``
+workers, without an unbounded number of predictions piling up when the model slows down.
+"""
+import logging
+import os
+import threading
+from multiprocessing import TimeoutError as PoolTimeoutError
+from multiprocessing.pool import ThreadPool
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import REQUEST_LIMIT_EXCEEDED, TEMPORARILY_UNAVAILABLE
+from mlflow.utils.cache_utils import ProcessLocalCache
+
+# Number of threads running predictions in each server process
+PREDICT_THREADS_ENV_VAR = "MLFLOW_SCORING_SERVER_PREDICT_THREADS"
+# Maximum number of predictions running or waiting for a thread in each server process. Requests
+# exceeding it are rejected with status 429.
+MAX_CONCURRENT_REQUESTS_ENV_VAR = "MLFLOW_SCORING_SERVER_MAX_CONCURRENT_REQUESTS"
+# Maximum time (in seconds) a request waits for its prediction before failing with status 503
+REQUEST_TIMEOUT_ENV_VAR = "MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT_SECONDS"
+
+_DEFAULT_PREDICT_THREADS = 8
+
+_logger = logging.getLogger(__name__)
+
+
+def get_executor_from_env(predict_fn=None):
+    """
+    :param predict_fn: Function scoring a pandas DataFrame, run by the executor's ``predict``
+                       method.
+    :return: A :py:class:`PredictExecutor` configured through the
+             ``MLFLOW_SCORING_SERVER_PREDICT_THREADS``,
+             ``MLFLOW_SCORING_SERVER_MAX_CONCURRENT_REQUESTS`` and
+             ``MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT_SECONDS`` environment variables, or ``None``
+             if none of them is set.
+    """
+    num_threads = os.environ.get(PREDICT_THREADS_ENV_VAR)
+    max_concurrent_requests = os.environ.get(MAX_CONCURRENT_REQUESTS_ENV_VAR)
+    timeout_seconds = os.environ.get(REQUEST_TIMEOUT_ENV_VAR)
+    if not (num_threads or max_concurrent_requests or timeout_seconds):
+        return None
+    return PredictExecutor(
+        predict_fn,
+        num_threads=int(num_threads) if num_threads else None,
+        max_concurrent_requests=int(max_concurrent_requests) if max_concurrent_requests else None,
+        timeout_seconds=float(timeout_seconds) if timeout_seconds else None)
+
+
+class PredictionRejectedException(MlflowException):
+    """
+    Raised when a prediction is not run because too many predictions are in progress, or does not
+    complete within the request timeout.
+    """
+
+
+class PredictExecutor(object):
+    """
+    Runs ``predict_fn`` in a thread pool on behalf of the threads handling requests. Other
+    prediction functions, e.g. of the models of a multi-model server, can share the pool and the
+    limit on concurrent predictions through :py:meth:`run`.
+
+    A prediction that times out keeps running in the pool, since threads cannot be interrupted,
+    and counts towards ``max_concurrent_requests`` until it completes. This keeps a slow model
+    from accumulating an unbounded backlog of abandoned predictions.
+
+    :param predict_fn: Function scoring a pandas DataFrame, run by :py:meth:`predict`. May be
+                       ``None`` if prediction functions are only passed to :py:meth:`run`.
+    :param num_threads: Number of threads running predictions. Defaults to
+                        ``max_concurrent_requests`` if it is set, and to 8 otherwise.
+    :param max_concurrent_requests: Maximum number of predictions running or waiting for a
+                                    thread. Unlimited if ``None``.
+    :param timeout_seconds: Maximum time to wait for a prediction. Unlimited if ``None``.
+    """
+
+    def __init__(self, predict_fn, num_threads=None, max_concurrent_requests=None,
+                 timeout_seconds=None):
+        self._predict_fn = predict_fn
+        self.num_threads = num_threads or max_concurrent_requests or _DEFAULT_PREDICT_THREADS
+        self.max_concurrent_requests = max_concurrent_requests
+        self.timeout_seconds = timeout_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrent_requests) \
+            if max_concurrent_requests else None
+        # Thread pools do not survive fork(), e.g. of a gunicorn master loading the model with
+        # --preload, so each process creates its own
+        self._pools = ProcessLocalCache()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def predict(self, data):
+        """
+        Score ``data`` with ``predict_fn`` in the thread pool and wait for the predictions.
+
+        :raise PredictionRejectedException: See :py:meth:`run`.
+        """
+        return self.run(self._predict_fn, data)
+
+    def run(self, predict_fn, data):
+        """
+        Score ``data`` with ``predict_fn`` in the thread pool and wait for the predictions. After
+        :py:meth:`close` has been called, ``data`` is scored in the calling thread.
+
+        :raise PredictionRejectedException: If ``max_concurrent_requests`` predictions are already
+                                            in progress, or the prediction does not complete
+                                            within ``timeout_seconds``.
+        """
+        if self._slots is not None and not self._slots.acquire(False):
+            raise PredictionRejectedException(
+                "The server is already processing {} requests. Retry later.".format(
+                    self.max_concurrent_requests),
+                error_code=REQUEST_LIMIT_EXCEEDED)
+
+        def run_predict():
+            try:
+                return predict_fn(data)
+            finally:
+                if self._slots is not None:
+                    self._slots.release()
+
+        try:
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    result = self._pools.get_or_create("pool", self._create_pool).apply_async(
+                        run_predict)
+        except Exception:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+        if closed:
+            return run_predict()
+        try:
+            return result.get(self.timeout_seconds)
+        except PoolTimeoutError:
+            raise PredictionRejectedException(
+                "The prediction did not complete within {} seconds.".format(self.timeout_seconds),
+                error_code=TEMPORARILY_UNAVAILABLE)
+
+    def close(self):
+        """
+        Stop the thread pool of the current process once its pending predictions have completed.
+        """
+        with self._lock:
+            self._closed = True
+            pool = self._pools.pop("pool")
+        if pool is not None:
+            pool.close()
+
+    def _create_pool(self):
+        _logger.info("Running predictions in %d threads", self.num_threads)
+        return ThreadPool(self.num_threads)
@@ -0,0 +1,353 @@
+"""
+Minimal, dependency-free metrics for the scoring server, exposed in the Prometheus text format.
+
+Servers with several worker processes (e.g. gunicorn with ``-w N``) aggregate the metrics of all
+workers if the ``MLFLOW_SCORING_SERVER_METRICS_DIR`` environment variable points to a directory
+shared by the workers: each worker periodically writes its metrics to a file in that directory,
+and ``/metrics`` reports the sum over the files of all workers, whichever worker handles it.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+METRICS_DIR_ENV_VAR = "MLFLOW_SCORING_SERVER_METRICS_DIR"
+
+_FLUSH_INTERVAL_SECONDS = 1.0
+
+_logger = logging.getLogger(__name__)
+
+
+def get_metrics_registry_from_env():
+    """
+    :return: A :py:class:`MetricsRegistry` aggregating the metrics of all processes sharing the
+             directory given by the ``MLFLOW_SCORING_SERVER_METRICS_DIR`` environment variable, or
+             reporting only the metrics of the current process if it is not set.
+    """
+    return MetricsRegistry(multiprocess_dir=os.environ.get(METRICS_DIR_ENV_VAR) or None)
+
+
+class _Metric(object):
+    metric_type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _get_label_values(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError("Metric '%s' expects labels %s, got %s"
+                             % (self.name, list(self.labelnames), sorted(labels)))
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, label_values, extra=()):
+        pairs = list(zip(self.labelnames, label_values)) + list(extra)
+        if not pairs:
+            return ""
+        return "{%s}" % ",".join('%s="%s"' % (k, _escape_label_value(v)) for k, v in pairs)
+
+    def _samples(self, values):
+        raise NotImplementedError()
+
+    @staticmethod
+    def _merge_value(value, other):
+        raise NotImplementedError()
+
+    def snapshot(self):
+        """
+        :return: Copy of the values of this metric, as a dictionary mapping tuples of label values
+                 to the value of the metric for these labels.
+        """
+        with self._lock:
+            return dict((k, _copy_value(v)) for k, v in self._values.items())
+
+    def merge(self, values, other_values):
+        """
+        Add ``other_values``, a snapshot of this metric in another process, to ``values``.
+        """
+        for label_values, value in other_values.items():
+            if label_values in values:
+                values[label_values] = self._merge_value(values[label_values], value)
+            else:
+                values[label_values] = _copy_value(value)
+
+    def expose(self, values=None):
+        """
+        :param values: Snapshot of the values to expose. Defaults to the current values.
+        :return: Lines describing this metric in the Prometheus text exposition format.
+        """
+        values = self.snapshot() if values is None else values
+        lines = ["# HELP %s %s" % (self.name, self.documentation),
+                 "# TYPE %s %s" % (self.name, self.metric_type)]
+        for suffix, label_str, value in self._samples(values):
+            lines.append("%s%s%s %s" % (self.name, suffix, label_str, _format_value(value)))
+        return lines
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count, optionally partitioned by a fixed set of labels.
+    """
+    metric_type = "counter"
+
+    def inc(self, amount=1, **labels):
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, **labels):
+        with self._lock:
+            return self._values.get(self._get_label_values(labels), 0)
+
+    @staticmethod
+    def _merge_value(value, other):
+        return value + other
+
+    def _samples(self, values):
+        return [("_total", self._format_labels(label_values), value)
+                for label_values, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over a fixed set of cumulative buckets, optionally
+    partitioned by a fixed set of labels.
+    """
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, buckets, labelnames=()):
+        super(Histogram, self).__init__(name, documentation, labelnames)
+        self.buckets = sorted(buckets)
+
+    def observe(self, value, **labels):
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                # Per-bucket counts, followed by the total count and the sum of observed values
+                state = self._values[label_values] = [0] * len(self.buckets) + [0, 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[-2] += 1
+            state[-1] += value
+
+    def get_count(self, **labels):
+        with self._lock:
+            state = self._values.get(self._get_label_values(labels))
+            return state[-2] if state else 0
+
+    def get_sum(self, **labels):
+        with self._lock:
+            state = self._values.get(self._get_label_values(labels))
+            return state[-1] if state else 0.0
+
+    @staticmethod
+    def _merge_value(value, other):
+        return [a + b for a, b in zip(value, other)]
+
+    def _samples(self, values):
+        samples = []
+        for label_values, state in sorted(values.items()):
+            for bound, count in zip(self.buckets, state):
+                samples.append(("_bucket", self._format_labels(label_values, [("le", bound)]),
+                                count))
+            samples.append(("_bucket", self._format_labels(label_values, [("le", "+Inf")]),
+                            state[-2]))
+            samples.append(("_sum", self._format_labels(label_values), state[-1]))
+            samples.append(("_count", self._format_labels(label_values), state[-2]))
+        return samples
+
+
+class MetricsRegistry(object):
+    """
+    Collection of metrics exposed together on the scoring server's ``/metrics`` endpoint.
+
+    :param multiprocess_dir: If specified, directory shared by the processes of a server, in which
+                             each process writes its metrics and from which :py:meth:`expose`
+                             reads the metrics of all processes. Processes write their metrics
+                             at most once per second, after :py:meth:`mark_updated` was called.
+    """
+
+    def __init__(self, multiprocess_dir=None):
+        self._lock = threading.Lock()
+        self._metrics = OrderedDict()
+        self._multiprocess_dir = multiprocess_dir
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flush_thread_pid = None
+        self._flush_path = None
+
+    def register(self, metric):
+        """
+        Add ``metric`` to the registry, unless a metric with the same name is already registered.
+
+        :return: The registered metric with the name of ``metric``.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, buckets, labelnames=()):
+        return self.register(Histogram(name, documentation, buckets, labelnames))
+
+    def mark_updated(self):
+        """
+        Signal that metrics of this process changed, scheduling a write of the metrics to the
+        multiprocess directory, if any.
+        """
+        if self._multiprocess_dir is None:
+            return
+        if self._flush_thread_pid != os.getpid():
+            with self._flush_lock:
+                if self._flush_thread_pid != os.getpid():
+                    # Start a writer thread in each process, including processes forked from a
+                    # process that already had one
+                    self._flush_path = os.path.join(
+                        self._multiprocess_dir,
+                        "metrics_%d_%s.json" % (os.getpid(), uuid.uuid4().hex))
+                    thread = threading.Thread(target=self._run_flush, name="mlflow-metrics-writer")
+                    thread.daemon = True
+                    thread.start()
+                    self._flush_thread_pid = os.getpid()
+        self._flush_event.set()
+
+    def _run_flush(self):
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                _logger.warning("Failed to write metrics to %s", self._multiprocess_dir,
+                                exc_info=True)
+            time.sleep(_FLUSH_INTERVAL_SECONDS)
+
+    def flush(self):
+        """
+        Write the metrics of this process to the multiprocess directory.
+        """
+        if self._flush_path is None:
+            return
+        snapshot = dict(
+            (metric.name, [[list(label_values), value]
+                           for label_values, value in metric.snapshot().items()])
+            for metric in self._get_metrics())
+        tmp_path = "%s.%s.tmp" % (self._flush_path, uuid.uuid4().hex)
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        # Readers see either the previous or the new file, never a partially written one
+        os.rename(tmp_path, self._flush_path)
+
+    def _get_metrics(self):
+        with self._lock:
+            return list(self._metrics.values())
+
+    def _read_other_processes(self):
+        snapshots = []
+        for file_name in os.listdir(self._multiprocess_dir):
+            path = os.path.join(self._multiprocess_dir, file_name)
+            if not file_name.endswith(".json") or path == self._flush_path:
+                continue
+            try:
+                with open(path) as f:
+                    snapshots.append(json.load(f))
+            except (IOError, OSError, ValueError):
+                _logger.warning("Failed to read metrics from %s", path, exc_info=True)
+        return snapshots
+
+    def expose(self):
+        """
+        :return: All registered metrics in the Prometheus text exposition format, summed over all
+                 processes sharing the multiprocess directory, if any.
+        """
+        metrics = self._get_metrics()
+        values = dict((metric.name, metric.snapshot()) for metric in metrics)
+        if self._multiprocess_dir is not None:
+            for snapshot in self._read_other_processes():
+                for metric in metrics:
+                    metric.merge(values[metric.name], dict(
+                        (tuple(label_values), value)
+                        for label_values, value in snapshot.get(metric.name, [])))
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.expose(values[metric.name]))
+        return "\n".join(lines) + "\n"
+
+
+_LATENCY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                    5.0, 10.0]
+# From 256 bytes to 64 MB
+_SIZE_BUCKETS = [4 ** i for i in range(4, 14)]
+
+
+class ScoringServerMetrics(object):
+    """
+    Metrics of the requests handled by the scoring server's ``/invocations`` endpoint(s):
+
+    - ``mlflow_scoring_server_requests_total``, by HTTP status code.
+    - ``mlflow_scoring_server_errors_total``, by MLflow error code.
+    - ``mlflow_scoring_server_input_rows_total``: number of input rows scored.
+    - ``mlflow_scoring_server_request_size_bytes`` and
+      ``mlflow_scoring_server_response_size_bytes``: sizes of request and response bodies.
+    - ``mlflow_scoring_server_request_duration_seconds``: total time spent handling requests.
+    - ``mlflow_scoring_server_stage_duration_seconds``: time spent in each stage of handling a
+      request: ``dispatch`` (reading the request body and selecting the parser for its content
+      type), ``parse``, ``predict`` and ``serialize``.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.requests = registry.counter(
+            "mlflow_scoring_server_requests", "Number of scoring requests.", ["status"])
+        self.errors = registry.counter(
+            "mlflow_scoring_server_errors", "Number of failed scoring requests.", ["error_code"])
+        self.input_rows = registry.counter(
+            "mlflow_scoring_server_input_rows", "Number of input rows scored.")
+        self.request_size = registry.histogram(
+            "mlflow_scoring_server_request_size_bytes", "Size of request bodies.", _SIZE_BUCKETS)
+        self.response_size = registry.histogram(
+            "mlflow_scoring_server_response_size_bytes", "Size of response bodies.",
+            _SIZE_BUCKETS)
+        self.request_duration = registry.histogram(
+            "mlflow_scoring_server_request_duration_seconds", "Time spent handling requests.",
+            _LATENCY_BUCKETS)
+        self.stage_duration = registry.histogram(
+            "mlflow_scoring_server_stage_duration_seconds",
+            "Time spent in each stage of handling requests.", _LATENCY_BUCKETS, ["stage"])
+
+    @contextmanager
+    def time_stage(self, stage):
+        """
+        Record the time spent in the ``with`` block as the duration of ``stage``.
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.stage_duration.observe(time.time() - start, stage=stage)
+
+
+def _escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _copy_value(value):
+    return list(value) if isinstance(value, list) else value
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
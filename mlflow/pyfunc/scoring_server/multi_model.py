@@ -0,0 +1,119 @@
+"""
+Lazily loaded, size-bounded collection of models hosted by a multi-model scoring server.
+"""
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.pyfunc.scoring_server.batching import get_batcher_from_env
+from mlflow.pyfunc.scoring_server.executor import get_executor_from_env
+
+_logger = logging.getLogger(__name__)
+
+
+class LazyModelCache(object):
+    """
+    Loads models on first use and keeps at most ``max_loaded_models`` of them in memory, unloading
+    the least recently used model when another one has to be loaded.
+
+    Each model is loaded at most once at a time: concurrent requests for a model that is being
+    loaded wait for it rather than loading it again. Requests already holding the prediction
+    function of a model that gets unloaded complete normally.
+
+    If a :py:class:`mlflow.pyfunc.scoring_server.executor.PredictExecutor` is configured through
+    the environment, all models share it, so that its number of threads and limit on concurrent
+    predictions apply to the whole process.
+
+    :param model_uris: Dictionary mapping model names to model URIs.
+    :param max_loaded_models: Maximum number of models loaded at the same time. Unlimited if
+                              ``None``.
+    :param load_model_fn: Function loading the pyfunc model at a URI.
+    :param metrics_registry: Registry in which request batchers, if batching is enabled, record
+                             their metrics.
+    """
+
+    def __init__(self, model_uris, max_loaded_models, load_model_fn, metrics_registry=None):
+        if max_loaded_models is not None and max_loaded_models < 1:
+            raise MlflowException("The maximum number of loaded models must be positive, got %s"
+                                  % max_loaded_models)
+        self._model_uris = dict(model_uris)
+        self._max_loaded_models = max_loaded_models
+        self._load_model_fn = load_model_fn
+        self._metrics_registry = metrics_registry
+        self._lock = threading.Lock()
+        self._load_locks = dict((name, threading.Lock()) for name in self._model_uris)
+        self._executor = get_executor_from_env()
+        # Maps names of loaded models to (predict function, batcher or None), least recently
+        # used first
+        self._loaded = OrderedDict()
+
+    def preload(self):
+        """
+        Load models, in name order, until all of them or ``max_loaded_models`` are loaded.
+        """
+        names = sorted(self._model_uris)
+        if self._max_loaded_models is not None:
+            names = names[:self._max_loaded_models]
+        for name in names:
+            self.get_predict_fn(name)
+
+    def describe(self):
+        """
+        :return: List of dictionaries with the name, URI and load status of each model.
+        """
+        with self._lock:
+            loaded = set(self._loaded)
+        return [{"name": name, "model_uri": uri, "loaded": name in loaded}
+                for name, uri in sorted(self._model_uris.items())]
+
+    def get_predict_fn(self, name):
+        """
+        :return: Function scoring a DataFrame with the model named ``name``, loading the model if
+                 it is not loaded yet.
+        """
+        if name not in self._model_uris:
+            raise MlflowException("No model named '%s' is served. Available models: %s"
+                                  % (name, sorted(self._model_uris)),
+                                  error_code=RESOURCE_DOES_NOT_EXIST)
+        predict_fn = self._get_loaded(name)
+        if predict_fn is not None:
+            return predict_fn
+        with self._load_locks[name]:
+            predict_fn = self._get_loaded(name)
+            if predict_fn is not None:
+                return predict_fn
+            start = time.time()
+            model = self._load_model_fn(self._model_uris[name])
+            _logger.info("Loaded model '%s' from %s in %.2f seconds",
+                         name, self._model_uris[name], time.time() - start)
+            batcher = get_batcher_from_env(model.predict, self._metrics_registry)
+            predict_fn = batcher.predict if batcher is not None else model.predict
+            if self._executor is not None:
+                predict_fn = functools.partial(self._executor.run, predict_fn)
+            self._add_loaded(name, predict_fn, batcher)
+            return predict_fn
+
+    def _get_loaded(self, name):
+        with self._lock:
+            entry = self._loaded.pop(name, None)
+            if entry is None:
+                return None
+            # Re-insert the model to mark it as most recently used
+            self._loaded[name] = entry
+            return entry[0]
+
+    def _add_loaded(self, name, predict_fn, batcher):
+        evicted = []
+        with self._lock:
+            self._loaded[name] = (predict_fn, batcher)
+            while self._max_loaded_models is not None and \
+                    len(self._loaded) > self._max_loaded_models:
+                evicted.append(self._loaded.popitem(last=False))
+        for evicted_name, (_, evicted_batcher) in evicted:
+            _logger.info("Unloaded least recently used model '%s'", evicted_name)
+            if evicted_batcher is not None:
+                evicted_batcher.close()
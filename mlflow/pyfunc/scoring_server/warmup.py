@@ -0,0 +1,117 @@
+"""
+Warm-up of models served by the pyfunc scoring server.
+
+The first predictions of many models are much slower than the following ones, e.g. because of JIT
+compilation, graph initialization or lazy imports. Scoring an example input a few times before
+reporting the server as ready keeps these delays out of the latency of actual requests.
+"""
+import logging
+import os
+import threading
+import time
+
+WARMUP_ITERATIONS_ENV_VAR = "MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS"
+WARMUP_INPUT_ENV_VAR = "MLFLOW_SCORING_SERVER_WARMUP_INPUT"
+
+_logger = logging.getLogger(__name__)
+
+
+def is_warmup_enabled():
+    """
+    :return: Whether the ``MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS`` environment variable is set to
+             a positive number, i.e. whether the warm-up input of the model is needed.
+    """
+    return _get_warmup_iterations() > 0
+
+
+def _get_warmup_iterations():
+    return int(os.environ.get(WARMUP_ITERATIONS_ENV_VAR, "0"))
+
+
+def get_warmup_from_env(predict_fn, warmup_input):
+    """
+    :return: A :py:class:`ModelWarmup` scoring ``warmup_input`` the number of times given by the
+             ``MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS`` environment variable, or ``None`` if that
+             variable is not set or there is no warm-up input.
+    """
+    iterations = _get_warmup_iterations()
+    if iterations <= 0:
+        return None
+    if warmup_input is None:
+        _logger.warning("%s is set but the model has no input example and %s is not set."
+                        " Skipping the model warm-up.",
+                        WARMUP_ITERATIONS_ENV_VAR, WARMUP_INPUT_ENV_VAR)
+        return None
+    return ModelWarmup(predict_fn, warmup_input, iterations)
+
+
+class ModelWarmup(object):
+    """
+    Scores an example input a given number of times, in a background thread, and reports whether
+    it is done.
+
+    Warm-up is per process: if the process forks before the warm-up completes (e.g. a gunicorn
+    master forking its workers), the warm-up is restarted in the child process the first time it
+    checks whether the warm-up is done. A failing warm-up is logged and counts as done, so that the
+    server still becomes ready.
+
+    :param predict_fn: Function scoring a pandas DataFrame.
+    :param warmup_input: pandas DataFrame to score.
+    :param iterations: Number of times to score ``warmup_input``.
+    """
+
+    def __init__(self, predict_fn, warmup_input, iterations):
+        self._predict_fn = predict_fn
+        self._warmup_input = warmup_input
+        self._iterations = iterations
+        self._lock = threading.Lock()
+        self._ready = False
+        self._pid = None
+
+    def start(self, block=False):
+        """
+        Start the warm-up.
+
+        :param block: If ``True``, run the warm-up in the calling thread and return when it is
+                      done. This avoids forking the process while a warm-up thread is scoring.
+        """
+        if block:
+            self._run()
+        else:
+            with self._lock:
+                self._start_thread()
+
+    def is_ready(self):
+        """
+        :return: ``True`` if the warm-up is done.
+        """
+        if self._ready:
+            return True
+        with self._lock:
+            if not self._ready and self._pid != os.getpid():
+                # The warm-up thread does not exist in this process, which was forked after it
+                # started
+                self._start_thread()
+        return self._ready
+
+    def _start_thread(self):
+        self._pid = os.getpid()
+        thread = threading.Thread(target=self._run, name="mlflow-model-warmup")
+        thread.daemon = True
+        thread.start()
+
+    def _run(self):
+        start = time.time()
+        try:
+            for i in range(self._iterations):
+                iteration_start = time.time()
+                # Copy the input in case the model modifies it
+                self._predict_fn(self._warmup_input.copy())
+                _logger.info("Model warm-up iteration %d/%d took %.3f seconds",
+                             i + 1, self._iterations, time.time() - iteration_start)
+            _logger.info("Model warm-up completed in %.3f seconds", time.time() - start)
+        except Exception:  # pylint: disable=broad-except
+            _logger.warning("Model warm-up failed after %.3f seconds. Serving the model without"
+                            " completing the warm-up.", time.time() - start, exc_info=True)
+        finally:
+            self._ready = True
@@ -1,6 +1,28 @@
+import gc
+import json
 import os
 from mlflow.pyfunc import scoring_server
 from mlflow.pyfunc import load_model
 
 
-app = scoring_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]))
+if scoring_server._SERVER_MODEL_URIS in os.environ:
+    max_loaded_models = os.environ.get(scoring_server._SERVER_MAX_LOADED_MODELS)
+    app = scoring_server.init_multi_model(
+        json.loads(os.environ[scoring_server._SERVER_MODEL_URIS]),
+        max_loaded_models=int(max_loaded_models) if max_loaded_models else None,
+        preload=os.environ.get(scoring_server._SERVER_PRELOAD) == "true")
+else:
+    model_path = os.environ[scoring_server._SERVER_MODEL_PATH]
+    preload = os.environ.get(scoring_server._SERVER_PRELOAD) == "true"
+    # Only read the warm-up input if it is used, so that an invalid input cannot break startup
+    warmup_input = scoring_server.load_warmup_input(model_path) \
+        if scoring_server.is_warmup_enabled() else None
+    # When preloading, warm up before gunicorn forks the workers rather than in a background thread
+    app = scoring_server.init(load_model(model_path), warmup_input=warmup_input,
+                              block_on_warmup=preload)
+
+if hasattr(gc, "freeze"):
+    # Move the objects created while loading the model out of the reach of the garbage
+    # collector, so that collections in forked worker processes do not write to (and thereby
+    # copy) the memory pages they share with the parent when serving with gunicorn --preload
+    gc.freeze()
@@ -5,6 +5,8 @@ import zipfile
 
 from pyspark.files import SparkFiles
 
+from mlflow.pyfunc.model_cache import ModelCache
+
 
 class SparkModelCache(object):
     """Caches models in memory on Spark Executors, to avoid continually reloading from disk.
@@ -17,7 +19,7 @@ class SparkModelCache(object):
     """
 
     # Map from unique name --> loaded model.
-    _models = {}
+    _models = ModelCache()
 
     # Number of cache hits we've had, for testing purposes.
     _cache_hits = 0
@@ -43,9 +45,10 @@ class SparkModelCache(object):
         """Given a path returned by add_local_model(), this method will return the loaded model.
         If this Python process ever loaded the model before, we will reuse that copy.
         """
-        if archive_path in SparkModelCache._models:
+        model = SparkModelCache._models.get(archive_path)
+        if model is not None:
             SparkModelCache._cache_hits += 1
-            return SparkModelCache._models[archive_path]
+            return model
 
         # BUG: Despite the documentation of SparkContext.addFile() and SparkFiles.get() in Scala
         # and Python, it turns out that we actually need to use the basename as the input to
@@ -59,6 +62,7 @@ class SparkModelCache(object):
 
         # We must rely on a supposed cyclic import here because we want this behavior
         # on the Spark Executors (i.e., don't try to pickle the load_model function).
-        from mlflow.pyfunc import load_pyfunc  # pylint: disable=cyclic-import
-        SparkModelCache._models[archive_path] = load_pyfunc(temp_dir)
-        return SparkModelCache._models[archive_path]
+        from mlflow.pyfunc import _load_model_from_local_path  # pylint: disable=cyclic-import
+        model = _load_model_from_local_path(temp_dir)
+        SparkModelCache._models.put(archive_path, model)
+        return model
@@ -3,7 +3,8 @@ The ``mlflow.pytorch`` module provides an API for logging and loading PyTorch mo
 exports PyTorch models with the following flavors:
 
 PyTorch (native) format
-    This is the main flavor that can be loaded back into PyTorch.
+    This is the main flavor that can be loaded back into PyTorch. Models are serialized with
+    ``torch.save``, or as `TorchScript <https://pytorch.org/docs/stable/jit.html>`_ programs.
 :py:mod:`mlflow.pyfunc`
     Produced for use by generic pyfunc-based deployment tools and batch inference.
 """
@@ -24,7 +25,7 @@ import mlflow.pyfunc.utils as pyfunc_utils
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
-from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
 from mlflow.pytorch import pickle_module as mlflow_pytorch_pickle_module
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
@@ -34,8 +35,22 @@ from mlflow.utils.model_utils import _get_flavor_configuration
 FLAVOR_NAME = "pytorch"
 
 _SERIALIZED_TORCH_MODEL_FILE_NAME = "model.pth"
+_TORCHSCRIPT_MODEL_FILE_NAME = "model.pt"
 _PICKLE_MODULE_INFO_FILE_NAME = "pickle_module_info.txt"
 
+JIT_MODE_TRACE = "trace"
+JIT_MODE_SCRIPT = "script"
+
+# Maximum number of rows passed to the model at a time by the pyfunc flavor. Larger inputs are
+# scored in several forward passes, which bounds the memory used by intermediate activations.
+PREDICT_BATCH_SIZE_ENV_VAR = "MLFLOW_PYTORCH_PREDICT_BATCH_SIZE"
+# Number of threads used by PyTorch for intra-op parallelism on CPU, set when a pyfunc model is
+# loaded. Serving several worker processes on the same machine typically calls for fewer threads
+# per process than PyTorch's default of one per core.
+NUM_THREADS_ENV_VAR = "MLFLOW_PYTORCH_NUM_THREADS"
+# Device on which pyfunc models are run, e.g. "cuda:0". Defaults to "cpu".
+DEVICE_ENV_VAR = "MLFLOW_PYTORCH_DEVICE"
+
 _logger = logging.getLogger(__name__)
 
 
@@ -64,7 +79,7 @@ def get_default_conda_env():
 
 
 def log_model(pytorch_model, artifact_path, conda_env=None, code_paths=None,
-              pickle_module=None, **kwargs):
+              pickle_module=None, jit_mode=None, example_input=None, **kwargs):
     """
     Log a PyTorch model as an MLflow artifact for the current run.
 
@@ -101,6 +116,14 @@ def log_model(pytorch_model, artifact_path, conda_env=None, code_paths=None,
                           ``pytorch_model``. This is passed as the ``pickle_module`` parameter
                           to ``torch.save()``. By default, this module is also used to
                           deserialize ("unpickle") the PyTorch model at load time.
+    :param jit_mode: If not ``None``, the model is compiled with TorchScript and saved with
+                     ``torch.jit.save``, which allows it to be loaded without its Python code and
+                     usually speeds up inference on CPU. ``"trace"`` compiles the model with
+                     ``torch.jit.trace`` applied to ``example_input``, and ``"script"`` with
+                     ``torch.jit.script``. Models that are already TorchScript modules are always
+                     saved with ``torch.jit.save``.
+    :param example_input: Example input of the model, as a tensor or a numpy array, used to trace
+                          it if ``jit_mode`` is ``"trace"``.
     :param kwargs: kwargs to pass to ``torch.save`` method.
 
     >>> import torch
@@ -147,11 +170,12 @@ def log_model(pytorch_model, artifact_path, conda_env=None, code_paths=None,
     """
     pickle_module = pickle_module or mlflow_pytorch_pickle_module
     Model.log(artifact_path=artifact_path, flavor=mlflow.pytorch, pytorch_model=pytorch_model,
-              conda_env=conda_env, code_paths=code_paths, pickle_module=pickle_module, **kwargs)
+              conda_env=conda_env, code_paths=code_paths, pickle_module=pickle_module,
+              jit_mode=jit_mode, example_input=example_input, **kwargs)
 
 
 def save_model(pytorch_model, path, conda_env=None, mlflow_model=Model(), code_paths=None,
-               pickle_module=None, **kwargs):
+               pickle_module=None, jit_mode=None, example_input=None, **kwargs):
     """
     Save a PyTorch model to a path on the local file system.
 
@@ -190,6 +214,14 @@ def save_model(pytorch_model, path, conda_env=None, mlflow_model=Model(), code_p
                           ``pytorch_model``. This is passed as the ``pickle_module`` parameter
                           to ``torch.save()``. By default, this module is also used to
                           deserialize ("unpickle") the PyTorch model at load time.
+    :param jit_mode: If not ``None``, the model is compiled with TorchScript and saved with
+                     ``torch.jit.save``, which allows it to be loaded without its Python code and
+                     usually speeds up inference on CPU. ``"trace"`` compiles the model with
+                     ``torch.jit.trace`` applied to ``example_input``, and ``"script"`` with
+                     ``torch.jit.script``. Models that are already TorchScript modules are always
+                     saved with ``torch.jit.save``.
+    :param example_input: Example input of the model, as a tensor or a numpy array, used to trace
+                          it if ``jit_mode`` is ``"trace"``.
     :param kwargs: kwargs to pass to ``torch.save`` method.
 
     >>> import torch
@@ -212,6 +244,15 @@ def save_model(pytorch_model, path, conda_env=None, mlflow_model=Model(), code_p
 
     if not isinstance(pytorch_model, torch.nn.Module):
         raise TypeError("Argument 'pytorch_model' should be a torch.nn.Module")
+    if jit_mode not in (None, JIT_MODE_TRACE, JIT_MODE_SCRIPT):
+        raise MlflowException(
+            message="Invalid jit_mode '{}'. Expected one of: None, '{}', '{}'".format(
+                jit_mode, JIT_MODE_TRACE, JIT_MODE_SCRIPT),
+            error_code=INVALID_PARAMETER_VALUE)
+    if jit_mode == JIT_MODE_TRACE and example_input is None:
+        raise MlflowException(
+            message="An example input is required to trace the model",
+            error_code=INVALID_PARAMETER_VALUE)
 
     path = os.path.abspath(path)
     if os.path.exists(path):
@@ -232,8 +273,12 @@ def save_model(pytorch_model, path, conda_env=None, mlflow_model=Model(), code_p
     with open(pickle_module_path, "w") as f:
         f.write(pickle_module.__name__)
     # Save pytorch model
-    model_path = os.path.join(model_data_path, _SERIALIZED_TORCH_MODEL_FILE_NAME)
-    torch.save(pytorch_model, model_path, pickle_module=pickle_module, **kwargs)
+    scripted_model = _compile_model(pytorch_model, jit_mode, example_input)
+    if scripted_model is not None:
+        torch.jit.save(scripted_model, os.path.join(model_data_path, _TORCHSCRIPT_MODEL_FILE_NAME))
+    else:
+        model_path = os.path.join(model_data_path, _SERIALIZED_TORCH_MODEL_FILE_NAME)
+        torch.save(pytorch_model, model_path, pickle_module=pickle_module, **kwargs)
 
     conda_env_subpath = "conda.yaml"
     if conda_env is None:
@@ -252,20 +297,51 @@ def save_model(pytorch_model, path, conda_env=None, mlflow_model=Model(), code_p
         code_dir_subpath = None
 
     mlflow_model.add_flavor(
-        FLAVOR_NAME, model_data=model_data_subpath, pytorch_version=torch.__version__)
+        FLAVOR_NAME, model_data=model_data_subpath, pytorch_version=torch.__version__,
+        torchscript=scripted_model is not None)
     pyfunc.add_to_model(mlflow_model, loader_module="mlflow.pytorch", data=model_data_subpath,
                         pickle_module_name=pickle_module.__name__, code=code_dir_subpath,
                         env=conda_env_subpath)
     mlflow_model.save(os.path.join(path, "MLmodel"))
 
 
+def _compile_model(pytorch_model, jit_mode, example_input):
+    """
+    :return: The TorchScript module to save for ``pytorch_model``, or ``None`` if the model is
+             to be pickled.
+    """
+    import torch
+
+    if isinstance(pytorch_model, torch.jit.ScriptModule):
+        return pytorch_model
+    if jit_mode == JIT_MODE_SCRIPT:
+        return torch.jit.script(pytorch_model)
+    if jit_mode == JIT_MODE_TRACE:
+        if isinstance(example_input, np.ndarray):
+            example_input = torch.from_numpy(example_input)
+        was_training = pytorch_model.training
+        pytorch_model.eval()
+        try:
+            with torch.no_grad():
+                return torch.jit.trace(pytorch_model, example_input)
+        finally:
+            pytorch_model.train(was_training)
+    return None
+
+
 def _load_model(path, **kwargs):
     """
     :param path: The path to a serialized PyTorch model.
-    :param kwargs: Additional kwargs to pass to the PyTorch ``torch.load`` function.
+    :param kwargs: Additional kwargs to pass to the PyTorch ``torch.load`` function. Only
+                   ``map_location`` is used to load TorchScript models.
     """
     import torch
 
+    if os.path.isdir(path) and \
+            os.path.exists(os.path.join(path, _TORCHSCRIPT_MODEL_FILE_NAME)):
+        return torch.jit.load(os.path.join(path, _TORCHSCRIPT_MODEL_FILE_NAME),
+                              map_location=kwargs.get("map_location"))
+
     if os.path.isdir(path):
         # `path` is a directory containing a serialized PyTorch model and a text file containing
         # information about the pickle module that should be used by PyTorch to load it
@@ -351,30 +427,71 @@ def _load_pyfunc(path, **kwargs):
 
     :param path: Local filesystem path to the MLflow Model with the ``pytorch`` flavor.
     """
-    return _PyTorchWrapper(_load_model(path, **kwargs))
+    import torch
+
+    num_threads = os.environ.get(NUM_THREADS_ENV_VAR)
+    if num_threads:
+        torch.set_num_threads(int(num_threads))
+    batch_size = os.environ.get(PREDICT_BATCH_SIZE_ENV_VAR)
+    return _PyTorchWrapper(_load_model(path, **kwargs),
+                           device=os.environ.get(DEVICE_ENV_VAR, "cpu"),
+                           batch_size=int(batch_size) if batch_size else None)
 
 
 class _PyTorchWrapper(object):
     """
     Wrapper class that creates a predict function such that
     predict(data: pd.DataFrame) -> model's output as pd.DataFrame (pandas DataFrame)
+
+    The model is moved to ``device`` and switched to evaluation mode once, when the wrapper is
+    created, rather than on every prediction.
+
+    :param device: Device on which the model is run.
+    :param batch_size: Maximum number of rows passed to the model at a time. If ``None``, the
+                       whole input is scored in a single forward pass.
     """
-    def __init__(self, pytorch_model):
+    def __init__(self, pytorch_model, device="cpu", batch_size=None):
         self.pytorch_model = pytorch_model
+        self.batch_size = batch_size
+        self._device = None
+        self._prepare(device)
+
+    def _prepare(self, device):
+        if device != self._device:
+            self.pytorch_model.to(device)
+            self.pytorch_model.eval()
+            self._device = device
 
-    def predict(self, data, device='cpu'):
+    def predict(self, data, device=None):
         import torch
 
         if not isinstance(data, pd.DataFrame):
             raise TypeError("Input data should be pandas.DataFrame")
-        self.pytorch_model.to(device)
-        self.pytorch_model.eval()
+        if device is not None:
+            self._prepare(device)
+        values = data.values
+        if values.dtype != np.float32:
+            values = values.astype(np.float32)
+        num_rows = len(values)
+        batch_size = self.batch_size or max(num_rows, 1)
+        output = None
         with torch.no_grad():
-            input_tensor = torch.from_numpy(data.values.astype(np.float32)).to(device)
-            preds = self.pytorch_model(input_tensor)
-            if not isinstance(preds, torch.Tensor):
-                raise TypeError("Expected PyTorch model to output a single output tensor, "
-                                "but got output of type '{}'".format(type(preds)))
-            predicted = pd.DataFrame(preds.numpy())
-            predicted.index = data.index
-            return predicted
+            # An empty input is still passed to the model, in a single empty batch
+            for start in range(0, max(num_rows, 1), batch_size):
+                # torch.from_numpy shares the memory of the batch, which is a view of the input
+                # whenever the DataFrame holds a single float32 block
+                input_tensor = torch.from_numpy(values[start:start + batch_size]).to(self._device)
+                preds = self.pytorch_model(input_tensor)
+                if not isinstance(preds, torch.Tensor):
+                    raise TypeError("Expected PyTorch model to output a single output tensor, "
+                                    "but got output of type '{}'".format(type(preds)))
+                preds = preds.cpu().numpy()
+                if output is None:
+                    if len(preds) == num_rows:
+                        output = preds
+                        continue
+                    output = np.empty((num_rows,) + preds.shape[1:], dtype=preds.dtype)
+                output[start:start + len(preds)] = preds
+        predicted = pd.DataFrame(output)
+        predicted.index = data.index
+        return predicted
@@ -5,7 +5,8 @@ import sys
 from flask import Flask, send_from_directory
 
 from mlflow.server import handlers
-from mlflow.server.handlers import get_artifact_handler, STATIC_PREFIX_ENV_VAR, _add_static_prefix
+from mlflow.server.handlers import get_artifact_handler, STATIC_PREFIX_ENV_VAR, \
+    SERVE_ARTIFACTS_ENV_VAR, _add_static_prefix
 from mlflow.utils.process import exec_cmd
 
 # NB: These are intenrnal environment variables used for communication between
@@ -22,6 +23,9 @@ STATIC_DIR = os.path.join(app.root_path, REL_STATIC_DIR)
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
+for http_path, handler, methods in handlers.get_artifact_proxy_endpoints():
+    app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
+
 
 # Serve the "get-artifact" route.
 @app.route(_add_static_prefix('/get-artifact'))
@@ -60,11 +64,13 @@ def _build_gunicorn_command(gunicorn_opts, host, port, workers):
 
 
 def _run_server(file_store_path, default_artifact_root, host, port, static_prefix=None,
-                workers=None, gunicorn_opts=None, waitress_opts=None):
+                workers=None, gunicorn_opts=None, waitress_opts=None, serve_artifacts=False):
     """
     Run the MLflow server, wrapping it in gunicorn or waitress on windows
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param serve_artifacts: If True, enable the ``mlflow-artifacts`` endpoints, which proxy
+                            artifact uploads, downloads and listings to the default artifact root.
     :return: None
     """
     env_map = {}
@@ -74,6 +80,8 @@ def _run_server(file_store_path, default_artifact_root, host, port, static_prefi
         env_map[ARTIFACT_ROOT_ENV_VAR] = default_artifact_root
     if static_prefix:
         env_map[STATIC_PREFIX_ENV_VAR] = static_prefix
+    if serve_artifacts:
+        env_map[SERVE_ARTIFACTS_ENV_VAR] = "true"
 
     # TODO: eventually may want waitress on non-win32
     if sys.platform == 'win32':
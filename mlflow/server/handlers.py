@@ -1,7 +1,13 @@
 # Define all the service endpoint handlers here.
 import json
 import os
+import posixpath
 import re
+import shutil
+import tempfile
+import time
+import uuid
+
 import six
 
 from functools import wraps
@@ -11,19 +17,33 @@ from querystring_parser import parser
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
 from mlflow.exceptions import MlflowException
 from mlflow.protos import databricks_pb2
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, INVALID_PARAMETER_VALUE, \
+    RESOURCE_DOES_NOT_EXIST
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListArtifacts, GetMetricHistory, CreateRun, \
     UpdateRun, LogMetric, LogParam, SetTag, ListExperiments, \
     DeleteExperiment, RestoreExperiment, RestoreRun, DeleteRun, UpdateExperiment, LogBatch, \
     DeleteTag, SetExperimentTag
 from mlflow.store.artifact_repository_registry import get_artifact_repository
+from mlflow.store.local_artifact_repo import LocalArtifactRepository
 from mlflow.store.dbmodels.db_types import DATABASE_ENGINES
 from mlflow.tracking.registry import TrackingStoreRegistry
 from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils.validation import _validate_batch_log_api_req, path_not_unique, \
+    bad_path_message
 
 _store = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+SERVE_ARTIFACTS_ENV_VAR = "_MLFLOW_SERVER_SERVE_ARTIFACTS"
+
+# Size of the chunks in which artifact request bodies are read and written to disk
+_ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024
+# Parts of multipart artifact uploads are staged under this directory until the upload completes.
+# It is shared by all server workers on the host, which may each receive different parts.
+_MULTIPART_UPLOAD_STAGING_DIR = os.path.join(tempfile.gettempdir(), "mlflow-multipart-uploads")
+# Multipart uploads that received no part for this long, e.g. because their client died before
+# completing or aborting them, are removed when another upload is created
+_MULTIPART_UPLOAD_EXPIRATION_SECONDS = 24 * 60 * 60
 
 
 def _add_static_prefix(route):
@@ -43,13 +63,20 @@ def _get_sqlalchemy_store(store_uri, artifact_uri):
     return SqlAlchemyStore(store_uri, artifact_uri)
 
 
-_tracking_store_registry = TrackingStoreRegistry()
-_tracking_store_registry.register('', _get_file_store)
-_tracking_store_registry.register('file', _get_file_store)
-for scheme in DATABASE_ENGINES:
-    _tracking_store_registry.register(scheme, _get_sqlalchemy_store)
+# Built when the store is first requested
+_tracking_store_registry = None
+
 
-_tracking_store_registry.register_entrypoints()
+def _get_tracking_store_registry():
+    global _tracking_store_registry
+    if _tracking_store_registry is None:
+        registry = TrackingStoreRegistry()
+        registry.register('', _get_file_store)
+        registry.register('file', _get_file_store)
+        for scheme in DATABASE_ENGINES:
+            registry.register(scheme, _get_sqlalchemy_store)
+        _tracking_store_registry = registry
+    return _tracking_store_registry
 
 
 def _get_store(backend_store_uri=None, default_artifact_root=None):
@@ -58,7 +85,7 @@ def _get_store(backend_store_uri=None, default_artifact_root=None):
     if _store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
-        _store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        _store = _get_tracking_store_registry().get_store(store_uri, artifact_root)
     return _store
 
 
@@ -346,9 +373,10 @@ def _list_artifacts():
         path = None
     run_id = request_message.run_id or request_message.run_uuid
     run = _get_store().get_run(run_id)
-    artifact_entities = _get_artifact_repo(run).list_artifacts(path)
+    artifact_repo = _get_artifact_repo(run)
+    artifact_entities = artifact_repo.list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
-    response_message.root_uri = _get_artifact_repo(run).artifact_uri
+    response_message.root_uri = artifact_repo.artifact_uri
     response = Response(mimetype='application/json')
     response.set_data(message_to_json(response_message))
     return response
@@ -367,6 +395,25 @@ def _get_metric_history():
     return response
 
 
+@catch_mlflow_exception
+def _get_metric_histories():
+    request_json = _get_request_json()
+    if not isinstance(request_json, dict):
+        request_json = {}
+    run_ids = request_json.get("run_ids", [])
+    metric_keys = request_json.get("metric_keys", [])
+    for name, values in [("run_ids", run_ids), ("metric_keys", metric_keys)]:
+        if not isinstance(values, list) or \
+                not all(isinstance(value, six.string_types) for value in values):
+            raise MlflowException("Invalid value for '%s'. Expected a list of strings." % name,
+                                  error_code=INVALID_PARAMETER_VALUE)
+    columns = _get_store().get_metric_histories(run_ids, metric_keys,
+                                                request_json.get("max_points"))
+    response = Response(mimetype='application/json')
+    response.set_data(json.dumps(columns))
+    return response
+
+
 @catch_mlflow_exception
 def _list_experiments():
     request_message = _get_request_message(ListExperiments())
@@ -397,6 +444,220 @@ def _log_batch():
     return response
 
 
+def _get_proxied_artifact_repo():
+    """
+    :return: The artifact repository for the server's default artifact root, which backs the
+             ``mlflow-artifacts`` proxy endpoints.
+    """
+    from mlflow.server import ARTIFACT_ROOT_ENV_VAR
+    if os.environ.get(SERVE_ARTIFACTS_ENV_VAR) != "true":
+        raise MlflowException(
+            "Proxied artifact access is disabled. Start the tracking server with the "
+            "'--serve-artifacts' option to enable it.", error_code=ENDPOINT_NOT_FOUND)
+    artifact_root = os.environ.get(ARTIFACT_ROOT_ENV_VAR) or _get_store().artifact_root_uri
+    return get_artifact_repository(artifact_root)
+
+
+def _validate_proxied_artifact_path(artifact_path):
+    if not artifact_path or path_not_unique(artifact_path):
+        raise MlflowException("Invalid artifact path: '%s'. %s" % (
+            artifact_path, bad_path_message(artifact_path or "")),
+            error_code=INVALID_PARAMETER_VALUE)
+
+
+def _validate_multipart_upload_id(upload_id):
+    try:
+        return uuid.UUID(upload_id).hex
+    except (TypeError, ValueError):
+        raise MlflowException("Invalid multipart upload ID: '%s'" % upload_id,
+                              error_code=INVALID_PARAMETER_VALUE)
+
+
+def _get_required_query_param(name):
+    value = request.args.get(name)
+    if value is None:
+        raise MlflowException("Missing value for required parameter '%s'" % name,
+                              error_code=INVALID_PARAMETER_VALUE)
+    return value
+
+
+def _write_request_body(dst_file):
+    """
+    Copy the body of the current request to ``dst_file`` in fixed-size chunks, so that arbitrarily
+    large uploads (including those sent with chunked transfer encoding) are never held in memory.
+    """
+    while True:
+        chunk = request.stream.read(_ARTIFACT_STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        dst_file.write(chunk)
+
+
+def _log_proxied_artifact(local_file, artifact_path):
+    """
+    Log ``local_file`` to the proxied artifact repository at the (file) path ``artifact_path``.
+    ``local_file`` must be named after the last component of ``artifact_path``.
+    """
+    artifact_dir = posixpath.dirname(artifact_path) or None
+    _get_proxied_artifact_repo().log_artifact(local_file, artifact_dir)
+
+
+def _empty_json_response():
+    response = Response(mimetype='application/json')
+    response.set_data(json.dumps({}))
+    return response
+
+
+@catch_mlflow_exception
+def _upload_artifact(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        local_file = os.path.join(tmp_dir, posixpath.basename(artifact_path))
+        with open(local_file, "wb") as f:
+            _write_request_body(f)
+        _log_proxied_artifact(local_file, artifact_path)
+    finally:
+        shutil.rmtree(tmp_dir)
+    return _empty_json_response()
+
+
+@catch_mlflow_exception
+def _download_artifact(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    artifact_repo = _get_proxied_artifact_repo()
+    # Local artifacts can be served in place; anything else is staged in a temporary directory
+    # that is removed once the response has been sent
+    tmp_dir = None if isinstance(artifact_repo, LocalArtifactRepository) else tempfile.mkdtemp()
+    try:
+        local_path = artifact_repo.download_artifacts(artifact_path, tmp_dir)
+        if os.path.isdir(local_path):
+            raise MlflowException("Artifact path '%s' is a directory" % artifact_path,
+                                  error_code=INVALID_PARAMETER_VALUE)
+        response = send_file(local_path, mimetype='application/octet-stream',
+                             as_attachment=True)
+    except Exception:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    if tmp_dir is not None:
+        response.call_on_close(lambda: shutil.rmtree(tmp_dir, ignore_errors=True))
+    return response
+
+
+@catch_mlflow_exception
+def _list_proxied_artifacts():
+    path = request.args.get('path') or None
+    if path is not None:
+        _validate_proxied_artifact_path(path)
+    files = [{'path': f.path, 'is_dir': f.is_dir, 'file_size': f.file_size}
+             for f in _get_proxied_artifact_repo().list_artifacts(path)]
+    response = Response(mimetype='application/json')
+    response.set_data(json.dumps({'files': files}))
+    return response
+
+
+def _get_multipart_upload_dir(upload_id):
+    return os.path.join(_MULTIPART_UPLOAD_STAGING_DIR, _validate_multipart_upload_id(upload_id))
+
+
+def _remove_expired_multipart_uploads():
+    """
+    Remove the staging directories of multipart uploads whose last part was received (or which
+    were created, if they received none) more than ``_MULTIPART_UPLOAD_EXPIRATION_SECONDS`` ago.
+    """
+    if not os.path.isdir(_MULTIPART_UPLOAD_STAGING_DIR):
+        return
+    expiration_time = time.time() - _MULTIPART_UPLOAD_EXPIRATION_SECONDS
+    for upload_id in os.listdir(_MULTIPART_UPLOAD_STAGING_DIR):
+        upload_dir = os.path.join(_MULTIPART_UPLOAD_STAGING_DIR, upload_id)
+        try:
+            # Adding a part to the directory updates its modification time
+            expired = os.path.getmtime(upload_dir) < expiration_time
+        except OSError:
+            # Completed or aborted concurrently
+            continue
+        if expired:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+
+
+@catch_mlflow_exception
+def _create_multipart_upload(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    # Fail fast if proxying is disabled, before staging anything
+    _get_proxied_artifact_repo()
+    _remove_expired_multipart_uploads()
+    upload_id = uuid.uuid4().hex
+    os.makedirs(_get_multipart_upload_dir(upload_id))
+    response = Response(mimetype='application/json')
+    response.set_data(json.dumps({'upload_id': upload_id}))
+    return response
+
+
+def _get_existing_multipart_upload_dir(upload_id):
+    upload_dir = _get_multipart_upload_dir(upload_id)
+    if not os.path.isdir(upload_dir):
+        raise MlflowException("Multipart upload '%s' does not exist" % upload_id,
+                              error_code=RESOURCE_DOES_NOT_EXIST)
+    return upload_dir
+
+
+def _get_part_number(value):
+    try:
+        part_number = int(value)
+    except ValueError:
+        part_number = -1
+    if part_number < 0:
+        raise MlflowException("Invalid part number: '%s'" % value,
+                              error_code=INVALID_PARAMETER_VALUE)
+    return part_number
+
+
+@catch_mlflow_exception
+def _upload_artifact_part(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    upload_dir = _get_existing_multipart_upload_dir(_get_required_query_param('upload_id'))
+    part_number = _get_part_number(_get_required_query_param('part_number'))
+    # Write to a temporary name first so that a partially received part is never assembled
+    part_file = os.path.join(upload_dir, str(part_number))
+    fd, tmp_part_file = tempfile.mkstemp(dir=upload_dir, prefix=".part")
+    with os.fdopen(fd, "wb") as f:
+        _write_request_body(f)
+    os.rename(tmp_part_file, part_file)
+    return _empty_json_response()
+
+
+@catch_mlflow_exception
+def _complete_multipart_upload(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    upload_dir = _get_existing_multipart_upload_dir(_get_required_query_param('upload_id'))
+    num_parts = _get_part_number(_get_required_query_param('num_parts'))
+    part_files = [os.path.join(upload_dir, str(i)) for i in range(num_parts)]
+    missing_parts = [str(i) for i, part in enumerate(part_files) if not os.path.exists(part)]
+    if missing_parts:
+        raise MlflowException("Cannot complete multipart upload: missing parts %s" %
+                              ", ".join(missing_parts), error_code=INVALID_PARAMETER_VALUE)
+    assembly_dir = tempfile.mkdtemp(dir=upload_dir)
+    try:
+        local_file = os.path.join(assembly_dir, posixpath.basename(artifact_path))
+        with open(local_file, "wb") as dst:
+            for part in part_files:
+                with open(part, "rb") as src:
+                    shutil.copyfileobj(src, dst, _ARTIFACT_STREAM_CHUNK_SIZE)
+        _log_proxied_artifact(local_file, artifact_path)
+    finally:
+        shutil.rmtree(upload_dir, ignore_errors=True)
+    return _empty_json_response()
+
+
+@catch_mlflow_exception
+def _abort_multipart_upload(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    upload_dir = _get_existing_multipart_upload_dir(_get_required_query_param('upload_id'))
+    shutil.rmtree(upload_dir, ignore_errors=True)
+    return _empty_json_response()
+
+
 def _get_paths(base_path):
     """
     A service endpoints base path is typically something like /preview/mlflow/experiment.
@@ -418,9 +679,43 @@ def get_endpoints():
             for http_path in _get_paths(endpoint.path):
                 handler = get_handler(MlflowService().GetRequestClass(service_method))
                 ret.append((http_path, handler, [endpoint.method]))
+    for endpoint_path, handler, methods in JSON_ENDPOINTS:
+        for http_path in _get_paths(endpoint_path):
+            ret.append((http_path, handler, methods))
     return ret
 
 
+def get_artifact_proxy_endpoints():
+    """
+    Endpoints that proxy artifact uploads, downloads and listings to the server's default
+    artifact root, so that clients do not need direct access to the underlying storage. Artifacts
+    are addressed by their path relative to the artifact root. Request and response bodies are
+    raw file contents, which are streamed rather than buffered in memory.
+
+    :return: List of tuples (path, handler, methods)
+    """
+    base_path = "/mlflow-artifacts"
+    routes = [
+        ("/artifacts", _list_proxied_artifacts, ['GET']),
+        ("/artifacts/<path:artifact_path>", _download_artifact, ['GET']),
+        ("/artifacts/<path:artifact_path>", _upload_artifact, ['PUT']),
+        ("/mpu/create/<path:artifact_path>", _create_multipart_upload, ['POST']),
+        ("/mpu/upload/<path:artifact_path>", _upload_artifact_part, ['PUT']),
+        ("/mpu/complete/<path:artifact_path>", _complete_multipart_upload, ['POST']),
+        ("/mpu/abort/<path:artifact_path>", _abort_multipart_upload, ['POST']),
+    ]
+    return [(http_path, handler, methods)
+            for route, handler, methods in routes
+            for http_path in _get_paths(base_path + route)]
+
+
+# Endpoints outside of MlflowService, whose request and response bodies are JSON documents
+# rather than protobuf messages. Metric histories are returned as one list per column.
+JSON_ENDPOINTS = [
+    ("/mlflow/metrics/get-histories", _get_metric_histories, ['POST']),
+    ("/preview/mlflow/metrics/get-histories", _get_metric_histories, ['POST']),
+]
+
 HANDLERS = {
     CreateExperiment: _create_experiment,
     GetExperiment: _get_experiment,
@@ -2,7 +2,8 @@
 The ``mlflow.sklearn`` module provides an API for logging and loading scikit-learn models. This
 module exports scikit-learn models with the following flavors:
 
-Python (native) `pickle <https://scikit-learn.org/stable/modules/model_persistence.html>`_ format
+Python (native) `pickle <https://scikit-learn.org/stable/modules/model_persistence.html>`_ or
+`joblib <https://joblib.readthedocs.io/en/latest/persistence.html>`_ format
     This is the main flavor that can be loaded back into scikit-learn.
 
 :py:mod:`mlflow.pyfunc`
@@ -19,6 +20,7 @@ import mlflow
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
+from mlflow.models.utils import _save_example
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, INTERNAL_ERROR
 from mlflow.protos.databricks_pb2 import RESOURCE_ALREADY_EXISTS
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
@@ -29,12 +31,17 @@ FLAVOR_NAME = "sklearn"
 
 SERIALIZATION_FORMAT_PICKLE = "pickle"
 SERIALIZATION_FORMAT_CLOUDPICKLE = "cloudpickle"
+SERIALIZATION_FORMAT_JOBLIB = "joblib"
 
 SUPPORTED_SERIALIZATION_FORMATS = [
     SERIALIZATION_FORMAT_PICKLE,
-    SERIALIZATION_FORMAT_CLOUDPICKLE
+    SERIALIZATION_FORMAT_CLOUDPICKLE,
+    SERIALIZATION_FORMAT_JOBLIB
 ]
 
+_PICKLE_MODEL_DATA_SUBPATH = "model.pkl"
+_JOBLIB_MODEL_DATA_SUBPATH = "model.joblib"
+
 
 def get_default_conda_env(include_cloudpickle=False):
     """
@@ -56,7 +63,7 @@ def get_default_conda_env(include_cloudpickle=False):
 
 
 def save_model(sk_model, path, conda_env=None, mlflow_model=Model(),
-               serialization_format=SERIALIZATION_FORMAT_CLOUDPICKLE):
+               serialization_format=SERIALIZATION_FORMAT_CLOUDPICKLE, input_example=None):
     """
     Save a scikit-learn model to a path on the local file system.
 
@@ -85,7 +92,14 @@ def save_model(sk_model, path, conda_env=None, mlflow_model=Model(),
                                  ``mlflow.sklearn.SUPPORTED_SERIALIZATION_FORMATS``. The Cloudpickle
                                  format, ``mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE``,
                                  provides better cross-system compatibility by identifying and
-                                 packaging code dependencies with the serialized model.
+                                 packaging code dependencies with the serialized model. The Joblib
+                                 format, ``mlflow.sklearn.SERIALIZATION_FORMAT_JOBLIB``, stores the
+                                 numpy arrays of the model uncompressed, so that they can be
+                                 memory-mapped when the model is loaded rather than read into
+                                 memory (see :py:func:`load_model`).
+    :param input_example: (Experimental) Example of the model input, as a pandas DataFrame, a
+                          numpy ndarray or a dictionary mapping column names to column values. It
+                          is stored with the model and used, e.g., to warm up model servers.
 
     >>> import mlflow.sklearn
     >>> from sklearn.datasets import load_iris
@@ -120,7 +134,8 @@ def save_model(sk_model, path, conda_env=None, mlflow_model=Model(),
         raise MlflowException(message="Path '{}' already exists".format(path),
                               error_code=RESOURCE_ALREADY_EXISTS)
     os.makedirs(path)
-    model_data_subpath = "model.pkl"
+    model_data_subpath = _JOBLIB_MODEL_DATA_SUBPATH \
+        if serialization_format == SERIALIZATION_FORMAT_JOBLIB else _PICKLE_MODEL_DATA_SUBPATH
     _save_model(sk_model=sk_model, output_path=os.path.join(path, model_data_subpath),
                 serialization_format=serialization_format)
 
@@ -140,11 +155,12 @@ def save_model(sk_model, path, conda_env=None, mlflow_model=Model(),
                             pickled_model=model_data_subpath,
                             sklearn_version=sklearn.__version__,
                             serialization_format=serialization_format)
+    _save_example(mlflow_model, input_example, path)
     mlflow_model.save(os.path.join(path, "MLmodel"))
 
 
 def log_model(sk_model, artifact_path, conda_env=None,
-              serialization_format=SERIALIZATION_FORMAT_CLOUDPICKLE):
+              serialization_format=SERIALIZATION_FORMAT_CLOUDPICKLE, input_example=None):
     """
     Log a scikit-learn model as an MLflow artifact for the current run.
 
@@ -172,7 +188,14 @@ def log_model(sk_model, artifact_path, conda_env=None,
                                  ``mlflow.sklearn.SUPPORTED_SERIALIZATION_FORMATS``. The Cloudpickle
                                  format, ``mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE``,
                                  provides better cross-system compatibility by identifying and
-                                 packaging code dependencies with the serialized model.
+                                 packaging code dependencies with the serialized model. The Joblib
+                                 format, ``mlflow.sklearn.SERIALIZATION_FORMAT_JOBLIB``, stores the
+                                 numpy arrays of the model uncompressed, so that they can be
+                                 memory-mapped when the model is loaded rather than read into
+                                 memory (see :py:func:`load_model`).
+    :param input_example: (Experimental) Example of the model input, as a pandas DataFrame, a
+                          numpy ndarray or a dictionary mapping column names to column values. It
+                          is stored with the model and used, e.g., to warm up model servers.
 
     >>> import mlflow
     >>> import mlflow.sklearn
@@ -192,12 +215,15 @@ def log_model(sk_model, artifact_path, conda_env=None,
                      flavor=mlflow.sklearn,
                      sk_model=sk_model,
                      conda_env=conda_env,
-                     serialization_format=serialization_format)
+                     serialization_format=serialization_format,
+                     input_example=input_example)
 
 
-def _load_model_from_local_file(path):
+def _load_model_from_local_file(path, mmap_mode=None):
     """Load a scikit-learn model saved as an MLflow artifact on the local file system."""
     # TODO: we could validate the scikit-learn version here
+    if path.endswith(_JOBLIB_MODEL_DATA_SUBPATH):
+        return _import_joblib().load(path, mmap_mode=mmap_mode)
     with open(path, "rb") as f:
         # Models serialized with Cloudpickle can be deserialized using Pickle; in fact,
         # Cloudpickle.load() is just a redefinition of pickle.load(). Therefore, we do
@@ -205,13 +231,24 @@ def _load_model_from_local_file(path):
         return pickle.load(f)
 
 
+def _import_joblib():
+    try:
+        import joblib
+    except ImportError:
+        # scikit-learn < 0.21 vendors joblib instead of depending on it
+        from sklearn.externals import joblib
+    return joblib
+
+
 def _load_pyfunc(path):
     """
     Load PyFunc implementation. Called by ``pyfunc.load_pyfunc``.
 
     :param path: Local filesystem path to the MLflow Model with the ``sklearn`` flavor.
     """
-    return _load_model_from_local_file(path)
+    # Memory-map the arrays of models saved in the Joblib format, so that processes serving the
+    # same model share its pages through the OS page cache instead of each holding a copy
+    return _load_model_from_local_file(path, mmap_mode="r")
 
 
 def _save_model(sk_model, output_path, serialization_format):
@@ -219,8 +256,9 @@ def _save_model(sk_model, output_path, serialization_format):
     :param sk_model: The scikit-learn model to serialize.
     :param output_path: The file path to which to write the serialized model.
     :param serialization_format: The format in which to serialize the model. This should be one of
-                                 the following: ``mlflow.sklearn.SERIALIZATION_FORMAT_PICKLE`` or
-                                 ``mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE``.
+                                 the following: ``mlflow.sklearn.SERIALIZATION_FORMAT_PICKLE``,
+                                 ``mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE`` or
+                                 ``mlflow.sklearn.SERIALIZATION_FORMAT_JOBLIB``.
     """
     with open(output_path, "wb") as out:
         if serialization_format == SERIALIZATION_FORMAT_PICKLE:
@@ -228,6 +266,9 @@ def _save_model(sk_model, output_path, serialization_format):
         elif serialization_format == SERIALIZATION_FORMAT_CLOUDPICKLE:
             import cloudpickle
             cloudpickle.dump(sk_model, out)
+        elif serialization_format == SERIALIZATION_FORMAT_JOBLIB:
+            # Uncompressed, so that the arrays of the model can be memory-mapped
+            _import_joblib().dump(sk_model, out, compress=0)
         else:
             raise MlflowException(
                     message="Unrecognized serialization format: {serialization_format}".format(
@@ -235,7 +276,7 @@ def _save_model(sk_model, output_path, serialization_format):
                     error_code=INTERNAL_ERROR)
 
 
-def load_model(model_uri):
+def load_model(model_uri, mmap_mode=None):
     """
     Load a scikit-learn model from a local file or a run.
 
@@ -249,6 +290,11 @@ def load_model(model_uri):
                       For more information about supported URI schemes, see
                       `Referencing Artifacts <https://www.mlflow.org/docs/latest/tracking.html#
                       artifact-locations>`_.
+    :param mmap_mode: If not ``None``, the numpy arrays of the model are memory-mapped with this
+                      mode (see ``numpy.load``) instead of being read into memory. With ``"r"``,
+                      processes loading the same model share its arrays through the OS page
+                      cache. Only supported for models saved with the
+                      ``mlflow.sklearn.SERIALIZATION_FORMAT_JOBLIB`` serialization format.
 
     :return: A scikit-learn model.
 
@@ -261,4 +307,12 @@ def load_model(model_uri):
     local_model_path = _download_artifact_from_uri(artifact_uri=model_uri)
     flavor_conf = _get_flavor_configuration(model_path=local_model_path, flavor_name=FLAVOR_NAME)
     sklearn_model_artifacts_path = os.path.join(local_model_path, flavor_conf['pickled_model'])
-    return _load_model_from_local_file(path=sklearn_model_artifacts_path)
+    if mmap_mode is not None and \
+            flavor_conf.get("serialization_format") != SERIALIZATION_FORMAT_JOBLIB:
+        raise MlflowException(
+            message="Memory-mapping is only supported for models saved with the '{joblib}'"
+                    " serialization format, not '{serialization_format}'.".format(
+                        joblib=SERIALIZATION_FORMAT_JOBLIB,
+                        serialization_format=flavor_conf.get("serialization_format")),
+            error_code=INVALID_PARAMETER_VALUE)
+    return _load_model_from_local_file(path=sklearn_model_artifacts_path, mmap_mode=mmap_mode)
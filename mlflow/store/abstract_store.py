@@ -1,7 +1,14 @@
 from abc import abstractmethod, ABCMeta
 
 from mlflow.entities import ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST
 from mlflow.store import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.utils.validation import _validate_metric_histories_args
+
+
+# Columns of the metric histories returned by AbstractStore.get_metric_histories
+METRIC_HISTORY_COLUMNS = ["run_id", "key", "step", "timestamp", "value"]
 
 
 class PagedList(list):
@@ -211,6 +218,37 @@ class AbstractStore:
         """
         pass
 
+    def get_metric_histories(self, run_ids, metric_keys, max_points=None):
+        """
+        Return all values logged for several metrics of several runs, as one column per field of
+        the logged values. Values are ordered by run, in the order of ``run_ids``, then by
+        metric, in the order of ``metric_keys``, then by step and timestamp. Runs and metrics
+        that do not exist have no values. This implementation calls
+        :py:func:`get_metric_history` for each run and metric. Stores should override it to fetch
+        all values at once.
+
+        :param run_ids: List of unique identifiers for runs
+        :param metric_keys: List of metric names within the runs
+        :param max_points: If specified, the maximum number of values returned for each run and
+                           metric. Metrics with more values are downsampled to values evenly
+                           spread over their history, including the first and last ones.
+
+        :return: A dictionary mapping each of ``METRIC_HISTORY_COLUMNS`` (run_id, key, step,
+                 timestamp and value) to the list of its values.
+        """
+        _validate_metric_histories_args(run_ids, metric_keys, max_points)
+
+        def get_points(run_id, metric_key):
+            try:
+                metrics = self.get_metric_history(run_id, metric_key)
+            except MlflowException as e:
+                if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                    raise
+                return []
+            return [(metric.step, metric.timestamp, metric.value) for metric in metrics]
+
+        return _metric_histories_to_columns(run_ids, metric_keys, get_points, max_points)
+
     def search_runs(self, experiment_ids, filter_string, run_view_type,
                     max_results=SEARCH_MAX_RESULTS_DEFAULT, order_by=None, page_token=None):
         """
@@ -277,3 +315,44 @@ class AbstractStore:
         :return: None.
         """
         pass
+
+
+def _unique(items):
+    seen = set()
+    return [item for item in items if not (item in seen or seen.add(item))]
+
+
+def _downsample(points, max_points):
+    """
+    Select ``max_points`` of ``points`` evenly spread over the list, including its first and last
+    elements. If ``max_points`` is 1, only the last point is kept.
+    """
+    if max_points is None or len(points) <= max_points:
+        return points
+    if max_points == 1:
+        return points[-1:]
+    last = len(points) - 1
+    # Round halves up rather than with round(), which rounds them to even on Python 3 only
+    return [points[int(i * last / float(max_points - 1) + 0.5)] for i in range(max_points)]
+
+
+def _metric_histories_to_columns(run_ids, metric_keys, get_points, max_points):
+    """
+    Build the columns returned by :py:func:`AbstractStore.get_metric_histories`.
+
+    :param get_points: Function returning the list of (step, timestamp, value) tuples logged
+                       for a run ID and metric key, in the order they were logged.
+    """
+    columns = {column: [] for column in METRIC_HISTORY_COLUMNS}
+    for run_id in _unique(run_ids):
+        for metric_key in _unique(metric_keys):
+            # Sorting is stable, so values logged at the same step and time keep their order
+            points = sorted(get_points(run_id, metric_key), key=lambda point: point[:2])
+            points = _downsample(points, max_points)
+            columns["run_id"].extend([run_id] * len(points))
+            columns["key"].extend([metric_key] * len(points))
+            for step, timestamp, value in points:
+                columns["step"].append(step)
+                columns["timestamp"].append(timestamp)
+                columns["value"].append(value)
+    return columns
@@ -2,12 +2,18 @@ import os
 import posixpath
 import tempfile
 from abc import abstractmethod, ABCMeta
+from multiprocessing.pool import ThreadPool
 
 from mlflow.utils.validation import path_not_unique, bad_path_message
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
 
+# Maximum number of files that repositories supporting concurrent transfers upload or download
+# at the same time
+MAX_TRANSFER_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS"
+_DEFAULT_MAX_TRANSFER_WORKERS = 8
+
 
 class ArtifactRepository:
     """
@@ -76,23 +82,6 @@ class ArtifactRepository:
         # TODO: Probably need to add a more efficient method to stream just a single artifact
         #       without downloading it, or to get a pre-signed URL for cloud storage.
 
-        def download_artifacts_into(artifact_path, dest_dir):
-            basename = posixpath.basename(artifact_path)
-            local_path = os.path.join(dest_dir, basename)
-            listing = self.list_artifacts(artifact_path)
-            if len(listing) > 0:
-                # Artifact_path is a directory, so make a directory for it and download everything
-                if not os.path.exists(local_path):
-                    os.mkdir(local_path)
-                for file_info in listing:
-                    # prevent an infinite loop (sometimes the current path is listed e.g. as ".")
-                    if file_info.path == "." or file_info.path == artifact_path:
-                        continue
-                    download_artifacts_into(artifact_path=file_info.path, dest_dir=local_path)
-            else:
-                self._download_file(remote_file_path=artifact_path, local_path=local_path)
-            return local_path
-
         if dst_path is None:
             dst_path = tempfile.mkdtemp()
         dst_path = os.path.abspath(dst_path)
@@ -110,7 +99,58 @@ class ArtifactRepository:
                     " Destination path: {dst_path}".format(dst_path=dst_path)),
                 error_code=INVALID_PARAMETER_VALUE)
 
-        return download_artifacts_into(artifact_path, dst_path)
+        return self._download_artifacts_into(artifact_path, dst_path)
+
+    def _download_artifacts_into(self, artifact_path, dest_dir):
+        """
+        Download the artifact file or directory at ``artifact_path`` into the existing local
+        directory ``dest_dir``, walking directories one level at a time via ``list_artifacts``.
+
+        :return: Local path of the downloaded artifact.
+        """
+        basename = posixpath.basename(artifact_path)
+        local_path = os.path.join(dest_dir, basename)
+        listing = self.list_artifacts(artifact_path)
+        if len(listing) > 0:
+            # Artifact_path is a directory, so make a directory for it and download everything
+            if not os.path.exists(local_path):
+                os.mkdir(local_path)
+            for file_info in listing:
+                # prevent an infinite loop (sometimes the current path is listed e.g. as ".")
+                if file_info.path == "." or file_info.path == artifact_path:
+                    continue
+                self._download_artifacts_into(artifact_path=file_info.path, dest_dir=local_path)
+        else:
+            self._download_file(remote_file_path=artifact_path, local_path=local_path)
+        return local_path
+
+    def _download_file_listing(self, artifact_path, dest_dir, file_paths):
+        """
+        Download the artifact at ``artifact_path`` into the existing local directory ``dest_dir``,
+        given a flat listing of all files beneath it. Repositories whose backends can list a
+        prefix recursively in a single (paginated) call can use this instead of the default
+        directory-by-directory traversal: the local directory tree is reconstructed up front and
+        the files are then downloaded concurrently.
+
+        :param file_paths: Paths, relative to the repository root, of all files under
+                           ``artifact_path``. If empty, ``artifact_path`` is treated as a file.
+        :return: Local path of the downloaded artifact.
+        """
+        local_path = os.path.join(dest_dir, posixpath.basename(artifact_path))
+        if len(file_paths) == 0:
+            self._download_file(remote_file_path=artifact_path, local_path=local_path)
+            return local_path
+
+        downloads = []
+        for file_path in file_paths:
+            rel_path = posixpath.relpath(file_path, artifact_path) if artifact_path else file_path
+            local_file_path = os.path.join(local_path, *rel_path.split("/"))
+            local_file_dir = os.path.dirname(local_file_path)
+            if not os.path.exists(local_file_dir):
+                os.makedirs(local_file_dir)
+            downloads.append((file_path, local_file_path))
+        _map_concurrently(lambda args: self._download_file(*args), downloads)
+        return local_path
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -129,3 +169,23 @@ def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException("Invalid artifact path: '%s'. %s" % (artifact_path,
                                                                    bad_path_message(artifact_path)))
+
+
+def _map_concurrently(func, items):
+    """
+    Apply ``func`` to each element of ``items`` using a pool of at most
+    ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads, re-raising the first exception encountered.
+
+    :return: List of results, in the order of ``items``.
+    """
+    items = list(items)
+    max_workers = int(os.environ.get(MAX_TRANSFER_WORKERS_ENV_VAR, _DEFAULT_MAX_TRANSFER_WORKERS))
+    num_workers = min(max_workers, len(items))
+    if num_workers <= 1:
+        return [func(item) for item in items]
+    pool = ThreadPool(num_workers)
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
@@ -1,18 +1,16 @@
-import entrypoints
+import importlib
+import threading
 import warnings
 
-from mlflow.exceptions import MlflowException
-from mlflow.store.azure_blob_artifact_repo import AzureBlobArtifactRepository
-from mlflow.store.dbfs_artifact_repo import dbfs_artifact_repo_factory
-from mlflow.store.ftp_artifact_repo import FTPArtifactRepository
-from mlflow.store.gcs_artifact_repo import GCSArtifactRepository
-from mlflow.store.hdfs_artifact_repo import HdfsArtifactRepository
-from mlflow.store.local_artifact_repo import LocalArtifactRepository
-from mlflow.store.runs_artifact_repo import RunsArtifactRepository
-from mlflow.store.s3_artifact_repo import S3ArtifactRepository
-from mlflow.store.sftp_artifact_repo import SFTPArtifactRepository
+import entrypoints
+import six
 
+from mlflow.exceptions import MlflowException
 from mlflow.utils import get_uri_scheme
+from mlflow.utils.cache_utils import ProcessLocalCache
+
+# Maximum number of repository instances retained by an `ArtifactRepositoryRegistry`
+_MAX_CACHED_ARTIFACT_REPOSITORIES = 1024
 
 
 class ArtifactRepositoryRegistry:
@@ -26,14 +24,43 @@ class ArtifactRepositoryRegistry:
     When instantiating an artifact repository through the `get_artifact_repository` method, the
     scheme of the artifact URI provided will be used to select which implementation to instantiate,
     which will be called with same arguments passed to the `get_artifact_repository` method.
+
+    An implementation can also be registered as a ``"module:attribute"`` string, in which case
+    its module is only imported when its scheme is first used. The entrypoints are scanned once,
+    on the first call to `get_artifact_repository`, unless `register_entrypoints` is called
+    beforehand, so that implementations provided by other packages can still replace the
+    built-in ones.
+
+    Implementations registered with ``cache_instances=True`` are only instantiated once per
+    process for a given `artifact_uri`; subsequent calls to `get_artifact_repository` return the
+    cached instance. This should only be enabled for implementations whose instances are
+    stateless beyond their `artifact_uri` and safe to share between threads.
     """
 
     def __init__(self):
         self._registry = {}
+        self._cached_schemes = set()
+        self._instance_cache = ProcessLocalCache(max_size=_MAX_CACHED_ARTIFACT_REPOSITORIES)
+        self._entrypoints_lock = threading.Lock()
+        self._entrypoints_registered = False
 
-    def register(self, scheme, repository):
-        """Register artifact repositories provided by other packages"""
+    def register(self, scheme, repository, cache_instances=False):
+        """Register artifact repositories provided by other packages
+
+        :param repository: Class or function creating an artifact repository from an artifact URI,
+                           or ``"module:attribute"`` string referring to one, which is imported
+                           when the scheme is first used.
+        """
         self._registry[scheme] = repository
+        if cache_instances:
+            self._cached_schemes.add(scheme)
+        else:
+            self._cached_schemes.discard(scheme)
+        self._instance_cache.clear()
+
+    def clear_cache(self):
+        """Discard all cached artifact repository instances."""
+        self._instance_cache.clear()
 
     def register_entrypoints(self):
         # Register artifact repositories provided by other packages
@@ -47,6 +74,7 @@ class ArtifactRepositoryRegistry:
                     ),
                     stacklevel=2
                 )
+        self._entrypoints_registered = True
 
     def get_artifact_repository(self, artifact_uri):
         """Get an artifact repository from the registry based on the scheme of artifact_uri
@@ -59,7 +87,7 @@ class ArtifactRepositoryRegistry:
                  requirements.
         """
         scheme = get_uri_scheme(artifact_uri)
-        repository = self._registry.get(scheme)
+        repository = self._get_repository(scheme)
         if repository is None:
             raise MlflowException(
                 "Could not find a registered artifact repository for: {}. "
@@ -67,23 +95,58 @@ class ArtifactRepositoryRegistry:
                     artifact_uri, list(self._registry.keys())
                 )
             )
+        if scheme in self._cached_schemes:
+            return self._instance_cache.get_or_create(
+                artifact_uri, lambda: repository(artifact_uri))
         return repository(artifact_uri)
 
+    def _get_repository(self, scheme):
+        if not self._entrypoints_registered:
+            with self._entrypoints_lock:
+                if not self._entrypoints_registered:
+                    self.register_entrypoints()
+        repository = self._registry.get(scheme)
+        if isinstance(repository, six.string_types):
+            module_name, attribute_name = repository.split(":")
+            repository = getattr(importlib.import_module(module_name), attribute_name)
+            # Replace the reference, unless the scheme was registered again in the meantime
+            if isinstance(self._registry.get(scheme), six.string_types):
+                self._registry[scheme] = repository
+        return repository
+
 
 _artifact_repository_registry = ArtifactRepositoryRegistry()
 
-_artifact_repository_registry.register('', LocalArtifactRepository)
-_artifact_repository_registry.register('file', LocalArtifactRepository)
-_artifact_repository_registry.register('s3', S3ArtifactRepository)
-_artifact_repository_registry.register('gs', GCSArtifactRepository)
-_artifact_repository_registry.register('wasbs', AzureBlobArtifactRepository)
-_artifact_repository_registry.register('ftp', FTPArtifactRepository)
-_artifact_repository_registry.register('sftp', SFTPArtifactRepository)
-_artifact_repository_registry.register('dbfs', dbfs_artifact_repo_factory)
-_artifact_repository_registry.register('hdfs', HdfsArtifactRepository)
-_artifact_repository_registry.register('runs', RunsArtifactRepository)
-
-_artifact_repository_registry.register_entrypoints()
+# Implementations are imported when their scheme is first used
+_artifact_repository_registry.register(
+    '', "mlflow.store.local_artifact_repo:LocalArtifactRepository", cache_instances=True)
+_artifact_repository_registry.register(
+    'file', "mlflow.store.local_artifact_repo:LocalArtifactRepository", cache_instances=True)
+_artifact_repository_registry.register(
+    's3', "mlflow.store.s3_artifact_repo:S3ArtifactRepository", cache_instances=True)
+_artifact_repository_registry.register(
+    'gs', "mlflow.store.gcs_artifact_repo:GCSArtifactRepository", cache_instances=True)
+# Azure clients are cached per account and credentials by the repository itself, so that
+# instances pick up credential changes made through the environment
+_artifact_repository_registry.register(
+    'wasbs', "mlflow.store.azure_blob_artifact_repo:AzureBlobArtifactRepository")
+_artifact_repository_registry.register(
+    'ftp', "mlflow.store.ftp_artifact_repo:FTPArtifactRepository", cache_instances=True)
+# SFTP repositories hold an open connection that is not safe to share between threads
+_artifact_repository_registry.register(
+    'sftp', "mlflow.store.sftp_artifact_repo:SFTPArtifactRepository")
+# The DBFS implementation is chosen based on the environment at instantiation time
+_artifact_repository_registry.register(
+    'dbfs', "mlflow.store.dbfs_artifact_repo:dbfs_artifact_repo_factory")
+_artifact_repository_registry.register(
+    'hdfs', "mlflow.store.hdfs_artifact_repo:HdfsArtifactRepository", cache_instances=True)
+_artifact_repository_registry.register(
+    'http', "mlflow.store.http_artifact_repo:HttpArtifactRepository", cache_instances=True)
+_artifact_repository_registry.register(
+    'https', "mlflow.store.http_artifact_repo:HttpArtifactRepository", cache_instances=True)
+# `runs:/` URI resolution is memoized by RunsArtifactRepository with a short TTL
+_artifact_repository_registry.register(
+    'runs', "mlflow.store.runs_artifact_repo:RunsArtifactRepository")
 
 
 def get_artifact_repository(artifact_uri):
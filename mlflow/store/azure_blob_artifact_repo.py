@@ -6,7 +6,11 @@ from six.moves import urllib
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.store.artifact_repo import ArtifactRepository, _map_concurrently
+from mlflow.utils.cache_utils import ProcessLocalCache
+
+# BlockBlobService clients, keyed by (storage account, connection string, access key)
+_azure_clients = ProcessLocalCache()
 
 
 class AzureBlobArtifactRepository(ArtifactRepository):
@@ -27,19 +31,15 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             self.client = client
             return
 
-        from azure.storage.blob import BlockBlobService
         (_, account, _) = AzureBlobArtifactRepository.parse_wasbs_uri(artifact_uri)
-        if "AZURE_STORAGE_CONNECTION_STRING" in os.environ:
-            self.client = BlockBlobService(
-                account_name=account,
-                connection_string=os.environ.get("AZURE_STORAGE_CONNECTION_STRING"))
-        elif "AZURE_STORAGE_ACCESS_KEY" in os.environ:
-            self.client = BlockBlobService(
-                account_name=account,
-                account_key=os.environ.get("AZURE_STORAGE_ACCESS_KEY"))
-        else:
+        connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
+        access_key = os.environ.get("AZURE_STORAGE_ACCESS_KEY")
+        if connection_string is None and access_key is None:
             raise Exception("You need to set one of AZURE_STORAGE_CONNECTION_STRING or "
                             "AZURE_STORAGE_ACCESS_KEY to access Azure storage.")
+        self.client = _azure_clients.get_or_create(
+            (account, connection_string, access_key),
+            lambda: _create_block_blob_service(account, connection_string, access_key))
 
     @staticmethod
     def parse_wasbs_uri(uri):
@@ -71,15 +71,17 @@ class AzureBlobArtifactRepository(ArtifactRepository):
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         local_dir = os.path.abspath(local_dir)
+        uploads = []
         for (root, _, filenames) in os.walk(local_dir):
             upload_path = dest_path
             if root != local_dir:
                 rel_path = os.path.relpath(root, local_dir)
                 upload_path = posixpath.join(dest_path, rel_path)
             for f in filenames:
-                path = posixpath.join(upload_path, f)
-                self.client.create_blob_from_path(
-                    container, path, os.path.join(root, f))
+                uploads.append((posixpath.join(upload_path, f), os.path.join(root, f)))
+        _map_concurrently(
+            lambda upload: self.client.create_blob_from_path(container, upload[0], upload[1]),
+            uploads)
 
     def list_artifacts(self, path=None):
         from azure.storage.blob.models import BlobPrefix
@@ -113,7 +115,50 @@ class AzureBlobArtifactRepository(ArtifactRepository):
                 break
         return sorted(infos, key=lambda f: f.path)
 
+    def _list_files_recursive(self, path):
+        """
+        List all blobs under ``path`` with a single, flat (non-delimited) paginated listing of the
+        prefix, instead of one listing per directory level.
+
+        :return: Paths of the blobs, relative to the artifact root.
+        """
+        (container, _, artifact_path) = self.parse_wasbs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path + "/" if dest_path else ""
+        file_paths = []
+        marker = None  # Used to make next list request if this one exceeded the result limit
+        while True:
+            results = self.client.list_blobs(container, prefix=prefix, marker=marker)
+            for r in results:
+                if not r.name.startswith(artifact_path):
+                    raise MlflowException(
+                        "The name of the listed Azure blob does not begin with the specified"
+                        " artifact path. Artifact path: {artifact_path}. Blob name:"
+                        " {blob_name}".format(artifact_path=artifact_path, blob_name=r.name))
+                if r.name.endswith("/"):
+                    continue
+                file_paths.append(posixpath.relpath(path=r.name, start=artifact_path)
+                                  if artifact_path else r.name)
+            if results.next_marker:
+                marker = results.next_marker
+            else:
+                break
+        return file_paths
+
+    def _download_artifacts_into(self, artifact_path, dest_dir):
+        return self._download_file_listing(
+            artifact_path, dest_dir, self._list_files_recursive(artifact_path))
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
         self.client.get_blob_to_path(container, remote_full_path, local_path)
+
+
+def _create_block_blob_service(account, connection_string, access_key):
+    from azure.storage.blob import BlockBlobService
+    if connection_string is not None:
+        return BlockBlobService(account_name=account, connection_string=connection_string)
+    return BlockBlobService(account_name=account, account_key=access_key)
@@ -4,6 +4,7 @@ import sys
 import click
 
 from mlflow.store.artifact_repository_registry import get_artifact_repository
+from mlflow.store.local_blob_store import LocalBlobStore, BLOB_STORE_ENV_VAR
 from mlflow.tracking import _get_store
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.proto_json_utils import message_to_json
@@ -119,5 +120,20 @@ def download_artifacts(run_id, artifact_path, artifact_uri):
     artifact_location = artifact_repo.download_artifacts(artifact_path)
     print(artifact_location)
 
+
+@commands.command("gc-blob-store")
+@click.option("--blob-store", "-b", envvar=BLOB_STORE_ENV_VAR, required=True,
+              help="Path of the local content-addressed blob store. Defaults to the value of "
+                   "the %s environment variable." % BLOB_STORE_ENV_VAR)
+def gc_blob_store(blob_store):
+    """
+    Remove blobs that are no longer referenced by any artifact from the content-addressed blob
+    store used by local artifact repositories. Run this after deleting run artifacts to reclaim
+    the space of files that were logged with deduplication enabled.
+    """
+    num_removed, bytes_freed = LocalBlobStore(blob_store).collect_garbage()
+    _logger.info("Removed %s unreferenced blobs, freeing %s bytes", num_removed, bytes_freed)
+
+
 if __name__ == '__main__':
     commands()
@@ -14,10 +14,10 @@ from mlflow.exceptions import MlflowException, MissingConfigException
 import mlflow.protos.databricks_pb2 as databricks_pb2
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, RESOURCE_DOES_NOT_EXIST
 from mlflow.store import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.abstract_store import AbstractStore
+from mlflow.store.abstract_store import AbstractStore, _metric_histories_to_columns
 from mlflow.utils.validation import _validate_metric_name, _validate_param_name, _validate_run_id, \
     _validate_tag_name, _validate_experiment_id, \
-    _validate_batch_log_limits, _validate_batch_log_data
+    _validate_batch_log_limits, _validate_batch_log_data, _validate_metric_histories_args
 from mlflow.utils.env import get_env
 from mlflow.utils.file_utils import (is_directory, list_subdirs, mkdir, exists, write_yaml,
                                      read_yaml, find, read_file_lines, read_file,
@@ -504,6 +504,33 @@ class FileStore(AbstractStore):
         return [FileStore._get_metric_from_line(metric_key, line)
                 for line in read_file_lines(parent_path, metric_key)]
 
+    def get_metric_histories(self, run_ids, metric_keys, max_points=None):
+        _validate_metric_histories_args(run_ids, metric_keys, max_points)
+        self._check_root_dir()
+        # Find the directories of all runs with a single listing of each experiment, rather than
+        # searching the experiments for each run
+        remaining_run_ids = set(run_ids)
+        run_dirs = {}
+        for experiment_dir in (self._get_active_experiments(True) +
+                               self._get_deleted_experiments(True)):
+            if not remaining_run_ids:
+                break
+            for run_id in remaining_run_ids.intersection(list_subdirs(experiment_dir)):
+                run_dirs[run_id] = os.path.join(experiment_dir, run_id)
+            remaining_run_ids.difference_update(run_dirs)
+
+        def get_points(run_id, metric_key):
+            if run_id not in run_dirs:
+                return []
+            metrics_dir = os.path.join(run_dirs[run_id], FileStore.METRICS_FOLDER_NAME)
+            if not os.path.isfile(os.path.join(metrics_dir, metric_key)):
+                return []
+            metrics = [FileStore._get_metric_from_line(metric_key, line)
+                       for line in read_file_lines(metrics_dir, metric_key)]
+            return [(metric.step, metric.timestamp, metric.value) for metric in metrics]
+
+        return _metric_histories_to_columns(run_ids, metric_keys, get_points, max_points)
+
     @staticmethod
     def _get_param_from_file(parent_path, param_name):
         _validate_param_name(param_name)
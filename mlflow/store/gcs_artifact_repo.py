@@ -4,9 +4,14 @@ import posixpath
 from six.moves import urllib
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.store.artifact_repo import ArtifactRepository, _map_concurrently
+from mlflow.utils.cache_utils import ProcessLocalCache
 from mlflow.utils.file_utils import relative_path_to_artifact_path
 
+# Bucket handles, keyed by (credentials file, bucket name). Constructing a client resolves
+# credentials and looking up a bucket issues an RPC, so both are reused within a process.
+_gcs_buckets = ProcessLocalCache()
+
 
 class GCSArtifactRepository(ArtifactRepository):
     """
@@ -22,8 +27,17 @@ class GCSArtifactRepository(ArtifactRepository):
         else:
             from google.cloud import storage as gcs_storage
             self.gcs = gcs_storage
+        # Clients passed in explicitly (e.g. for testing) bypass the process-wide bucket cache
+        self._use_bucket_cache = client is None
         super(GCSArtifactRepository, self).__init__(artifact_uri)
 
+    def _get_bucket(self, bucket):
+        if not self._use_bucket_cache:
+            return self.gcs.Client().get_bucket(bucket)
+        cache_key = (os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'), bucket)
+        return _gcs_buckets.get_or_create(
+            cache_key, lambda: self.gcs.Client().get_bucket(bucket))
+
     @staticmethod
     def parse_gcs_uri(uri):
         """Parse an GCS URI, returning (bucket, path)"""
@@ -42,7 +56,7 @@ class GCSArtifactRepository(ArtifactRepository):
         dest_path = posixpath.join(
             dest_path, os.path.basename(local_file))
 
-        gcs_bucket = self.gcs.Client().get_bucket(bucket)
+        gcs_bucket = self._get_bucket(bucket)
         blob = gcs_bucket.blob(dest_path)
         blob.upload_from_filename(local_file)
 
@@ -50,9 +64,10 @@ class GCSArtifactRepository(ArtifactRepository):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        gcs_bucket = self.gcs.Client().get_bucket(bucket)
+        gcs_bucket = self._get_bucket(bucket)
 
         local_dir = os.path.abspath(local_dir)
+        uploads = []
         for (root, _, filenames) in os.walk(local_dir):
             upload_path = dest_path
             if root != local_dir:
@@ -60,8 +75,9 @@ class GCSArtifactRepository(ArtifactRepository):
                 rel_path = relative_path_to_artifact_path(rel_path)
                 upload_path = posixpath.join(dest_path, rel_path)
             for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
+                uploads.append((posixpath.join(upload_path, f), os.path.join(root, f)))
+        _map_concurrently(
+            lambda upload: gcs_bucket.blob(upload[0]).upload_from_filename(upload[1]), uploads)
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
@@ -70,7 +86,7 @@ class GCSArtifactRepository(ArtifactRepository):
             dest_path = posixpath.join(dest_path, path)
         prefix = dest_path + "/"
 
-        bkt = self.gcs.Client().get_bucket(bucket)
+        bkt = self._get_bucket(bucket)
 
         infos = self._list_folders(bkt, prefix, artifact_path)
 
@@ -89,8 +105,34 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return [FileInfo(path[len(artifact_path) + 1:-1], True, None) for path in dir_paths]
 
+    def _list_files_recursive(self, path):
+        """
+        List all files under ``path`` with a single, flat (non-delimited) listing of the prefix,
+        instead of one listing per directory level.
+
+        :return: Paths of the files, relative to the artifact root.
+        """
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path + "/" if dest_path else ""
+        bkt = self._get_bucket(bucket)
+        file_paths = []
+        for result in bkt.list_blobs(prefix=prefix):
+            # Skip placeholder objects that some tools create to represent directories
+            if result.name.endswith("/"):
+                continue
+            file_paths.append(result.name[len(artifact_path) + 1:] if artifact_path
+                              else result.name)
+        return file_paths
+
+    def _download_artifacts_into(self, artifact_path, dest_dir):
+        return self._download_file_listing(
+            artifact_path, dest_dir, self._list_files_recursive(artifact_path))
+
     def _download_file(self, remote_file_path, local_path):
         (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
-        gcs_bucket = self.gcs.Client().get_bucket(bucket)
+        gcs_bucket = self._get_bucket(bucket)
         gcs_bucket.get_blob(remote_full_path).download_to_filename(local_path)
@@ -0,0 +1,184 @@
+import math
+import os
+import posixpath
+from multiprocessing.pool import ThreadPool
+
+from six.moves import urllib
+
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.utils.rest_utils import MlflowHostCreds, http_request, http_request_safe, \
+    verify_rest_response
+
+# Marker separating the server-specific part of a proxied artifact URI from the artifact path
+_ARTIFACTS_ENDPOINT = "/api/2.0/mlflow-artifacts/artifacts"
+
+# Files larger than this are uploaded as several parts, which are sent concurrently
+MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_HTTP_ARTIFACT_MULTIPART_CHUNK_SIZE"
+_DEFAULT_MULTIPART_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+MULTIPART_UPLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_HTTP_ARTIFACT_MULTIPART_MAX_WORKERS"
+_DEFAULT_MULTIPART_UPLOAD_MAX_WORKERS = 8
+
+# Size of the chunks in which request and response bodies are streamed
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class _FileChunks(object):
+    """
+    Re-iterable view of the byte range ``[offset, offset + length)`` of a local file. Passing an
+    instance as the body of a ``requests`` call streams it using chunked transfer encoding without
+    reading the whole range into memory. Unlike a generator or an open file, it can be iterated
+    again if ``http_request`` retries the request.
+    """
+
+    def __init__(self, path, offset=0, length=None):
+        self.path = path
+        self.offset = offset
+        self.length = length if length is not None else os.path.getsize(path) - offset
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = f.read(min(_STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class HttpArtifactRepository(ArtifactRepository):
+    """
+    Stores artifacts through the artifact proxy of an MLflow tracking server started with
+    ``mlflow server --serve-artifacts``, so that clients need no credentials for the underlying
+    storage.
+
+    This repository is used with URIs of the form
+    ``http(s)://<host>:<port>/api/2.0/mlflow-artifacts/artifacts/<path>``, where ``<path>`` is
+    relative to the default artifact root of the server. Authentication uses the same
+    ``MLFLOW_TRACKING_USERNAME``, ``MLFLOW_TRACKING_PASSWORD`` and ``MLFLOW_TRACKING_TOKEN``
+    environment variables as the REST tracking store.
+    """
+
+    def __init__(self, artifact_uri):
+        super(HttpArtifactRepository, self).__init__(artifact_uri)
+        self._host, self._base_path, self._root_path = \
+            HttpArtifactRepository.parse_http_artifact_uri(artifact_uri)
+
+    @staticmethod
+    def parse_http_artifact_uri(uri):
+        """
+        Parse a proxied artifact URI, returning (host, API base path, artifact root path), e.g.
+        ``("http://localhost:5000", "/api/2.0/mlflow-artifacts", "0/1234/artifacts")``.
+        """
+        parsed = urllib.parse.urlparse(uri)
+        if parsed.scheme not in ("http", "https") or _ARTIFACTS_ENDPOINT not in parsed.path:
+            raise MlflowException(
+                "Not a proxied artifact URI: %s. Proxied artifact URIs must be of the form "
+                "'http(s)://<host>:<port>%s/<path>'" % (uri, _ARTIFACTS_ENDPOINT))
+        prefix, _, root_path = parsed.path.partition(_ARTIFACTS_ENDPOINT)
+        host = urllib.parse.urlunparse((parsed.scheme, parsed.netloc, "", "", "", ""))
+        base_path = prefix + posixpath.dirname(_ARTIFACTS_ENDPOINT)
+        return host, base_path, root_path.strip("/")
+
+    def _get_host_creds(self):
+        from mlflow.tracking import utils
+        return MlflowHostCreds(
+            host=self._host,
+            username=os.environ.get(utils._TRACKING_USERNAME_ENV_VAR),
+            password=os.environ.get(utils._TRACKING_PASSWORD_ENV_VAR),
+            token=os.environ.get(utils._TRACKING_TOKEN_ENV_VAR),
+            ignore_tls_verification=os.environ.get(utils._TRACKING_INSECURE_TLS_ENV_VAR) == 'true',
+        )
+
+    def _get_full_path(self, artifact_path):
+        if not artifact_path:
+            return self._root_path
+        return posixpath.join(self._root_path, artifact_path) if self._root_path \
+            else artifact_path
+
+    def _get_endpoint(self, route, artifact_path):
+        return "%s/%s/%s" % (self._base_path, route,
+                             urllib.parse.quote(self._get_full_path(artifact_path)))
+
+    def _call_endpoint(self, route, artifact_path, method, **kwargs):
+        return http_request_safe(host_creds=self._get_host_creds(),
+                                 endpoint=self._get_endpoint(route, artifact_path),
+                                 method=method, **kwargs)
+
+    def log_artifact(self, local_file, artifact_path=None):
+        verify_artifact_path(artifact_path)
+        file_name = os.path.basename(local_file)
+        dest_path = posixpath.join(artifact_path, file_name) if artifact_path else file_name
+        chunk_size = int(os.environ.get(MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR,
+                                        _DEFAULT_MULTIPART_UPLOAD_CHUNK_SIZE))
+        file_size = os.path.getsize(local_file)
+        if file_size > chunk_size:
+            self._multipart_upload(local_file, dest_path, file_size, chunk_size)
+        else:
+            self._call_endpoint("artifacts", dest_path, "PUT", data=_FileChunks(local_file))
+
+    def _multipart_upload(self, local_file, dest_path, file_size, chunk_size):
+        upload_id = self._call_endpoint("mpu/create", dest_path, "POST").json()["upload_id"]
+        num_parts = int(math.ceil(float(file_size) / chunk_size))
+
+        def upload_part(part_number):
+            offset = part_number * chunk_size
+            part = _FileChunks(local_file, offset, min(chunk_size, file_size - offset))
+            self._call_endpoint("mpu/upload", dest_path, "PUT", data=part,
+                                params={"upload_id": upload_id, "part_number": part_number})
+
+        max_workers = int(os.environ.get(MULTIPART_UPLOAD_MAX_WORKERS_ENV_VAR,
+                                         _DEFAULT_MULTIPART_UPLOAD_MAX_WORKERS))
+        pool = ThreadPool(min(max_workers, num_parts))
+        try:
+            pool.map(upload_part, range(num_parts))
+        except Exception:
+            self._call_endpoint("mpu/abort", dest_path, "POST", params={"upload_id": upload_id})
+            raise
+        finally:
+            pool.close()
+            pool.join()
+        self._call_endpoint("mpu/complete", dest_path, "POST",
+                            params={"upload_id": upload_id, "num_parts": num_parts})
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        verify_artifact_path(artifact_path)
+        local_dir = os.path.abspath(local_dir)
+        for (root, _, filenames) in os.walk(local_dir):
+            upload_path = artifact_path
+            if root != local_dir:
+                rel_path = relative_path_to_artifact_path(os.path.relpath(root, local_dir))
+                upload_path = posixpath.join(artifact_path, rel_path) if artifact_path \
+                    else rel_path
+            for f in filenames:
+                self.log_artifact(os.path.join(root, f), upload_path)
+
+    def list_artifacts(self, path=None):
+        list_path = self._get_full_path(path)
+        params = {"path": list_path} if list_path else {}
+        response = http_request_safe(host_creds=self._get_host_creds(),
+                                     endpoint="%s/artifacts" % self._base_path,
+                                     method="GET", params=params)
+        infos = []
+        for f in response.json().get("files", []):
+            file_path = f["path"]
+            if self._root_path:
+                file_path = posixpath.relpath(file_path, self._root_path)
+            infos.append(FileInfo(file_path, f["is_dir"], f.get("file_size")))
+        return sorted(infos, key=lambda f: f.path)
+
+    def _download_file(self, remote_file_path, local_path):
+        response = http_request(host_creds=self._get_host_creds(),
+                                endpoint=self._get_endpoint("artifacts", remote_file_path),
+                                method="GET", stream=True)
+        try:
+            verify_rest_response(response, remote_file_path)
+            with open(local_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+        finally:
+            response.close()
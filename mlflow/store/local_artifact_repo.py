@@ -1,10 +1,17 @@
-import distutils.dir_util as dir_util
 import os
 import shutil
 
-from mlflow.store.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.store.artifact_repo import ArtifactRepository, verify_artifact_path, \
+    _map_concurrently
+from mlflow.store.local_blob_store import get_blob_store_from_env
 from mlflow.utils.file_utils import mkdir, list_all, get_file_info, local_file_uri_to_path, \
-    relative_path_to_artifact_path
+    relative_path_to_artifact_path, transfer_file
+
+# How files are logged to and downloaded from local artifact repositories: one of "copy" (the
+# default), "fastcopy", "reflink" or "hardlink" (see ``mlflow.utils.file_utils.transfer_file``).
+# Downloads are never hardlinked, so that modifying them cannot modify the logged artifacts: they
+# are reflinked instead.
+LINK_MODE_ENV_VAR = "MLFLOW_LOCAL_ARTIFACT_LINK_MODE"
 
 
 class LocalArtifactRepository(ArtifactRepository):
@@ -29,7 +36,12 @@ class LocalArtifactRepository(ArtifactRepository):
             self.artifact_dir
         if not os.path.exists(artifact_dir):
             mkdir(artifact_dir)
-        shutil.copy(local_file, artifact_dir)
+        dst_path = os.path.join(artifact_dir, os.path.basename(local_file))
+        blob_store = get_blob_store_from_env()
+        if blob_store is not None:
+            blob_store.log_files([(local_file, dst_path)])
+        else:
+            transfer_file(local_file, dst_path, _get_link_mode())
 
     def log_artifacts(self, local_dir, artifact_path=None):
         verify_artifact_path(artifact_path)
@@ -41,13 +53,24 @@ class LocalArtifactRepository(ArtifactRepository):
             self.artifact_dir
         if not os.path.exists(artifact_dir):
             mkdir(artifact_dir)
-        dir_util.copy_tree(src=local_dir, dst=artifact_dir)
+        blob_store = get_blob_store_from_env()
+        link_mode = _get_link_mode()
+        if blob_store is not None:
+            blob_store.log_files(_make_dir_tree(local_dir, artifact_dir))
+        elif link_mode != "copy":
+            _map_concurrently(lambda f: transfer_file(f[0], f[1], link_mode),
+                              _make_dir_tree(local_dir, artifact_dir))
+        else:
+            # distutils is slow to import, as it loads setuptools when setuptools is installed
+            import distutils.dir_util as dir_util
+            dir_util.copy_tree(src=local_dir, dst=artifact_dir)
 
     def download_artifacts(self, artifact_path, dst_path=None):
         """
         Artifacts tracked by ``LocalArtifactRepository`` already exist on the local filesystem.
         If ``dst_path`` is ``None``, the absolute filesystem path of the specified artifact is
-        returned. If ``dst_path`` is not ``None``, the local artifact is copied to ``dst_path``.
+        returned. If ``dst_path`` is not ``None``, the local artifact is copied (or cloned,
+        depending on ``MLFLOW_LOCAL_ARTIFACT_LINK_MODE``) to ``dst_path``.
 
         :param artifact_path: Relative source path to the desired artifacts.
         :param dst_path: Absolute path of the local filesystem destination directory to which to
@@ -85,4 +108,33 @@ class LocalArtifactRepository(ArtifactRepository):
         # NOTE: The remote_file_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
-        shutil.copyfile(remote_file_path, local_path)
+        link_mode = _get_link_mode()
+        if link_mode == "hardlink":
+            # A hardlinked download would share its data with the logged artifact
+            link_mode = "reflink"
+        if link_mode != "copy":
+            transfer_file(remote_file_path, local_path, link_mode)
+        else:
+            shutil.copyfile(remote_file_path, local_path)
+
+
+def _get_link_mode():
+    return os.environ.get(LINK_MODE_ENV_VAR, "copy")
+
+
+def _make_dir_tree(src_dir, dst_dir):
+    """
+    Recreate the directory tree of ``src_dir`` (including empty directories) under ``dst_dir``.
+
+    :return: List of (source file path, destination file path) tuples for all files in
+             ``src_dir``.
+    """
+    files = []
+    for (root, dirnames, filenames) in os.walk(src_dir, followlinks=True):
+        dst_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        for dirname in dirnames:
+            dst_subdir = os.path.join(dst_root, dirname)
+            if not os.path.exists(dst_subdir):
+                mkdir(dst_subdir)
+        files.extend((os.path.join(root, f), os.path.join(dst_root, f)) for f in filenames)
+    return files
@@ -0,0 +1,149 @@
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+
+from mlflow.store.artifact_repo import _map_concurrently
+
+# If set, LocalArtifactRepository stores artifact contents once in the content-addressed blob
+# store at this path and links run artifacts to them
+BLOB_STORE_ENV_VAR = "MLFLOW_LOCAL_ARTIFACT_BLOB_STORE"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def get_blob_store_from_env():
+    """
+    :return: The :py:class:`LocalBlobStore` configured through the
+             ``MLFLOW_LOCAL_ARTIFACT_BLOB_STORE`` environment variable, or ``None`` if it is unset.
+    """
+    root = os.environ.get(BLOB_STORE_ENV_VAR)
+    return LocalBlobStore(root) if root else None
+
+
+class LocalBlobStore(object):
+    """
+    Content-addressed store of immutable files on the local filesystem.
+
+    Each distinct file content is stored exactly once, as a read-only file named by the SHA-256
+    digest of its content. Artifacts are logged as hardlinks to these blobs, so logging the same
+    file to many runs consumes disk space only once. The link count that the filesystem keeps for
+    each blob acts as its reference count: a blob whose only remaining link is the store's own is
+    no longer referenced by any artifact and is removed by :py:meth:`collect_garbage`.
+
+    The store must be on the same filesystem as the artifact directories linking to it; when a
+    hardlink cannot be created (e.g. across devices), artifacts are copied instead.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+
+    def _get_blob_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:])
+
+    @staticmethod
+    def hash_file(path):
+        """
+        :return: Hex SHA-256 digest of the content of the file at ``path``.
+        """
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def add(self, local_file, digest):
+        """
+        Store the content of ``local_file``, whose SHA-256 digest is ``digest``, unless a blob with
+        that digest already exists.
+
+        :return: Path of the blob.
+        """
+        blob_path = self._get_blob_path(digest)
+        if os.path.exists(blob_path):
+            return blob_path
+        blob_dir = os.path.dirname(blob_path)
+        if not os.path.exists(blob_dir):
+            try:
+                os.makedirs(blob_dir)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+        # Copy to a temporary file and rename it into place, so that concurrent writers of the
+        # same content never expose a partially written blob
+        fd, tmp_path = tempfile.mkstemp(dir=blob_dir, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst, open(local_file, "rb") as src:
+                shutil.copyfileobj(src, dst, _HASH_CHUNK_SIZE)
+            os.chmod(tmp_path, _READ_ONLY)
+            os.rename(tmp_path, blob_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return blob_path
+
+    def link(self, local_file, dst_path, digest):
+        """
+        Make ``dst_path`` a hardlink to the blob holding the content of ``local_file``, adding the
+        blob if needed. Any existing file at ``dst_path`` is replaced (never written through, since
+        it may itself be a link to a blob shared with other artifacts). Falls back to copying
+        ``local_file`` if the blob cannot be linked.
+        """
+        if os.path.lexists(dst_path):
+            os.remove(dst_path)
+        # Retry once if the blob is garbage collected between adding and linking it
+        for attempt in range(2):
+            blob_path = self.add(local_file, digest)
+            try:
+                os.link(blob_path, dst_path)
+                return
+            except OSError as e:
+                if e.errno == errno.ENOENT and attempt == 0:
+                    continue
+                if e.errno in (errno.EXDEV, errno.EMLINK, errno.EPERM, errno.ENOTSUP):
+                    break
+                raise
+        shutil.copyfile(local_file, dst_path)
+
+    def log_files(self, files):
+        """
+        Store and link several files. File contents are hashed concurrently, using up to
+        ``MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS`` threads.
+
+        :param files: List of (local file path, destination path) tuples. The parent directories
+                      of the destination paths must exist.
+        """
+        files = list(files)
+        digests = _map_concurrently(lambda f: LocalBlobStore.hash_file(f[0]), files)
+        for (local_file, dst_path), digest in zip(files, digests):
+            self.link(local_file, dst_path, digest)
+
+    def collect_garbage(self):
+        """
+        Remove blobs that are no longer linked from any artifact.
+
+        :return: Tuple of (number of blobs removed, number of bytes freed).
+        """
+        num_removed = 0
+        bytes_freed = 0
+        if not os.path.isdir(self.root):
+            return num_removed, bytes_freed
+        for blob_dir in os.listdir(self.root):
+            blob_dir_path = os.path.join(self.root, blob_dir)
+            if not os.path.isdir(blob_dir_path):
+                continue
+            for blob_name in os.listdir(blob_dir_path):
+                if blob_name.startswith(".tmp"):
+                    # Blob being added by a concurrent writer
+                    continue
+                blob_path = os.path.join(blob_dir_path, blob_name)
+                blob_stat = os.stat(blob_path)
+                if blob_stat.st_nlink <= 1:
+                    os.remove(blob_path)
+                    num_removed += 1
+                    bytes_freed += blob_stat.st_size
+        return num_removed, bytes_freed
@@ -2,6 +2,7 @@ import json
 
 from mlflow.entities import Experiment, Run, RunInfo, Metric, ViewType
 from mlflow.protos import databricks_pb2
+from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, ErrorCode
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListExperiments, GetMetricHistory, LogMetric, LogParam, SetTag, \
     UpdateRun, CreateRun, DeleteRun, RestoreRun, DeleteExperiment, RestoreExperiment, \
@@ -9,6 +10,7 @@ from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperi
 from mlflow.store.abstract_store import AbstractStore
 from mlflow.utils.proto_json_utils import message_to_json, parse_dict
 from mlflow.utils.rest_utils import http_request, verify_rest_response
+from mlflow.utils.validation import _validate_metric_histories_args
 
 
 def _get_path(endpoint_path):
@@ -27,7 +29,30 @@ def _api_method_to_info():
     return res
 
 
-_METHOD_TO_INFO = _api_method_to_info()
+def _is_endpoint_not_found(response):
+    """
+    :return: Whether ``response`` reports that the server does not serve the requested endpoint,
+             as opposed to an error raised by the endpoint.
+    """
+    if response.status_code != 404:
+        return False
+    try:
+        error = json.loads(response.text)
+    except ValueError:
+        return True
+    return not isinstance(error, dict) or \
+        error.get("error_code") == ErrorCode.Name(ENDPOINT_NOT_FOUND)
+
+
+# Built on first use, as introspecting the service methods is slow
+_METHOD_TO_INFO = None
+
+
+def _get_method_to_info():
+    global _METHOD_TO_INFO
+    if _METHOD_TO_INFO is None:
+        _METHOD_TO_INFO = _api_method_to_info()
+    return _METHOD_TO_INFO
 
 
 class RestStore(AbstractStore):
@@ -47,7 +72,7 @@ class RestStore(AbstractStore):
         return verify_rest_response(response, endpoint)
 
     def _call_endpoint(self, api, json_body):
-        endpoint, method = _METHOD_TO_INFO[api]
+        endpoint, method = _get_method_to_info()[api]
         response_proto = api.Response()
         # Convert json string to json dictionary, to pass to requests
         if json_body:
@@ -223,6 +248,31 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric) for metric in response_proto.metrics]
 
+    def get_metric_histories(self, run_ids, metric_keys, max_points=None):
+        """
+        Return all values logged for several metrics of several runs with a single request. If
+        the tracking server does not serve the ``metrics/get-histories`` endpoint, the metric
+        histories are requested one run and metric at a time.
+
+        :param run_ids: List of unique identifiers for runs
+        :param metric_keys: List of metric names within the runs
+        :param max_points: If specified, the maximum number of values returned for each run and
+                           metric.
+
+        :return: A dictionary mapping each of ``METRIC_HISTORY_COLUMNS`` (run_id, key, step,
+                 timestamp and value) to the list of its values.
+        """
+        _validate_metric_histories_args(run_ids, metric_keys, max_points)
+        endpoint = _get_path("/mlflow/metrics/get-histories")
+        response = http_request(
+            host_creds=self.get_host_creds(), endpoint=endpoint, method="POST",
+            json={"run_ids": list(run_ids), "metric_keys": list(metric_keys),
+                  "max_points": max_points})
+        if _is_endpoint_not_found(response):
+            return super(RestStore, self).get_metric_histories(run_ids, metric_keys, max_points)
+        response = self._verify_rest_response(response, endpoint)
+        return json.loads(response.text)
+
     def _search_runs(self, experiment_ids, filter_string, run_view_type, max_results, order_by,
                      page_token):
         experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
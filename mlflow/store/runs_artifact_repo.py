@@ -1,7 +1,16 @@
+import posixpath
+
 from six.moves import urllib
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.utils.cache_utils import ProcessLocalCache
+
+# Number of seconds for which the artifact root of a run is memoized
+_RUN_ARTIFACT_ROOT_TTL_SECONDS = 30
+
+# Artifact roots of recently resolved runs, keyed by (tracking URI, run ID)
+_run_artifact_roots = ProcessLocalCache(max_size=1024, ttl_seconds=_RUN_ARTIFACT_ROOT_TTL_SECONDS)
 
 
 class RunsArtifactRepository(ArtifactRepository):
@@ -16,14 +25,29 @@ class RunsArtifactRepository(ArtifactRepository):
     """
 
     def __init__(self, artifact_uri):
-        from mlflow.tracking.artifact_utils import get_artifact_uri
         from mlflow.store.artifact_repository_registry import get_artifact_repository
         (run_id, artifact_path) = RunsArtifactRepository.parse_runs_uri(artifact_uri)
-        uri = get_artifact_uri(run_id, artifact_path)
+        uri = RunsArtifactRepository.get_underlying_uri(run_id, artifact_path)
         assert urllib.parse.urlparse(uri).scheme != "runs"  # avoid an infinite loop
         super(RunsArtifactRepository, self).__init__(artifact_uri)
         self.repo = get_artifact_repository(uri)
 
+    @staticmethod
+    def get_underlying_uri(run_id, artifact_path=None):
+        """
+        Resolve the absolute URI of ``artifact_path`` within the artifacts of the specified run.
+        The artifact root of each run is memoized for a short period of time, so that repeatedly
+        resolving ``runs:/`` URIs for the same run does not fetch the run from the tracking
+        store every time.
+        """
+        from mlflow.tracking.artifact_utils import get_artifact_uri
+        from mlflow.tracking.utils import get_tracking_uri
+        artifact_root = _run_artifact_roots.get_or_create(
+            (get_tracking_uri(), run_id), lambda: get_artifact_uri(run_id))
+        if artifact_path is None:
+            return artifact_root
+        return posixpath.join(artifact_root, artifact_path)
+
     @staticmethod
     def parse_runs_uri(run_uri):
         parsed = urllib.parse.urlparse(run_uri)
@@ -7,8 +7,22 @@ from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.utils.cache_utils import ProcessLocalCache
 from mlflow.utils.file_utils import relative_path_to_artifact_path
 
+# Environment variables that affect how S3 clients are constructed. Clients are cached per
+# combination of their values so that changes to the environment take effect.
+_S3_CLIENT_ENV_VARS = [
+    'MLFLOW_S3_ENDPOINT_URL',
+    'AWS_ACCESS_KEY_ID',
+    'AWS_SECRET_ACCESS_KEY',
+    'AWS_SESSION_TOKEN',
+    'AWS_PROFILE',
+    'AWS_DEFAULT_REGION',
+]
+
+_s3_clients = ProcessLocalCache()
+
 
 class S3ArtifactRepository(ArtifactRepository):
     """Stores artifacts on Amazon S3."""
@@ -24,9 +38,8 @@ class S3ArtifactRepository(ArtifactRepository):
         return parsed.netloc, path
 
     def _get_s3_client(self):
-        import boto3
-        s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
-        return boto3.client('s3', endpoint_url=s3_endpoint_url)
+        cache_key = tuple(os.environ.get(var) for var in _S3_CLIENT_ENV_VARS)
+        return _s3_clients.get_or_create(cache_key, _create_s3_client)
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
@@ -100,3 +113,10 @@ class S3ArtifactRepository(ArtifactRepository):
         s3_full_path = posixpath.join(s3_root_path, remote_file_path)
         s3_client = self._get_s3_client()
         s3_client.download_file(bucket, s3_full_path, local_path)
+
+
+def _create_s3_client():
+    import boto3
+    s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
+    # NB: boto3's default session is not thread-safe, so each client gets its own session
+    return boto3.session.Session().client('s3', endpoint_url=s3_endpoint_url)
@@ -1,3 +1,4 @@
+import collections
 import logging
 import uuid
 from contextlib import contextmanager
@@ -13,7 +14,7 @@ from mlflow.store.dbmodels.db_types import MYSQL
 from mlflow.store.dbmodels.models import Base, SqlExperiment, SqlRun, SqlMetric, SqlParam, SqlTag, \
     SqlExperimentTag
 from mlflow.entities import RunStatus, SourceType, Experiment
-from mlflow.store.abstract_store import AbstractStore
+from mlflow.store.abstract_store import AbstractStore, _metric_histories_to_columns
 from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_ALREADY_EXISTS, \
@@ -23,13 +24,18 @@ from mlflow.utils import extract_db_type_from_uri
 from mlflow.utils.file_utils import mkdir, local_file_uri_to_path
 from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.validation import _validate_batch_log_limits, _validate_batch_log_data, \
-    _validate_run_id, _validate_metric, _validate_experiment_tag, _validate_tag
+    _validate_run_id, _validate_metric, _validate_experiment_tag, _validate_tag, \
+    _validate_metric_histories_args
 from mlflow.store.db.utils import _upgrade_db, _get_alembic_config, _get_schema_version
 from mlflow.store.dbmodels.initial_models import Base as InitialBase
 
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of run IDs and metric keys in a query fetching metric histories, well below the
+# limit on the number of query parameters of SQLite (999 before version 3.32)
+MAX_PARAMETERS_PER_METRIC_HISTORY_QUERY = 500
+
 
 class SqlAlchemyStore(AbstractStore):
     """
@@ -432,6 +438,32 @@ class SqlAlchemyStore(AbstractStore):
             metrics = session.query(SqlMetric).filter_by(run_uuid=run_id, key=metric_key).all()
             return [metric.to_mlflow_entity() for metric in metrics]
 
+    def get_metric_histories(self, run_ids, metric_keys, max_points=None):
+        _validate_metric_histories_args(run_ids, metric_keys, max_points)
+        points = collections.defaultdict(list)
+        unique_run_ids = list(set(run_ids))
+        unique_metric_keys = list(set(metric_keys))
+        # Query runs and keys in batches, as databases limit the number of parameters of a query.
+        # Keys use at most half of the parameters, and run IDs the rest.
+        keys_per_query = max(1, min(len(unique_metric_keys),
+                                    MAX_PARAMETERS_PER_METRIC_HISTORY_QUERY // 2))
+        run_ids_per_query = max(1, MAX_PARAMETERS_PER_METRIC_HISTORY_QUERY - keys_per_query)
+        with self.ManagedSessionMaker() as session:
+            for i in range(0, len(unique_metric_keys), keys_per_query):
+                for j in range(0, len(unique_run_ids), run_ids_per_query):
+                    rows = session.query(SqlMetric.run_uuid, SqlMetric.key, SqlMetric.step,
+                                         SqlMetric.timestamp, SqlMetric.value, SqlMetric.is_nan) \
+                        .filter(SqlMetric.run_uuid.in_(
+                            unique_run_ids[j:j + run_ids_per_query])) \
+                        .filter(SqlMetric.key.in_(unique_metric_keys[i:i + keys_per_query])) \
+                        .all()
+                    for run_uuid, key, step, timestamp, value, is_nan in rows:
+                        points[(run_uuid, key)].append(
+                            (step, timestamp, float("nan") if is_nan else value))
+        return _metric_histories_to_columns(
+            run_ids, metric_keys, lambda run_id, metric_key: points[(run_id, metric_key)],
+            max_points)
+
     def log_param(self, run_id, param):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
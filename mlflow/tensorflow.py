@@ -38,13 +38,18 @@ from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils import keyword_only, experimental
 from mlflow.utils.environment import _mlflow_conda_env
 from mlflow.utils.file_utils import _copy_file_or_tree
-from mlflow.utils.model_utils import _get_flavor_configuration
+from mlflow.utils.model_utils import _get_flavor_configuration, _run_in_batches
 from mlflow.utils.autologging_utils import try_mlflow_log
 from mlflow.entities import Metric
 
 
 FLAVOR_NAME = "tensorflow"
 
+# Maximum number of rows passed to the model at a time by the pyfunc flavor. Larger inputs are
+# scored in several session runs, which bounds the memory used by intermediate tensors. By
+# default, each input is scored in a single run.
+PREDICT_BATCH_SIZE_ENV_VAR = "MLFLOW_TENSORFLOW_PREDICT_BATCH_SIZE"
+
 _logger = logging.getLogger(__name__)
 
 _MAX_METRIC_QUEUE_SIZE = 500
@@ -309,23 +314,35 @@ def _load_pyfunc(path):
             tf_saved_model_dir=tf_saved_model_dir, tf_sess=tf_sess,
             tf_meta_graph_tags=tf_meta_graph_tags, tf_signature_def_key=tf_signature_def_key)
 
-    return _TFWrapper(tf_sess=tf_sess, tf_graph=tf_graph, signature_def=signature_def)
+    batch_size = os.environ.get(PREDICT_BATCH_SIZE_ENV_VAR)
+    return _TFWrapper(tf_sess=tf_sess, tf_graph=tf_graph, signature_def=signature_def,
+                      batch_size=int(batch_size) if batch_size else None)
 
 
 class _TFWrapper(object):
     """
     Wrapper class that exposes a TensorFlow model for inference via a ``predict`` function such that
-    ``predict(data: pandas.DataFrame) -> pandas.DataFrame``.
+    ``predict(data: pandas.DataFrame) -> pandas.DataFrame``. ``predict`` also accepts a NumPy
+    array, which is fed to the first input tensor of the signature definition, and then returns
+    the value of its first output tensor as a NumPy array.
+
+    The session runs evaluating the signature definition are prepared once, as callables of the
+    session, so that predictions neither enter the model's graph nor resolve the feeds and fetches
+    of the run. Sessions are thread-safe, so ``predict`` may be called from several threads at
+    once.
     """
-    def __init__(self, tf_sess, tf_graph, signature_def):
+    def __init__(self, tf_sess, tf_graph, signature_def, batch_size=None):
         """
         :param tf_sess: The TensorFlow session used to evaluate the model.
         :param tf_graph: The TensorFlow graph containing the model.
         :param signature_def: The TensorFlow signature definition used to transform input dataframes
                               into tensors and output vectors into dataframes.
+        :param batch_size: Maximum number of rows passed to the model at a time. If ``None``, the
+                           whole input is scored in a single session run.
         """
         self.tf_sess = tf_sess
         self.tf_graph = tf_graph
+        self.batch_size = batch_size
         # We assume that input keys in the signature definition correspond to input DataFrame column
         # names
         self.input_tensor_mapping = {
@@ -338,6 +355,14 @@ class _TFWrapper(object):
                 sigdef_output: tf_graph.get_tensor_by_name(tnsr_info.name)
                 for sigdef_output, tnsr_info in signature_def.outputs.items()
         }
+        self._input_names = list(self.input_tensor_mapping.keys())
+        self._output_names = list(self.output_tensors.keys())
+        self._run_fn = tf_sess.make_callable(
+            fetches=[self.output_tensors[name] for name in self._output_names],
+            feed_list=[self.input_tensor_mapping[name] for name in self._input_names])
+        self._run_array_fn = tf_sess.make_callable(
+            fetches=[self.output_tensors[self._output_names[0]]],
+            feed_list=[self.input_tensor_mapping[self._input_names[0]]])
 
     @dispatch(object)
     def predict(self, inputs):
@@ -345,25 +370,17 @@ class _TFWrapper(object):
 
     @dispatch(pandas.DataFrame)
     def predict(self, inputs):
-        with self.tf_graph.as_default():
-            # Build the feed dict, mapping input tensors to DataFrame column values.
-            feed_dict = {
-                    self.input_tensor_mapping[tensor_column_name]: inputs[tensor_column_name].values
-                    for tensor_column_name in self.input_tensor_mapping.keys()
-            }
-            raw_preds = self.tf_sess.run(self.output_tensors, feed_dict=feed_dict)
-            pred_dict = {column_name: values.ravel() for column_name, values in raw_preds.items()}
-            return pandas.DataFrame(data=pred_dict)
+        # Feed the DataFrame column values, in the order of the input tensors of the callable
+        raw_preds = _run_in_batches(
+            self._run_fn, [inputs[column_name].values for column_name in self._input_names],
+            self.batch_size)
+        pred_dict = {column_name: values.ravel()
+                     for column_name, values in zip(self._output_names, raw_preds)}
+        return pandas.DataFrame(data=pred_dict)
 
     @dispatch(np.ndarray)
     def predict(self, inputs):
-        with self.tf_graph.as_default():
-            # Build the feed dict, mapping input tensors to a numpy array
-            feed_dict = {
-                    list(self.input_tensor_mapping.values())[0]: inputs
-            }
-            raw_preds = self.tf_sess.run(self.output_tensors, feed_dict=feed_dict)
-            return raw_preds[list(self.output_tensors.keys())[0]]
+        return _run_in_batches(self._run_array_fn, [inputs], self.batch_size)[0]
 
 
 class __MLflowTfKerasCallback(Callback):
@@ -9,6 +9,7 @@ import os
 from six import iteritems
 
 from mlflow.store import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.abstract_store import METRIC_HISTORY_COLUMNS
 from mlflow.tracking import utils
 from mlflow.utils.validation import _validate_param_name, _validate_tag_name, _validate_run_id, \
     _validate_experiment_artifact_location, _validate_experiment_name, _validate_metric
@@ -60,6 +61,41 @@ class MlflowClient(object):
         """
         return self.store.get_metric_history(run_id=run_id, metric_key=key)
 
+    def get_metric_histories(self, run_ids, keys, max_points=None, as_dataframe=False):
+        """
+        Return all values logged for several metrics of several runs, e.g. to plot learning
+        curves across the runs of a hyperparameter sweep. Stores fetch all values at once rather
+        than one run and metric at a time, as :py:func:`get_metric_history` does.
+
+        :param run_ids: List of unique identifiers for runs
+        :param keys: List of metric names within the runs
+        :param max_points: If specified, the maximum number of values returned for each run and
+                           metric. Metrics with more values are downsampled to values evenly
+                           spread over their history, including the first and last ones.
+        :param as_dataframe: If True, return the values as a ``pandas.DataFrame``.
+
+        :return: A dictionary mapping the columns ``run_id``, ``key``, ``step``, ``timestamp``
+                 and ``value`` to lists of the values logged for each run and metric, ordered by
+                 run, in the order of ``run_ids``, then by metric, in the order of ``keys``, then
+                 by step and timestamp. Runs and metrics that do not exist have no values. If
+                 ``as_dataframe`` is True, a ``pandas.DataFrame`` with these columns is returned
+                 instead, with int64 steps and timestamps and float64 values.
+        """
+        columns = self.store.get_metric_histories(run_ids=run_ids, metric_keys=keys,
+                                                  max_points=max_points)
+        if not as_dataframe:
+            return columns
+        import numpy as np
+        import pandas as pd
+
+        return pd.DataFrame({
+            "run_id": columns["run_id"],
+            "key": columns["key"],
+            "step": np.array(columns["step"], dtype=np.int64),
+            "timestamp": np.array(columns["timestamp"], dtype=np.int64),
+            "value": np.array(columns["value"], dtype=np.float64),
+        }, columns=METRIC_HISTORY_COLUMNS)
+
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
         Create a :py:class:`mlflow.entities.Run` object that can be associated with
@@ -8,10 +8,14 @@ from __future__ import print_function
 import os
 
 import atexit
+import collections
+import sys
+import threading
 import time
 import logging
-import numpy as np
-import pandas as pd
+
+import six
+from six.moves import queue
 
 from mlflow.entities import Run, RunStatus, Param, RunTag, Metric, ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
@@ -32,6 +36,8 @@ _active_experiment_id = None
 
 SEARCH_MAX_RESULTS_PANDAS = 100000
 NUM_RUNS_PER_PAGE_PANDAS = 10000
+# Number of pages of runs fetched ahead by search_runs from a REST tracking server by default
+NUM_PAGES_PREFETCHED_PANDAS = 1
 
 _logger = logging.getLogger(__name__)
 
@@ -311,7 +317,8 @@ def get_artifact_uri(artifact_path=None):
 
 
 def search_runs(experiment_ids=None, filter_string="", run_view_type=ViewType.ACTIVE_ONLY,
-                max_results=SEARCH_MAX_RESULTS_PANDAS, order_by=None):
+                max_results=SEARCH_MAX_RESULTS_PANDAS, order_by=None, sparse=False,
+                prefetch_pages=None):
     """
     Get a pandas DataFrame of runs that fit the search criteria.
 
@@ -324,6 +331,15 @@ def search_runs(experiment_ids=None, filter_string="", run_view_type=ViewType.AC
     :param order_by: List of columns to order by (e.g., "metrics.rmse"). The ``order_by`` column
                      can contain an optional ``DESC`` or ``ASC`` value. The default is ``ASC``.
                      The default ordering is to sort by ``start_time DESC``, then ``run_id``.
+    :param sparse: If True, store the metrics.*, params.* and tags.* columns as pandas sparse
+                   arrays, which only hold the values of the runs having each metric, parameter
+                   or tag. This saves memory when runs log many different keys.
+    :param prefetch_pages: Maximum number of pages of runs fetched in a background thread while
+                           the previous pages are added to the DataFrame, overlapping requests
+                           to the tracking server with the DataFrame construction. 0 fetches
+                           every page in the calling thread. Defaults to
+                           ``NUM_PAGES_PREFETCHED_PANDAS`` when searching a REST tracking
+                           server and to 0 for local stores, whose searches run in this process.
 
     :return: A pandas.DataFrame of runs, where each metric, parameter, and tag
         are expanded into their own columns named metrics.*, params.*, and tags.*
@@ -332,86 +348,201 @@ def search_runs(experiment_ids=None, filter_string="", run_view_type=ViewType.AC
     """
     if not experiment_ids:
         experiment_ids = _get_experiment_id()
-    runs = _get_paginated_runs(experiment_ids, filter_string, run_view_type, max_results,
-                               order_by)
-    info = {'run_id': [], 'experiment_id': [],
-            'status': [], 'artifact_uri': [],
-            'start_time': [], 'end_time': []}
-    params, metrics, tags = ({}, {}, {})
-    PARAM_NULL, METRIC_NULL, TAG_NULL = (None, np.nan, None)
-    for i, run in enumerate(runs):
-        info['run_id'].append(run.info.run_id)
-        info['experiment_id'].append(run.info.experiment_id)
-        info['status'].append(run.info.status)
-        info['artifact_uri'].append(run.info.artifact_uri)
-        info['start_time'].append(pd.to_datetime(run.info.start_time, unit="ms", utc=True))
-        info['end_time'].append(pd.to_datetime(run.info.end_time, unit="ms", utc=True))
-
-        # Params
-        param_keys = set(params.keys())
-        for key in param_keys:
-            if key in run.data.params:
-                params[key].append(run.data.params[key])
-            else:
-                params[key].append(PARAM_NULL)
-        new_params = set(run.data.params.keys()) - param_keys
-        for p in new_params:
-            params[p] = [PARAM_NULL]*i  # Fill in null values for all previous runs
-            params[p].append(run.data.params[p])
-
-        # Metrics
-        metric_keys = set(metrics.keys())
-        for key in metric_keys:
-            if key in run.data.metrics:
-                metrics[key].append(run.data.metrics[key])
-            else:
-                metrics[key].append(METRIC_NULL)
-        new_metrics = set(run.data.metrics.keys()) - metric_keys
-        for m in new_metrics:
-            metrics[m] = [METRIC_NULL]*i
-            metrics[m].append(run.data.metrics[m])
-
-        # Tags
-        tag_keys = set(tags.keys())
-        for key in tag_keys:
-            if key in run.data.tags:
-                tags[key].append(run.data.tags[key])
-            else:
-                tags[key].append(TAG_NULL)
-        new_tags = set(run.data.tags.keys()) - tag_keys
-        for t in new_tags:
-            tags[t] = [TAG_NULL]*i
-            tags[t].append(run.data.tags[t])
-
-    data = {}
-    data.update(info)
-    for key in metrics:
-        data['metrics.' + key] = metrics[key]
-    for key in params:
-        data['params.' + key] = params[key]
-    for key in tags:
-        data['tags.' + key] = tags[key]
-    return pd.DataFrame(data)
+    if prefetch_pages is None:
+        prefetch_pages = _get_default_prefetch_pages()
+    builder = _RunsDataFrameBuilder()
+    for runs in _get_paginated_run_pages(experiment_ids, filter_string, run_view_type,
+                                         max_results, order_by, prefetch_pages):
+        builder.add_runs(runs)
+    return builder.to_dataframe(sparse=sparse)
+
+
+class _RunsDataFrameBuilder(object):
+    """
+    Builds the DataFrame returned by :py:func:`search_runs` one page of runs at a time, so that
+    the runs of a page can be freed once it is added. Run attributes are appended to one list per
+    column, while the metrics, params and tags of each key are collected as the indices of the
+    runs having the key and their values. Every column is then created at once with a single
+    typed array: datetimes for start and end times, float64 for metrics and objects, with None
+    for missing values, for params and tags.
+    """
+
+    _INFO_COLUMNS = ["run_id", "experiment_id", "status", "artifact_uri"]
+
+    def __init__(self):
+        self._num_runs = 0
+        self._info = {column: [] for column in self._INFO_COLUMNS}
+        self._start_times = []
+        self._end_times = []
+        # Map each key to a tuple of the indices of the runs having the key and of their values
+        self._metrics = collections.OrderedDict()
+        self._params = collections.OrderedDict()
+        self._tags = collections.OrderedDict()
+
+    def add_runs(self, runs):
+        """
+        :param runs: Iterable of :py:class:`mlflow.entities.Run` to add as rows of the DataFrame.
+        """
+        run_ids = self._info["run_id"]
+        experiment_ids = self._info["experiment_id"]
+        statuses = self._info["status"]
+        artifact_uris = self._info["artifact_uri"]
+        for run in runs:
+            info = run.info
+            run_ids.append(info.run_id)
+            experiment_ids.append(info.experiment_id)
+            statuses.append(info.status)
+            artifact_uris.append(info.artifact_uri)
+            self._start_times.append(info.start_time)
+            self._end_times.append(info.end_time)
+            self._add_values(self._metrics, run.data.metrics)
+            self._add_values(self._params, run.data.params)
+            self._add_values(self._tags, run.data.tags)
+            self._num_runs += 1
+
+    def _add_values(self, columns, values):
+        for key, value in values.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = ([], [])
+            column[0].append(self._num_runs)
+            column[1].append(value)
+
+    def to_dataframe(self, sparse=False):
+        """
+        :param sparse: If True, create the metric, param and tag columns as pandas sparse arrays.
+        :return: A pandas.DataFrame with a row per added run.
+        """
+        import numpy as np
+        import pandas as pd
+
+        data = collections.OrderedDict()
+        for column in self._INFO_COLUMNS:
+            data[column] = self._info[column]
+        data["start_time"] = self._to_datetimes(self._start_times)
+        data["end_time"] = self._to_datetimes(self._end_times)
+        for prefix, columns, dtype, null in [("metrics.", self._metrics, np.float64, np.nan),
+                                             ("params.", self._params, object, None),
+                                             ("tags.", self._tags, object, None)]:
+            for key, (indices, values) in columns.items():
+                column = np.full(self._num_runs, null, dtype=dtype)
+                column[np.asarray(indices, dtype=np.intp)] = values
+                data[prefix + key] = _to_sparse_array(column, null) if sparse else column
+        return pd.DataFrame(data, columns=list(data.keys()))
+
+    def _to_datetimes(self, timestamps):
+        """
+        Convert timestamps in milliseconds, or None if missing, to UTC datetimes with a single
+        call to ``pandas.to_datetime``.
+        """
+        import numpy as np
+        import pandas as pd
+
+        missing = np.array([timestamp is None for timestamp in timestamps], dtype=bool)
+        milliseconds = np.array([0 if timestamp is None else timestamp
+                                 for timestamp in timestamps], dtype=np.int64)
+        datetimes = pd.to_datetime(milliseconds, unit="ms", utc=True)
+        return datetimes.where(~missing) if missing.any() else datetimes
+
+
+def _to_sparse_array(values, fill_value):
+    try:
+        from pandas.arrays import SparseArray
+    except ImportError:
+        from pandas import SparseArray
+    return SparseArray(values, fill_value=fill_value)
 
 
 def _get_paginated_runs(experiment_ids, filter_string, run_view_type, max_results,
                         order_by):
     all_runs = []
+    for runs in _get_paginated_run_pages(experiment_ids, filter_string, run_view_type,
+                                         max_results, order_by):
+        all_runs.extend(runs)
+    return all_runs
+
+
+def _get_paginated_run_pages(experiment_ids, filter_string, run_view_type, max_results,
+                             order_by, prefetch_pages=0):
+    """
+    Generate the pages of up to ``NUM_RUNS_PER_PAGE_PANDAS`` runs matching the search criteria,
+    until ``max_results`` runs are returned or no pages remain. If ``prefetch_pages`` is positive,
+    the pages are fetched in a background thread, which keeps up to ``prefetch_pages`` pages
+    ahead of the caller.
+    """
+    pages = _fetch_run_pages(experiment_ids, filter_string, run_view_type, max_results,
+                             order_by)
+    if prefetch_pages > 0:
+        pages = _prefetch(pages, prefetch_pages)
+    return pages
+
+
+def _fetch_run_pages(experiment_ids, filter_string, run_view_type, max_results, order_by):
+    num_runs = 0
     next_page_token = None
-    while(len(all_runs) < max_results):
-        runs_to_get = max_results-len(all_runs)
+    while num_runs < max_results:
+        runs_to_get = max_results - num_runs
         if runs_to_get < NUM_RUNS_PER_PAGE_PANDAS:
             runs = MlflowClient().search_runs(experiment_ids, filter_string, run_view_type,
                                               runs_to_get, order_by, next_page_token)
         else:
             runs = MlflowClient().search_runs(experiment_ids, filter_string, run_view_type,
                                               NUM_RUNS_PER_PAGE_PANDAS, order_by, next_page_token)
-        all_runs.extend(runs)
+        num_runs += len(runs)
+        yield runs
         if hasattr(runs, 'token') and runs.token != '' and runs.token is not None:
             next_page_token = runs.token
         else:
             break
-    return all_runs
+
+
+def _prefetch(items, max_prefetched):
+    """
+    Iterate over ``items`` in a background thread, which stops once ``max_prefetched`` items
+    are waiting to be consumed. Exceptions raised while iterating are re-raised to the caller.
+    The background thread stops when the returned generator is closed.
+    """
+    prefetched = queue.Queue(maxsize=max_prefetched)
+    stopped = threading.Event()
+    end = object()
+
+    def put(entry):
+        while not stopped.is_set():
+            try:
+                prefetched.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except Exception:  # pylint: disable=broad-except
+            put((end, sys.exc_info()))
+
+    thread = threading.Thread(target=produce, name="MlflowPagePrefetcher")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item, exc_info = prefetched.get()
+            if item is end:
+                if exc_info is not None:
+                    six.reraise(*exc_info)
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+def _get_default_prefetch_pages():
+    from mlflow.store.rest_store import RestStore
+
+    return NUM_PAGES_PREFETCHED_PANDAS if isinstance(MlflowClient().store, RestStore) else 0
 
 
 def _get_or_start_run():
@@ -1,3 +1,4 @@
+import threading
 import warnings
 
 import entrypoints
@@ -19,10 +20,16 @@ class TrackingStoreRegistry:
     the store URI provided (or inferred from environment) will be used to
     select which implementation to instantiate, which will be called with same
     arguments passed to the `get_store` method.
+
+    The entrypoints are scanned once, on the first call to `get_store`, unless
+    `register_entrypoints` is called beforehand, so that implementations
+    provided by other packages can still replace the built-in ones.
     """
 
     def __init__(self):
         self._registry = {}
+        self._entrypoints_lock = threading.Lock()
+        self._entrypoints_registered = False
 
     def register(self, scheme, store_builder):
         self._registry[scheme] = store_builder
@@ -39,6 +46,7 @@ class TrackingStoreRegistry:
                     ),
                     stacklevel=2
                 )
+        self._entrypoints_registered = True
 
     def get_store(self, store_uri=None, artifact_uri=None):
         """Get a store from the registry based on the scheme of store_uri
@@ -55,6 +63,10 @@ class TrackingStoreRegistry:
         from mlflow.tracking import utils
         store_uri = store_uri if store_uri is not None else utils.get_tracking_uri()
         scheme = store_uri if store_uri == "databricks" else get_uri_scheme(store_uri)
+        if not self._entrypoints_registered:
+            with self._entrypoints_lock:
+                if not self._entrypoints_registered:
+                    self.register_entrypoints()
 
         try:
             store_builder = self._registry[scheme]
@@ -7,8 +7,6 @@ from six.moves import urllib
 
 from mlflow.store import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 from mlflow.store.dbmodels.db_types import DATABASE_ENGINES
-from mlflow.store.file_store import FileStore
-from mlflow.store.rest_store import RestStore
 from mlflow.tracking.registry import TrackingStoreRegistry
 from mlflow.utils import env, rest_utils
 from mlflow.utils.file_utils import path_to_local_file_uri
@@ -88,6 +86,7 @@ def _is_databricks_uri(uri):
 
 
 def _get_file_store(store_uri, **_):
+    from mlflow.store.file_store import FileStore
     return FileStore(store_uri, store_uri)
 
 
@@ -99,6 +98,8 @@ def _get_sqlalchemy_store(store_uri, artifact_uri):
 
 
 def _get_rest_store(store_uri, **_):
+    from mlflow.store.rest_store import RestStore
+
     def get_default_host_creds():
         return rest_utils.MlflowHostCreds(
             host=store_uri,
@@ -123,6 +124,7 @@ def get_db_profile_from_uri(uri):
 
 
 def _get_databricks_rest_store(store_uri, **_):
+    from mlflow.store.rest_store import RestStore
     profile = get_db_profile_from_uri(store_uri)
     return RestStore(lambda: get_databricks_host_creds(profile))
 
@@ -138,8 +140,6 @@ for scheme in ['http', 'https']:
 for scheme in DATABASE_ENGINES:
     _tracking_store_registry.register(scheme, _get_sqlalchemy_store)
 
-_tracking_store_registry.register_entrypoints()
-
 
 def _get_store(store_uri=None, artifact_uri=None):
     return _tracking_store_registry.get_store(store_uri, artifact_uri)
@@ -1,7 +1,5 @@
 from sys import version_info
 
-import numpy as np
-import pandas as pd
 from six.moves import urllib
 
 from mlflow.exceptions import MlflowException
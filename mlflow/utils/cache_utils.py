@@ -0,0 +1,119 @@
+"""
+Utilities for caching expensive-to-construct objects (e.g. cloud storage clients) within a single
+process.
+"""
+import collections
+import os
+import threading
+import time
+
+
+class ProcessLocalCache(object):
+    """
+    Thread-safe key-value cache whose entries are only visible to the process that created them.
+
+    Objects such as SDK clients, HTTP sessions and open connections are generally not safe to share
+    across ``fork()``, e.g. between gunicorn workers that were forked from a common master. The
+    cache records the PID of the process that populated it and transparently discards all entries
+    the first time it is accessed from a different (forked) process.
+
+    :param max_size: Maximum number of entries to retain. When exceeded, the least recently used
+                     entry is evicted. If ``None``, the cache is unbounded.
+    :param ttl_seconds: Number of seconds after which an entry expires and is recreated on the
+                        next access. If ``None``, entries never expire.
+    """
+
+    def __init__(self, max_size=None, ttl_seconds=None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._reset()
+
+    def _reset(self):
+        # NB: A lock held by another thread at fork time stays locked forever in the child, so the
+        # lock is recreated along with the entries.
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._pid = os.getpid()
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _is_expired(self, created_at):
+        return self.ttl_seconds is not None and time.time() - created_at >= self.ttl_seconds
+
+    def get(self, key, default=None):
+        """
+        :return: The cached value for ``key``, or ``default`` if the key is absent or has expired.
+        """
+        self._check_pid()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, created_at = entry
+            if self._is_expired(created_at):
+                del self._entries[key]
+                return default
+            # Mark the entry as most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+            return value
+
+    def put(self, key, value):
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry if the cache is full.
+        """
+        self._check_pid()
+        with self._lock:
+            self._put_locked(key, value)
+
+    def _put_locked(self, key, value):
+        self._entries.pop(key, None)
+        self._entries[key] = (value, time.time())
+        if self.max_size is not None:
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached value for ``key``, calling ``factory()`` to create and cache it if it is
+        absent. ``factory`` is invoked outside of the cache lock so that slow constructors (e.g.
+        credential resolution) do not serialize unrelated lookups; if two threads race to create
+        the same entry, the first value stored wins and is returned to both.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        value = factory()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_expired(entry[1]):
+                return entry[0]
+            self._put_locked(key, value)
+        return value
+
+    def pop(self, key, default=None):
+        """
+        Remove ``key`` from the cache, returning its value or ``default`` if it was absent.
+        """
+        self._check_pid()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        self._check_pid()
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        missing = object()
+        return self.get(key, missing) is not missing
+
+    def __len__(self):
+        self._check_pid()
+        with self._lock:
+            return len(self._entries)
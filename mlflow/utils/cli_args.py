@@ -43,3 +43,14 @@ PORT = click.option("--port", "-p", default=5000,
 # We use None to disambiguate manually selecting "4"
 WORKERS = click.option("--workers", "-w", default=None,
                        help="Number of gunicorn worker processes to handle requests (default: 4).")
+
+PRELOAD = click.option("--preload", is_flag=True, default=False,
+                       help="If specified, load the model before forking the gunicorn worker "
+                            "processes, so that the workers share the memory of the model instead "
+                            "of each loading a copy of it.")
+
+THREADS = click.option("--threads", "-t", default=None, type=click.INT,
+                       help="If specified, serve requests with gunicorn's asynchronous gthread "
+                            "workers, each handling up to this many requests concurrently. Use "
+                            "this for models waiting on I/O, e.g. calls to other services, in "
+                            "predict.")
@@ -4,7 +4,6 @@ import subprocess
 
 from mlflow.exceptions import MlflowException
 from mlflow.utils.rest_utils import MlflowHostCreds
-from databricks_cli.configure import provider
 
 
 _logger = logging.getLogger(__name__)
@@ -104,6 +103,10 @@ def get_databricks_host_creds(profile=None):
     :return: :py:class:`mlflow.rest_utils.MlflowHostCreds` which includes the hostname and
         authentication information necessary to talk to the Databricks server.
     """
+    # Imported here rather than at module level, as the Databricks CLI is slow to import and only
+    # needed to talk to Databricks
+    from databricks_cli.configure import provider
+
     if not hasattr(provider, 'get_config'):
         _logger.warning(
             "Support for databricks-cli<0.8.0 is deprecated and will be removed"
@@ -339,6 +339,97 @@ def _copy_file_or_tree(src, dst, dst_dir=None):
     return dst_subpath
 
 
+# Modes in which ``transfer_file`` can create the destination file. "copy" copies bytes through
+# user space, "fastcopy" copies them within the kernel (copy_file_range or sendfile), "reflink"
+# creates a copy-on-write clone sharing the source's data blocks and "hardlink" creates a second
+# link to the source's inode, so that later in-place writes to either file affect both.
+FILE_TRANSFER_MODES = ["copy", "fastcopy", "reflink", "hardlink"]
+
+# ioctl request number of FICLONE on Linux (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+_KERNEL_COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+
+
+def transfer_file(src, dst, mode="copy"):
+    """
+    Copy or link the file ``src`` to the path ``dst``, replacing any existing file at ``dst``.
+
+    In the ``reflink`` and ``hardlink`` modes, whether ``src`` and the parent directory of ``dst``
+    are on the same device is checked first. If they are not, or the filesystem does not support
+    the requested kind of link, the file is copied within the kernel as in ``fastcopy`` mode,
+    which in turn falls back to a regular copy where no kernel copy primitive is available.
+
+    :param mode: One of ``FILE_TRANSFER_MODES``.
+    """
+    if mode not in FILE_TRANSFER_MODES:
+        raise ValueError("Invalid file transfer mode '%s'. Must be one of %s"
+                         % (mode, FILE_TRANSFER_MODES))
+    if mode == "copy":
+        shutil.copy(src, dst)
+        return
+    if os.path.lexists(dst):
+        # Never write through an existing destination, which may be linked to other files
+        os.remove(dst)
+    if mode in ("reflink", "hardlink") and _is_same_device(src, dst):
+        try:
+            if mode == "hardlink":
+                os.link(src, dst)
+            else:
+                _reflink_file(src, dst)
+            return
+        except (OSError, IOError):
+            if os.path.lexists(dst):
+                os.remove(dst)
+    _kernel_copy_file(src, dst)
+
+
+def _is_same_device(src, dst):
+    return os.stat(src).st_dev == os.stat(os.path.dirname(os.path.abspath(dst))).st_dev
+
+
+def _reflink_file(src, dst):
+    import fcntl  # Not available on Windows, where reflinks are not supported
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    shutil.copymode(src, dst)
+
+
+def _kernel_copy_file(src, dst):
+    """
+    Copy ``src`` to ``dst`` without passing the data through user space, using
+    ``os.copy_file_range`` (which also allows the filesystem to share or server-side copy the
+    data) or ``os.sendfile``, falling back to ``shutil.copyfile`` if neither is available or
+    supported for these files.
+    """
+    copied = False
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        src_fd, dst_fd = src_file.fileno(), dst_file.fileno()
+        for copy_chunk in _get_kernel_copy_functions():
+            try:
+                while copy_chunk(src_fd, dst_fd) > 0:
+                    pass
+                copied = True
+                break
+            except OSError:
+                if os.lseek(src_fd, 0, os.SEEK_CUR) != 0:
+                    # Failed part way through the file; do not retry with another method
+                    raise
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
+
+def _get_kernel_copy_functions():
+    functions = []
+    if hasattr(os, "copy_file_range"):
+        functions.append(lambda src_fd, dst_fd: os.copy_file_range(
+            src_fd, dst_fd, _KERNEL_COPY_CHUNK_SIZE))
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        functions.append(lambda src_fd, dst_fd: os.sendfile(
+            dst_fd, src_fd, None, _KERNEL_COPY_CHUNK_SIZE))
+    return functions
+
+
 def get_parent_dir(path):
     return os.path.abspath(os.path.join(path, os.pardir))
 
@@ -1,5 +1,7 @@
 import os
 
+import numpy as np
+
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
@@ -30,3 +32,30 @@ def _get_flavor_configuration(model_path, flavor_name):
                 RESOURCE_DOES_NOT_EXIST)
     conf = model_conf.flavors[flavor_name]
     return conf
+
+
+def _run_in_batches(run_fn, inputs, batch_size):
+    """
+    Runs ``run_fn`` on consecutive slices of at most ``batch_size`` rows of the specified inputs
+    and stacks the outputs of the slices.
+
+    :param run_fn: Function that takes one positional argument per input and returns a list of
+                   output arrays, each with one row per input row.
+    :param inputs: List of arrays with the same number of rows.
+    :param batch_size: Maximum number of rows passed to ``run_fn`` at a time. If ``None``, all
+                       rows are passed in a single call.
+    :return: The list of output arrays, with one row per input row.
+    """
+    num_rows = len(inputs[0])
+    if not batch_size or num_rows <= batch_size:
+        return run_fn(*inputs)
+    outputs = None
+    for start in range(0, num_rows, batch_size):
+        batch_outputs = run_fn(*[values[start:start + batch_size] for values in inputs])
+        if outputs is None:
+            # Preallocate the outputs, rather than concatenating the outputs of every slice
+            outputs = [np.empty((num_rows,) + np.shape(output)[1:], dtype=np.asarray(output).dtype)
+                       for output in batch_outputs]
+        for output, batch_output in zip(outputs, batch_outputs):
+            output[start:start + batch_size] = batch_output
+    return outputs
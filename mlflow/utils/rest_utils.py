@@ -3,8 +3,6 @@ import time
 import logging
 import json
 
-import requests
-
 from mlflow import __version__
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
@@ -29,6 +27,10 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3, **kwargs):
         hostname and optional authentication.
     :return: Parsed API response
     """
+    # Imported here rather than at module level, so that clients that do not talk to a server
+    # do not pay for importing requests
+    import requests
+
     hostname = host_creds.host
     auth_str = None
     if host_creds.username and host_creds.password:
@@ -191,6 +191,22 @@ def _validate_batch_log_api_req(json_req):
         raise MlflowException(error_msg, error_code=INVALID_PARAMETER_VALUE)
 
 
+def _validate_metric_histories_args(run_ids, metric_keys, max_points):
+    """
+    Check the arguments of a bulk metric history request and raise an exception if they are
+    invalid.
+    """
+    for run_id in run_ids:
+        _validate_run_id(run_id)
+    for metric_key in metric_keys:
+        _validate_metric_name(metric_key)
+    if max_points is not None and (isinstance(max_points, bool) or
+                                   not isinstance(max_points, numbers.Integral) or
+                                   max_points <= 0):
+        raise MlflowException("Invalid value %s for max_points. Expected a positive integer." %
+                              repr(max_points), error_code=INVALID_PARAMETER_VALUE)
+
+
 def _validate_experiment_name(experiment_name):
     """Check that `experiment_name` is a valid string and raise an exception if it isn't."""
     if experiment_name == "" or experiment_name is None:
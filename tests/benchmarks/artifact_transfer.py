@@ -0,0 +1,136 @@
+"""
+Benchmark for uploading and downloading directory trees with cloud artifact repositories, run
+against local storage emulators so that results do not depend on network conditions or cloud
+credentials.
+
+Start an emulator, e.g.:
+
+    docker run -d -p 4443:4443 fsouza/fake-gcs-server -scheme http
+    docker run -d -p 10000:10000 mcr.microsoft.com/azure-storage/azurite azurite-blob \\
+        --blobHost 0.0.0.0
+
+and run:
+
+    python -m tests.benchmarks.artifact_transfer --backend gcs --num-files 500
+    python -m tests.benchmarks.artifact_transfer --backend azure --workers 1,8,32
+
+For each worker count, the benchmark logs a generated directory tree with ``log_artifacts`` and
+downloads it with ``download_artifacts`` (flat listing + concurrent transfers). The legacy
+directory-by-directory traversal with sequential downloads is timed as a baseline.
+"""
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+import click
+
+from mlflow.store.artifact_repo import ArtifactRepository, MAX_TRANSFER_WORKERS_ENV_VAR
+
+_AZURITE_ACCOUNT = "devstoreaccount1"
+
+
+def _gcs_repo(emulator_url, bucket_name):
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud import storage
+    from google.cloud.exceptions import Conflict
+    from mlflow.store.gcs_artifact_repo import GCSArtifactRepository
+
+    os.environ["STORAGE_EMULATOR_HOST"] = emulator_url
+
+    class _EmulatorStorage(object):
+        # Stands in for the `google.cloud.storage` module expected by GCSArtifactRepository
+        @staticmethod
+        def Client():  # pylint: disable=invalid-name
+            return storage.Client(project="benchmark", credentials=AnonymousCredentials())
+
+    try:
+        _EmulatorStorage.Client().create_bucket(bucket_name)
+    except Conflict:
+        pass
+    return GCSArtifactRepository("gs://%s/benchmark" % bucket_name, client=_EmulatorStorage)
+
+
+def _azure_repo(emulator_url, container_name):
+    from azure.storage.blob import BlockBlobService
+    from mlflow.store.azure_blob_artifact_repo import AzureBlobArtifactRepository
+
+    client = BlockBlobService(is_emulated=True, custom_domain=emulator_url) \
+        if emulator_url else BlockBlobService(is_emulated=True)
+    client.create_container(container_name)
+    return AzureBlobArtifactRepository(
+        "wasbs://%s@%s.blob.core.windows.net/benchmark" % (container_name, _AZURITE_ACCOUNT),
+        client=client)
+
+
+def _make_tree(root, num_files, file_size, files_per_dir):
+    for i in range(num_files):
+        # Spread files across nested directories so that per-directory listing has work to do
+        dir_index = i // files_per_dir
+        file_dir = os.path.join(root, "dir%d" % (dir_index % 10), "sub%d" % dir_index)
+        if not os.path.exists(file_dir):
+            os.makedirs(file_dir)
+        with open(os.path.join(file_dir, "file%d.bin" % i), "wb") as f:
+            f.write(os.urandom(file_size))
+
+
+def _timed(func):
+    start = time.time()
+    func()
+    return time.time() - start
+
+
+def _report(label, seconds, num_files, total_bytes):
+    click.echo("%-40s %8.2fs %10.1f files/s %10.2f MB/s" % (
+        label, seconds, num_files / seconds, total_bytes / seconds / 1e6))
+
+
+@click.command()
+@click.option("--backend", type=click.Choice(["gcs", "azure"]), required=True)
+@click.option("--emulator-url", default=None,
+              help="Emulator endpoint. Defaults to http://localhost:4443 for GCS and the "
+                   "Azurite default endpoint for Azure.")
+@click.option("--num-files", default=200, help="Number of files in the generated tree.")
+@click.option("--file-size", default=64 * 1024, help="Size of each file, in bytes.")
+@click.option("--files-per-dir", default=10, help="Number of files per leaf directory.")
+@click.option("--workers", default="1,8,32",
+              help="Comma-separated worker counts to benchmark concurrent transfers with.")
+def main(backend, emulator_url, num_files, file_size, files_per_dir, workers):
+    name = "mlflow-benchmark-%s" % uuid.uuid4().hex[:8]
+    if backend == "gcs":
+        repo = _gcs_repo(emulator_url or "http://localhost:4443", name)
+    else:
+        repo = _azure_repo(emulator_url, name)
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        src_dir = os.path.join(tmp_dir, "src")
+        _make_tree(src_dir, num_files, file_size, files_per_dir)
+        total_bytes = num_files * file_size
+        click.echo("%s: %d files of %d bytes" % (backend, num_files, file_size))
+
+        for num_workers in [int(w) for w in workers.split(",")]:
+            os.environ[MAX_TRANSFER_WORKERS_ENV_VAR] = str(num_workers)
+            artifact_path = "workers-%d" % num_workers
+            _report("log_artifacts (%d workers)" % num_workers,
+                    _timed(lambda: repo.log_artifacts(src_dir, artifact_path)),
+                    num_files, total_bytes)
+            dst_dir = tempfile.mkdtemp(dir=tmp_dir)
+            _report("download_artifacts (%d workers)" % num_workers,
+                    _timed(lambda: repo.download_artifacts(artifact_path, dst_dir)),
+                    num_files, total_bytes)
+
+        # Baseline: one listing call per directory and sequential downloads
+        os.environ[MAX_TRANSFER_WORKERS_ENV_VAR] = "1"
+        dst_dir = tempfile.mkdtemp(dir=tmp_dir)
+        _report("download_artifacts (per-directory listing)",
+                _timed(lambda: ArtifactRepository._download_artifacts_into(
+                    repo, artifact_path, dst_dir)),
+                num_files, total_bytes)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
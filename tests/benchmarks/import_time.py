@@ -0,0 +1,57 @@
+"""
+Benchmark for the time taken to import MLflow, as measured by ``python -X importtime``.
+
+The statement is run in ``--repeat`` new Python processes, and the median total import time is
+reported along with the modules taking the longest to import, by median cumulative time:
+
+    python -m tests.benchmarks.import_time
+    python -m tests.benchmarks.import_time --statement "import mlflow.sklearn" --top 30
+"""
+import subprocess
+import sys
+
+import click
+import numpy as np
+
+
+def _get_import_times(statement):
+    stderr = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", statement], stderr=subprocess.STDOUT,
+        universal_newlines=True)
+    """
+    :return: Tuple of a dictionary mapping the imported modules to their cumulative import times
+             in microseconds, and of the list of top-level modules, whose imports are not nested
+             in the import of another module.
+    """
+    import_times = {}
+    top_level_modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module_name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level, after the separating space
+        if not module_name[1:].startswith(" "):
+            top_level_modules.append(module_name.strip())
+        import_times[module_name.strip()] = int(cumulative_us)
+    return import_times, top_level_modules
+
+
+@click.command()
+@click.option("--statement", default="import mlflow", help="Python statement to time.")
+@click.option("--repeat", default=5, help="Number of processes running the statement.")
+@click.option("--top", default=15, help="Number of slowest modules to report.")
+def main(statement, repeat, top):
+    runs, top_level_modules = zip(*[_get_import_times(statement) for _ in range(repeat)])
+    total_us = [sum(run[module_name] for module_name in modules)
+                for run, modules in zip(runs, top_level_modules)]
+    click.echo("%s: %.1f ms (median of %d runs), %d modules imported" % (
+        statement, np.median(total_us) / 1e3, repeat, len(runs[0])))
+    median_us = {module_name: np.median([run.get(module_name, 0) for run in runs])
+                 for module_name in runs[0]}
+    click.echo("%-50s %16s" % ("module", "cumulative (ms)"))
+    for module_name in sorted(median_us, key=median_us.get, reverse=True)[:top]:
+        click.echo("%-50s %16.1f" % (module_name, median_us[module_name] / 1e3))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
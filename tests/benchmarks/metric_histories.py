@@ -0,0 +1,80 @@
+"""
+Benchmark for fetching the histories of several metrics of several runs.
+
+``--runs`` runs logging ``--steps`` values of each of ``--metrics`` metrics are created in a
+``FileStore`` and in a SQLite ``SqlAlchemyStore``. The histories of all their metrics are then
+fetched with one ``get_metric_history`` call per run and metric, as clients had to before, and
+with a single ``get_metric_histories`` call:
+
+    python -m tests.benchmarks.metric_histories
+    python -m tests.benchmarks.metric_histories --runs 500 --metrics 5 --steps 1000
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import click
+
+from mlflow.entities import Metric
+from mlflow.store.dbmodels.models import SqlMetric
+from mlflow.store.file_store import FileStore
+from mlflow.store.sqlalchemy_store import SqlAlchemyStore
+
+
+def _log_runs(store, num_runs, metric_keys, num_steps):
+    experiment_id = store.create_experiment("metric histories")
+    run_ids = [store.create_run(experiment_id, "user", 0, []).info.run_id
+               for _ in range(num_runs)]
+    metrics = [Metric(key, float(step), step, step)
+               for key in metric_keys for step in range(num_steps)]
+    for run_id in run_ids:
+        if isinstance(store, SqlAlchemyStore):
+            # Insert all values at once, as SqlAlchemyStore.log_batch commits each metric
+            with store.ManagedSessionMaker() as session:
+                session.bulk_save_objects([
+                    SqlMetric(run_uuid=run_id, key=metric.key, value=metric.value,
+                              timestamp=metric.timestamp, step=metric.step, is_nan=False)
+                    for metric in metrics])
+        else:
+            # Write the metric files directly, as FileStore.log_batch reads the run metadata for
+            # each metric
+            metrics_dir = os.path.join(store._get_run_dir(experiment_id, run_id),
+                                       FileStore.METRICS_FOLDER_NAME)
+            for key in metric_keys:
+                with open(os.path.join(metrics_dir, key), "w") as f:
+                    f.writelines("%d %s %d\n" % (metric.timestamp, metric.value, metric.step)
+                                 for metric in metrics if metric.key == key)
+    return run_ids
+
+
+@click.command()
+@click.option("--runs", default=100, help="Number of runs.")
+@click.option("--metrics", default=5, help="Number of metrics per run.")
+@click.option("--steps", default=100, help="Number of values logged per metric.")
+def main(runs, metrics, steps):
+    tmpdir = tempfile.mkdtemp()
+    try:
+        stores = [
+            ("FileStore", FileStore(os.path.join(tmpdir, "mlruns"))),
+            ("SqlAlchemyStore", SqlAlchemyStore("sqlite:///" + os.path.join(tmpdir, "db.sqlite"),
+                                                os.path.join(tmpdir, "artifacts"))),
+        ]
+        metric_keys = ["metric_%d" % i for i in range(metrics)]
+        click.echo("%-16s %-24s %12s" % ("store", "method", "seconds"))
+        for name, store in stores:
+            run_ids = _log_runs(store, runs, metric_keys, steps)
+            start = time.time()
+            for run_id in run_ids:
+                for key in metric_keys:
+                    store.get_metric_history(run_id, key)
+            click.echo("%-16s %-24s %12.3f" % (name, "get_metric_history", time.time() - start))
+            start = time.time()
+            store.get_metric_histories(run_ids, metric_keys)
+            click.echo("%-16s %-24s %12.3f" % (name, "get_metric_histories", time.time() - start))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,89 @@
+"""
+Benchmark for the ``python_function`` representation of :py:mod:`mlflow.onnx` models.
+
+A dense layer (``MatMul`` followed by ``Add``) with float32 inputs is built with ``onnx.helper``,
+saved with each graph optimization level, and scored on float64 DataFrames of each batch size.
+The ``legacy cast`` line converts the inputs as the pyfunc model did before the single-copy cast,
+replacing each float64 column of the DataFrame by a float32 copy before reading its values:
+
+    python -m tests.benchmarks.onnx_predict
+    python -m tests.benchmarks.onnx_predict --features 512 --outputs 256 --batch-sizes 1,64,4096
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+import mlflow.onnx
+import mlflow.pyfunc
+
+_DEFAULT_BATCH_SIZES = "1,16,256,4096,65536"
+
+
+def _build_dense_model(num_features, num_outputs):
+    from onnx import helper, numpy_helper, TensorProto
+
+    weights = numpy_helper.from_array(
+        np.random.rand(num_features, num_outputs).astype(np.float32), name="weights")
+    bias = numpy_helper.from_array(np.random.rand(num_outputs).astype(np.float32), name="bias")
+    graph = helper.make_graph(
+        nodes=[helper.make_node("MatMul", ["input", "weights"], ["product"]),
+               helper.make_node("Add", ["product", "bias"], ["output"])],
+        name="dense",
+        inputs=[helper.make_tensor_value_info("input", TensorProto.FLOAT, [None, num_features])],
+        outputs=[helper.make_tensor_value_info("output", TensorProto.FLOAT, [None, num_outputs])],
+        initializer=[weights, bias])
+    return helper.make_model(graph)
+
+
+def _legacy_predict(wrapper, dataframe):
+    dataframe = wrapper._cast_float64_to_float32(dataframe.copy(deep=False),
+                                                 dataframe.columns)
+    return wrapper.rt.run(wrapper.output_names, {wrapper.inputs[0][0]: dataframe.values})
+
+
+def _time_per_row(predict_fn, dataframe, min_seconds):
+    predict_fn(dataframe)
+    num_calls = 0
+    start = time.time()
+    while time.time() - start < min_seconds:
+        predict_fn(dataframe)
+        num_calls += 1
+    return (time.time() - start) / (num_calls * len(dataframe))
+
+
+@click.command()
+@click.option("--features", default=100, help="Number of input features.")
+@click.option("--outputs", default=10, help="Number of output values per row.")
+@click.option("--batch-sizes", default=_DEFAULT_BATCH_SIZES,
+              help="Comma-separated numbers of rows scored per call.")
+@click.option("--min-seconds", default=1.0, help="Minimum time spent scoring each batch size.")
+def main(features, outputs, batch_sizes, min_seconds):
+    onnx_model = _build_dense_model(features, outputs)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        click.echo("%-24s %12s %16s" % ("mode", "batch size", "us/row"))
+        for batch_size in [int(size) for size in batch_sizes.split(",")]:
+            dataframe = pd.DataFrame(np.random.rand(batch_size, features))
+            for level in ["disable_all", "all"]:
+                model_path = os.path.join(tmpdir, "%s-%d" % (level, batch_size))
+                mlflow.onnx.save_model(onnx_model, model_path,
+                                       session_options={"graph_optimization_level": level})
+                wrapper = mlflow.pyfunc.load_pyfunc(model_path)
+                if level == "disable_all":
+                    seconds = _time_per_row(lambda df: _legacy_predict(wrapper, df), dataframe,
+                                            min_seconds)
+                    click.echo("%-24s %12d %16.3f" % ("legacy cast", batch_size, seconds * 1e6))
+                seconds = _time_per_row(wrapper.predict, dataframe, min_seconds)
+                click.echo("%-24s %12d %16.3f" % ("optimization " + level, batch_size,
+                                                  seconds * 1e6))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
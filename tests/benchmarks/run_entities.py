@@ -0,0 +1,82 @@
+"""
+Benchmark for the memory used and time taken to materialize large run search results.
+
+``--runs`` runs, each with ``--metrics`` metrics, ``--params`` params and ``--tags`` tags, are
+created as :py:class:`mlflow.entities.Run` objects the way the tracking stores create them:
+directly from their attributes (``FileStore`` and ``SqlAlchemyStore``) and from protobuf messages
+(``RestStore``). The construction time and the memory allocated per run, as traced by
+``tracemalloc``, are reported, along with the time taken to convert every run info to a
+dictionary, which lists the properties of ``RunInfo``. Requires Python 3:
+
+    python -m tests.benchmarks.run_entities
+    python -m tests.benchmarks.run_entities --runs 100000 --metrics 50
+"""
+import gc
+import time
+import tracemalloc
+
+import click
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, \
+    LifecycleStage
+
+
+def _create_run(i, num_metrics, num_params, num_tags):
+    run_id = "%032x" % i
+    run_info = RunInfo(run_uuid=run_id, run_id=run_id, experiment_id="0", user_id="user",
+                       status=RunStatus.to_string(RunStatus.FINISHED), start_time=i,
+                       end_time=i + 1, lifecycle_stage=LifecycleStage.ACTIVE,
+                       artifact_uri="file:///tmp/mlruns/0/%s/artifacts" % run_id)
+    run_data = RunData(
+        metrics=[Metric("metric_%d" % j, float(i * j), i, 0) for j in range(num_metrics)],
+        params=[Param("param_%d" % j, str(j)) for j in range(num_params)],
+        tags=[RunTag("tag_%d" % j, "value") for j in range(num_tags)])
+    return Run(run_info, run_data)
+
+
+def _measure(create_fn):
+    """
+    :return: Tuple of the objects returned by ``create_fn``, the seconds taken to create them and
+             the bytes allocated to create them, excluding memory freed before returning. Memory
+             is traced in a separate call, as tracing slows allocations down.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = create_fn()
+    allocated_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    gc.collect()
+    start = time.time()
+    objects = create_fn()
+    return objects, time.time() - start, allocated_bytes
+
+
+@click.command()
+@click.option("--runs", default=20000, help="Number of runs.")
+@click.option("--metrics", default=20, help="Number of metrics per run.")
+@click.option("--params", default=10, help="Number of params per run.")
+@click.option("--tags", default=5, help="Number of tags per run.")
+def main(runs, metrics, params, tags):
+    # Build the protobuf messages outside of the measured sections
+    protos = [_create_run(i, metrics, params, tags).to_proto() for i in range(runs)]
+
+    click.echo("%-24s %12s %16s" % ("construction", "us/run", "bytes/run"))
+    created, seconds, allocated_bytes = _measure(
+        lambda: [_create_run(i, metrics, params, tags) for i in range(runs)])
+    click.echo("%-24s %12.2f %16.0f" % ("from attributes", seconds / runs * 1e6,
+                                        allocated_bytes / runs))
+    del created
+    created, seconds, allocated_bytes = _measure(
+        lambda: [Run.from_proto(proto) for proto in protos])
+    click.echo("%-24s %12.2f %16.0f" % ("from protos", seconds / runs * 1e6,
+                                        allocated_bytes / runs))
+
+    start = time.time()
+    for run in created:
+        dict(run.info)
+    click.echo("%-24s %12.2f" % ("dict(run.info)", (time.time() - start) / runs * 1e6))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
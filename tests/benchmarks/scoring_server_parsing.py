@@ -0,0 +1,106 @@
+"""
+Benchmark for the input parsers of the pyfunc scoring server.
+
+Each payload shape is serialized in every content type accepted by ``/invocations`` that can
+represent it, and the time taken to turn the request body into the DataFrame passed to
+``predict`` (including decoding the body to text for the text-based formats) is reported:
+
+    python -m tests.benchmarks.scoring_server_parsing
+    python -m tests.benchmarks.scoring_server_parsing --shapes 1x1000,5000x50 --repeats 20
+"""
+import time
+from io import BytesIO, StringIO
+
+import click
+import numpy as np
+import pandas as pd
+
+from mlflow.pyfunc import scoring_server
+
+_DEFAULT_SHAPES = "1x1000,100x20,1000x100,10000x10"
+
+
+def _encode_arrow_stream(df):
+    import pyarrow as pa
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, table.schema)
+    writer.write_table(table)
+    writer.close()
+    return sink.getvalue().to_pybytes()
+
+
+def _encode_npy(df):
+    buf = BytesIO()
+    np.save(buf, df.values)
+    return buf.getvalue()
+
+
+def _get_formats(numeric):
+    """
+    :return: List of (content type, encoder from DataFrame to bytes, parser of bytes).
+    """
+    formats = [
+        (scoring_server.CONTENT_TYPE_JSON_SPLIT_ORIENTED,
+         lambda df: df.to_json(orient="split").encode("utf-8"),
+         lambda body: scoring_server.parse_json_input(body.decode("utf-8"), orient="split")),
+        (scoring_server.CONTENT_TYPE_JSON_RECORDS_ORIENTED,
+         lambda df: df.to_json(orient="records").encode("utf-8"),
+         lambda body: scoring_server.parse_json_input(body.decode("utf-8"), orient="records")),
+        (scoring_server.CONTENT_TYPE_JSON_SPLIT_NUMPY,
+         lambda df: df.to_json(orient="split").encode("utf-8"),
+         lambda body: scoring_server.parse_split_oriented_json_input_to_numpy(
+             body.decode("utf-8"))),
+        (scoring_server.CONTENT_TYPE_CSV,
+         lambda df: df.to_csv(index=False).encode("utf-8"),
+         lambda body: scoring_server.parse_csv_input(StringIO(body.decode("utf-8")))),
+        (scoring_server.CONTENT_TYPE_ARROW_STREAM, _encode_arrow_stream,
+         scoring_server.parse_arrow_stream_input),
+    ]
+    if numeric:
+        formats.append((scoring_server.CONTENT_TYPE_NPY, _encode_npy,
+                        scoring_server.parse_npy_input))
+    return formats
+
+
+def _make_payload(num_rows, num_cols, mixed):
+    df = pd.DataFrame(np.random.rand(num_rows, num_cols),
+                      columns=["f%d" % i for i in range(num_cols)])
+    if mixed:
+        df["category"] = np.random.choice(["red", "green", "blue"], num_rows)
+        df["count"] = np.random.randint(0, 1000, num_rows)
+    return df
+
+
+def _time_parser(parse, body, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.time()
+        parse(body)
+        timings.append(time.time() - start)
+    return np.median(timings)
+
+
+@click.command()
+@click.option("--shapes", default=_DEFAULT_SHAPES,
+              help="Comma-separated payload shapes of the form <rows>x<numeric columns>.")
+@click.option("--mixed", is_flag=True,
+              help="Add a string and an integer column to each payload.")
+@click.option("--repeats", default=10,
+              help="Number of timed parses per payload; the median time is reported.")
+def main(shapes, mixed, repeats):
+    click.echo("%-12s %-40s %10s %12s %10s" % (
+        "shape", "content type", "size (KB)", "median (ms)", "MB/s"))
+    for shape in shapes.split(","):
+        num_rows, num_cols = [int(n) for n in shape.split("x")]
+        df = _make_payload(num_rows, num_cols, mixed)
+        for content_type, encode, parse in _get_formats(numeric=not mixed):
+            body = encode(df)
+            seconds = _time_parser(parse, body, repeats)
+            click.echo("%-12s %-40s %10.1f %12.3f %10.1f" % (
+                shape, content_type, len(body) / 1e3, seconds * 1e3,
+                len(body) / seconds / 1e6 if seconds > 0 else float("inf")))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,98 @@
+"""
+Benchmark for serializing predictions in the pyfunc scoring server.
+
+For predictions of several shapes, compares the original serializer (``DataFrame.to_dict`` and
+``json.dump`` with ``NumpyEncoder``) with ``predictions_to_json`` using each available JSON
+backend, and with the binary response formats:
+
+    python -m tests.benchmarks.scoring_server_serialization
+    python -m tests.benchmarks.scoring_server_serialization --rows 1000,100000 --repeats 5
+"""
+import json
+import os
+import time
+from io import BytesIO, StringIO
+
+import click
+import numpy as np
+import pandas as pd
+
+from mlflow.pyfunc import scoring_server
+
+
+def _legacy_predictions_to_json(raw_predictions, output):
+    if isinstance(raw_predictions, np.ndarray):
+        predictions = raw_predictions.tolist()
+    elif isinstance(raw_predictions, pd.Series):
+        predictions = pd.DataFrame(raw_predictions).to_dict(orient="records")
+    else:
+        predictions = raw_predictions.to_dict(orient="records")
+    json.dump(predictions, output, cls=scoring_server.NumpyEncoder)
+
+
+def _make_predictions(num_rows):
+    return [
+        ("ndarray (n,)", np.random.rand(num_rows)),
+        ("ndarray (n, 10)", np.random.rand(num_rows, 10)),
+        ("Series", pd.Series(np.random.rand(num_rows), name="prediction")),
+        ("DataFrame (n, 3 float)", pd.DataFrame(np.random.rand(num_rows, 3),
+                                                columns=["p0", "p1", "p2"])),
+        ("DataFrame (label, score)", pd.DataFrame({
+            "label": np.random.choice(["cat", "dog"], num_rows),
+            "score": np.random.rand(num_rows)})),
+    ]
+
+
+def _get_serializers():
+    serializers = [("legacy json + NumpyEncoder", None, _legacy_predictions_to_json, StringIO)]
+    for backend in ["json", "ujson", "orjson"]:
+        try:
+            if backend != "json":
+                __import__(backend)
+        except ImportError:
+            continue
+        serializers.append(("predictions_to_json (%s)" % backend, backend,
+                            scoring_server.predictions_to_json, StringIO))
+    serializers.append(("predictions_to_npy", None, scoring_server.predictions_to_npy, BytesIO))
+    serializers.append(("predictions_to_arrow_stream", None,
+                        scoring_server.predictions_to_arrow_stream, BytesIO))
+    return serializers
+
+
+def _time_serializer(serialize, predictions, make_output, repeats):
+    timings = []
+    for _ in range(repeats):
+        output = make_output()
+        start = time.time()
+        serialize(predictions, output)
+        timings.append(time.time() - start)
+    return np.median(timings)
+
+
+@click.command()
+@click.option("--rows", default="1,1000,100000",
+              help="Comma-separated numbers of prediction rows to benchmark.")
+@click.option("--repeats", default=10,
+              help="Number of timed serializations per case; the median time is reported.")
+def main(rows, repeats):
+    click.echo("%-8s %-26s %-30s %12s %10s" % (
+        "rows", "predictions", "serializer", "median (ms)", "speedup"))
+    for num_rows in [int(n) for n in rows.split(",")]:
+        for predictions_name, predictions in _make_predictions(num_rows):
+            baseline = None
+            for serializer_name, backend, serialize, make_output in _get_serializers():
+                if backend is not None:
+                    os.environ[scoring_server.JSON_BACKEND_ENV_VAR] = backend
+                try:
+                    seconds = _time_serializer(serialize, predictions, make_output, repeats)
+                except Exception:  # pylint: disable=broad-except
+                    # E.g. string predictions, which cannot be returned as .npy
+                    continue
+                baseline = baseline or seconds
+                click.echo("%-8d %-26s %-30s %12.3f %9.1fx" % (
+                    num_rows, predictions_name, serializer_name, seconds * 1e3,
+                    baseline / seconds if seconds > 0 else float("inf")))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
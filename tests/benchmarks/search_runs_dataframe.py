@@ -0,0 +1,89 @@
+"""
+Benchmark for building the DataFrame returned by :py:func:`mlflow.search_runs`.
+
+``--runs`` runs, each logging ``--keys-per-run`` metrics, params and tags drawn from ``--keys``
+distinct keys, are converted to a DataFrame with and without sparse columns, and the time taken
+and memory used by the DataFrame are reported. The ``row-by-row`` line builds the DataFrame as
+``search_runs`` did before its columnar builder, appending every run to a list per column and
+converting start and end times one run at a time:
+
+    python -m tests.benchmarks.search_runs_dataframe
+    python -m tests.benchmarks.search_runs_dataframe --runs 100000 --keys 1000 --keys-per-run 20
+"""
+import random
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, \
+    LifecycleStage
+from mlflow.tracking.fluent import _RunsDataFrameBuilder
+
+
+def _create_run(i, keys):
+    run_id = "%032x" % i
+    run_info = RunInfo(run_uuid=run_id, run_id=run_id, experiment_id="0", user_id="user",
+                       status=RunStatus.to_string(RunStatus.FINISHED), start_time=i,
+                       end_time=i + 1, lifecycle_stage=LifecycleStage.ACTIVE,
+                       artifact_uri="file:///tmp/mlruns/0/%s/artifacts" % run_id)
+    run_data = RunData(metrics=[Metric("metric_%d" % key, float(i), i, 0) for key in keys],
+                       params=[Param("param_%d" % key, str(i)) for key in keys],
+                       tags=[RunTag("tag_%d" % key, str(i)) for key in keys])
+    return Run(run_info, run_data)
+
+
+def _row_by_row_dataframe(runs):
+    info = {"run_id": [], "experiment_id": [], "status": [], "artifact_uri": [],
+            "start_time": [], "end_time": []}
+    columns = ({}, {}, {})
+    nulls = (None, np.nan, None)
+    for i, run in enumerate(runs):
+        info["run_id"].append(run.info.run_id)
+        info["experiment_id"].append(run.info.experiment_id)
+        info["status"].append(run.info.status)
+        info["artifact_uri"].append(run.info.artifact_uri)
+        info["start_time"].append(pd.to_datetime(run.info.start_time, unit="ms", utc=True))
+        info["end_time"].append(pd.to_datetime(run.info.end_time, unit="ms", utc=True))
+        run_values = (run.data.params, run.data.metrics, run.data.tags)
+        for values, null, current in zip(run_values, nulls, columns):
+            keys = set(current.keys())
+            for key in keys:
+                current[key].append(values.get(key, null))
+            for key in set(values.keys()) - keys:
+                current[key] = [null] * i
+                current[key].append(values[key])
+    data = dict(info)
+    for prefix, current in zip(["params.", "metrics.", "tags."], columns):
+        for key, values in current.items():
+            data[prefix + key] = values
+    return pd.DataFrame(data)
+
+
+def _columnar_dataframe(runs, sparse):
+    builder = _RunsDataFrameBuilder()
+    builder.add_runs(runs)
+    return builder.to_dataframe(sparse=sparse)
+
+
+@click.command()
+@click.option("--runs", default=20000, help="Number of runs.")
+@click.option("--keys", default=200, help="Number of distinct metric, param and tag keys.")
+@click.option("--keys-per-run", default=10, help="Number of metrics, params and tags per run.")
+def main(runs, keys, keys_per_run):
+    random.seed(0)
+    all_runs = [_create_run(i, random.sample(range(keys), keys_per_run)) for i in range(runs)]
+    click.echo("%-24s %12s %16s" % ("builder", "seconds", "DataFrame (MB)"))
+    for name, build_fn in [("row-by-row", _row_by_row_dataframe),
+                           ("columnar", lambda r: _columnar_dataframe(r, sparse=False)),
+                           ("columnar, sparse", lambda r: _columnar_dataframe(r, sparse=True))]:
+        start = time.time()
+        dataframe = build_fn(all_runs)
+        seconds = time.time() - start
+        click.echo("%-24s %12.2f %16.1f" % (name, seconds,
+                                            dataframe.memory_usage(deep=True).sum() / 1e6))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,46 @@
+"""
+Benchmark for the page prefetching of :py:func:`mlflow.search_runs`.
+
+``MlflowClient.search_runs`` is replaced by a function returning pages of ``--runs-per-page``
+runs after sleeping for ``--latency-ms`` milliseconds, as a request to a remote tracking server
+would, and ``--pages`` pages are converted to a DataFrame with each number of prefetched pages:
+
+    python -m tests.benchmarks.search_runs_prefetch
+    python -m tests.benchmarks.search_runs_prefetch --pages 20 --latency-ms 1000
+"""
+import time
+
+import click
+import mock
+
+import mlflow
+from mlflow.store.abstract_store import PagedList
+from mlflow.tracking.client import MlflowClient
+from tests.benchmarks.search_runs_dataframe import _create_run
+
+
+@click.command()
+@click.option("--pages", default=10, help="Number of pages of runs.")
+@click.option("--runs-per-page", default=10000, help="Number of runs per page.")
+@click.option("--latency-ms", default=500, help="Time taken to fetch each page.")
+@click.option("--prefetch-pages", default="0,1,2",
+              help="Comma-separated numbers of pages to prefetch.")
+def main(pages, runs_per_page, latency_ms, prefetch_pages):
+    page = [_create_run(i, range(10)) for i in range(runs_per_page)]
+
+    def search_runs(*args, **kwargs):  # pylint: disable=unused-argument
+        time.sleep(latency_ms / 1000.0)
+        return PagedList(page, "token")
+
+    click.echo("%-16s %12s" % ("prefetch pages", "seconds"))
+    with mock.patch("mlflow.tracking.fluent.NUM_RUNS_PER_PAGE_PANDAS", runs_per_page), \
+            mock.patch.object(MlflowClient, "search_runs", side_effect=search_runs):
+        for num_prefetched in [int(num) for num in prefetch_pages.split(",")]:
+            start = time.time()
+            mlflow.search_runs(["0"], max_results=pages * runs_per_page,
+                               prefetch_pages=num_prefetched)
+            click.echo("%-16d %12.2f" % (num_prefetched, time.time() - start))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
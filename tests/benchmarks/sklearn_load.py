@@ -0,0 +1,113 @@
+"""
+Benchmark for loading scikit-learn models in several worker processes, as a model server does.
+
+A random forest is saved in each serialization format of :py:mod:`mlflow.sklearn`, and then
+loaded and scored once by each of ``--workers`` processes at the same time. The median load time
+and the memory added by loading the model are reported: the resident set size (RSS) of a worker,
+which counts shared pages in full, and the proportional set size (PSS) summed over all workers,
+which splits shared pages between the processes sharing them and therefore measures the memory
+actually used. Models saved in the ``joblib`` format are also loaded with ``mmap_mode="r"``,
+which shares their arrays between workers through the page cache. Requires Linux:
+
+    python -m tests.benchmarks.sklearn_load
+    python -m tests.benchmarks.sklearn_load --workers 8 --trees 500 --max-depth 20
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import click
+import numpy as np
+
+import mlflow.sklearn
+
+
+def _read_memory_kb():
+    """
+    :return: Tuple of the RSS and PSS of the current process, in kB.
+    """
+    memory = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            fields = line.split()
+            if fields[0] in ("Rss:", "Pss:"):
+                memory[fields[0]] = int(fields[1])
+    return memory["Rss:"], memory["Pss:"]
+
+
+def _load_in_worker(model_path, mmap_mode, inference_data, loaded, all_loaded, results):
+    rss_before, pss_before = _read_memory_kb()
+    start = time.time()
+    model = mlflow.sklearn.load_model(model_path, mmap_mode=mmap_mode)
+    model.predict(inference_data)
+    loaded.put(time.time() - start)
+    # Measure once all workers have loaded the model, so that shared pages are accounted for
+    all_loaded.wait()
+    rss_after, pss_after = _read_memory_kb()
+    results.put((rss_after - rss_before, pss_after - pss_before))
+
+
+def _run_workers(model_path, mmap_mode, inference_data, num_workers):
+    """
+    :return: Tuple of the load times of the workers and of their (RSS, PSS) increases.
+    """
+    loaded = multiprocessing.Queue()
+    all_loaded = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(
+        target=_load_in_worker,
+        args=(model_path, mmap_mode, inference_data, loaded, all_loaded, results))
+        for _ in range(num_workers)]
+    for worker in workers:
+        worker.start()
+    load_seconds = [loaded.get() for _ in workers]
+    all_loaded.set()
+    memory_kb = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return load_seconds, memory_kb
+
+
+@click.command()
+@click.option("--workers", default=4, help="Number of processes loading the model.")
+@click.option("--trees", default=200, help="Number of trees of the random forest.")
+@click.option("--max-depth", default=None, type=int,
+              help="Maximum depth of the trees. Unlimited by default.")
+@click.option("--rows", default=50000, help="Number of training rows.")
+def main(workers, trees, max_depth, rows):
+    from sklearn.ensemble import RandomForestRegressor
+
+    features = np.random.rand(rows, 20)
+    target = features.sum(axis=1) + np.random.rand(rows)
+    model = RandomForestRegressor(n_estimators=trees, max_depth=max_depth, n_jobs=-1)
+    model.fit(features, target)
+    inference_data = features[:100]
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        click.echo("%-12s %-10s %10s %18s %20s %16s" % (
+            "format", "mmap_mode", "size (MB)", "median load (s)", "RSS/worker (MB)",
+            "total PSS (MB)"))
+        for serialization_format in mlflow.sklearn.SUPPORTED_SERIALIZATION_FORMATS:
+            model_path = os.path.join(tmpdir, serialization_format)
+            mlflow.sklearn.save_model(model, model_path,
+                                      serialization_format=serialization_format)
+            size = sum(os.path.getsize(os.path.join(model_path, name))
+                       for name in os.listdir(model_path))
+            mmap_modes = [None, "r"] \
+                if serialization_format == mlflow.sklearn.SERIALIZATION_FORMAT_JOBLIB else [None]
+            for mmap_mode in mmap_modes:
+                load_seconds, memory_kb = _run_workers(model_path, mmap_mode, inference_data,
+                                                       workers)
+                rss_kb, pss_kb = zip(*memory_kb)
+                click.echo("%-12s %-10s %10.1f %18.3f %20.1f %16.1f" % (
+                    serialization_format, mmap_mode, size / 1e6, np.median(load_seconds),
+                    np.mean(rss_kb) / 1e3, sum(pss_kb) / 1e3))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
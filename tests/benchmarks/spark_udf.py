@@ -0,0 +1,113 @@
+"""
+Benchmark for :py:func:`mlflow.pyfunc.spark_udf`, running a local-mode Spark job.
+
+A pyfunc model returning a given number of numeric columns is applied to a generated DataFrame
+with each result type and Arrow batch size, and the number of scored rows per second is reported.
+The ``array<double> (per-row)`` line applies the same model through a UDF building its array
+results one row at a time with ``DataFrame.iterrows()``, as ``spark_udf`` did before array
+results were built from a single ndarray:
+
+    python -m tests.benchmarks.spark_udf
+    python -m tests.benchmarks.spark_udf --rows 2000000 --output-columns 100 --batch-sizes 10000
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+import mlflow.pyfunc
+
+_DEFAULT_BATCH_SIZES = "1000,10000,50000"
+
+
+class WideOutputModel(mlflow.pyfunc.PythonModel):
+    def __init__(self, num_output_columns):
+        self.num_output_columns = num_output_columns
+
+    def predict(self, context, model_input):
+        values = model_input.values.sum(axis=1)
+        return pd.DataFrame(np.outer(values, np.arange(self.num_output_columns, dtype=np.float64)),
+                            columns=["out%d" % i for i in range(self.num_output_columns)])
+
+
+def _per_row_array_udf(spark, model_path):
+    from pyspark.sql.functions import pandas_udf
+    from mlflow.pyfunc.spark_model_cache import SparkModelCache
+
+    archive_path = SparkModelCache.add_local_model(spark, model_path)
+
+    def predict(*args):
+        model = SparkModelCache.get_or_load(archive_path)
+        pdf = pd.DataFrame({str(i): arg for i, arg in enumerate(args)},
+                           columns=[str(i) for i, _ in enumerate(args)])
+        result = model.predict(pdf).select_dtypes(include=(np.number,)).astype(np.float64)
+        return pd.Series([row[1].values for row in result.iterrows()])
+
+    return pandas_udf(predict, "array<double>")
+
+
+def _time_udf(spark_df, udf):
+    from pyspark.sql.functions import col, size
+
+    scored = spark_df.withColumn("prediction", udf(*spark_df.columns))
+    # Aggregate the predictions so that the driver does not collect them
+    result_type = scored.schema["prediction"].dataType.simpleString()
+    if result_type.startswith("array"):
+        scored = scored.select(size(col("prediction")).alias("prediction"))
+    elif result_type.startswith("struct"):
+        scored = scored.select(col("prediction.out0").alias("prediction"))
+    start = time.time()
+    scored.agg({"prediction": "count"}).collect()
+    return time.time() - start
+
+
+@click.command()
+@click.option("--rows", default=1000000, help="Number of rows to score.")
+@click.option("--input-columns", default=10, help="Number of numeric input columns.")
+@click.option("--output-columns", default=20, help="Number of numeric columns predicted.")
+@click.option("--batch-sizes", default=_DEFAULT_BATCH_SIZES,
+              help="Comma-separated Arrow batch sizes.")
+@click.option("--partitions", default=4, help="Number of partitions of the scored DataFrame.")
+def main(rows, input_columns, output_columns, batch_sizes, partitions):
+    import pyspark
+    from pyspark.sql.functions import rand
+
+    os.environ["PYSPARK_PYTHON"] = sys.executable
+    spark = pyspark.sql.SparkSession.builder \
+        .config("spark.python.worker.reuse", True) \
+        .master("local[%d]" % partitions) \
+        .getOrCreate()
+    model_dir = tempfile.mkdtemp()
+    try:
+        model_path = os.path.join(model_dir, "model")
+        mlflow.pyfunc.save_model(path=model_path,
+                                 python_model=WideOutputModel(output_columns))
+        spark_df = spark.range(rows, numPartitions=partitions).select(
+            *[rand(seed=i).alias("x%d" % i) for i in range(input_columns)]).cache()
+        spark_df.count()
+
+        struct_type = ", ".join(["out%d double" % i for i in range(output_columns)])
+        result_types = [("double", "double"), ("array<double>", "array<double>"),
+                        ("struct", struct_type)]
+        click.echo("%-26s %12s %12s %14s" % ("result type", "batch size", "seconds", "rows/s"))
+        for batch_size in [int(size) for size in batch_sizes.split(",")]:
+            spark.conf.set("spark.sql.execution.arrow.maxRecordsPerBatch", str(batch_size))
+            udfs = [(name, mlflow.pyfunc.spark_udf(spark, model_path, result_type=result_type))
+                    for name, result_type in result_types]
+            udfs.append(("array<double> (per-row)", _per_row_array_udf(spark, model_path)))
+            for name, udf in udfs:
+                seconds = _time_udf(spark_df, udf)
+                click.echo("%-26s %12d %12.2f %14.0f" % (name, batch_size, seconds,
+                                                         rows / seconds))
+    finally:
+        shutil.rmtree(model_dir)
+        spark.stop()
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -1,6 +1,9 @@
+import pickle
+
 import pytest
 
-from mlflow.entities import Run, Metric, RunData, RunStatus, RunInfo, LifecycleStage
+from mlflow.entities import Run, Metric, Param, RunData, RunStatus, RunInfo, RunTag, \
+    LifecycleStage
 from mlflow.exceptions import MlflowException
 from tests.entities.test_run_data import TestRunData
 from tests.entities.test_run_info import TestRunInfo
@@ -77,3 +80,48 @@ class TestRun(TestRunInfo, TestRunData):
         with pytest.raises(MlflowException) as no_info_exc:
             Run(None, run_data)
         assert "run_info cannot be None" in str(no_info_exc)
+
+    def test_run_entities_do_not_carry_instance_dicts(self):
+        run_data, _, _, _ = TestRunData._create()
+        run_info = TestRunInfo._create()[0]
+        run = Run(run_info, run_data)
+        for entity in [run, run_info, run_data, Metric("key", 1.0, 0, 0), Param("key", "value"),
+                       RunTag("key", "value")]:
+            assert not hasattr(entity, "__dict__")
+            with pytest.raises(AttributeError):
+                entity.unknown_attribute = 1
+
+    def test_properties_are_listed_once_per_class(self):
+        assert RunInfo._properties() is RunInfo._properties()
+        assert Metric._properties() == ["key", "step", "timestamp", "value"]
+        assert Param._properties() == ["key", "value"]
+        assert RunInfo._properties() != Metric._properties()
+
+    def test_run_info_equality_compares_attributes(self):
+        run_info = TestRunInfo._create()[0]
+        assert run_info == RunInfo.from_proto(run_info.to_proto())
+        assert run_info != run_info._copy_with_overrides(end_time=run_info.end_time + 1)
+        assert RunTag("key", "value") == RunTag("key", "value")
+        assert RunTag("key", "value") != RunTag("key", "other")
+
+    def test_run_entities_can_be_pickled_with_any_protocol(self):
+        run_data, metrics, params, tags = TestRunData._create()
+        run_info = TestRunInfo._create()[0]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            run = pickle.loads(pickle.dumps(Run(run_info, run_data), protocol))
+            self._check_run(run, run_info, metrics, params, tags)
+            assert run.info == run_info
+            assert pickle.loads(pickle.dumps(RunTag("key", "value"), protocol)) == \
+                RunTag("key", "value")
+
+    def test_slot_values_include_slots_of_base_classes(self):
+        class ExtendedRunTag(RunTag):
+            __slots__ = ("_extra",)
+
+            def __init__(self, key, value, extra):
+                super(ExtendedRunTag, self).__init__(key, value)
+                self._extra = extra
+
+        assert ExtendedRunTag._slots() == ["_key", "_value", "_extra"]
+        assert ExtendedRunTag("key", "value", 1) == ExtendedRunTag("key", "value", 1)
+        assert ExtendedRunTag("key", "value", 1) != ExtendedRunTag("key", "value", 2)
@@ -216,6 +216,26 @@ def test_model_save_load(build_model, model_path, data):
         np.array(spark_udf_preds), expected.reshape(len(spark_udf_preds)), decimal=4)
 
 
+@pytest.mark.large
+def test_pyfunc_predict_accepts_arrays_and_splits_batches(model, model_path, data):
+    x, _ = data
+    expected = model.predict(x)
+    mlflow.keras.save_model(model, model_path)
+
+    with mock.patch.dict(os.environ, {mlflow.keras.PREDICT_BATCH_SIZE_ENV_VAR: "16"}):
+        pyfunc_loaded = mlflow.pyfunc.load_pyfunc(model_path)
+    assert pyfunc_loaded.batch_size == 16
+
+    predicted_df = pyfunc_loaded.predict(x)
+    assert isinstance(predicted_df, pd.DataFrame)
+    assert all(predicted_df.index == x.index)
+    np.testing.assert_allclose(predicted_df.values, expected, rtol=1e-6)
+
+    predicted_array = pyfunc_loaded.predict(x.values)
+    assert isinstance(predicted_array, np.ndarray)
+    np.testing.assert_allclose(predicted_array, expected, rtol=1e-6)
+
+
 @pytest.mark.large
 def test_custom_model_save_load(custom_model, custom_layer, data, custom_predicted, model_path):
     x, _ = data
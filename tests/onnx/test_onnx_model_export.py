@@ -153,6 +153,93 @@ def test_cast_float64_to_float32():
     assert df2['col1'].dtype == np.float32 and df2['col2'].dtype == np.bool
 
 
+@pytest.mark.large
+def test_to_float32_array_casts_float_columns_without_modifying_dataframe():
+    import mlflow.onnx
+    df = pd.DataFrame({"a": np.arange(3, dtype=np.float64), "b": np.ones(3, dtype=np.float32)})
+    values = mlflow.onnx._OnnxModelWrapper._to_float32_array(df)
+    assert values.dtype == np.float32 and values.shape == (3, 2)
+    assert np.array_equal(values, df.values.astype(np.float32))
+    assert df["a"].dtype == np.float64
+
+    # Non-float columns are not cast, so that the ONNX Runtime rejects them
+    df_int = pd.DataFrame({"a": np.arange(3, dtype=np.float64), "b": np.arange(3)})
+    values = mlflow.onnx._OnnxModelWrapper._to_float32_array(df_int)
+    assert values.dtype != np.float32
+    assert df_int["a"].dtype == np.float64
+
+
+@pytest.mark.large
+def test_model_save_persists_session_options(onnx_model, model_path, onnx_custom_env):
+    import mlflow.onnx
+    session_options = {"graph_optimization_level": "extended", "intra_op_num_threads": 2,
+                       "optimized_model_path": "model.opt.onnx"}
+    mlflow.onnx.save_model(onnx_model, model_path, conda_env=onnx_custom_env,
+                           session_options=session_options)
+
+    flavor_conf = _get_flavor_configuration(model_path=model_path,
+                                            flavor_name=mlflow.onnx.FLAVOR_NAME)
+    assert flavor_conf["session_options"] == session_options
+
+
+@pytest.mark.large
+def test_model_save_with_invalid_session_options_raises_exception(onnx_model, model_path):
+    import mlflow.onnx
+    from mlflow.exceptions import MlflowException
+    from mlflow.protos.databricks_pb2 import ErrorCode, INVALID_PARAMETER_VALUE
+    for session_options in [{"unknown_option": 1}, {"graph_optimization_level": "fastest"},
+                            {"execution_mode": "async"}]:
+        with pytest.raises(MlflowException) as exc:
+            mlflow.onnx.save_model(onnx_model, model_path, session_options=session_options)
+        assert exc.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        assert not os.path.exists(model_path)
+
+
+# TODO: Mark this as large once MLflow's Travis build supports the onnxruntime library
+@pytest.mark.release
+def test_pyfunc_load_with_session_options_saves_and_reuses_optimized_model(
+        onnx_model, model_path, data, predicted):
+    import mlflow.onnx
+    x, _ = data
+    mlflow.onnx.save_model(onnx_model, model_path,
+                           session_options={"graph_optimization_level": "all",
+                                            "execution_mode": "sequential",
+                                            "optimized_model_path": "model.opt.onnx"})
+
+    pyfunc_loaded = mlflow.pyfunc.load_pyfunc(model_path)
+    assert os.path.exists(os.path.join(model_path, "model.opt.onnx"))
+    assert np.allclose(pyfunc_loaded.predict(x).values, predicted, rtol=1e-05, atol=1e-05)
+
+    with mock.patch.dict(os.environ, {mlflow.onnx.SESSION_OPTIONS_ENV_VAR:
+                                      '{"intra_op_num_threads": 1}'}):
+        pyfunc_reloaded = mlflow.pyfunc.load_pyfunc(model_path)
+    assert np.allclose(pyfunc_reloaded.predict(x).values, predicted, rtol=1e-05, atol=1e-05)
+
+
+# TODO: Mark this as large once MLflow's Travis build supports the onnxruntime library
+@pytest.mark.release
+def test_pyfunc_load_renames_optimized_model_once_written(onnx_model, model_path):
+    import onnxruntime
+    import mlflow.onnx
+    mlflow.onnx.save_model(onnx_model, model_path,
+                           session_options={"optimized_model_path": "model.opt.onnx"})
+    optimized_model_path = os.path.join(model_path, "model.opt.onnx")
+    create_session = onnxruntime.InferenceSession
+
+    def create_session_checking_optimized_model(path, sess_options):
+        assert sess_options.optimized_model_filepath != optimized_model_path
+        session = create_session(path, sess_options=sess_options)
+        assert os.path.exists(sess_options.optimized_model_filepath)
+        assert not os.path.exists(optimized_model_path)
+        return session
+
+    with mock.patch("onnxruntime.InferenceSession",
+                    side_effect=create_session_checking_optimized_model):
+        mlflow.pyfunc.load_pyfunc(model_path)
+    assert os.path.exists(optimized_model_path)
+    assert not [name for name in os.listdir(model_path) if name.endswith(".tmp")]
+
+
 # TODO: Use the default conda environment once MLflow's Travis build supports the onnxruntime
 # library
 @pytest.mark.large
@@ -0,0 +1,123 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+import mlflow.pyfunc
+from mlflow.exceptions import MlflowException
+from mlflow.models import cli as models_cli
+from mlflow.pyfunc import batch_predict
+
+
+class SumModel(mlflow.pyfunc.PythonModel):
+    def predict(self, context, model_input):
+        return (model_input["a"] + model_input["b"]).values
+
+
+class ScoreFrameModel(mlflow.pyfunc.PythonModel):
+    def predict(self, context, model_input):
+        return pd.DataFrame({"sum": model_input["a"] + model_input["b"],
+                             "label": np.where(model_input["a"] > 50, "high", "low")})
+
+
+@pytest.fixture
+def input_df():
+    return pd.DataFrame({"a": np.arange(103), "b": np.arange(103) * 0.5})
+
+
+@pytest.fixture
+def sum_model_path(tmpdir):
+    path = os.path.join(str(tmpdir), "sum_model")
+    mlflow.pyfunc.save_model(path=path, python_model=SumModel())
+    return path
+
+
+@pytest.fixture
+def frame_model_path(tmpdir):
+    path = os.path.join(str(tmpdir), "frame_model")
+    mlflow.pyfunc.save_model(path=path, python_model=ScoreFrameModel())
+    return path
+
+
+def test_predict_batch_scores_csv_in_chunks_and_writes_json_lines(sum_model_path, input_df,
+                                                                  tmpdir):
+    input_path = str(tmpdir.join("input.csv"))
+    output_path = str(tmpdir.join("output.jsonl"))
+    input_df.to_csv(input_path, index=False)
+
+    num_rows = batch_predict.predict_batch(sum_model_path, input_path, output_path, chunk_size=10)
+
+    assert num_rows == len(input_df)
+    with open(output_path) as f:
+        predictions = [json.loads(line) for line in f]
+    assert predictions == [{"prediction": a + b} for a, b in zip(input_df["a"], input_df["b"])]
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_predict_batch_preserves_order_with_several_workers(frame_model_path, input_df, tmpdir,
+                                                            num_workers):
+    input_path = str(tmpdir.join("input.jsonl"))
+    output_path = str(tmpdir.join("output.csv"))
+    input_df.to_json(input_path, orient="records", lines=True)
+
+    batch_predict.predict_batch(frame_model_path, input_path, output_path, chunk_size=7,
+                                num_workers=num_workers)
+
+    expected = ScoreFrameModel().predict(None, input_df)
+    pd.testing.assert_frame_equal(pd.read_csv(output_path), expected, check_dtype=False)
+
+
+def test_predict_batch_reads_and_writes_parquet(frame_model_path, input_df, tmpdir):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    input_path = str(tmpdir.join("input.parquet"))
+    output_path = str(tmpdir.join("output.parquet"))
+    pq.write_table(pa.Table.from_pandas(input_df), input_path, row_group_size=20)
+
+    batch_predict.predict_batch(frame_model_path, input_path, output_path, chunk_size=25)
+
+    expected = ScoreFrameModel().predict(None, input_df)
+    pd.testing.assert_frame_equal(pd.read_parquet(output_path), expected)
+
+
+def test_predict_chunks_reads_a_bounded_number_of_chunks_ahead(sum_model_path, input_df):
+    num_read_chunks = [0]
+
+    def read_chunks():
+        for start in range(0, len(input_df), 5):
+            num_read_chunks[0] += 1
+            yield input_df.iloc[start:start + 5]
+
+    predictions = batch_predict._predict_chunks(sum_model_path, read_chunks(), num_workers=2)
+    first_predictions = next(predictions)
+    assert num_read_chunks[0] <= 4
+    np.testing.assert_array_equal(first_predictions["prediction"],
+                                  input_df["a"][:5] + input_df["b"][:5])
+    assert sum(len(chunk) for chunk in predictions) == len(input_df) - 5
+
+
+def test_predict_batch_rejects_unknown_formats(sum_model_path, tmpdir):
+    with pytest.raises(MlflowException):
+        batch_predict.predict_batch(sum_model_path, str(tmpdir.join("input.txt")))
+    with pytest.raises(MlflowException):
+        batch_predict.predict_batch(sum_model_path, str(tmpdir.join("input.csv")),
+                                    output_format="parquet")
+
+
+def test_predict_batch_cli_writes_predictions(sum_model_path, input_df, tmpdir):
+    input_path = str(tmpdir.join("input.csv"))
+    output_path = str(tmpdir.join("output.csv"))
+    input_df.to_csv(input_path, index=False)
+
+    result = CliRunner().invoke(
+        models_cli.predict_batch,
+        ["-m", sum_model_path, "-i", input_path, "-o", output_path, "--chunk-size", "50",
+         "--no-conda"])
+
+    assert result.exit_code == 0, result.output
+    np.testing.assert_array_almost_equal(pd.read_csv(output_path)["prediction"],
+                                         input_df["a"] + input_df["b"])
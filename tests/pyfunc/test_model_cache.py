@@ -0,0 +1,124 @@
+import os
+
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlflow.pyfunc
+from mlflow.pyfunc import model_cache
+
+
+class ConstantModel(mlflow.pyfunc.PythonModel):
+    def __init__(self, value):
+        self.value = value
+
+    def predict(self, context, model_input):
+        return np.full(len(model_input), self.value)
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    model_cache.invalidate()
+    yield
+    model_cache.invalidate()
+
+
+@pytest.fixture
+def model_path(tmpdir):
+    path = os.path.join(str(tmpdir), "model")
+    mlflow.pyfunc.save_model(path=path, python_model=ConstantModel(1))
+    return path
+
+
+def test_model_cache_evicts_least_recently_used_models_and_misses_on_fingerprint_change():
+    cache = model_cache.ModelCache(max_size=2)
+    cache.put("a", "model_a", fingerprint="1")
+    cache.put("b", "model_b", fingerprint="1")
+    assert cache.get("a", fingerprint="1") == "model_a"
+    cache.put("c", "model_c", fingerprint="1")
+
+    assert cache.get("b", fingerprint="1") is None
+    assert cache.get("a", fingerprint="2") is None
+    assert cache.get_or_load("a", lambda: "new_model_a", fingerprint="2") == "new_model_a"
+    assert cache.get("a", fingerprint="2") == "new_model_a"
+    assert cache.num_hits == 2
+
+    cache.invalidate("a")
+    assert cache.get("a", fingerprint="2") is None
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_load_model_with_cache_reuses_model_until_its_files_change(model_path):
+    model = mlflow.pyfunc.load_model(model_path, use_cache=True)
+    assert mlflow.pyfunc.load_model(model_path, use_cache=True) is model
+    assert mlflow.pyfunc.load_model("file://" + model_path, use_cache=True) is model
+    assert mlflow.pyfunc.load_model(model_path) is not model
+
+    with open(os.path.join(model_path, "MLmodel"), "a") as f:
+        f.write("\n")
+    reloaded_model = mlflow.pyfunc.load_model(model_path, use_cache=True)
+    assert reloaded_model is not model
+    assert mlflow.pyfunc.load_model(model_path, use_cache=True) is reloaded_model
+
+
+def test_invalidate_removes_model_from_cache(model_path):
+    model = mlflow.pyfunc.load_model(model_path, use_cache=True)
+    model_cache.invalidate(model_path)
+    assert mlflow.pyfunc.load_model(model_path, use_cache=True) is not model
+
+
+def test_disk_model_cache_downloads_and_validates_model_once(model_path, tmpdir):
+    cache = model_cache.DiskModelCache(str(tmpdir.join("cache")))
+    fingerprint = model_cache.get_model_fingerprint(model_path)
+    validate_fn = mock.Mock(return_value={"validated": True})
+
+    cached_path, validation = cache.get_or_download(model_path, fingerprint, validate_fn)
+    assert validation == {"validated": True}
+    assert validate_fn.call_count == 1
+    assert os.path.exists(os.path.join(cached_path, "MLmodel"))
+
+    with mock.patch("mlflow.tracking.artifact_utils._download_artifact_from_uri") as download:
+        assert cache.get_or_download(model_path, fingerprint, validate_fn) == \
+            (cached_path, validation)
+        download.assert_not_called()
+    assert validate_fn.call_count == 1
+
+    model = mlflow.pyfunc._load_model_from_local_path(cached_path)
+    assert list(model.predict(pd.DataFrame({"a": [1, 2]}))) == [1, 1]
+
+    cache.invalidate("s3://bucket/other/model")
+    assert os.path.exists(cached_path)
+    cache.invalidate(model_path)
+    assert not os.path.exists(cached_path)
+
+
+def test_disk_model_cache_does_not_cache_models_failing_validation(model_path, tmpdir):
+    cache = model_cache.DiskModelCache(str(tmpdir.join("cache")))
+    validate_fn = mock.Mock(side_effect=ValueError("Invalid model"))
+
+    with pytest.raises(ValueError):
+        cache.get_or_download(model_path, "fingerprint", validate_fn)
+    assert os.listdir(cache.cache_dir) == []
+
+
+def test_load_model_uses_disk_cache_for_remote_models(model_path, tmpdir):
+    cache_dir = str(tmpdir.join("cache"))
+    remote_uri = "s3://bucket/path/to/model"
+    download_artifact_from_uri = mlflow.tracking.artifact_utils._download_artifact_from_uri
+
+    def download(artifact_uri, output_path=None):
+        assert artifact_uri == remote_uri
+        return download_artifact_from_uri(model_path, output_path)
+
+    with mock.patch.dict(os.environ, {model_cache.CACHE_DIR_ENV_VAR: cache_dir}), \
+            mock.patch("mlflow.pyfunc.model_cache.get_model_fingerprint", return_value="1"), \
+            mock.patch("mlflow.tracking.artifact_utils._download_artifact_from_uri",
+                       side_effect=download) as download_mock:
+        mlflow.pyfunc.load_model(remote_uri)
+        model = mlflow.pyfunc.load_model(remote_uri)
+
+    assert download_mock.call_count == 1
+    assert list(model.predict(pd.DataFrame({"a": [1]}))) == [1]
@@ -1,16 +1,28 @@
 import os
 import json
+import sys
+import threading
+import time
 import pandas as pd
 import numpy as np
 from collections import namedtuple, OrderedDict
+from io import BytesIO, StringIO
 
+import mock
 import pytest
 import sklearn.datasets as datasets
 import sklearn.neighbors as knn
 
 import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc.scoring_server.batching import MicroBatcher
+from mlflow.pyfunc.scoring_server.executor import PredictExecutor, PredictionRejectedException
+from mlflow.pyfunc.scoring_server.metrics import MetricsRegistry
+from mlflow.pyfunc.scoring_server.multi_model import LazyModelCache
 import mlflow.sklearn
-from mlflow.protos.databricks_pb2 import ErrorCode, MALFORMED_REQUEST, BAD_REQUEST
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ErrorCode, MALFORMED_REQUEST, BAD_REQUEST, \
+    INVALID_PARAMETER_VALUE, REQUEST_LIMIT_EXCEEDED, TEMPORARILY_UNAVAILABLE
+from mlflow.utils.file_utils import path_to_local_file_uri
 
 from tests.helper_functions import pyfunc_serve_and_score_model, random_int, random_str
 
@@ -263,3 +275,646 @@ def test_get_jsonnable_obj():
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
     np_ary = _get_jsonable_obj(np.array(py_ary, dtype=type(str)))
     assert json.dumps(py_ary, cls=NumpyEncoder) == json.dumps(np_ary, cls=NumpyEncoder)
+
+
+class _RecordingModel(object):
+    """Doubles its input, recording the number of rows passed to each call to predict."""
+
+    def __init__(self, delay_seconds=0):
+        self.batch_sizes = []
+        self.delay_seconds = delay_seconds
+
+    def predict(self, data):
+        self.batch_sizes.append(len(data))
+        time.sleep(self.delay_seconds)
+        if (data["x"] < 0).any():
+            raise ValueError("Negative input")
+        return data["x"].values * 2
+
+
+def test_micro_batcher_scores_concurrent_requests_together_and_splits_predictions():
+    model = _RecordingModel(delay_seconds=0.05)
+    registry = MetricsRegistry()
+    batcher = MicroBatcher(model.predict, max_batch_size=100, max_batch_delay_ms=200,
+                           metrics_registry=registry)
+    inputs = [pd.DataFrame({"x": [i] * (i + 1)}) for i in range(8)]
+    results = [None] * len(inputs)
+
+    def score(i):
+        results[i] = batcher.predict(inputs[i])
+
+    threads = [threading.Thread(target=score, args=(i,)) for i in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i, result in enumerate(results):
+        np.testing.assert_array_equal(result, [2 * i] * (i + 1))
+    assert sum(model.batch_sizes) == sum(len(df) for df in inputs)
+    assert len(model.batch_sizes) < len(inputs)
+    assert max(model.batch_sizes) <= 100
+    assert batcher.batch_size.get_count() == len(model.batch_sizes)
+    assert batcher.queue_delay.get_count() == len(inputs)
+    assert "mlflow_scoring_server_batch_size_rows_count %s" % len(model.batch_sizes) in \
+        registry.expose()
+
+
+def test_micro_batcher_reports_errors_only_for_failing_requests():
+    model = _RecordingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=100, max_batch_delay_ms=200)
+    results = {}
+
+    def score(value):
+        try:
+            results[value] = batcher.predict(pd.DataFrame({"x": [value]}))
+        except ValueError as e:
+            results[value] = e
+
+    threads = [threading.Thread(target=score, args=(v,)) for v in [1, -1, 3]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    np.testing.assert_array_equal(results[1], [2])
+    np.testing.assert_array_equal(results[3], [6])
+    assert isinstance(results[-1], ValueError)
+
+
+def test_micro_batcher_does_not_combine_requests_with_different_columns():
+    batch_columns = []
+
+    def predict(data):
+        batch_columns.append(list(data.columns))
+        return np.zeros(len(data))
+
+    batcher = MicroBatcher(predict, max_batch_size=100, max_batch_delay_ms=200)
+    threads = [threading.Thread(target=batcher.predict, args=(pd.DataFrame({col: [1]}),))
+               for col in ["a", "b", "a"]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(len(columns) == 1 for columns in batch_columns)
+
+
+def test_scoring_server_uses_micro_batcher_when_enabled():
+    model = _RecordingModel()
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE": "16",
+                                      "MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS": "1"}):
+        app = pyfunc_scoring_server.init(model)
+    client = app.test_client()
+    response = client.post("/invocations", data=pd.DataFrame({"x": [1, 2]}).to_json(orient="split"),
+                           content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON)
+    assert response.status_code == 200
+    assert json.loads(response.data) == [2, 4]
+    metrics = client.get("/metrics").data.decode("utf-8")
+    assert 'mlflow_scoring_server_batch_size_rows_bucket{le="2"} 1' in metrics
+
+
+def test_parse_npy_input_does_not_copy_numeric_arrays():
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    buf = BytesIO()
+    np.save(buf, array)
+    npy_bytes = buf.getvalue()
+    df = pyfunc_scoring_server.parse_npy_input(npy_bytes)
+    np.testing.assert_array_equal(df.values, array)
+    assert df.dtypes.tolist() == [np.float32] * 4
+    assert np.shares_memory(df.values, np.frombuffer(npy_bytes, dtype=np.uint8))
+
+    buf = BytesIO()
+    np.save(buf, np.asfortranarray(array))
+    np.testing.assert_array_equal(pyfunc_scoring_server.parse_npy_input(buf.getvalue()).values,
+                                  array)
+
+    buf = BytesIO()
+    np.save(buf, np.array([1, 2, 3]))
+    assert pyfunc_scoring_server.parse_npy_input(buf.getvalue()).shape == (3, 1)
+
+
+def test_parse_npy_input_supports_structured_arrays():
+    array = np.array([(1, 2.5), (3, 4.5)], dtype=[("a", np.int64), ("b", np.float64)])
+    buf = BytesIO()
+    np.save(buf, array)
+    df = pyfunc_scoring_server.parse_npy_input(buf.getvalue())
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [1, 3]
+    assert df["b"].tolist() == [2.5, 4.5]
+
+
+@pytest.mark.parametrize("npy_bytes", [b"not an npy file", None])
+def test_parse_npy_input_rejects_malformed_and_object_arrays(npy_bytes):
+    if npy_bytes is None:
+        buf = BytesIO()
+        np.save(buf, np.array([["a", 1]], dtype=object), allow_pickle=True)
+        npy_bytes = buf.getvalue()
+    with pytest.raises(MlflowException) as exc_info:
+        pyfunc_scoring_server.parse_npy_input(npy_bytes)
+    assert exc_info.value.error_code == ErrorCode.Name(MALFORMED_REQUEST)
+
+
+def test_parse_arrow_stream_input():
+    import pyarrow as pa
+    df = pd.DataFrame({"a": np.arange(5, dtype=np.float64), "b": list("abcde")})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, table.schema)
+    writer.write_table(table)
+    writer.close()
+    parsed = pyfunc_scoring_server.parse_arrow_stream_input(sink.getvalue().to_pybytes())
+    pd.testing.assert_frame_equal(parsed, df)
+
+    with pytest.raises(MlflowException) as exc_info:
+        pyfunc_scoring_server.parse_arrow_stream_input(b"not an arrow stream")
+    assert exc_info.value.error_code == ErrorCode.Name(MALFORMED_REQUEST)
+
+
+def test_scoring_server_accepts_npy_input():
+    class SumModel(object):
+        def predict(self, data):
+            return data.sum(axis=1).values
+
+    client = pyfunc_scoring_server.init(SumModel()).test_client()
+    buf = BytesIO()
+    np.save(buf, np.array([[1.0, 2.0], [3.0, 4.0]]))
+    response = client.post("/invocations", data=buf.getvalue(),
+                           content_type=pyfunc_scoring_server.CONTENT_TYPE_NPY)
+    assert response.status_code == 200
+    assert json.loads(response.data) == [3.0, 7.0]
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "auto"])
+@pytest.mark.parametrize("predictions", [
+    np.array([1.5, 2.0, 3.25]),
+    np.arange(6).reshape(3, 2)[:, ::-1],
+    pd.Series([1, 2, 3], name="label"),
+    pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5], "c": ["x", "y"]}),
+    pd.DataFrame({"a": np.array([1, 2], dtype=np.int32), "b": [np.float32(1.5), None]},
+                 dtype=object),
+])
+def test_predictions_to_json_matches_numpy_encoder_output(backend, predictions):
+    expected = json.loads(json.dumps(
+        predictions.tolist() if isinstance(predictions, np.ndarray)
+        else pd.DataFrame(predictions).to_dict(orient="records"),
+        cls=pyfunc_scoring_server.NumpyEncoder))
+    output = StringIO()
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_JSON_BACKEND": backend}):
+        pyfunc_scoring_server.predictions_to_json(predictions, output)
+    assert json.loads(output.getvalue()) == expected
+
+
+def test_predictions_to_json_falls_back_to_json_module_if_backend_fails():
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_JSON_BACKEND": "orjson"}), \
+            mock.patch("orjson.dumps", side_effect=TypeError()):
+        output = StringIO()
+        pyfunc_scoring_server.predictions_to_json(np.array([1, 2]), output)
+    assert output.getvalue() == "[1, 2]"
+
+
+def test_predictions_to_json_uses_json_module_by_default():
+    output = StringIO()
+    with mock.patch.dict(os.environ):
+        os.environ.pop("MLFLOW_SCORING_SERVER_JSON_BACKEND", None)
+        pyfunc_scoring_server.predictions_to_json(np.array([1.5, np.nan, np.inf]), output)
+    assert output.getvalue() == "[1.5, NaN, Infinity]"
+
+
+def test_scoring_server_init_fails_for_invalid_json_backend():
+    for backend in ["invalid", "not_installed"]:
+        with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_JSON_BACKEND": backend}), \
+                mock.patch.object(pyfunc_scoring_server, "_JSON_BACKENDS",
+                                  ["json", "not_installed"]), \
+                pytest.raises(MlflowException) as exc_info:
+            pyfunc_scoring_server.init(None)
+        assert exc_info.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_scoring_server_returns_binary_predictions_for_accept_header():
+    import pyarrow as pa
+
+    class IdentityModel(object):
+        def predict(self, data):
+            return data
+
+    client = pyfunc_scoring_server.init(IdentityModel()).test_client()
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [3, 4]})
+    request_body = df.to_json(orient="split")
+
+    response = client.post("/invocations", data=request_body,
+                           content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON,
+                           headers={"Accept": pyfunc_scoring_server.CONTENT_TYPE_NPY})
+    assert response.status_code == 200
+    assert response.content_type == pyfunc_scoring_server.CONTENT_TYPE_NPY
+    array = np.load(BytesIO(response.data))
+    assert array["a"].tolist() == [1.0, 2.0]
+    assert array["b"].tolist() == [3, 4]
+
+    response = client.post("/invocations", data=request_body,
+                           content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON,
+                           headers={"Accept": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM})
+    assert response.status_code == 200
+    table = pa.ipc.open_stream(pa.py_buffer(response.data)).read_all()
+    pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+    response = client.post("/invocations", data=request_body,
+                           content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON,
+                           headers={"Accept": "*/*"})
+    assert response.content_type == pyfunc_scoring_server.CONTENT_TYPE_JSON
+    assert json.loads(response.data) == [{"a": 1.0, "b": 3}, {"a": 2.0, "b": 4}]
+
+
+def test_micro_batcher_scores_requests_directly_after_close():
+    model = _RecordingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=100, max_batch_delay_ms=1)
+    np.testing.assert_array_equal(batcher.predict(pd.DataFrame({"x": [1]})), [2])
+    batcher.close()
+    np.testing.assert_array_equal(batcher.predict(pd.DataFrame({"x": [2, 3]})), [4, 6])
+    assert model.batch_sizes == [1, 2]
+
+
+def test_multi_model_scoring_server_loads_models_lazily_and_unloads_least_recently_used():
+    loaded_uris = []
+
+    def load_model(model_uri):
+        loaded_uris.append(model_uri)
+        return _RecordingModel()
+
+    with mock.patch("mlflow.pyfunc.scoring_server.load_model", side_effect=load_model):
+        app = pyfunc_scoring_server.init_multi_model(
+            {"a": "models:/a", "b": "models:/b", "c": "models:/c"}, max_loaded_models=2)
+        client = app.test_client()
+        assert loaded_uris == []
+
+        def score(name):
+            return client.post("/models/%s/invocations" % name,
+                               data=pd.DataFrame({"x": [1, 2]}).to_json(orient="split"),
+                               content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON)
+
+        for name in ["a", "b", "a", "c", "a", "b"]:
+            response = score(name)
+            assert response.status_code == 200
+            assert json.loads(response.data) == [2, 4]
+        # "b" is unloaded when loading "c" because "a" was used more recently, then "c" is
+        # unloaded when reloading "b"
+        assert loaded_uris == ["models:/a", "models:/b", "models:/c", "models:/b"]
+
+        models = json.loads(client.get("/models").data)["models"]
+        assert [(m["name"], m["loaded"]) for m in models] == \
+            [("a", True), ("b", True), ("c", False)]
+
+        response = score("unknown")
+        assert response.status_code == 404
+        assert json.loads(response.data)["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_multi_model_scoring_server_preloads_models():
+    with mock.patch("mlflow.pyfunc.scoring_server.load_model",
+                    return_value=_RecordingModel()) as load_model_mock:
+        pyfunc_scoring_server.init_multi_model(
+            {"b": "models:/b", "a": "models:/a", "c": "models:/c"}, max_loaded_models=2,
+            preload=True)
+    assert [call[0][0] for call in load_model_mock.call_args_list] == ["models:/a", "models:/b"]
+
+
+def test_lazy_model_cache_loads_each_model_once_under_concurrent_requests():
+    load_model_mock = mock.Mock(side_effect=lambda uri: time.sleep(0.1) or _RecordingModel())
+    models = LazyModelCache({"a": "models:/a"}, None, load_model_mock)
+    threads = [threading.Thread(target=models.get_predict_fn, args=("a",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert load_model_mock.call_count == 1
+
+
+def test_lazy_model_cache_shares_predict_executor_between_models():
+    predict_started = threading.Event()
+    release_predict = threading.Event()
+    model = _RecordingModel()
+    original_predict = model.predict
+
+    def predict(data):
+        predict_started.set()
+        release_predict.wait()
+        return original_predict(data)
+
+    model.predict = predict
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_MAX_CONCURRENT_REQUESTS": "1"}):
+        models = LazyModelCache({"a": "models:/a", "b": "models:/b"}, 1, lambda uri: model)
+    predict_a = models.get_predict_fn("a")
+    thread = threading.Thread(target=predict_a, args=(pd.DataFrame({"x": [1]}),))
+    thread.start()
+    try:
+        predict_started.wait()
+        # Loading "b" unloads "a", whose prediction is still in progress and uses the only slot
+        # of the executor shared by both models
+        with pytest.raises(PredictionRejectedException) as e:
+            models.get_predict_fn("b")(pd.DataFrame({"x": [1]}))
+        assert e.value.error_code == ErrorCode.Name(REQUEST_LIMIT_EXCEEDED)
+    finally:
+        release_predict.set()
+        thread.join()
+    np.testing.assert_array_equal(models.get_predict_fn("b")(pd.DataFrame({"x": [2]})), [4])
+
+
+def test_serve_multiple_models_sets_server_environment(tmpdir):
+    from mlflow.pyfunc.backend import serve_multiple_models
+    with mock.patch("mlflow.pyfunc.backend._download_artifact_from_uri",
+                    side_effect=lambda uri: str(tmpdir.join(uri.split("/")[-1]))), \
+            mock.patch("subprocess.Popen") as popen_mock:
+        serve_multiple_models({"a": "runs:/1/a"}, port=5001, host="0.0.0.0", workers=2,
+                              preload=True, max_loaded_models=3)
+    command = popen_mock.call_args[0][0][-1]
+    env = popen_mock.call_args[1]["env"]
+    assert "--preload" in command
+    assert "-w 2" in command
+    assert json.loads(env[pyfunc_scoring_server._SERVER_MODEL_URIS]) == \
+        {"a": path_to_local_file_uri(str(tmpdir.join("a")))}
+    assert env[pyfunc_scoring_server._SERVER_MAX_LOADED_MODELS] == "3"
+    assert env[pyfunc_scoring_server._SERVER_PRELOAD] == "true"
+
+
+def test_scoring_server_reports_ready_only_after_warmup():
+    release_predict = threading.Event()
+    model = _RecordingModel()
+    original_predict = model.predict
+
+    def predict(data):
+        release_predict.wait()
+        return original_predict(data)
+
+    model.predict = predict
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS": "3"}):
+        app = pyfunc_scoring_server.init(model, warmup_input=pd.DataFrame({"x": [1, 2]}))
+    client = app.test_client()
+    assert client.get("/ping").status_code == 503
+
+    release_predict.set()
+    deadline = time.time() + 10
+    while client.get("/ping").status_code != 200 and time.time() < deadline:
+        time.sleep(0.01)
+    assert client.get("/ping").status_code == 200
+    assert model.batch_sizes == [2, 2, 2]
+
+
+def test_scoring_server_becomes_ready_if_warmup_fails():
+    model = _RecordingModel()
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS": "2"}):
+        app = pyfunc_scoring_server.init(model, warmup_input=pd.DataFrame({"x": [-1]}),
+                                         block_on_warmup=True)
+    assert app.test_client().get("/ping").status_code == 200
+    assert model.batch_sizes == [1]
+
+
+def test_scoring_server_skips_warmup_without_iterations_or_input():
+    model = _RecordingModel()
+    pyfunc_scoring_server.init(model, warmup_input=pd.DataFrame({"x": [1]}), block_on_warmup=True)
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS": "2"}):
+        app = pyfunc_scoring_server.init(model, warmup_input=None, block_on_warmup=True)
+    assert app.test_client().get("/ping").status_code == 200
+    assert model.batch_sizes == []
+
+
+def test_load_warmup_input_reads_input_example_or_user_supplied_file(
+        sklearn_model, model_path, tmpdir):
+    example = pd.DataFrame(sklearn_model.inference_data[:3], columns=["a", "b"])
+    mlflow.sklearn.save_model(sk_model=sklearn_model.model, path=model_path,
+                              input_example=example)
+    pd.testing.assert_frame_equal(pyfunc_scoring_server.load_warmup_input(model_path), example)
+
+    input_path = str(tmpdir.join("warmup.csv"))
+    example.head(1).to_csv(input_path, index=False)
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_WARMUP_INPUT": input_path}):
+        pd.testing.assert_frame_equal(pyfunc_scoring_server.load_warmup_input(model_path),
+                                      example.head(1))
+
+
+def test_load_warmup_input_returns_none_for_model_without_input_example(sklearn_model,
+                                                                        model_path):
+    mlflow.sklearn.save_model(sk_model=sklearn_model.model, path=model_path)
+    assert pyfunc_scoring_server.load_warmup_input(model_path) is None
+
+
+def test_wsgi_app_only_loads_warmup_input_if_warmup_is_enabled(tmpdir):
+    env = {pyfunc_scoring_server._SERVER_MODEL_PATH: str(tmpdir),
+           "MLFLOW_SCORING_SERVER_WARMUP_INPUT": str(tmpdir.join("invalid.txt"))}
+    for iterations, expected_calls in [("0", 0), ("1", 1)]:
+        env["MLFLOW_SCORING_SERVER_WARMUP_ITERATIONS"] = iterations
+        with mock.patch.dict(os.environ, env), \
+                mock.patch("mlflow.pyfunc.load_model", return_value=_RecordingModel()), \
+                mock.patch.object(pyfunc_scoring_server, "load_warmup_input",
+                                  return_value=None) as load_warmup_input_mock, \
+                mock.patch("gc.freeze", create=True):
+            sys.modules.pop("mlflow.pyfunc.scoring_server.wsgi", None)
+            import mlflow.pyfunc.scoring_server.wsgi  # pylint: disable=unused-import
+        sys.modules.pop("mlflow.pyfunc.scoring_server.wsgi", None)
+        assert load_warmup_input_mock.call_count == expected_calls
+
+
+def _get_metric_value(metrics_text, sample):
+    for line in metrics_text.splitlines():
+        if line.startswith(sample + " "):
+            return float(line.split(" ")[-1])
+    return None
+
+
+def test_scoring_server_reports_request_stage_and_error_metrics():
+    client = pyfunc_scoring_server.init(_RecordingModel()).test_client()
+    request_body = pd.DataFrame({"x": [1, 2, 3]}).to_json(orient="split")
+    for _ in range(2):
+        response = client.post("/invocations", data=request_body,
+                               content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON)
+        assert response.status_code == 200
+    client.post("/invocations", data="not json",
+                content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON)
+    client.post("/invocations", data=pd.DataFrame({"x": [-1]}).to_json(orient="split"),
+                content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON)
+    client.post("/invocations", data="x", content_type="text/unsupported")
+
+    metrics = client.get("/metrics").data.decode("utf-8")
+    assert _get_metric_value(metrics, 'mlflow_scoring_server_requests_total{status="200"}') == 2
+    assert _get_metric_value(metrics, 'mlflow_scoring_server_requests_total{status="400"}') == 1
+    assert _get_metric_value(metrics, 'mlflow_scoring_server_requests_total{status="500"}') == 1
+    assert _get_metric_value(metrics, 'mlflow_scoring_server_requests_total{status="415"}') == 1
+    assert _get_metric_value(
+        metrics, 'mlflow_scoring_server_errors_total{error_code="MALFORMED_REQUEST"}') == 1
+    assert _get_metric_value(
+        metrics, 'mlflow_scoring_server_errors_total{error_code="BAD_REQUEST"}') == 1
+    assert _get_metric_value(metrics, "mlflow_scoring_server_input_rows_total") == 7
+    assert _get_metric_value(metrics, "mlflow_scoring_server_request_size_bytes_count") == 4
+    assert _get_metric_value(metrics, "mlflow_scoring_server_request_size_bytes_sum") == \
+        2 * len(request_body) + len("not json") + \
+        len(pd.DataFrame({"x": [-1]}).to_json(orient="split"))
+    assert _get_metric_value(metrics, "mlflow_scoring_server_response_size_bytes_count") == 2
+    assert _get_metric_value(metrics, "mlflow_scoring_server_request_duration_seconds_count") == 5
+    for stage, count in [("dispatch", 5), ("parse", 4), ("predict", 3), ("serialize", 2)]:
+        assert _get_metric_value(
+            metrics,
+            'mlflow_scoring_server_stage_duration_seconds_count{stage="%s"}' % stage) == count
+
+
+def test_metrics_registry_aggregates_metrics_of_forked_processes(tmpdir):
+    import multiprocessing
+
+    registry = MetricsRegistry(multiprocess_dir=str(tmpdir))
+    requests = registry.counter("requests", "Requests.", ["status"])
+    latency = registry.histogram("latency", "Latency.", [1.0, 2.0])
+
+    def handle_requests(num_requests):
+        for _ in range(num_requests):
+            requests.inc(status="200")
+            latency.observe(1.5)
+        registry.mark_updated()
+        registry.flush()
+
+    processes = [multiprocessing.get_context("fork").Process(target=handle_requests, args=(n,))
+                 for n in [2, 3]]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    requests.inc(status="500")
+
+    metrics = registry.expose()
+    assert _get_metric_value(metrics, 'requests_total{status="200"}') == 5
+    assert _get_metric_value(metrics, 'requests_total{status="500"}') == 1
+    assert _get_metric_value(metrics, 'latency_bucket{le="1.0"}') == 0
+    assert _get_metric_value(metrics, 'latency_bucket{le="2.0"}') == 5
+    assert _get_metric_value(metrics, "latency_sum") == 7.5
+    # Metrics of the current process are only counted once, even after writing them
+    registry.mark_updated()
+    registry.flush()
+    assert _get_metric_value(registry.expose(), 'requests_total{status="500"}') == 1
+
+
+def test_predict_executor_limits_concurrent_predictions_and_times_out():
+    release_predict = threading.Event()
+
+    def predict(data):
+        release_predict.wait()
+        return data["x"].values * 2
+
+    executor = PredictExecutor(predict, max_concurrent_requests=2, timeout_seconds=0.1)
+    assert executor.num_threads == 2
+    for _ in range(2):
+        with pytest.raises(PredictionRejectedException) as e:
+            executor.predict(pd.DataFrame({"x": [1]}))
+        assert e.value.error_code == ErrorCode.Name(TEMPORARILY_UNAVAILABLE)
+    # The predictions that timed out still occupy their slots until they complete
+    with pytest.raises(PredictionRejectedException) as e:
+        executor.predict(pd.DataFrame({"x": [1]}))
+    assert e.value.error_code == ErrorCode.Name(REQUEST_LIMIT_EXCEEDED)
+
+    release_predict.set()
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            result = executor.predict(pd.DataFrame({"x": [1, 2]}))
+            break
+        except PredictionRejectedException:
+            time.sleep(0.01)
+    np.testing.assert_array_equal(result, [2, 4])
+
+
+def test_predict_executor_scores_requests_directly_after_close():
+    model = _RecordingModel()
+    executor = PredictExecutor(model.predict, num_threads=1)
+    np.testing.assert_array_equal(executor.predict(pd.DataFrame({"x": [1]})), [2])
+    pool = executor._pools.get("pool")
+    executor.close()
+    assert executor._pools.get("pool") is None
+    with mock.patch.object(pool, "apply_async") as apply_async_mock:
+        np.testing.assert_array_equal(executor.predict(pd.DataFrame({"x": [2, 3]})), [4, 6])
+    apply_async_mock.assert_not_called()
+    assert len(executor._pools) == 0
+
+
+def test_scoring_server_rejects_requests_beyond_limits_of_predict_executor():
+    release_predict = threading.Event()
+    model = _RecordingModel()
+    original_predict = model.predict
+
+    def predict(data):
+        release_predict.wait()
+        return original_predict(data)
+
+    model.predict = predict
+    with mock.patch.dict(os.environ, {"MLFLOW_SCORING_SERVER_MAX_CONCURRENT_REQUESTS": "1",
+                                      "MLFLOW_SCORING_SERVER_REQUEST_TIMEOUT_SECONDS": "0.1"}):
+        client = pyfunc_scoring_server.init(model).test_client()
+
+    def score():
+        return client.post("/invocations",
+                           data=pd.DataFrame({"x": [1]}).to_json(orient="split"),
+                           content_type=pyfunc_scoring_server.CONTENT_TYPE_JSON)
+
+    response = score()
+    assert response.status_code == 503
+    assert json.loads(response.data)["error_code"] == "TEMPORARILY_UNAVAILABLE"
+    response = score()
+    assert response.status_code == 429
+    assert json.loads(response.data)["error_code"] == "REQUEST_LIMIT_EXCEEDED"
+    release_predict.set()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires async def")
+def test_python_model_with_async_predict_runs_predictions_concurrently():
+    from mlflow.pyfunc.model import _PythonModelPyfuncWrapper
+
+    namespace = {}
+    exec("""
+import asyncio
+
+class AsyncModel(object):
+    async def predict(self, context, model_input):
+        await asyncio.sleep(0.5)
+        return model_input["x"].values * 2
+""", namespace)
+    wrapper = _PythonModelPyfuncWrapper(namespace["AsyncModel"](), context=None)
+    results = [None] * 8
+
+    def score(i):
+        results[i] = wrapper.predict(pd.DataFrame({"x": [i]}))
+
+    threads = [threading.Thread(target=score, args=(i,)) for i in range(len(results))]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The predictions wait on the same event loop rather than one after the other
+    assert time.time() - start < 2
+    for i, result in enumerate(results):
+        np.testing.assert_array_equal(result, [2 * i])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 5), reason="requires asyncio")
+def test_concurrent_first_async_predictions_start_a_single_event_loop():
+    import mlflow.pyfunc.model as pyfunc_model
+    start_event_loop = pyfunc_model._start_event_loop
+
+    def slow_start_event_loop():
+        time.sleep(0.1)
+        return start_event_loop()
+
+    with mock.patch.object(pyfunc_model, "_event_loop_pid", None), \
+            mock.patch.object(pyfunc_model, "_event_loop", None), \
+            mock.patch.object(pyfunc_model, "_start_event_loop",
+                              side_effect=slow_start_event_loop) as start_event_loop_mock:
+        loops = []
+        threads = [threading.Thread(target=lambda: loops.append(pyfunc_model._get_event_loop()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert start_event_loop_mock.call_count == 1
+        assert len(set(loops)) == 1
+    loops[0].call_soon_threadsafe(loops[0].stop)
+
+
+def test_gunicorn_command_uses_gthread_workers_when_threads_are_specified():
+    from mlflow.pyfunc.backend import _build_gunicorn_command
+    assert "-k gthread --threads 16 " in _build_gunicorn_command("127.0.0.1", 5000, 2, False, 16)
+    assert "gthread" not in _build_gunicorn_command("127.0.0.1", 5000, 2, False)
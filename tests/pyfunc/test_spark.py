@@ -43,7 +43,23 @@ class ConstantPyfuncWrapper(object):
         return prediction_df
 
 
-def _load_pyfunc(_):
+class BatchSizePyfuncWrapper(object):
+    @staticmethod
+    def predict(model_input):
+        return pd.DataFrame({"0": np.full(len(model_input), len(model_input))})
+
+
+class Int64NdarrayPyfuncWrapper(object):
+    @staticmethod
+    def predict(model_input):
+        return np.arange(len(model_input), dtype=np.int64)
+
+
+def _load_pyfunc(path):
+    if os.path.exists(os.path.join(path, "batch_size_model")):
+        return BatchSizePyfuncWrapper()
+    if os.path.exists(os.path.join(path, "int64_ndarray_model")):
+        return Int64NdarrayPyfuncWrapper()
     return ConstantPyfuncWrapper()
 
 
@@ -108,6 +124,73 @@ def test_spark_udf(spark, model_path):
                 assert expected == actual
 
 
+@pytest.mark.large
+def test_spark_udf_with_struct_result_type(spark, model_path):
+    mlflow.pyfunc.save_model(
+        path=model_path,
+        loader_module=__name__,
+        code_path=[os.path.dirname(tests.__file__)],
+    )
+    pandas_df = pd.DataFrame(data=np.ones((10, 2)), columns=["a", "b"])
+    spark_df = spark.createDataFrame(pandas_df)
+
+    # "label" is taken from the first prediction column, "0" and "4" from the columns with the
+    # same names
+    pyfunc_udf = spark_udf(spark, model_path, result_type="label string, `0` int, `4` double")
+    new_df = spark_df.withColumn("prediction", pyfunc_udf(*pandas_df.columns))
+    actual = [tuple(row["prediction"]) for row in new_df.collect()]
+    assert actual == [("1", 1, 0.2)] * 10
+
+    with pytest.raises(Exception):
+        pyfunc_udf = spark_udf(spark, model_path, result_type="a int, b int, c int, d int, "
+                                                              "e int, f int")
+        spark_df.withColumn("prediction", pyfunc_udf(*pandas_df.columns)).collect()
+
+
+@pytest.mark.large
+def test_spark_udf_with_integer_result_types_for_int64_ndarray_predictions(spark, model_path):
+    mlflow.pyfunc.save_model(
+        path=model_path,
+        loader_module=__name__,
+        code_path=[os.path.dirname(tests.__file__)],
+    )
+    open(os.path.join(model_path, "int64_ndarray_model"), "w").close()
+    spark_df = spark.createDataFrame(pd.DataFrame({"a": np.arange(10.0)})).coalesce(1)
+
+    for result_type in ["int", "long", "array<int>", "array<long>"]:
+        pyfunc_udf = spark_udf(spark, model_path, result_type=result_type)
+        predictions = [row["prediction"] for row in
+                       spark_df.withColumn("prediction", pyfunc_udf("a")).collect()]
+        if result_type.startswith("array"):
+            assert predictions == [[i] for i in range(10)]
+        else:
+            assert predictions == list(range(10))
+
+
+@pytest.mark.large
+def test_spark_udf_arrow_batch_size(spark, model_path):
+    mlflow.pyfunc.save_model(
+        path=model_path,
+        loader_module=__name__,
+        code_path=[os.path.dirname(tests.__file__)],
+    )
+    open(os.path.join(model_path, "batch_size_model"), "w").close()
+    spark_df = spark.createDataFrame(pd.DataFrame({"a": np.arange(100.0)})).coalesce(1)
+
+    max_records_per_batch = spark.conf.get("spark.sql.execution.arrow.maxRecordsPerBatch")
+    pyfunc_udf = spark_udf(spark, model_path, result_type="long")
+    # spark_udf leaves the session configuration to the caller
+    assert spark.conf.get("spark.sql.execution.arrow.maxRecordsPerBatch") == \
+        max_records_per_batch
+    spark.conf.set("spark.sql.execution.arrow.maxRecordsPerBatch", "7")
+    try:
+        batch_sizes = [row["prediction"] for row in
+                       spark_df.withColumn("prediction", pyfunc_udf("a")).collect()]
+    finally:
+        spark.conf.set("spark.sql.execution.arrow.maxRecordsPerBatch", max_records_per_batch)
+    assert max(batch_sizes) == 7
+
+
 @pytest.mark.large
 def test_model_cache(spark, model_path):
     mlflow.pyfunc.save_model(
@@ -246,6 +246,61 @@ def test_save_and_load_model(sequential_model, model_path, data, sequential_pred
         pyfunc_loaded.predict(data[0]).values[:, 0], sequential_predicted, decimal=4)
 
 
+@pytest.mark.large
+@pytest.mark.parametrize("jit_mode", ["trace", "script"])
+def test_save_and_load_model_with_torchscript(sequential_model, model_path, data,
+                                              sequential_predicted, jit_mode):
+    mlflow.pytorch.save_model(sequential_model, model_path, jit_mode=jit_mode,
+                              example_input=data[0].values[:2].astype(np.float32))
+
+    model_data_path = os.path.join(model_path, "data")
+    assert mlflow.pytorch._TORCHSCRIPT_MODEL_FILE_NAME in os.listdir(model_data_path)
+    assert mlflow.pytorch._SERIALIZED_TORCH_MODEL_FILE_NAME not in os.listdir(model_data_path)
+    assert sequential_model.training
+
+    sequential_model_loaded = mlflow.pytorch.load_model(model_path)
+    assert isinstance(sequential_model_loaded, torch.jit.ScriptModule)
+    np.testing.assert_array_almost_equal(
+        _predict(sequential_model_loaded, data), sequential_predicted, decimal=5)
+
+    pyfunc_loaded = mlflow.pyfunc.load_model(model_path)
+    np.testing.assert_array_almost_equal(
+        pyfunc_loaded.predict(data[0]).values[:, 0], sequential_predicted, decimal=4)
+
+
+@pytest.mark.large
+def test_save_model_with_trace_jit_mode_requires_example_input(sequential_model, model_path):
+    with pytest.raises(MlflowException):
+        mlflow.pytorch.save_model(sequential_model, model_path, jit_mode="trace")
+    with pytest.raises(MlflowException):
+        mlflow.pytorch.save_model(sequential_model, model_path, jit_mode="compile")
+    assert not os.path.exists(model_path)
+
+
+@pytest.mark.large
+def test_pyfunc_predicts_in_batches_with_configured_batch_size_and_threads(
+        sequential_model, model_path, data, sequential_predicted):
+    mlflow.pytorch.save_model(sequential_model, model_path)
+
+    with mock.patch.dict(os.environ, {mlflow.pytorch.PREDICT_BATCH_SIZE_ENV_VAR: "7",
+                                      mlflow.pytorch.NUM_THREADS_ENV_VAR: "2"}), \
+            mock.patch("torch.set_num_threads") as set_num_threads_mock:
+        pyfunc_loaded = mlflow.pyfunc.load_model(model_path)
+    set_num_threads_mock.assert_called_once_with(2)
+
+    pytorch_model = pyfunc_loaded.pytorch_model
+    with mock.patch.object(pytorch_model, "forward", wraps=pytorch_model.forward) as forward, \
+            mock.patch.object(pytorch_model, "eval", wraps=pytorch_model.eval) as eval_mock:
+        predictions = pyfunc_loaded.predict(data[0])
+        pyfunc_loaded.predict(data[0].iloc[:0])
+
+    assert forward.call_count == int(np.ceil(len(data[0]) / 7.0)) + 1
+    eval_mock.assert_not_called()
+    assert predictions.index.equals(data[0].index)
+    np.testing.assert_array_almost_equal(
+        predictions.values[:, 0], sequential_predicted, decimal=4)
+
+
 @pytest.mark.large
 def test_load_model_from_remote_uri_succeeds(
         sequential_model, model_path, mock_s3_bucket, data, sequential_predicted):
@@ -0,0 +1,165 @@
+# pylint: disable=redefined-outer-name
+import json
+import os
+import time
+
+import mock
+import pytest
+import requests
+
+from mlflow.server import app, ARTIFACT_ROOT_ENV_VAR
+from mlflow.server.handlers import SERVE_ARTIFACTS_ENV_VAR
+from mlflow.store.artifact_repository_registry import get_artifact_repository
+from mlflow.store.http_artifact_repo import HttpArtifactRepository, \
+    MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR
+
+BASE_PATH = "/api/2.0/mlflow-artifacts"
+
+
+@pytest.fixture
+def artifact_root(tmpdir):
+    root = tmpdir.join("artifact-root")
+    root.mkdir()
+    env = {ARTIFACT_ROOT_ENV_VAR: root.strpath, SERVE_ARTIFACTS_ENV_VAR: "true"}
+    with mock.patch.dict(os.environ, env):
+        yield root
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.fixture
+def proxied_requests(client):
+    """Route HTTP requests made by `HttpArtifactRepository` to the Flask test client"""
+    def request(method, url, params=None, data=None, **kwargs):
+        # pylint: disable=unused-argument
+        path = requests.utils.urlparse(url).path
+        if data is not None and not isinstance(data, bytes):
+            data = b"".join(data)
+        flask_response = client.open(path, method=method, query_string=params, data=data)
+        response = requests.models.Response()
+        response.status_code = flask_response.status_code
+        response._content = flask_response.get_data()
+        response._content_consumed = True
+        return response
+
+    with mock.patch("requests.request", side_effect=request) as request_mock:
+        yield request_mock
+
+
+def test_upload_list_and_download_artifact(artifact_root, client):
+    response = client.put(BASE_PATH + "/artifacts/0/run/artifacts/dir/file.txt", data=b"content")
+    assert response.status_code == 200
+    assert artifact_root.join("0", "run", "artifacts", "dir", "file.txt").read() == "content"
+
+    response = client.get(BASE_PATH + "/artifacts", query_string={"path": "0/run/artifacts"})
+    assert json.loads(response.get_data()) == {
+        "files": [{"path": "0/run/artifacts/dir", "is_dir": True, "file_size": None}]
+    }
+
+    response = client.get(BASE_PATH + "/artifacts/0/run/artifacts/dir/file.txt")
+    assert response.status_code == 200
+    assert response.get_data() == b"content"
+
+
+def test_multipart_upload(artifact_root, client):
+    artifact_path = "0/run/artifacts/model.bin"
+    response = client.post(BASE_PATH + "/mpu/create/" + artifact_path)
+    upload_id = json.loads(response.get_data())["upload_id"]
+    for part_number, content in reversed(list(enumerate([b"first-", b"second-", b"third"]))):
+        response = client.put(BASE_PATH + "/mpu/upload/" + artifact_path, data=content,
+                              query_string={"upload_id": upload_id, "part_number": part_number})
+        assert response.status_code == 200
+
+    response = client.post(BASE_PATH + "/mpu/complete/" + artifact_path,
+                           query_string={"upload_id": upload_id, "num_parts": 4})
+    assert response.status_code == 400
+    assert "missing parts 3" in json.loads(response.get_data())["message"]
+
+    response = client.post(BASE_PATH + "/mpu/complete/" + artifact_path,
+                           query_string={"upload_id": upload_id, "num_parts": 3})
+    assert response.status_code == 200
+    assert artifact_root.join("0", "run", "artifacts", "model.bin").read() == "first-second-third"
+
+    # The staged parts are removed once the upload completes
+    response = client.post(BASE_PATH + "/mpu/abort/" + artifact_path,
+                           query_string={"upload_id": upload_id})
+    assert response.status_code == 404
+
+
+def test_expired_multipart_uploads_are_removed_on_create(artifact_root, client, tmpdir):
+    # pylint: disable=unused-argument
+    staging_dir = tmpdir.join("staging")
+    with mock.patch("mlflow.server.handlers._MULTIPART_UPLOAD_STAGING_DIR", staging_dir.strpath):
+        upload_ids = [json.loads(client.post(BASE_PATH + "/mpu/create/a.txt").get_data())[
+            "upload_id"] for _ in range(2)]
+        expired_time = time.time() - 2 * 24 * 60 * 60
+        os.utime(staging_dir.join(upload_ids[0]).strpath, (expired_time, expired_time))
+
+        new_upload_id = json.loads(client.post(BASE_PATH + "/mpu/create/a.txt").get_data())[
+            "upload_id"]
+        assert sorted(os.listdir(staging_dir.strpath)) == sorted([upload_ids[1], new_upload_id])
+        response = client.put(BASE_PATH + "/mpu/upload/a.txt", data=b"content",
+                              query_string={"upload_id": upload_ids[0], "part_number": 0})
+        assert response.status_code == 404
+
+
+@pytest.mark.parametrize("artifact_path", ["../escape.txt", "a/../../escape.txt", "a//b.txt"])
+def test_invalid_artifact_paths_are_rejected(artifact_root, client, artifact_path):
+    response = client.put(BASE_PATH + "/artifacts/" + artifact_path, data=b"content")
+    assert response.status_code in (400, 404)
+    assert not artifact_root.dirpath().join("escape.txt").exists()
+
+
+def test_invalid_upload_id_is_rejected(artifact_root, client):  # pylint: disable=unused-argument
+    response = client.put(BASE_PATH + "/mpu/upload/a.txt", data=b"content",
+                          query_string={"upload_id": "../../etc", "part_number": 0})
+    assert response.status_code == 400
+
+
+def test_proxy_is_disabled_by_default(client, tmpdir):
+    with mock.patch.dict(os.environ, {ARTIFACT_ROOT_ENV_VAR: tmpdir.strpath}):
+        os.environ.pop(SERVE_ARTIFACTS_ENV_VAR, None)
+        response = client.put(BASE_PATH + "/artifacts/a.txt", data=b"content")
+    assert response.status_code == 404
+    assert not tmpdir.join("a.txt").exists()
+
+
+def test_parse_http_artifact_uri():
+    assert HttpArtifactRepository.parse_http_artifact_uri(
+        "https://host:5000/prefix/api/2.0/mlflow-artifacts/artifacts/0/run/artifacts") == \
+        ("https://host:5000", "/prefix/api/2.0/mlflow-artifacts", "0/run/artifacts")
+    assert isinstance(
+        get_artifact_repository("http://host/api/2.0/mlflow-artifacts/artifacts/0"),
+        HttpArtifactRepository)
+    with pytest.raises(Exception, match="Not a proxied artifact URI"):
+        HttpArtifactRepository("http://host/some/path")
+
+
+@pytest.mark.usefixtures("proxied_requests")
+def test_http_artifact_repo_round_trip(artifact_root, tmpdir):
+    repo = HttpArtifactRepository(
+        "http://localhost:5000/api/2.0/mlflow-artifacts/artifacts/0/run/artifacts")
+    src_dir = tmpdir.join("src")
+    src_dir.join("a.txt").write("A", ensure=True)
+    src_dir.join("sub", "b.txt").write("B" * 100, ensure=True)
+
+    with mock.patch.dict(os.environ, {MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR: "16"}):
+        repo.log_artifacts(src_dir.strpath, "data")
+        repo.log_artifact(src_dir.join("a.txt").strpath)
+
+    run_root = artifact_root.join("0", "run", "artifacts")
+    assert run_root.join("data", "sub", "b.txt").read() == "B" * 100
+    assert run_root.join("a.txt").read() == "A"
+
+    assert [(f.path, f.is_dir) for f in repo.list_artifacts()] == \
+        [("a.txt", False), ("data", True)]
+    assert [(f.path, f.file_size) for f in repo.list_artifacts("data/sub")] == \
+        [("data/sub/b.txt", 100)]
+
+    dst_dir = tmpdir.join("dst")
+    dst_dir.mkdir()
+    local_path = repo.download_artifacts("data", dst_dir.strpath)
+    assert open(os.path.join(local_path, "sub", "b.txt")).read() == "B" * 100
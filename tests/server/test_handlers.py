@@ -9,7 +9,7 @@ from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE, ErrorCode
 from mlflow.server.handlers import get_endpoints, _create_experiment, _get_request_message, \
-    _search_runs, _log_batch, catch_mlflow_exception
+    _search_runs, _log_batch, catch_mlflow_exception, _get_metric_histories
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR
 from mlflow.store.abstract_store import PagedList
 from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
@@ -40,6 +40,9 @@ def test_get_endpoints():
     endpoints = get_endpoints()
     create_experiment_endpoint = [e for e in endpoints if e[1] == _create_experiment]
     assert len(create_experiment_endpoint) == 4
+    get_metric_histories_endpoint = [e for e in endpoints if e[1] == _get_metric_histories]
+    assert len(get_metric_histories_endpoint) == 4
+    assert all(e[2] == ['POST'] for e in get_metric_histories_endpoint)
 
 
 def test_can_parse_json():
@@ -100,6 +103,29 @@ def test_log_batch_api_req(mock_get_request_json):
             in json_response["message"])
 
 
+def test_get_metric_histories(mock_get_request_json, mock_store):
+    histories = {"run_id": ["a"], "key": ["loss"], "step": [0], "timestamp": [1], "value": [0.5]}
+    mock_store.get_metric_histories.return_value = histories
+    mock_get_request_json.return_value = {"run_ids": ["a", "b"], "metric_keys": ["loss"],
+                                          "max_points": 5}
+    response = _get_metric_histories()
+    assert json.loads(response.get_data()) == histories
+    mock_store.get_metric_histories.assert_called_once_with(["a", "b"], ["loss"], 5)
+
+
+@pytest.mark.parametrize("request_json", [
+    {"run_ids": "a", "metric_keys": ["loss"]},
+    {"run_ids": ["a"], "metric_keys": [1]},
+])
+def test_get_metric_histories_invalid_request(mock_get_request_json, mock_store, request_json):
+    mock_get_request_json.return_value = request_json
+    response = _get_metric_histories()
+    assert response.status_code == 400
+    assert json.loads(response.get_data())["error_code"] == \
+        ErrorCode.Name(INVALID_PARAMETER_VALUE)
+    mock_store.get_metric_histories.assert_not_called()
+
+
 def test_catch_mlflow_exception():
     @catch_mlflow_exception
     def test_handler():
@@ -23,7 +23,7 @@ import mlflow.utils
 import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.protos.databricks_pb2 import ErrorCode, INVALID_PARAMETER_VALUE
 from mlflow.models import Model
 from mlflow.store.s3_artifact_repo import S3ArtifactRepository
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
@@ -188,6 +188,37 @@ def test_custom_transformer_can_be_saved_and_loaded_with_cloudpickle_format(
                 sklearn_custom_transformer_model.inference_data))
 
 
+@pytest.mark.large
+def test_model_save_load_with_joblib_format_memory_maps_arrays(sklearn_knn_model, model_path):
+    mlflow.sklearn.save_model(sk_model=sklearn_knn_model.model, path=model_path,
+                              serialization_format=mlflow.sklearn.SERIALIZATION_FORMAT_JOBLIB)
+
+    reloaded_knn_model = mlflow.sklearn.load_model(model_uri=model_path)
+    assert not isinstance(reloaded_knn_model._fit_X, np.memmap)
+    mmapped_knn_model = mlflow.sklearn.load_model(model_uri=model_path, mmap_mode="r")
+    assert isinstance(mmapped_knn_model._fit_X, np.memmap)
+    reloaded_knn_pyfunc = pyfunc.load_pyfunc(model_uri=model_path)
+
+    expected = sklearn_knn_model.model.predict(sklearn_knn_model.inference_data)
+    np.testing.assert_array_equal(
+            expected, reloaded_knn_model.predict(sklearn_knn_model.inference_data))
+    np.testing.assert_array_equal(
+            expected, mmapped_knn_model.predict(sklearn_knn_model.inference_data))
+    np.testing.assert_array_equal(
+            expected, reloaded_knn_pyfunc.predict(sklearn_knn_model.inference_data))
+
+
+@pytest.mark.large
+def test_load_model_with_mmap_mode_throws_exception_if_format_is_not_joblib(
+        sklearn_knn_model, model_path):
+    mlflow.sklearn.save_model(sk_model=sklearn_knn_model.model, path=model_path,
+                              serialization_format=mlflow.sklearn.SERIALIZATION_FORMAT_PICKLE)
+
+    with pytest.raises(MlflowException) as exc:
+        mlflow.sklearn.load_model(model_uri=model_path, mmap_mode="r")
+    assert exc.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
 @pytest.mark.large
 def test_model_save_persists_specified_conda_env_in_mlflow_model_directory(
         sklearn_knn_model, model_path, sklearn_custom_env):
@@ -358,20 +389,21 @@ def test_model_save_without_cloudpickle_format_does_not_add_cloudpickle_to_conda
     non_cloudpickle_serialization_formats.remove(mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE)
 
     for serialization_format in non_cloudpickle_serialization_formats:
+        format_model_path = os.path.join(model_path, serialization_format)
         mlflow.sklearn.save_model(
                 sk_model=sklearn_knn_model.model,
-                path=model_path,
+                path=format_model_path,
                 conda_env=None,
                 serialization_format=serialization_format)
 
         sklearn_conf = _get_flavor_configuration(
-                model_path=model_path, flavor_name=mlflow.sklearn.FLAVOR_NAME)
+                model_path=format_model_path, flavor_name=mlflow.sklearn.FLAVOR_NAME)
         assert "serialization_format" in sklearn_conf
         assert sklearn_conf["serialization_format"] == serialization_format
 
         pyfunc_conf = _get_flavor_configuration(
-                model_path=model_path, flavor_name=pyfunc.FLAVOR_NAME)
-        saved_conda_env_path = os.path.join(model_path, pyfunc_conf[pyfunc.ENV])
+                model_path=format_model_path, flavor_name=pyfunc.FLAVOR_NAME)
+        saved_conda_env_path = os.path.join(format_model_path, pyfunc_conf[pyfunc.ENV])
         assert os.path.exists(saved_conda_env_path)
         with open(saved_conda_env_path, "r") as f:
             saved_conda_env_parsed = yaml.safe_load(f)
@@ -1,8 +1,12 @@
 import mock
+import pytest
 
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ErrorCode, INVALID_PARAMETER_VALUE, \
+    RESOURCE_DOES_NOT_EXIST
 from mlflow.store import SEARCH_MAX_RESULTS_DEFAULT
-from mlflow.store.abstract_store import AbstractStore
-from mlflow.entities import ViewType
+from mlflow.store.abstract_store import AbstractStore, _downsample
+from mlflow.entities import Metric, ViewType
 
 
 class AbstractStoreTestImpl(AbstractStore):
@@ -130,3 +134,48 @@ def test_search_runs():
         assert result.token == token
         store._search_runs.assert_called_once_with([experiment_id], None, view_type,
                                                    SEARCH_MAX_RESULTS_DEFAULT, None, None)
+
+
+def test_get_metric_histories():
+    histories = {
+        ("run1", "loss"): [Metric("loss", 0.5, 20, 2), Metric("loss", 1.0, 10, 1),
+                           Metric("loss", 0.7, 30, 2)],
+        ("run2", "loss"): [Metric("loss", 2.0, 10, 0)],
+    }
+
+    def get_metric_history(run_id, metric_key):
+        if run_id == "missing":
+            raise MlflowException("Run not found", RESOURCE_DOES_NOT_EXIST)
+        return histories.get((run_id, metric_key), [])
+
+    with mock.patch.object(AbstractStoreTestImpl, "get_metric_history",
+                           side_effect=get_metric_history):
+        store = AbstractStoreTestImpl()
+        result = store.get_metric_histories(["run2", "missing", "run1", "run2"], ["loss", "f1"])
+        assert result == {
+            "run_id": ["run2", "run1", "run1", "run1"],
+            "key": ["loss"] * 4,
+            "step": [0, 1, 2, 2],
+            "timestamp": [10, 10, 20, 30],
+            "value": [2.0, 1.0, 0.5, 0.7],
+        }
+        assert store.get_metric_histories(["run1"], ["loss"], max_points=1)["value"] == [0.7]
+
+
+def test_get_metric_histories_validates_max_points():
+    store = AbstractStoreTestImpl()
+    for max_points in [0, -1, 1.5, "5", True]:
+        with pytest.raises(MlflowException) as e:
+            store.get_metric_histories(["run1"], ["loss"], max_points=max_points)
+        assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_downsample():
+    points = list(range(10))
+    assert _downsample(points, None) == points
+    assert _downsample(points, 10) == points
+    assert _downsample(points, 20) == points
+    assert _downsample(points, 1) == [9]
+    assert _downsample(points, 2) == [0, 9]
+    assert _downsample(points, 4) == [0, 3, 6, 9]
+    assert _downsample(points, 5) == [0, 2, 5, 7, 9]
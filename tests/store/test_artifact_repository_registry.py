@@ -1,3 +1,5 @@
+import threading
+
 import mock
 import pytest
 from six.moves import reload_module as reload
@@ -13,10 +15,11 @@ def test_standard_artifact_registry():
     with mock.patch(
         "entrypoints.get_group_all", return_value=[mock_entrypoint]
     ):
-        # Entrypoints are registered at import time, so we need to reload the
-        # module to register the entrypoint given by the mocked
-        # extrypoints.get_group_all
+        # Entrypoints are registered on the first lookup, so we need to reload the
+        # module and look up a repository to register the entrypoint given by the
+        # mocked extrypoints.get_group_all
         reload(mlflow.store.artifact_repository_registry)
+        mlflow.store.artifact_repository_registry.get_artifact_repository("s3://bucket/path")
 
         expected_artifact_repository_registry = {
             '',
@@ -39,6 +42,7 @@ def test_plugin_registration_via_installed_package():
     """This test requires the package in tests/resources/mlflow-test-plugin to be installed"""
 
     reload(mlflow.store.artifact_repository_registry)
+    mlflow.store.artifact_repository_registry.get_artifact_repository("s3://bucket/path")
 
     assert (
         "file-plugin" in
@@ -117,3 +121,122 @@ def test_plugin_registration_failure_via_entrypoints(exception):
 
     mock_entrypoint.load.assert_called_once()
     mock_get_group_all.assert_called_once_with("mlflow.artifact_repository")
+
+
+def test_cached_repository_instances_are_reused_per_uri():
+    artifact_repository_registry = ArtifactRepositoryRegistry()
+
+    mock_plugin = mock.Mock(side_effect=lambda uri: mock.Mock(artifact_uri=uri))
+    artifact_repository_registry.register("mock-scheme", mock_plugin, cache_instances=True)
+    first = artifact_repository_registry.get_artifact_repository("mock-scheme://host/path")
+    second = artifact_repository_registry.get_artifact_repository("mock-scheme://host/path")
+    other = artifact_repository_registry.get_artifact_repository("mock-scheme://host/other")
+    assert first is second
+    assert other is not first
+    assert mock_plugin.call_count == 2
+
+    artifact_repository_registry.clear_cache()
+    assert artifact_repository_registry.get_artifact_repository(
+        "mock-scheme://host/path") is not first
+
+
+def test_uncached_repository_instances_are_created_per_call():
+    artifact_repository_registry = ArtifactRepositoryRegistry()
+
+    mock_plugin = mock.Mock(side_effect=lambda uri: mock.Mock(artifact_uri=uri))
+    artifact_repository_registry.register("mock-scheme", mock_plugin)
+    first = artifact_repository_registry.get_artifact_repository("mock-scheme://host/path")
+    second = artifact_repository_registry.get_artifact_repository("mock-scheme://host/path")
+    assert first is not second
+    assert mock_plugin.call_count == 2
+
+
+def test_repositories_registered_by_name_are_imported_on_first_use():
+    artifact_repository_registry = ArtifactRepositoryRegistry()
+
+    with mock.patch("importlib.import_module") as import_module:
+        artifact_repository_registry.register("mock-scheme", "mock_module:MockRepository")
+        import_module.assert_not_called()
+
+        repository = artifact_repository_registry.get_artifact_repository("mock-scheme://path")
+        artifact_repository_registry.get_artifact_repository("mock-scheme://path")
+
+    import_module.assert_called_once_with("mock_module")
+    assert repository == import_module.return_value.MockRepository.return_value
+
+
+def test_entrypoints_are_registered_once_on_first_lookup():
+    mock_plugin_function = mock.Mock()
+    mock_entrypoint = mock.Mock(load=mock.Mock(return_value=mock_plugin_function))
+    mock_entrypoint.name = "mock-scheme"
+
+    with mock.patch(
+        "entrypoints.get_group_all", return_value=[mock_entrypoint]
+    ) as mock_get_group_all:
+        artifact_repository_registry = ArtifactRepositoryRegistry()
+        artifact_repository_registry.register("registered-scheme", mock.Mock())
+        mock_get_group_all.assert_not_called()
+
+        artifact_repository_registry.get_artifact_repository("registered-scheme://path")
+        mock_get_group_all.assert_called_once_with("mlflow.artifact_repository")
+
+        assert (
+            artifact_repository_registry.get_artifact_repository("mock-scheme://path")
+            == mock_plugin_function.return_value
+        )
+        with pytest.raises(mlflow.exceptions.MlflowException):
+            artifact_repository_registry.get_artifact_repository("unknown-scheme://path")
+
+    mock_get_group_all.assert_called_once_with("mlflow.artifact_repository")
+
+
+def test_entrypoints_can_replace_builtin_repositories():
+    mock_plugin_function = mock.Mock()
+    mock_entrypoint = mock.Mock(load=mock.Mock(return_value=mock_plugin_function))
+    mock_entrypoint.name = "s3"
+
+    with mock.patch(
+        "entrypoints.get_group_all", return_value=[mock_entrypoint]
+    ):
+        reload(mlflow.store.artifact_repository_registry)
+        repository = mlflow.store.artifact_repository_registry.get_artifact_repository(
+            "s3://bucket/path")
+
+    assert repository == mock_plugin_function.return_value
+    reload(mlflow.store.artifact_repository_registry)
+
+
+def test_lookups_wait_for_entrypoints_being_registered():
+    scan_started = threading.Event()
+    finish_scan = threading.Event()
+    mock_plugin_function = mock.Mock()
+
+    def load():
+        scan_started.set()
+        finish_scan.wait()
+        return mock_plugin_function
+
+    mock_entrypoint = mock.Mock(load=load)
+    mock_entrypoint.name = "mock-scheme"
+    artifact_repository_registry = ArtifactRepositoryRegistry()
+    repositories = []
+
+    def get_repository():
+        repositories.append(
+            artifact_repository_registry.get_artifact_repository("mock-scheme://path"))
+
+    with mock.patch("entrypoints.get_group_all", return_value=[mock_entrypoint]):
+        scanning_thread = threading.Thread(target=get_repository)
+        scanning_thread.start()
+        scan_started.wait()
+        waiting_thread = threading.Thread(target=get_repository)
+        waiting_thread.start()
+        waiting_thread.join(0.1)
+        try:
+            assert waiting_thread.is_alive()
+        finally:
+            finish_scan.set()
+            scanning_thread.join()
+            waiting_thread.join()
+
+    assert repositories == [mock_plugin_function.return_value] * 2
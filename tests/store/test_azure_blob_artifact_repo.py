@@ -235,6 +235,9 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
         every level of the directory traversal.
         """
         # pylint: disable=unused-argument
+        if "delimiter" not in kwargs and kwargs["prefix"] == "":
+            # Flat listing of the entire container
+            return MockBlobList([blob_1, blob_2])
         if posixpath.abspath(kwargs["prefix"]) == "/":
             return MockBlobList([dir_prefix])
         if posixpath.abspath(kwargs["prefix"]) == posixpath.abspath(subdir_path):
@@ -290,3 +293,36 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_download_directory_artifact_lists_blobs_recursively_once(mock_client, tmpdir):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+
+    blob_props = BlobProperties()
+    blob_props.content_length = 42
+    blob_paths = ["model/MLmodel", "model/data/weights.bin", "model/data/nested/vocab.txt"]
+    first_page = MockBlobList(
+        [Blob(posixpath.join(TEST_ROOT_PATH, p), props=blob_props) for p in blob_paths[:2]],
+        next_marker="marker")
+    second_page = MockBlobList(
+        [Blob(posixpath.join(TEST_ROOT_PATH, blob_paths[2]), props=blob_props)])
+    mock_client.list_blobs.side_effect = [first_page, second_page]
+
+    def create_file(container, cloud_path, local_path):
+        # pylint: disable=unused-argument
+        with open(local_path, "w") as f:
+            f.write(cloud_path)
+
+    mock_client.get_blob_to_path.side_effect = create_file
+
+    local_path = repo.download_artifacts("model", tmpdir.strpath)
+
+    assert local_path == os.path.join(tmpdir.strpath, "model")
+    for blob_path in blob_paths:
+        with open(os.path.join(tmpdir.strpath, *blob_path.split("/"))) as f:
+            assert f.read() == posixpath.join(TEST_ROOT_PATH, blob_path)
+    mock_client.list_blobs.assert_has_calls([
+        mock.call("container", prefix=TEST_ROOT_PATH + "/model/", marker=None),
+        mock.call("container", prefix=TEST_ROOT_PATH + "/model/", marker="marker"),
+    ])
+    assert mock_client.list_blobs.call_count == 2
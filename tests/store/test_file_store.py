@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import math
 import os
 import posixpath
 import random
@@ -19,7 +20,8 @@ from mlflow.exceptions import MlflowException, MissingConfigException
 from mlflow.store import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.store.file_store import FileStore
 from mlflow.utils.file_utils import write_yaml, read_yaml, path_to_local_file_uri
-from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST, INTERNAL_ERROR
+from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST, INTERNAL_ERROR, \
+    INVALID_PARAMETER_VALUE
 
 from tests.helper_functions import random_int, random_str, safe_edit_yaml
 
@@ -400,6 +402,35 @@ class TestFileStore(unittest.TestCase):
                         self.assertEqual(metric.key, metric_name)
                         self.assertEqual(metric.value, metric_value)
 
+    def test_get_metric_histories(self):
+        fs = FileStore(self.test_root)
+        deleted_experiment_id = fs.create_experiment("deleted experiment")
+        run_ids = [self._create_run(fs).info.run_id for _ in range(2)]
+        run_ids.append(fs.create_run(deleted_experiment_id, 'user', 0, []).info.run_id)
+        for i, run_id in enumerate(run_ids):
+            for step in reversed(range(5)):
+                fs.log_metric(run_id, Metric("loss", float(i * 10 + step), step * 100, step))
+        fs.log_metric(run_ids[0], Metric("nested/accuracy", float("nan"), 7, 1))
+        fs.delete_experiment(deleted_experiment_id)
+
+        histories = fs.get_metric_histories(
+            [run_ids[1], run_ids[0], run_ids[2], "0" * 32], ["loss", "nested/accuracy", "f1"])
+        assert histories["run_id"] == [run_ids[1]] * 5 + [run_ids[0]] * 6 + [run_ids[2]] * 5
+        assert histories["key"] == ["loss"] * 10 + ["nested/accuracy"] + ["loss"] * 5
+        assert histories["step"] == list(range(5)) * 2 + [1] + list(range(5))
+        assert histories["timestamp"] == [step * 100 for step in range(5)] * 2 + [7] + \
+            [step * 100 for step in range(5)]
+        assert histories["value"][:10] == [10.0, 11.0, 12.0, 13.0, 14.0, 0.0, 1.0, 2.0, 3.0, 4.0]
+        assert math.isnan(histories["value"][10])
+
+        histories = fs.get_metric_histories(run_ids, ["loss"], max_points=3)
+        assert histories["step"] == [0, 2, 4] * 3
+        assert fs.get_metric_histories([], ["loss"]) == \
+            {"run_id": [], "key": [], "step": [], "timestamp": [], "value": []}
+        with pytest.raises(MlflowException) as e:
+            fs.get_metric_histories(run_ids, ["loss"], max_points=0)
+        assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
     def _search(self, fs, experiment_id, filter_str=None,
                 run_view_type=ViewType.ALL, max_results=SEARCH_MAX_RESULTS_DEFAULT):
         return [r.info.run_id
@@ -224,3 +224,42 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+@pytest.mark.parametrize("max_workers", ["1", "4"])
+def test_download_directory_artifact_lists_blobs_recursively_once(gcs_mock, tmpdir, max_workers):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+
+    blob_paths = ["model/MLmodel", "model/data/weights.bin", "model/data/nested/vocab.txt"]
+    blobs = []
+    for blob_path in blob_paths:
+        blob = mock.Mock()
+        blob.configure_mock(name="some/path/" + blob_path, size=1)
+        blobs.append(blob)
+    # Placeholder objects for directories are skipped
+    dir_placeholder = mock.Mock()
+    dir_placeholder.configure_mock(name="some/path/model/data/", size=0)
+
+    bucket = gcs_mock.Client.return_value.get_bucket.return_value
+    bucket.list_blobs.return_value = iter(blobs + [dir_placeholder])
+
+    def get_blob(name):
+        blob = mock.Mock()
+
+        def download_to_filename(local_path):
+            with open(local_path, "w") as f:
+                f.write(name)
+
+        blob.download_to_filename.side_effect = download_to_filename
+        return blob
+
+    bucket.get_blob.side_effect = get_blob
+
+    with mock.patch.dict(os.environ, {"MLFLOW_ARTIFACT_TRANSFER_MAX_WORKERS": max_workers}):
+        local_path = repo.download_artifacts("model", tmpdir.strpath)
+
+    assert local_path == os.path.join(tmpdir.strpath, "model")
+    for blob_path in blob_paths:
+        with open(os.path.join(tmpdir.strpath, *blob_path.split("/"))) as f:
+            assert f.read() == "some/path/" + blob_path
+    bucket.list_blobs.assert_called_once_with(prefix="some/path/model/")
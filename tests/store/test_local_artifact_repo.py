@@ -1,10 +1,12 @@
 import os
+import mock
 import pytest
 import posixpath
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.local_artifact_repo import LocalArtifactRepository
-from mlflow.utils.file_utils import TempDir
+from mlflow.store.local_blob_store import LocalBlobStore, BLOB_STORE_ENV_VAR
+from mlflow.utils.file_utils import TempDir, path_to_local_file_uri
 
 
 @pytest.fixture
@@ -158,3 +160,103 @@ def test_hidden_files_are_logged_correctly(local_artifact_repo):
             f.write("42")
         local_artifact_repo.log_artifact(hidden_file)
         assert open(local_artifact_repo.download_artifacts(".mystery")).read() == "42"
+
+
+@pytest.fixture
+def blob_store_root(tmpdir):
+    blob_store_root = str(tmpdir.join("blobs"))
+    with mock.patch.dict(os.environ, {BLOB_STORE_ENV_VAR: blob_store_root}):
+        yield blob_store_root
+
+
+def test_deduplicated_artifacts_are_hardlinks_to_a_single_blob(tmpdir, blob_store_root):
+    repo1 = LocalArtifactRepository(path_to_local_file_uri(str(tmpdir.join("run1"))))
+    repo2 = LocalArtifactRepository(path_to_local_file_uri(str(tmpdir.join("run2"))))
+    with TempDir() as local_dir:
+        os.makedirs(local_dir.path("data", "nested"))
+        os.mkdir(local_dir.path("data", "empty"))
+        with open(local_dir.path("data", "vocab.txt"), "w") as f:
+            f.write("vocab")
+        with open(local_dir.path("data", "nested", "vocab_copy.txt"), "w") as f:
+            f.write("vocab")
+        repo1.log_artifacts(local_dir.path("data"))
+        repo2.log_artifacts(local_dir.path("data"), "data")
+        repo2.log_artifact(local_dir.path("data", "vocab.txt"))
+
+    artifact_paths = [
+        os.path.join(repo1.artifact_dir, "vocab.txt"),
+        os.path.join(repo1.artifact_dir, "nested", "vocab_copy.txt"),
+        os.path.join(repo2.artifact_dir, "data", "vocab.txt"),
+        os.path.join(repo2.artifact_dir, "data", "nested", "vocab_copy.txt"),
+        os.path.join(repo2.artifact_dir, "vocab.txt"),
+    ]
+    assert all(open(path).read() == "vocab" for path in artifact_paths)
+    assert len(set(os.stat(path).st_ino for path in artifact_paths)) == 1
+    # One link per artifact, plus the blob itself
+    assert os.stat(artifact_paths[0]).st_nlink == len(artifact_paths) + 1
+    assert os.path.isdir(os.path.join(repo1.artifact_dir, "empty"))
+    assert [f.path for f in repo1.list_artifacts()] == ["empty", "nested", "vocab.txt"]
+
+    downloaded = repo1.download_artifacts("vocab.txt", str(tmpdir.mkdir("download")))
+    assert open(downloaded).read() == "vocab"
+    assert os.stat(downloaded).st_ino != os.stat(artifact_paths[0]).st_ino
+
+
+def test_relogging_deduplicated_artifact_does_not_modify_shared_blob(tmpdir, blob_store_root):
+    repo1 = LocalArtifactRepository(path_to_local_file_uri(str(tmpdir.join("run1"))))
+    repo2 = LocalArtifactRepository(path_to_local_file_uri(str(tmpdir.join("run2"))))
+    local_file = str(tmpdir.join("model.txt"))
+    with open(local_file, "w") as f:
+        f.write("v1")
+    repo1.log_artifact(local_file)
+    repo2.log_artifact(local_file)
+    with open(local_file, "w") as f:
+        f.write("v2")
+    repo2.log_artifact(local_file)
+    assert open(os.path.join(repo1.artifact_dir, "model.txt")).read() == "v1"
+    assert open(os.path.join(repo2.artifact_dir, "model.txt")).read() == "v2"
+
+
+def test_blob_store_garbage_collection_removes_only_unreferenced_blobs(tmpdir, blob_store_root):
+    repo = LocalArtifactRepository(path_to_local_file_uri(str(tmpdir.join("run"))))
+    for name, content in [("keep.txt", "keep"), ("delete.txt", "delete me")]:
+        local_file = str(tmpdir.join(name))
+        with open(local_file, "w") as f:
+            f.write(content)
+        repo.log_artifact(local_file)
+
+    blob_store = LocalBlobStore(blob_store_root)
+    assert blob_store.collect_garbage() == (0, 0)
+    os.remove(os.path.join(repo.artifact_dir, "delete.txt"))
+    assert blob_store.collect_garbage() == (1, len("delete me"))
+    assert open(os.path.join(repo.artifact_dir, "keep.txt")).read() == "keep"
+    blobs = [f for _, _, files in os.walk(blob_store_root) for f in files]
+    assert len(blobs) == 1
+
+
+@pytest.mark.parametrize("link_mode", ["hardlink", "reflink", "fastcopy"])
+def test_artifacts_are_logged_and_downloaded_in_link_mode(tmpdir, link_mode):
+    repo = LocalArtifactRepository(path_to_local_file_uri(str(tmpdir.join("run"))))
+    local_dir = tmpdir.mkdir("data")
+    local_dir.mkdir("nested").join("weights.bin").write("weights")
+    local_file = tmpdir.join("model.txt")
+    local_file.write("model")
+    with mock.patch.dict(os.environ, {"MLFLOW_LOCAL_ARTIFACT_LINK_MODE": link_mode}):
+        repo.log_artifacts(str(local_dir), "data")
+        repo.log_artifact(str(local_file))
+        downloaded = repo.download_artifacts("data", str(tmpdir.mkdir("download")))
+
+    logged_file = os.path.join(repo.artifact_dir, "model.txt")
+    assert open(logged_file).read() == "model"
+    assert open(os.path.join(repo.artifact_dir, "data", "nested", "weights.bin")).read() == \
+        "weights"
+    downloaded_file = os.path.join(downloaded, "nested", "weights.bin")
+    assert open(downloaded_file).read() == "weights"
+    is_same_inode = os.stat(str(local_file)).st_ino == os.stat(logged_file).st_ino
+    assert is_same_inode == (link_mode == "hardlink")
+
+    # Modifying a download does not modify the logged artifact
+    with open(downloaded_file, "w") as f:
+        f.write("modified")
+    assert open(os.path.join(repo.artifact_dir, "data", "nested", "weights.bin")).read() == \
+        "weights"
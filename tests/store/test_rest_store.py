@@ -241,6 +241,43 @@ class TestRestStore(unittest.TestCase):
                                   message_to_json(expected_message))
             assert result.token == "67890fghij"
 
+    def test_get_metric_histories(self):
+        creds = MlflowHostCreds('https://hello')
+        store = RestStore(lambda: creds)
+        histories = {"run_id": ["a", "a"], "key": ["loss", "loss"], "step": [0, 1],
+                     "timestamp": [10, 20], "value": [0.5, 0.25]}
+        with mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+            mock_http.return_value = mock.MagicMock(status_code=200, text=json.dumps(histories))
+            assert store.get_metric_histories(["a", "b"], ["loss"], max_points=10) == histories
+            self._verify_requests(mock_http, creds, "metrics/get-histories", "POST",
+                                  json.dumps({"run_ids": ["a", "b"], "metric_keys": ["loss"],
+                                              "max_points": 10}))
+
+    def test_get_metric_histories_falls_back_to_get_metric_history(self):
+        creds = MlflowHostCreds('https://hello')
+        store = RestStore(lambda: creds)
+        not_found_responses = [
+            mock.MagicMock(status_code=404, text="<html>Not Found</html>"),
+            mock.MagicMock(status_code=404, text=json.dumps({
+                "error_code": "ENDPOINT_NOT_FOUND", "message": "No API found"})),
+        ]
+        history = [Metric("loss", 0.5, 10, 0), Metric("loss", 0.25, 20, 1)]
+        for response in not_found_responses:
+            with mock.patch('mlflow.store.rest_store.http_request', return_value=response), \
+                    mock.patch.object(RestStore, "get_metric_history", return_value=history):
+                assert store.get_metric_histories(["a"], ["loss"]) == {
+                    "run_id": ["a", "a"], "key": ["loss", "loss"], "step": [0, 1],
+                    "timestamp": [10, 20], "value": [0.5, 0.25]}
+                store.get_metric_history.assert_called_once_with("a", "loss")
+
+        error = mock.MagicMock(status_code=404, text=json.dumps({
+            "error_code": "RESOURCE_DOES_NOT_EXIST", "message": "Not found"}))
+        with mock.patch('mlflow.store.rest_store.http_request', return_value=error), \
+                mock.patch.object(RestStore, "get_metric_history") as get_metric_history:
+            with self.assertRaises(MlflowException):
+                store.get_metric_histories(["a"], ["loss"])
+            get_metric_history.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,9 @@
 import pytest
+import mock
 from mock import Mock
 
 import mlflow
+import mlflow.tracking.artifact_utils
 from mlflow.exceptions import MlflowException
 from mlflow.store.runs_artifact_repo import RunsArtifactRepository
 from mlflow.store.s3_artifact_repo import S3ArtifactRepository
@@ -62,3 +64,18 @@ def test_runs_artifact_repo_uses_repo_download_artifacts():
     runs_repo.repo = Mock()
     runs_repo.download_artifacts('artifact_path', 'dst_path')
     runs_repo.repo.download_artifacts.assert_called_once()
+
+
+@pytest.mark.usefixtures("tracking_uri_mock")
+def test_runs_artifact_repo_memoizes_run_artifact_root():
+    artifact_location = "s3://blah_bucket/"
+    experiment_id = mlflow.create_experiment("expr_abcde", artifact_location)
+    with mlflow.start_run(experiment_id=experiment_id):
+        run_id = mlflow.active_run().info.run_id
+    with mock.patch("mlflow.tracking.artifact_utils.get_artifact_uri",
+                    wraps=mlflow.tracking.artifact_utils.get_artifact_uri) as get_artifact_uri_mock:
+        first = RunsArtifactRepository("runs:/{}/model".format(run_id))
+        second = RunsArtifactRepository("runs:/{}/other".format(run_id))
+    get_artifact_uri_mock.assert_called_once_with(run_id)
+    assert first.repo.artifact_uri == "%s%s/artifacts/model" % (artifact_location, run_id)
+    assert second.repo.artifact_uri == "%s%s/artifacts/other" % (artifact_location, run_id)
@@ -650,6 +650,62 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
                              [(m.key, m.value, m.timestamp) for m in expected],
                              [(m.key, m.value, m.timestamp) for m in actual])
 
+    def test_get_metric_histories(self):
+        experiment_id = self._experiment_factory('test_get_metric_histories')
+        run_ids = [self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+                   for _ in range(3)]
+        for i, run_id in enumerate(run_ids):
+            for step in reversed(range(5)):
+                self.store.log_metric(run_id, Metric("loss", float(i * 10 + step), step * 100,
+                                                     step))
+        self.store.log_metric(run_ids[0], Metric("accuracy", float("nan"), 7, 1))
+        self.store.log_metric(run_ids[0], Metric("ignored", 1.0, 7, 1))
+
+        # Query the runs and keys in batches of one run ID and one key
+        with mock.patch("mlflow.store.sqlalchemy_store.MAX_PARAMETERS_PER_METRIC_HISTORY_QUERY",
+                        2):
+            histories = self.store.get_metric_histories(
+                [run_ids[1], run_ids[0], run_ids[2], "0" * 32], ["loss", "accuracy", "f1"])
+        assert histories["run_id"] == [run_ids[1]] * 5 + [run_ids[0]] * 6 + [run_ids[2]] * 5
+        assert histories["key"] == ["loss"] * 10 + ["accuracy"] + ["loss"] * 5
+        assert histories["step"] == list(range(5)) * 2 + [1] + list(range(5))
+        assert histories["timestamp"] == [step * 100 for step in range(5)] * 2 + [7] + \
+            [step * 100 for step in range(5)]
+        assert histories["value"][:10] == [10.0, 11.0, 12.0, 13.0, 14.0, 0.0, 1.0, 2.0, 3.0, 4.0]
+        assert math.isnan(histories["value"][10])
+
+        histories = self.store.get_metric_histories(run_ids, ["loss"], max_points=2)
+        assert histories["step"] == [0, 4] * 3
+        with pytest.raises(MlflowException) as e:
+            self.store.get_metric_histories(run_ids, ["loss"], max_points=-1)
+        assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_get_metric_histories_limits_query_parameters_with_many_keys(self):
+        experiment_id = self._experiment_factory('test_get_metric_histories_many_keys')
+        run_ids = [self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+                   for _ in range(2)]
+        keys = ["metric_%d" % i for i in range(1000)]
+        for run_id in run_ids:
+            self.store.log_metric(run_id, Metric(keys[0], 1.0, 1, 0))
+            self.store.log_metric(run_id, Metric(keys[-1], 2.0, 1, 0))
+        all_run_ids = run_ids + ["%032x" % i for i in range(600)]
+        num_parameters = []
+
+        def record_num_parameters(conn, cursor, statement, parameters, context, executemany):
+            num_parameters.append(len(parameters))
+
+        sqlalchemy.event.listen(self.store.engine, "before_cursor_execute",
+                                record_num_parameters)
+        try:
+            histories = self.store.get_metric_histories(all_run_ids, keys)
+        finally:
+            sqlalchemy.event.remove(self.store.engine, "before_cursor_execute",
+                                    record_num_parameters)
+        assert max(num_parameters) <= 500
+        assert sorted(zip(histories["run_id"], histories["key"], histories["value"])) == \
+            sorted((run_id, key, value) for run_id in run_ids
+                   for key, value in [(keys[0], 1.0), (keys[-1], 2.0)])
+
     def test_list_run_infos(self):
         experiment_id = self._experiment_factory('test_exp')
         r1 = self._run_factory(config=self._get_run_configs(experiment_id)).info.run_id
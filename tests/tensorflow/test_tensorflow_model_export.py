@@ -8,6 +8,9 @@ import shutil
 import pytest
 import yaml
 import json
+from multiprocessing.pool import ThreadPool
+
+import mock
 
 import numpy as np
 import pandas as pd
@@ -478,6 +481,31 @@ def test_iris_data_model_can_be_loaded_and_evaluated_as_pyfunc(saved_tf_iris_mod
     assert results_df.equals(saved_tf_iris_model.expected_results_df)
 
 
+@pytest.mark.large
+def test_pyfunc_predictions_are_independent_of_batch_size_and_thread(
+        saved_tf_iris_model, model_path):
+    mlflow.tensorflow.save_model(tf_saved_model_dir=saved_tf_iris_model.path,
+                                 tf_meta_graph_tags=saved_tf_iris_model.meta_graph_tags,
+                                 tf_signature_def_key=saved_tf_iris_model.signature_def_key,
+                                 path=model_path)
+    expected_results_df = saved_tf_iris_model.expected_results_df
+
+    with mock.patch.dict(os.environ, {mlflow.tensorflow.PREDICT_BATCH_SIZE_ENV_VAR: "7"}):
+        pyfunc_wrapper = pyfunc.load_pyfunc(model_path)
+    assert pyfunc_wrapper.batch_size == 7
+    pandas.testing.assert_frame_equal(
+        pyfunc_wrapper.predict(saved_tf_iris_model.inference_df), expected_results_df,
+        check_less_precise=6)
+
+    pool = ThreadPool(4)
+    try:
+        results = pool.map(pyfunc_wrapper.predict, [saved_tf_iris_model.inference_df] * 8)
+    finally:
+        pool.close()
+    for results_df in results:
+        pandas.testing.assert_frame_equal(results_df, expected_results_df, check_less_precise=6)
+
+
 @pytest.mark.large
 def test_categorical_model_can_be_loaded_and_evaluated_as_pyfunc(
         saved_tf_categorical_model, model_path):
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are slow to import and are not needed to log to a run, which `import mlflow` must
+# therefore not import
+_DEFERRED_MODULES = [
+    "databricks_cli",
+    "distutils",
+    "docker",
+    "IPython",
+    "mlflow.projects",
+    "numpy",
+    "pandas",
+]
+
+
+def _get_imported_modules(statement):
+    """
+    :return: Dictionary mapping the modules imported by running ``statement`` in a new Python
+             process to their cumulative import times in microseconds, as reported by
+             ``python -X importtime``.
+    """
+    process = subprocess.Popen([sys.executable, "-X", "importtime", "-c", statement],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               universal_newlines=True)
+    _, stderr = process.communicate()
+    assert process.returncode == 0, stderr
+    imported_modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module_name = line[len("import time:"):].split("|")
+        imported_modules[module_name.strip()] = int(cumulative_us)
+    return imported_modules
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires python -X importtime")
+def test_import_mlflow_does_not_import_deferred_modules():
+    imported_modules = _get_imported_modules("import mlflow")
+    assert "mlflow" in imported_modules
+    imported_deferred_modules = [
+        module_name for module_name in imported_modules
+        if any(module_name == deferred or module_name.startswith(deferred + ".")
+               for deferred in _DEFERRED_MODULES)]
+    assert imported_deferred_modules == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Requires python -X importtime")
+def test_log_metric_does_not_import_deferred_modules(tmpdir):
+    imported_modules = _get_imported_modules(
+        "import mlflow; mlflow.set_tracking_uri({!r}); mlflow.log_metric('m', 1.0); "
+        "mlflow.end_run()".format(tmpdir.join("mlruns").strpath))
+    assert "mlflow.projects" not in imported_modules
+    assert "pandas" not in imported_modules
+
+
+def test_lazy_attributes_are_imported_on_first_access():
+    import mlflow
+    import mlflow.projects
+
+    assert mlflow.projects is sys.modules["mlflow.projects"]
+    assert mlflow.run is mlflow.projects.run
+    with pytest.raises(AttributeError):
+        mlflow.not_an_attribute  # pylint: disable=pointless-statement
@@ -147,3 +147,29 @@ def test_client_search_runs_page_token(mock_store):
                                                    max_results=SEARCH_MAX_RESULTS_DEFAULT,
                                                    order_by=None,
                                                    page_token="blah")
+
+
+def test_client_get_metric_histories(mock_store):
+    histories = {"run_id": ["a", "b"], "key": ["loss", "loss"], "step": [0, 1],
+                 "timestamp": [10, 20], "value": [0.5, float("nan")]}
+    mock_store.get_metric_histories.return_value = histories
+
+    assert MlflowClient().get_metric_histories(["a", "b"], ["loss"]) == histories
+    mock_store.get_metric_histories.assert_called_once_with(
+        run_ids=["a", "b"], metric_keys=["loss"], max_points=None)
+
+    pdf = MlflowClient().get_metric_histories(["a", "b"], ["loss"], max_points=3,
+                                              as_dataframe=True)
+    assert list(pdf.columns) == ["run_id", "key", "step", "timestamp", "value"]
+    expected_dtypes = ["object", "object", "int64", "int64", "float64"]
+    assert [str(dtype) for dtype in pdf.dtypes] == expected_dtypes
+    assert list(pdf["run_id"]) == ["a", "b"]
+    assert pdf["value"].isnull().tolist() == [False, True]
+    mock_store.get_metric_histories.assert_called_with(
+        run_ids=["a", "b"], metric_keys=["loss"], max_points=3)
+
+    mock_store.get_metric_histories.return_value = {
+        "run_id": [], "key": [], "step": [], "timestamp": [], "value": []}
+    pdf = MlflowClient().get_metric_histories(["a"], ["f1"], as_dataframe=True)
+    assert len(pdf) == 0
+    assert str(pdf["value"].dtype) == "float64"
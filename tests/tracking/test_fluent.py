@@ -1,5 +1,6 @@
 import os
 import random
+import threading
 import uuid
 
 import pytest
@@ -13,14 +14,17 @@ from mlflow.entities import LifecycleStage, SourceType, Run, RunInfo, RunData, R
     Param, RunTag, ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.store.abstract_store import PagedList
+from mlflow.store.rest_store import RestStore
 from mlflow.tracking.client import MlflowClient
 import mlflow.tracking.fluent
 import mlflow.tracking.context.registry
 from mlflow.tracking.fluent import start_run, _get_experiment_id, _get_experiment_id_from_env, \
     search_runs, _EXPERIMENT_NAME_ENV_VAR, _EXPERIMENT_ID_ENV_VAR, _RUN_ID_ENV_VAR, \
-    _get_paginated_runs, NUM_RUNS_PER_PAGE_PANDAS, SEARCH_MAX_RESULTS_PANDAS
+    _get_paginated_runs, _get_paginated_run_pages, NUM_RUNS_PER_PAGE_PANDAS, \
+    NUM_PAGES_PREFETCHED_PANDAS, SEARCH_MAX_RESULTS_PANDAS
 from mlflow.utils.file_utils import TempDir
 from mlflow.utils import mlflow_tags
+from mlflow.utils.rest_utils import MlflowHostCreds
 
 
 class HelperEnv:
@@ -361,7 +365,7 @@ def test_start_run_existing_run_deleted(empty_active_run_stack):
 def test_search_runs_attributes():
     runs = [create_run(status=RunStatus.FINISHED, a_uri="dbfs:/test", run_id='abc', exp_id="123"),
             create_run(status=RunStatus.SCHEDULED, a_uri="dbfs:/test2", run_id='def', exp_id="321")]
-    with mock.patch('mlflow.tracking.fluent._get_paginated_runs', return_value=runs):
+    with mock.patch('mlflow.tracking.fluent._get_paginated_run_pages', return_value=[runs]):
         pdf = search_runs()
         data = {'status': [RunStatus.FINISHED, RunStatus.SCHEDULED],
                 'artifact_uri': ["dbfs:/test", "dbfs:/test2"],
@@ -387,7 +391,7 @@ def test_search_runs_data():
             tags=[RunTag("tag2", "v2")],
             start=1564765200000,
             end=1564783200000)]
-    with mock.patch('mlflow.tracking.fluent._get_paginated_runs', return_value=runs):
+    with mock.patch('mlflow.tracking.fluent._get_paginated_run_pages', return_value=[runs]):
         pdf = search_runs()
         data = {
             'status': [RunStatus.FINISHED]*2,
@@ -409,6 +413,48 @@ def test_search_runs_data():
         pd.testing.assert_frame_equal(pdf, expected_df, check_like=True, check_frame_type=False)
 
 
+def test_search_runs_data_from_multiple_pages():
+    pages = [
+        [create_run(metrics=[Metric("m%d" % (i % 3), float(i), 0, 0)],
+                    params=[Param("p%d" % (i % 4), str(i))],
+                    tags=[RunTag("t", "v%d" % i)] if i % 2 else [],
+                    start=i,
+                    end=None if i % 5 == 0 else i + 1)
+         for i in range(page_start, page_start + 10)]
+        for page_start in range(0, 30, 10)]
+    with mock.patch('mlflow.tracking.fluent._get_paginated_run_pages', return_value=pages):
+        pdf = search_runs()
+    assert len(pdf) == 30
+    assert list(pdf.columns[:6]) == ["run_id", "experiment_id", "status", "artifact_uri",
+                                     "start_time", "end_time"]
+    for i in range(3):
+        metric = pdf["metrics.m%d" % i]
+        assert metric.dtype == np.float64
+        np.testing.assert_array_equal(
+            metric.values, [float(j) if j % 3 == i else np.nan for j in range(30)])
+    for i in range(4):
+        assert list(pdf["params.p%d" % i]) == [str(j) if j % 4 == i else None for j in range(30)]
+    assert list(pdf["tags.t"]) == ["v%d" % j if j % 2 else None for j in range(30)]
+    assert list(pdf["start_time"]) == [pd.to_datetime(j, unit="ms", utc=True) for j in range(30)]
+    assert pdf["end_time"].isnull().tolist() == [j % 5 == 0 for j in range(30)]
+    assert pdf["end_time"][1] == pd.to_datetime(2, unit="ms", utc=True)
+
+
+def test_search_runs_sparse():
+    runs = [
+        create_run(metrics=[Metric("mse", 0.2, 0, 0)], params=[Param("param", "value")]),
+        create_run(metrics=[Metric("loss", 1.2, 0, 5)], tags=[RunTag("tag", "value")])]
+    with mock.patch('mlflow.tracking.fluent._get_paginated_run_pages', return_value=[runs]):
+        dense_pdf = search_runs()
+        sparse_pdf = search_runs(sparse=True)
+    for column in ["metrics.mse", "metrics.loss", "params.param", "tags.tag"]:
+        assert isinstance(sparse_pdf[column].dtype, pd.SparseDtype)
+        assert sparse_pdf[column].sparse.density == 0.5
+        pd.testing.assert_series_equal(sparse_pdf[column].sparse.to_dense(), dense_pdf[column])
+    info_columns = list(dense_pdf.columns[:6])
+    pd.testing.assert_frame_equal(sparse_pdf[info_columns], dense_pdf[info_columns])
+
+
 def test_search_runs_no_arguments():
     """
     When no experiment ID is specified, it should try to get the implicit one or
@@ -417,15 +463,33 @@ def test_search_runs_no_arguments():
     mock_experiment_id = mock.Mock()
     experiment_id_patch = mock.patch("mlflow.tracking.fluent._get_experiment_id",
                                      return_value=mock_experiment_id)
-    get_paginated_runs_patch = mock.patch('mlflow.tracking.fluent._get_paginated_runs',
+    get_paginated_runs_patch = mock.patch('mlflow.tracking.fluent._get_paginated_run_pages',
                                           return_value=[])
     with experiment_id_patch, get_paginated_runs_patch:
         pdf = search_runs()
-        mlflow.tracking.fluent._get_paginated_runs.assert_called_once_with(
-            mock_experiment_id, '', ViewType.ACTIVE_ONLY, SEARCH_MAX_RESULTS_PANDAS, None
+        mlflow.tracking.fluent._get_paginated_run_pages.assert_called_once_with(
+            mock_experiment_id, '', ViewType.ACTIVE_ONLY, SEARCH_MAX_RESULTS_PANDAS, None, 0
         )
 
 
+def test_search_runs_prefetches_pages_from_rest_store():
+    rest_store = RestStore(lambda: MlflowHostCreds("https://hello"))
+    get_paginated_runs_patch = mock.patch('mlflow.tracking.fluent._get_paginated_run_pages',
+                                          return_value=[])
+    with get_paginated_runs_patch:
+        with mock.patch("mlflow.tracking.utils._get_store", return_value=rest_store):
+            search_runs(["0"])
+        mlflow.tracking.fluent._get_paginated_run_pages.assert_called_with(
+            ["0"], '', ViewType.ACTIVE_ONLY, SEARCH_MAX_RESULTS_PANDAS, None,
+            NUM_PAGES_PREFETCHED_PANDAS)
+        search_runs(["0"])
+        mlflow.tracking.fluent._get_paginated_run_pages.assert_called_with(
+            ["0"], '', ViewType.ACTIVE_ONLY, SEARCH_MAX_RESULTS_PANDAS, None, 0)
+        search_runs(["0"], prefetch_pages=3)
+        mlflow.tracking.fluent._get_paginated_run_pages.assert_called_with(
+            ["0"], '', ViewType.ACTIVE_ONLY, SEARCH_MAX_RESULTS_PANDAS, None, 3)
+
+
 def test_get_paginated_runs_lt_maxresults_onepage():
     """
     Number of runs is less than max_results and fits on one page,
@@ -547,6 +611,45 @@ def test_get_paginated_runs_gt_maxresults_onepage():
             assert len(paginated_runs) == 10
 
 
+@pytest.mark.parametrize("prefetch_pages", [0, 1, 3])
+def test_get_paginated_run_pages_prefetch(prefetch_pages):
+    pages = [PagedList([create_run(run_id=str(i))], "token%d" % i) for i in range(5)]
+    pages.append(PagedList([create_run(run_id="5")], ""))
+    with mock.patch.object(MlflowClient, "search_runs", side_effect=pages):
+        run_pages = _get_paginated_run_pages([1], "", ViewType.ACTIVE_ONLY, 100, None,
+                                             prefetch_pages)
+        assert [run.info.run_id for page in run_pages for run in page] == \
+            [str(i) for i in range(6)]
+        calls = [mock.call([1], "", ViewType.ACTIVE_ONLY, 100, None, None)] + \
+            [mock.call([1], "", ViewType.ACTIVE_ONLY, 99 - i, None, "token%d" % i)
+             for i in range(5)]
+        MlflowClient.search_runs.assert_has_calls(calls)
+
+
+def test_get_paginated_run_pages_prefetch_reraises_errors():
+    pages = [PagedList([create_run()], "token"), MlflowException("Search failed")]
+    with mock.patch.object(MlflowClient, "search_runs", side_effect=pages):
+        run_pages = _get_paginated_run_pages([1], "", ViewType.ACTIVE_ONLY, 100, None, 1)
+        assert len(next(run_pages)) == 1
+        with pytest.raises(MlflowException, match="Search failed"):
+            next(run_pages)
+
+
+def test_get_paginated_run_pages_prefetch_stops_when_closed():
+    page = PagedList([create_run()], "token")
+    with mock.patch.object(MlflowClient, "search_runs", return_value=page):
+        run_pages = _get_paginated_run_pages([1], "", ViewType.ACTIVE_ONLY, 1000, None, 2)
+        next(run_pages)
+        run_pages.close()
+        prefetcher_threads = [thread for thread in threading.enumerate()
+                              if thread.name == "MlflowPagePrefetcher"]
+        for thread in prefetcher_threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        # One page consumed, two pages prefetched and one page waiting to be prefetched
+        assert MlflowClient.search_runs.call_count <= 4
+
+
 def test_delete_tag():
     """
     Confirm that fluent API delete tags actually works
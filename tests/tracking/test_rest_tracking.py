@@ -3,6 +3,7 @@ Integration test which starts a local Tracking Server on an ephemeral port,
 and ensures we can use the tracking API to communicate with it.
 """
 
+import math
 import mock
 from subprocess import Popen
 import os
@@ -333,6 +334,37 @@ def test_log_metrics_params_tags(mlflow_client, backend_store_uri):
     assert metric1.step == 0
 
 
+def test_get_metric_histories(mlflow_client, backend_store_uri):
+    experiment_id = mlflow_client.create_experiment('Metric histories')
+    run_ids = [mlflow_client.create_run(experiment_id).info.run_id for _ in range(2)]
+    for i, run_id in enumerate(run_ids):
+        mlflow_client.log_batch(run_id, metrics=[
+            Metric("loss", float(i + step), timestamp=step * 10, step=step)
+            for step in range(4)])
+    mlflow_client.log_metric(run_ids[1], key="accuracy", value=float("nan"), timestamp=5, step=1)
+
+    # The histories are fetched with a single request rather than one request per metric
+    with mock.patch("mlflow.store.rest_store.RestStore.get_metric_history") as get_history:
+        histories = mlflow_client.get_metric_histories(run_ids + ["0" * 32],
+                                                       ["loss", "accuracy"])
+        get_history.assert_not_called()
+    assert histories["run_id"] == [run_ids[0]] * 4 + [run_ids[1]] * 5
+    assert histories["key"] == ["loss"] * 8 + ["accuracy"]
+    assert histories["step"] == [0, 1, 2, 3] * 2 + [1]
+    assert histories["timestamp"] == [0, 10, 20, 30] * 2 + [5]
+    assert histories["value"][:8] == [0.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 4.0]
+    assert math.isnan(histories["value"][8])
+
+    histories = mlflow_client.get_metric_histories(run_ids, ["loss"], max_points=2,
+                                                   as_dataframe=True)
+    assert list(histories.columns) == ["run_id", "key", "step", "timestamp", "value"]
+    assert list(histories["step"]) == [0, 3, 0, 3]
+    assert list(histories["value"]) == [0.0, 3.0, 1.0, 4.0]
+
+    with pytest.raises(MlflowException, match="max_points"):
+        mlflow_client.get_metric_histories(run_ids, ["loss"], max_points=0)
+
+
 def test_set_experiment_tag(mlflow_client, backend_store_uri):
     experiment_id = mlflow_client.create_experiment('SetExperimentTagTest')
     mlflow_client.set_experiment_tag(experiment_id, "dataset", "imagenet1K")
@@ -181,10 +181,11 @@ def test_standard_store_registry_with_mocked_entrypoint():
     with mock.patch(
         "entrypoints.get_group_all", return_value=[mock_entrypoint]
     ):
-        # Entrypoints are registered at import time, so we need to reload the
-        # module to register the entrypoint given by the mocked
+        # Entrypoints are registered on the first lookup, so we need to reload the
+        # module and look up a store to register the entrypoint given by the mocked
         # extrypoints.get_group_all
         reload(mlflow.tracking.utils)
+        mlflow.tracking.utils._get_store("databricks")
 
         expected_standard_registry = {
             '',
@@ -208,6 +209,7 @@ def test_standard_store_registry_with_installed_plugin(tmp_wkdir):
     """This test requires the package in tests/resources/mlflow-test-plugin to be installed"""
 
     reload(mlflow.tracking.utils)
+    mlflow.tracking.utils._get_store("databricks")
     assert "file-plugin" in mlflow.tracking.utils._tracking_store_registry._registry.keys()
 
     from mlflow_test_plugin import PluginFileStore
@@ -273,6 +275,43 @@ def test_handle_plugin_registration_failure_via_entrypoints(exception):
     mock_get_group_all.assert_called_once_with("mlflow.tracking_store")
 
 
+def test_entrypoints_are_registered_once_on_first_lookup():
+    mock_plugin_function = mock.Mock()
+    mock_entrypoint = mock.Mock(load=mock.Mock(return_value=mock_plugin_function))
+    mock_entrypoint.name = "mock-scheme"
+
+    with mock.patch(
+        "entrypoints.get_group_all", return_value=[mock_entrypoint]
+    ) as mock_get_group_all:
+        tracking_store = TrackingStoreRegistry()
+        tracking_store.register("registered-scheme", mock.Mock())
+        mock_get_group_all.assert_not_called()
+
+        tracking_store.get_store("registered-scheme://")
+        mock_get_group_all.assert_called_once_with("mlflow.tracking_store")
+
+        assert tracking_store.get_store("mock-scheme://") == mock_plugin_function.return_value
+        with pytest.raises(mlflow.exceptions.MlflowException):
+            tracking_store.get_store("unknown-scheme://")
+
+    mock_get_group_all.assert_called_once_with("mlflow.tracking_store")
+
+
+def test_entrypoints_can_replace_builtin_stores():
+    mock_plugin_function = mock.Mock()
+    mock_entrypoint = mock.Mock(load=mock.Mock(return_value=mock_plugin_function))
+    mock_entrypoint.name = "file"
+
+    with mock.patch(
+        "entrypoints.get_group_all", return_value=[mock_entrypoint]
+    ):
+        reload(mlflow.tracking.utils)
+        store = mlflow.tracking.utils._get_store("file:///tmp/mlruns")
+
+    assert store == mock_plugin_function.return_value
+    reload(mlflow.tracking.utils)
+
+
 def test_get_store_for_unregistered_scheme():
 
     tracking_store = TrackingStoreRegistry()
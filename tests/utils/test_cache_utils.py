@@ -0,0 +1,71 @@
+import os
+import threading
+
+import mock
+
+from mlflow.utils.cache_utils import ProcessLocalCache
+
+
+def test_get_or_create_calls_factory_once_per_key():
+    cache = ProcessLocalCache()
+    factory = mock.Mock(side_effect=lambda: object())
+    first = cache.get_or_create("key", factory)
+    assert cache.get_or_create("key", factory) is first
+    assert factory.call_count == 1
+    assert "key" in cache
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted_when_full():
+    cache = ProcessLocalCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl():
+    cache = ProcessLocalCache(ttl_seconds=10)
+    with mock.patch("time.time", return_value=100):
+        cache.put("key", "value")
+    with mock.patch("time.time", return_value=105):
+        assert cache.get("key") == "value"
+    with mock.patch("time.time", return_value=110):
+        assert cache.get("key") is None
+        assert cache.get_or_create("key", lambda: "new-value") == "new-value"
+
+
+def test_entries_are_discarded_in_forked_process():
+    cache = ProcessLocalCache()
+    cache.put("key", "value")
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+def test_pop_and_clear():
+    cache = ProcessLocalCache()
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "default") == "default"
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_concurrent_get_or_create_returns_single_value():
+    cache = ProcessLocalCache()
+    results = []
+
+    def create():
+        results.append(cache.get_or_create("key", lambda: object()))
+
+    threads = [threading.Thread(target=create) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(id(value) for value in results)) == 1
@@ -3,6 +3,7 @@
 import codecs
 import filecmp
 import hashlib
+import mock
 import os
 import shutil
 import pytest
@@ -121,3 +122,46 @@ def test_dir_copy():
             f.write("testing")
         _copy_file_or_tree(dir_path, copy_path, "")
         assert filecmp.dircmp(dir_path, copy_path)
+
+
+@pytest.mark.parametrize("mode", file_utils.FILE_TRANSFER_MODES)
+def test_transfer_file_replaces_destination_with_source_content(tmpdir, mode):
+    src = tmpdir.join("src.txt")
+    src.write("new content")
+    dst = tmpdir.join("dst.txt")
+    dst.write("old content that is longer")
+    file_utils.transfer_file(str(src), str(dst), mode)
+    assert dst.read() == "new content"
+    is_same_inode = os.stat(str(src)).st_ino == os.stat(str(dst)).st_ino
+    assert is_same_inode == (mode == "hardlink")
+
+
+def test_transfer_file_falls_back_to_kernel_copy_across_devices(tmpdir):
+    src = tmpdir.join("src.txt")
+    src.write("content")
+    dst = tmpdir.join("dst.txt")
+    with mock.patch("mlflow.utils.file_utils._is_same_device", return_value=False), \
+            mock.patch("os.link") as link_mock:
+        file_utils.transfer_file(str(src), str(dst), "hardlink")
+    link_mock.assert_not_called()
+    assert dst.read() == "content"
+    assert os.stat(str(src)).st_ino != os.stat(str(dst)).st_ino
+
+
+def test_transfer_file_falls_back_to_copy_without_kernel_copy_support(tmpdir):
+    src = tmpdir.join("src.txt")
+    src.write("content")
+    dst = tmpdir.join("dst.txt")
+
+    def unsupported_copy(src_fd, dst_fd):
+        raise OSError("Not supported")
+
+    with mock.patch("mlflow.utils.file_utils._get_kernel_copy_functions",
+                    return_value=[unsupported_copy]):
+        file_utils.transfer_file(str(src), str(dst), "fastcopy")
+    assert dst.read() == "content"
+
+
+def test_transfer_file_rejects_invalid_mode(tmpdir):
+    with pytest.raises(ValueError):
+        file_utils.transfer_file(str(tmpdir.join("a")), str(tmpdir.join("b")), "symlink")
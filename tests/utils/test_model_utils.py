@@ -1,5 +1,7 @@
 import os
 
+import mock
+import numpy as np
 import pytest
 import sklearn.datasets as datasets
 import sklearn.neighbors as knn
@@ -59,3 +61,22 @@ def test_get_flavor_configuration_with_present_flavor_returns_expected_configura
             model_path=model_path, flavor_name=mlflow.sklearn.FLAVOR_NAME)
     model_config = Model.load(os.path.join(model_path, "MLmodel"))
     assert sklearn_flavor_config == model_config.flavors[mlflow.sklearn.FLAVOR_NAME]
+
+
+def test_run_in_batches_stacks_outputs_of_slices_in_order():
+    def run_fn(x, y):
+        return [x + y, (2 * x).reshape(-1, 1)]
+    run_fn = mock.Mock(side_effect=run_fn)
+    x = np.arange(10.0)
+    y = np.ones(10)
+
+    outputs = mlflow_model_utils._run_in_batches(run_fn, [x, y], batch_size=4)
+    assert run_fn.call_count == 3
+    np.testing.assert_array_equal(outputs[0], x + y)
+    np.testing.assert_array_equal(outputs[1], (2 * x).reshape(-1, 1))
+
+    run_fn.reset_mock()
+    for batch_size in [None, 10]:
+        outputs = mlflow_model_utils._run_in_batches(run_fn, [x, y], batch_size=batch_size)
+        np.testing.assert_array_equal(outputs[0], x + y)
+    assert run_fn.call_count == 2